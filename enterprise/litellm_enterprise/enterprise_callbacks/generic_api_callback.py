@@ -137,8 +137,8 @@ class GenericAPILogger(CustomBatchLogger):
                 # New logging payload, StandardLoggingPayload
                 self.log_queue.append(standard_logging_payload)
 
-            if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+            if self.should_flush():
+                await self.flush_queue()
 
         except Exception as e:
             verbose_logger.exception(
@@ -174,43 +174,45 @@ class GenericAPILogger(CustomBatchLogger):
             else:
                 self.log_queue.append(standard_logging_payload)
 
-            if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+            if self.should_flush():
+                await self.flush_queue()
 
         except Exception as e:
             verbose_logger.exception(
                 f"Generic API Logger Error - {str(e)}\n{traceback.format_exc()}"
             )
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
-        Sends the batch of messages to Generic API Endpoint
+        Sends the batch of messages (defaults to self.log_queue) to Generic API Endpoint
+
+        Returns False if the batch couldn't be sent
         """
+        batch = self.log_queue if batch is None else batch
         try:
-            if not self.log_queue:
+            if not batch:
                 return
 
             verbose_logger.debug(
-                f"Generic API Logger - about to flush {len(self.log_queue)} events"
+                f"Generic API Logger - about to flush {len(batch)} events"
             )
 
             # make POST request to Generic API Endpoint
             response = await self.async_httpx_client.post(
                 url=self.endpoint,
                 headers=self.headers,
-                data=safe_dumps(self.log_queue),
+                data=safe_dumps(batch),
             )
 
             verbose_logger.debug(
                 f"Generic API Logger - sent batch to {self.endpoint}, status code {response.status_code}"
             )
-
+            batch.clear()
         except Exception as e:
             verbose_logger.exception(
                 f"Generic API Logger Error sending batch - {str(e)}\n{traceback.format_exc()}"
             )
-        finally:
-            self.log_queue.clear()
+            return False
 
     def _get_v1_logging_payload(
         self, kwargs, response_obj, start_time, end_time
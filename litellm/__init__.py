@@ -10,6 +10,7 @@ from typing import (
     List,
     Optional,
     Dict,
+    Tuple,
     Union,
     Any,
     Literal,
@@ -18,6 +19,7 @@ from typing import (
 )
 from litellm.types.integrations.datadog_llm_obs import DatadogLLMObsInitParams
 from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+from litellm.llms.custom_httpx.http_client_pool import HTTPClientPool
 from litellm.caching.caching import Cache, DualCache, RedisCache, InMemoryCache
 from litellm.caching.llm_caching_handler import LLMClientCache
 from litellm.types.llms.bedrock import COHERE_EMBEDDING_INPUT_TYPES
@@ -251,6 +253,7 @@ disable_add_transform_inline_image_block: bool = False
 disable_add_user_agent_to_request_tags: bool = False
 extra_spend_tag_headers: Optional[List[str]] = None
 in_memory_llm_clients_cache: LLMClientCache = LLMClientCache()
+http_client_pool: HTTPClientPool = HTTPClientPool()
 safe_memory_mode: bool = False
 enable_azure_ad_token_refresh: Optional[bool] = False
 ### DEFAULT AZURE API VERSION ###
@@ -375,6 +378,9 @@ disable_aiohttp_trust_env: bool = (
 force_ipv4: bool = (
     False  # when True, litellm will force ipv4 for all LLM requests. Some users have seen httpx ConnectionError when using ipv6.
 )
+enable_http2: bool = (
+    False  # use HTTP/2 for httpx clients, needs the `h2` package - `pip install httpx[http2]`
+)
 module_level_aclient = AsyncHTTPHandler(
     timeout=request_timeout, client_alias="module level aclient"
 )
@@ -401,9 +407,15 @@ _key_management_settings: KeyManagementSettings = KeyManagementSettings()
 #### PII MASKING ####
 output_parse_pii: bool = False
 #############################################
-from litellm.litellm_core_utils.get_model_cost_map import get_model_cost_map
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_bundled_model_cost_map,
+    get_model_cost_map,
+    start_background_model_cost_map_refresh,
+)
 
-model_cost = get_model_cost_map(url=model_cost_map_url)
+model_cost = (
+    get_bundled_model_cost_map()
+)  # refreshed from `model_cost_map_url` in the background, after `add_known_models()`
 custom_prompt_dict: Dict[str, dict] = {}
 check_provider_endpoint = False
 
@@ -575,174 +587,228 @@ def is_openai_finetune_model(key: str) -> bool:
     return key.startswith("ft:") and not key.count(":") > 1
 
 
-def add_known_models():
-    for key, value in model_cost.items():
-        if value.get("litellm_provider") == "openai" and not is_openai_finetune_model(
-            key
-        ):
-            open_ai_chat_completion_models.append(key)
-        elif value.get("litellm_provider") == "text-completion-openai":
-            open_ai_text_completion_models.append(key)
-        elif value.get("litellm_provider") == "azure_text":
-            azure_text_models.append(key)
-        elif value.get("litellm_provider") == "cohere":
-            cohere_models.append(key)
-        elif value.get("litellm_provider") == "cohere_chat":
-            cohere_chat_models.append(key)
-        elif value.get("litellm_provider") == "mistral":
-            mistral_chat_models.append(key)
-        elif value.get("litellm_provider") == "anthropic":
-            anthropic_models.append(key)
-        elif value.get("litellm_provider") == "empower":
-            empower_models.append(key)
-        elif value.get("litellm_provider") == "openrouter":
-            openrouter_models.append(key)
-        elif value.get("litellm_provider") == "datarobot":
-            datarobot_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-text-models":
-            vertex_text_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-text-models":
-            vertex_code_text_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-language-models":
-            vertex_language_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-vision-models":
-            vertex_vision_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-chat-models":
-            vertex_chat_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
-            vertex_code_chat_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-embedding-models":
-            vertex_embedding_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-anthropic_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_anthropic_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-llama_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_llama3_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-deepseek_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_deepseek_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-mistral_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_mistral_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-ai21_models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_ai21_models.append(key)
-        elif value.get("litellm_provider") == "vertex_ai-image-models":
-            key = key.replace("vertex_ai/", "")
-            vertex_ai_image_models.append(key)
-        elif value.get("litellm_provider") == "ai21":
-            if value.get("mode") == "chat":
-                ai21_chat_models.append(key)
-            else:
-                ai21_models.append(key)
-        elif value.get("litellm_provider") == "nlp_cloud":
-            nlp_cloud_models.append(key)
-        elif value.get("litellm_provider") == "aleph_alpha":
-            aleph_alpha_models.append(key)
-        elif value.get(
-            "litellm_provider"
-        ) == "bedrock" and not is_bedrock_pricing_only_model(key):
-            bedrock_models.append(key)
-        elif value.get("litellm_provider") == "bedrock_converse":
-            bedrock_converse_models.append(key)
-        elif value.get("litellm_provider") == "deepinfra":
-            deepinfra_models.append(key)
-        elif value.get("litellm_provider") == "perplexity":
-            perplexity_models.append(key)
-        elif value.get("litellm_provider") == "watsonx":
-            watsonx_models.append(key)
-        elif value.get("litellm_provider") == "gemini":
-            gemini_models.append(key)
-        elif value.get("litellm_provider") == "fireworks_ai":
-            # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
-            if "-to-" not in key and "fireworks-ai-default" not in key:
-                fireworks_ai_models.append(key)
-        elif value.get("litellm_provider") == "fireworks_ai-embedding-models":
-            # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
-            if "-to-" not in key:
-                fireworks_ai_embedding_models.append(key)
-        elif value.get("litellm_provider") == "text-completion-codestral":
-            text_completion_codestral_models.append(key)
-        elif value.get("litellm_provider") == "xai":
-            xai_models.append(key)
-        elif value.get("litellm_provider") == "deepseek":
-            deepseek_models.append(key)
-        elif value.get("litellm_provider") == "meta_llama":
-            llama_models.append(key)
-        elif value.get("litellm_provider") == "nscale":
-            nscale_models.append(key)
-        elif value.get("litellm_provider") == "azure_ai":
-            azure_ai_models.append(key)
-        elif value.get("litellm_provider") == "voyage":
-            voyage_models.append(key)
-        elif value.get("litellm_provider") == "infinity":
-            infinity_models.append(key)
-        elif value.get("litellm_provider") == "databricks":
-            databricks_models.append(key)
-        elif value.get("litellm_provider") == "cloudflare":
-            cloudflare_models.append(key)
-        elif value.get("litellm_provider") == "codestral":
-            codestral_models.append(key)
-        elif value.get("litellm_provider") == "friendliai":
-            friendliai_models.append(key)
-        elif value.get("litellm_provider") == "palm":
-            palm_models.append(key)
-        elif value.get("litellm_provider") == "groq":
-            groq_models.append(key)
-        elif value.get("litellm_provider") == "azure":
-            azure_models.append(key)
-        elif value.get("litellm_provider") == "anyscale":
-            anyscale_models.append(key)
-        elif value.get("litellm_provider") == "cerebras":
-            cerebras_models.append(key)
-        elif value.get("litellm_provider") == "galadriel":
-            galadriel_models.append(key)
-        elif value.get("litellm_provider") == "sambanova":
-            sambanova_models.append(key)
-        elif value.get("litellm_provider") == "sambanova-embedding-models":
-            sambanova_embedding_models.append(key)
-        elif value.get("litellm_provider") == "novita":
-            novita_models.append(key)
-        elif value.get("litellm_provider") == "nebius-chat-models":
-            nebius_models.append(key)
-        elif value.get("litellm_provider") == "nebius-embedding-models":
-            nebius_embedding_models.append(key)
-        elif value.get("litellm_provider") == "assemblyai":
-            assemblyai_models.append(key)
-        elif value.get("litellm_provider") == "jina_ai":
-            jina_ai_models.append(key)
-        elif value.get("litellm_provider") == "snowflake":
-            snowflake_models.append(key)
-        elif value.get("litellm_provider") == "gradient_ai":
-            gradient_ai_models.append(key)
-        elif value.get("litellm_provider") == "featherless_ai":
-            featherless_ai_models.append(key)
-        elif value.get("litellm_provider") == "deepgram":
-            deepgram_models.append(key)
-        elif value.get("litellm_provider") == "elevenlabs":
-            elevenlabs_models.append(key)
-        elif value.get("litellm_provider") == "dashscope":
-            dashscope_models.append(key)
-        elif value.get("litellm_provider") == "moonshot":
-            moonshot_models.append(key)
-        elif value.get("litellm_provider") == "v0":
-            v0_models.append(key)
-        elif value.get("litellm_provider") == "morph":
-            morph_models.append(key)
-        elif value.get("litellm_provider") == "lambda_ai":
-            lambda_ai_models.append(key)
-        elif value.get("litellm_provider") == "hyperbolic":
-            hyperbolic_models.append(key)
-        elif value.get("litellm_provider") == "recraft":
-            recraft_models.append(key)
-        elif value.get("litellm_provider") == "cometapi":
-            cometapi_models.append(key)
-        elif value.get("litellm_provider") == "oci":
-            oci_models.append(key)
+def _get_known_model_list_name(key: str, value: dict) -> Optional[Tuple[str, str]]:
+    """
+    Returns (name of the provider model list, model name) for a `model_cost` entry - None if it doesn't belong to one
+    """
+    if value.get("litellm_provider") == "openai" and not is_openai_finetune_model(key):
+        return "open_ai_chat_completion_models", key
+    elif value.get("litellm_provider") == "text-completion-openai":
+        return "open_ai_text_completion_models", key
+    elif value.get("litellm_provider") == "azure_text":
+        return "azure_text_models", key
+    elif value.get("litellm_provider") == "cohere":
+        return "cohere_models", key
+    elif value.get("litellm_provider") == "cohere_chat":
+        return "cohere_chat_models", key
+    elif value.get("litellm_provider") == "mistral":
+        return "mistral_chat_models", key
+    elif value.get("litellm_provider") == "anthropic":
+        return "anthropic_models", key
+    elif value.get("litellm_provider") == "empower":
+        return "empower_models", key
+    elif value.get("litellm_provider") == "openrouter":
+        return "openrouter_models", key
+    elif value.get("litellm_provider") == "datarobot":
+        return "datarobot_models", key
+    elif value.get("litellm_provider") == "vertex_ai-text-models":
+        return "vertex_text_models", key
+    elif value.get("litellm_provider") == "vertex_ai-code-text-models":
+        return "vertex_code_text_models", key
+    elif value.get("litellm_provider") == "vertex_ai-language-models":
+        return "vertex_language_models", key
+    elif value.get("litellm_provider") == "vertex_ai-vision-models":
+        return "vertex_vision_models", key
+    elif value.get("litellm_provider") == "vertex_ai-chat-models":
+        return "vertex_chat_models", key
+    elif value.get("litellm_provider") == "vertex_ai-code-chat-models":
+        return "vertex_code_chat_models", key
+    elif value.get("litellm_provider") == "vertex_ai-embedding-models":
+        return "vertex_embedding_models", key
+    elif value.get("litellm_provider") == "vertex_ai-anthropic_models":
+        key = key.replace("vertex_ai/", "")
+        return "vertex_anthropic_models", key
+    elif value.get("litellm_provider") == "vertex_ai-llama_models":
+        key = key.replace("vertex_ai/", "")
+        return "vertex_llama3_models", key
+    elif value.get("litellm_provider") == "vertex_ai-deepseek_models":
+        key = key.replace("vertex_ai/", "")
+        return "vertex_deepseek_models", key
+    elif value.get("litellm_provider") == "vertex_ai-mistral_models":
+        key = key.replace("vertex_ai/", "")
+        return "vertex_mistral_models", key
+    elif value.get("litellm_provider") == "vertex_ai-ai21_models":
+        key = key.replace("vertex_ai/", "")
+        return "vertex_ai_ai21_models", key
+    elif value.get("litellm_provider") == "vertex_ai-image-models":
+        key = key.replace("vertex_ai/", "")
+        return "vertex_ai_image_models", key
+    elif value.get("litellm_provider") == "ai21":
+        if value.get("mode") == "chat":
+            return "ai21_chat_models", key
+        else:
+            return "ai21_models", key
+    elif value.get("litellm_provider") == "nlp_cloud":
+        return "nlp_cloud_models", key
+    elif value.get("litellm_provider") == "aleph_alpha":
+        return "aleph_alpha_models", key
+    elif value.get(
+        "litellm_provider"
+    ) == "bedrock" and not is_bedrock_pricing_only_model(key):
+        return "bedrock_models", key
+    elif value.get("litellm_provider") == "bedrock_converse":
+        return "bedrock_converse_models", key
+    elif value.get("litellm_provider") == "deepinfra":
+        return "deepinfra_models", key
+    elif value.get("litellm_provider") == "perplexity":
+        return "perplexity_models", key
+    elif value.get("litellm_provider") == "watsonx":
+        return "watsonx_models", key
+    elif value.get("litellm_provider") == "gemini":
+        return "gemini_models", key
+    elif value.get("litellm_provider") == "fireworks_ai":
+        # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
+        if "-to-" not in key and "fireworks-ai-default" not in key:
+            return "fireworks_ai_models", key
+    elif value.get("litellm_provider") == "fireworks_ai-embedding-models":
+        # ignore the 'up-to', '-to-' model names -> not real models. just for cost tracking based on model params.
+        if "-to-" not in key:
+            return "fireworks_ai_embedding_models", key
+    elif value.get("litellm_provider") == "text-completion-codestral":
+        return "text_completion_codestral_models", key
+    elif value.get("litellm_provider") == "xai":
+        return "xai_models", key
+    elif value.get("litellm_provider") == "deepseek":
+        return "deepseek_models", key
+    elif value.get("litellm_provider") == "meta_llama":
+        return "llama_models", key
+    elif value.get("litellm_provider") == "nscale":
+        return "nscale_models", key
+    elif value.get("litellm_provider") == "azure_ai":
+        return "azure_ai_models", key
+    elif value.get("litellm_provider") == "voyage":
+        return "voyage_models", key
+    elif value.get("litellm_provider") == "infinity":
+        return "infinity_models", key
+    elif value.get("litellm_provider") == "databricks":
+        return "databricks_models", key
+    elif value.get("litellm_provider") == "cloudflare":
+        return "cloudflare_models", key
+    elif value.get("litellm_provider") == "codestral":
+        return "codestral_models", key
+    elif value.get("litellm_provider") == "friendliai":
+        return "friendliai_models", key
+    elif value.get("litellm_provider") == "palm":
+        return "palm_models", key
+    elif value.get("litellm_provider") == "groq":
+        return "groq_models", key
+    elif value.get("litellm_provider") == "azure":
+        return "azure_models", key
+    elif value.get("litellm_provider") == "anyscale":
+        return "anyscale_models", key
+    elif value.get("litellm_provider") == "cerebras":
+        return "cerebras_models", key
+    elif value.get("litellm_provider") == "galadriel":
+        return "galadriel_models", key
+    elif value.get("litellm_provider") == "sambanova":
+        return "sambanova_models", key
+    elif value.get("litellm_provider") == "sambanova-embedding-models":
+        return "sambanova_embedding_models", key
+    elif value.get("litellm_provider") == "novita":
+        return "novita_models", key
+    elif value.get("litellm_provider") == "nebius-chat-models":
+        return "nebius_models", key
+    elif value.get("litellm_provider") == "nebius-embedding-models":
+        return "nebius_embedding_models", key
+    elif value.get("litellm_provider") == "assemblyai":
+        return "assemblyai_models", key
+    elif value.get("litellm_provider") == "jina_ai":
+        return "jina_ai_models", key
+    elif value.get("litellm_provider") == "snowflake":
+        return "snowflake_models", key
+    elif value.get("litellm_provider") == "gradient_ai":
+        return "gradient_ai_models", key
+    elif value.get("litellm_provider") == "featherless_ai":
+        return "featherless_ai_models", key
+    elif value.get("litellm_provider") == "deepgram":
+        return "deepgram_models", key
+    elif value.get("litellm_provider") == "elevenlabs":
+        return "elevenlabs_models", key
+    elif value.get("litellm_provider") == "dashscope":
+        return "dashscope_models", key
+    elif value.get("litellm_provider") == "moonshot":
+        return "moonshot_models", key
+    elif value.get("litellm_provider") == "v0":
+        return "v0_models", key
+    elif value.get("litellm_provider") == "morph":
+        return "morph_models", key
+    elif value.get("litellm_provider") == "lambda_ai":
+        return "lambda_ai_models", key
+    elif value.get("litellm_provider") == "hyperbolic":
+        return "hyperbolic_models", key
+    elif value.get("litellm_provider") == "recraft":
+        return "recraft_models", key
+    elif value.get("litellm_provider") == "cometapi":
+        return "cometapi_models", key
+    elif value.get("litellm_provider") == "oci":
+        return "oci_models", key
+    return None
+
+
+def add_known_models(model_cost_map: Optional[dict] = None):
+    """
+    Add the models in `model_cost_map` (default: `model_cost`) to the provider model lists.
+
+    For a refreshed model cost map, each list that gains models is replaced by an extended copy, in one assignment - it's never changed in place while other threads may be reading it.
+    """
+    if model_cost_map is None:
+        for key, value in model_cost.items():
+            known_model = _get_known_model_list_name(key, value)
+            if known_model is not None:
+                globals()[known_model[0]].append(known_model[1])
+        return
+
+    new_models: Dict[str, List[str]] = {}
+    for key, value in model_cost_map.items():
+        known_model = _get_known_model_list_name(key, value)
+        if known_model is not None:
+            new_models.setdefault(known_model[0], []).append(known_model[1])
+    # runs before `models_by_provider` is defined if the refresh finishes during import
+    provider_model_lists = globals().get("models_by_provider", {})
+    for list_name, models in new_models.items():
+        old_list = globals()[list_name]
+        new_list = old_list + models
+        globals()[list_name] = new_list
+        for provider, provider_models in provider_model_lists.items():
+            if provider_models is old_list:
+                provider_model_lists[provider] = new_list
+
+    from litellm.litellm_core_utils.get_llm_provider_logic import (
+        flush_get_llm_provider_cache,
+    )
+
+    flush_get_llm_provider_cache()
+
+
+def _apply_model_cost_map_refresh(model_cost_updates: dict):
+    """
+    Swap in the refreshed model cost map - `model_cost` is replaced by an updated copy, never changed in place, so threads iterating it aren't affected.
+    """
+    global model_cost
+    new_models = {
+        key: value for key, value in model_cost_updates.items() if key not in model_cost
+    }
+    model_cost = {**model_cost, **model_cost_updates}
+    if new_models:
+        add_known_models(new_models)
 
 
 add_known_models()
+start_background_model_cost_map_refresh(
+    url=model_cost_map_url,
+    model_cost=model_cost,
+    on_refresh=_apply_model_cost_map_refresh,
+)
 # known openai compatible endpoints - we'll eventually move this list to the model_prices_and_context_window.json dictionary
 
 # this is maintained for Exception Mapping
@@ -952,7 +1018,10 @@ from .cost_calculator import completion_cost
 from litellm.litellm_core_utils.litellm_logging import Logging, modify_integration
 from litellm.litellm_core_utils.get_llm_provider_logic import get_llm_provider
 from litellm.litellm_core_utils.core_helpers import remove_index_from_tool_calls
-from litellm.litellm_core_utils.token_counter import get_modified_max_tokens
+from litellm.litellm_core_utils.token_counter import (
+    batch_token_counter,
+    get_modified_max_tokens,
+)
 from .utils import (
     client,
     exception_type,
@@ -1005,242 +1074,277 @@ ALL_LITELLM_RESPONSE_TYPES = [
     TextCompletionResponse,
 ]
 
-from .llms.bytez.chat.transformation import BytezChatConfig
-from .llms.custom_llm import CustomLLM
-from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
-from .llms.openai_like.chat.handler import OpenAILikeChatConfig
-from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
-from .llms.galadriel.chat.transformation import GaladrielChatConfig
-from .llms.github.chat.transformation import GithubChatConfig
-from .llms.empower.chat.transformation import EmpowerChatConfig
-from .llms.huggingface.chat.transformation import HuggingFaceChatConfig
-from .llms.huggingface.embedding.transformation import HuggingFaceEmbeddingConfig
-from .llms.oobabooga.chat.transformation import OobaboogaConfig
-from .llms.maritalk import MaritalkConfig
-from .llms.openrouter.chat.transformation import OpenrouterConfig
-from .llms.datarobot.chat.transformation import DataRobotConfig
-from .llms.anthropic.chat.transformation import AnthropicConfig
-from .llms.anthropic.common_utils import AnthropicModelInfo
-from .llms.groq.stt.transformation import GroqSTTConfig
-from .llms.anthropic.completion.transformation import AnthropicTextConfig
-from .llms.triton.completion.transformation import TritonConfig
-from .llms.triton.completion.transformation import TritonGenerateConfig
-from .llms.triton.completion.transformation import TritonInferConfig
-from .llms.triton.embedding.transformation import TritonEmbeddingConfig
-from .llms.huggingface.rerank.transformation import HuggingFaceRerankConfig
-from .llms.databricks.chat.transformation import DatabricksConfig
-from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
-from .llms.predibase.chat.transformation import PredibaseConfig
-from .llms.replicate.chat.transformation import ReplicateConfig
-from .llms.cohere.completion.transformation import CohereTextConfig as CohereConfig
-from .llms.snowflake.chat.transformation import SnowflakeConfig
-from .llms.cohere.rerank.transformation import CohereRerankConfig
-from .llms.cohere.rerank_v2.transformation import CohereRerankV2Config
-from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
-from .llms.infinity.rerank.transformation import InfinityRerankConfig
-from .llms.jina_ai.rerank.transformation import JinaAIRerankConfig
-from .llms.clarifai.chat.transformation import ClarifaiConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig, AI21ChatConfig as AI21Config
-from .llms.meta_llama.chat.transformation import LlamaAPIConfig
-from .llms.anthropic.experimental_pass_through.messages.transformation import (
-    AnthropicMessagesConfig,
-)
-from .llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaudeMessagesConfig,
-)
-from .llms.together_ai.chat import TogetherAIConfig
-from .llms.together_ai.completion.transformation import TogetherAITextCompletionConfig
-from .llms.cloudflare.chat.transformation import CloudflareChatConfig
-from .llms.novita.chat.transformation import NovitaConfig
-from .llms.deprecated_providers.palm import (
-    PalmConfig,
-)  # here to prevent breaking changes
-from .llms.nlp_cloud.chat.handler import NLPCloudConfig
-from .llms.petals.completion.transformation import PetalsConfig
-from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
-from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
-    VertexGeminiConfig,
-    VertexGeminiConfig as VertexAIConfig,
-)
-from .llms.gemini.common_utils import GeminiModelInfo
-from .llms.gemini.chat.transformation import (
-    GoogleAIStudioGeminiConfig,
-    GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
-)
-
-
-from .llms.vertex_ai.vertex_embeddings.transformation import (
-    VertexAITextEmbeddingConfig,
-)
+### PROVIDER CONFIGS ###
+# imported on first access - see `__getattr__` and `litellm/_lazy_imports.py`
+if TYPE_CHECKING:
+    from .llms.bytez.chat.transformation import BytezChatConfig
+    from .llms.custom_llm import CustomLLM
+    from .llms.bedrock.chat.converse_transformation import AmazonConverseConfig
+    from .llms.openai_like.chat.handler import OpenAILikeChatConfig
+    from .llms.aiohttp_openai.chat.transformation import AiohttpOpenAIChatConfig
+    from .llms.galadriel.chat.transformation import GaladrielChatConfig
+    from .llms.github.chat.transformation import GithubChatConfig
+    from .llms.empower.chat.transformation import EmpowerChatConfig
+    from .llms.huggingface.chat.transformation import HuggingFaceChatConfig
+    from .llms.huggingface.embedding.transformation import HuggingFaceEmbeddingConfig
+    from .llms.oobabooga.chat.transformation import OobaboogaConfig
+    from .llms.maritalk import MaritalkConfig
+    from .llms.openrouter.chat.transformation import OpenrouterConfig
+    from .llms.datarobot.chat.transformation import DataRobotConfig
+    from .llms.anthropic.chat.transformation import AnthropicConfig
+    from .llms.anthropic.common_utils import AnthropicModelInfo
+    from .llms.groq.stt.transformation import GroqSTTConfig
+    from .llms.anthropic.completion.transformation import AnthropicTextConfig
+    from .llms.triton.completion.transformation import TritonConfig
+    from .llms.triton.completion.transformation import TritonGenerateConfig
+    from .llms.triton.completion.transformation import TritonInferConfig
+    from .llms.triton.embedding.transformation import TritonEmbeddingConfig
+    from .llms.huggingface.rerank.transformation import HuggingFaceRerankConfig
+    from .llms.databricks.chat.transformation import DatabricksConfig
+    from .llms.databricks.embed.transformation import DatabricksEmbeddingConfig
+    from .llms.predibase.chat.transformation import PredibaseConfig
+    from .llms.replicate.chat.transformation import ReplicateConfig
+    from .llms.cohere.completion.transformation import CohereTextConfig as CohereConfig
+    from .llms.snowflake.chat.transformation import SnowflakeConfig
+    from .llms.cohere.rerank.transformation import CohereRerankConfig
+    from .llms.cohere.rerank_v2.transformation import CohereRerankV2Config
+    from .llms.azure_ai.rerank.transformation import AzureAIRerankConfig
+    from .llms.infinity.rerank.transformation import InfinityRerankConfig
+    from .llms.jina_ai.rerank.transformation import JinaAIRerankConfig
+    from .llms.clarifai.chat.transformation import ClarifaiConfig
+    from .llms.ai21.chat.transformation import (
+        AI21ChatConfig,
+        AI21ChatConfig as AI21Config,
+    )
+    from .llms.meta_llama.chat.transformation import LlamaAPIConfig
+    from .llms.anthropic.experimental_pass_through.messages.transformation import (
+        AnthropicMessagesConfig,
+    )
+    from .llms.bedrock.messages.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaudeMessagesConfig,
+    )
+    from .llms.together_ai.chat import TogetherAIConfig
+    from .llms.together_ai.completion.transformation import (
+        TogetherAITextCompletionConfig,
+    )
+    from .llms.cloudflare.chat.transformation import CloudflareChatConfig
+    from .llms.novita.chat.transformation import NovitaConfig
+    from .llms.deprecated_providers.palm import (
+        PalmConfig,
+    )  # here to prevent breaking changes
+    from .llms.nlp_cloud.chat.handler import NLPCloudConfig
+    from .llms.petals.completion.transformation import PetalsConfig
+    from .llms.deprecated_providers.aleph_alpha import AlephAlphaConfig
+    from .llms.vertex_ai.gemini.vertex_and_google_ai_studio_gemini import (
+        VertexGeminiConfig,
+        VertexGeminiConfig as VertexAIConfig,
+    )
+    from .llms.gemini.common_utils import GeminiModelInfo
+    from .llms.gemini.chat.transformation import (
+        GoogleAIStudioGeminiConfig,
+        GoogleAIStudioGeminiConfig as GeminiConfig,  # aliased to maintain backwards compatibility
+    )
+    from .llms.vertex_ai.vertex_embeddings.transformation import (
+        VertexAITextEmbeddingConfig,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
+        VertexAIAnthropicConfig,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
+        VertexAILlama3Config,
+    )
+    from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
+        VertexAIAi21Config,
+    )
+    from .llms.ollama.chat.transformation import OllamaChatConfig
+    from .llms.ollama.completion.transformation import OllamaConfig
+    from .llms.sagemaker.completion.transformation import SagemakerConfig
+    from .llms.sagemaker.chat.transformation import SagemakerChatConfig
+    from .llms.bedrock.chat.invoke_handler import (
+        AmazonCohereChatConfig,
+        bedrock_tool_name_mappings,
+    )
+    from .llms.bedrock.common_utils import (
+        AmazonBedrockGlobalConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
+        AmazonAI21Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
+        AmazonInvokeNovaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
+        AmazonAnthropicConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
+        AmazonAnthropicClaudeConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
+        AmazonCohereConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
+        AmazonLlamaConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation import (
+        AmazonDeepSeekR1Config,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
+        AmazonMistralConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
+        AmazonTitanConfig,
+    )
+    from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
+        AmazonInvokeConfig,
+    )
+    from .llms.bedrock.image.amazon_stability1_transformation import (
+        AmazonStabilityConfig,
+    )
+    from .llms.bedrock.image.amazon_stability3_transformation import (
+        AmazonStability3Config,
+    )
+    from .llms.bedrock.image.amazon_nova_canvas_transformation import (
+        AmazonNovaCanvasConfig,
+    )
+    from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
+    from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
+        AmazonTitanMultimodalEmbeddingG1Config,
+    )
+    from .llms.bedrock.embed.amazon_titan_v2_transformation import (
+        AmazonTitanV2Config,
+    )
+    from .llms.cohere.chat.transformation import CohereChatConfig
+    from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
+    from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
+    from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
+    from .llms.deepinfra.chat.transformation import DeepInfraConfig
+    from .llms.deepgram.audio_transcription.transformation import (
+        DeepgramAudioTranscriptionConfig,
+    )
+    from .llms.topaz.common_utils import TopazModelInfo
+    from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
+    from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
+    from .llms.groq.chat.transformation import GroqChatConfig
+    from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
+    from .llms.infinity.embedding.transformation import InfinityEmbeddingConfig
+    from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
+    from .llms.mistral.chat.transformation import MistralConfig
+    from .llms.openai.responses.transformation import OpenAIResponsesAPIConfig
+    from .llms.azure.responses.transformation import AzureOpenAIResponsesAPIConfig
+    from .llms.azure.responses.o_series_transformation import (
+        AzureOpenAIOSeriesResponsesAPIConfig,
+    )
+    from .llms.openai.chat.o_series_transformation import (
+        OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
+        OpenAIOSeriesConfig,
+    )
+    from .llms.snowflake.chat.transformation import SnowflakeConfig
+    from .llms.gradient_ai.chat.transformation import GradientAIConfig
+    from .llms.openai.chat.gpt_transformation import (
+        OpenAIGPTConfig,
+    )
+    from .llms.openai.chat.gpt_5_transformation import (
+        OpenAIGPT5Config,
+    )
+    from .llms.openai.transcriptions.whisper_transformation import (
+        OpenAIWhisperAudioTranscriptionConfig,
+    )
+    from .llms.openai.transcriptions.gpt_transformation import (
+        OpenAIGPTAudioTranscriptionConfig,
+    )
+    from .llms.openai.chat.gpt_audio_transformation import (
+        OpenAIGPTAudioConfig,
+    )
+    from .llms.nvidia_nim.chat.transformation import NvidiaNimConfig
+    from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
+    from .llms.featherless_ai.chat.transformation import FeatherlessAIConfig
+    from .llms.cerebras.chat import CerebrasConfig
+    from .llms.sambanova.chat import SambanovaConfig
+    from .llms.sambanova.embedding.transformation import SambaNovaEmbeddingConfig
+    from .llms.ai21.chat.transformation import AI21ChatConfig
+    from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
+    from .llms.fireworks_ai.completion.transformation import (
+        FireworksAITextCompletionConfig,
+    )
+    from .llms.fireworks_ai.audio_transcription.transformation import (
+        FireworksAIAudioTranscriptionConfig,
+    )
+    from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
+        FireworksAIEmbeddingConfig,
+    )
+    from .llms.friendliai.chat.transformation import FriendliaiChatConfig
+    from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
+    from .llms.xai.chat.transformation import XAIChatConfig
+    from .llms.xai.common_utils import XAIModelInfo
+    from .llms.volcengine import VolcEngineConfig
+    from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
+    from .llms.azure.azure import (
+        AzureOpenAIError,
+        AzureOpenAIAssistantsAPIConfig,
+    )
+    from .llms.cometapi.chat.transformation import CometAPIConfig
+    from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
+    from .llms.azure.chat.gpt_5_transformation import AzureOpenAIGPT5Config
+    from .llms.azure.completion.transformation import AzureOpenAITextConfig
+    from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
+    from .llms.llamafile.chat.transformation import LlamafileChatConfig
+    from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
+    from .llms.vllm.completion.transformation import VLLMConfig
+    from .llms.deepseek.chat.transformation import DeepSeekChatConfig
+    from .llms.lm_studio.chat.transformation import LMStudioChatConfig
+    from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
+    from .llms.nscale.chat.transformation import NscaleConfig
+    from .llms.perplexity.chat.transformation import PerplexityChatConfig
+    from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
+    from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
+    from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
+    from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
+    from .llms.github_copilot.chat.transformation import GithubCopilotConfig
+    from .llms.nebius.chat.transformation import NebiusConfig
+    from .llms.dashscope.chat.transformation import DashScopeChatConfig
+    from .llms.moonshot.chat.transformation import MoonshotChatConfig
+    from .llms.v0.chat.transformation import V0ChatConfig
+    from .llms.oci.chat.transformation import OCIChatConfig
+    from .llms.morph.chat.transformation import MorphChatConfig
+    from .llms.lambda_ai.chat.transformation import LambdaAIChatConfig
+    from .llms.hyperbolic.chat.transformation import HyperbolicChatConfig
+
+    vertexAITextEmbeddingConfig: VertexAITextEmbeddingConfig
+    openaiOSeriesConfig: OpenAIOSeriesConfig
+    openAIGPTConfig: OpenAIGPTConfig
+    openAIGPTAudioConfig: OpenAIGPTAudioConfig
+    openAIGPT5Config: OpenAIGPT5Config
+    nvidiaNimConfig: NvidiaNimConfig
+    nvidiaNimEmbeddingConfig: NvidiaNimEmbeddingConfig
+
+from ._lazy_imports import LAZY_PROVIDER_CONFIG_INSTANCES, LAZY_PROVIDER_CONFIGS
+
+
+def __getattr__(name: str) -> Any:
+    """Import provider configs (and their default instances) on first access"""
+    if name in LAZY_PROVIDER_CONFIGS:
+        import importlib
+
+        module_name, attribute_name = LAZY_PROVIDER_CONFIGS[name]
+        value = getattr(importlib.import_module(module_name), attribute_name)
+    elif name in LAZY_PROVIDER_CONFIG_INSTANCES:
+        value = __getattr__(LAZY_PROVIDER_CONFIG_INSTANCES[name])()
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(
+        set(globals())
+        | set(LAZY_PROVIDER_CONFIGS)
+        | set(LAZY_PROVIDER_CONFIG_INSTANCES)
+    )
 
-vertexAITextEmbeddingConfig = VertexAITextEmbeddingConfig()
 
-from .llms.vertex_ai.vertex_ai_partner_models.anthropic.transformation import (
-    VertexAIAnthropicConfig,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.llama3.transformation import (
-    VertexAILlama3Config,
-)
-from .llms.vertex_ai.vertex_ai_partner_models.ai21.transformation import (
-    VertexAIAi21Config,
-)
-from .llms.ollama.chat.transformation import OllamaChatConfig
-from .llms.ollama.completion.transformation import OllamaConfig
-from .llms.sagemaker.completion.transformation import SagemakerConfig
-from .llms.sagemaker.chat.transformation import SagemakerChatConfig
-from .llms.bedrock.chat.invoke_handler import (
-    AmazonCohereChatConfig,
-    bedrock_tool_name_mappings,
-)
-
-from .llms.bedrock.common_utils import (
-    AmazonBedrockGlobalConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_ai21_transformation import (
-    AmazonAI21Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_nova_transformation import (
-    AmazonInvokeNovaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude2_transformation import (
-    AmazonAnthropicConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.anthropic_claude3_transformation import (
-    AmazonAnthropicClaudeConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_cohere_transformation import (
-    AmazonCohereConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_llama_transformation import (
-    AmazonLlamaConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_deepseek_transformation import (
-    AmazonDeepSeekR1Config,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_mistral_transformation import (
-    AmazonMistralConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.amazon_titan_transformation import (
-    AmazonTitanConfig,
-)
-from .llms.bedrock.chat.invoke_transformations.base_invoke_transformation import (
-    AmazonInvokeConfig,
-)
-
-from .llms.bedrock.image.amazon_stability1_transformation import AmazonStabilityConfig
-from .llms.bedrock.image.amazon_stability3_transformation import AmazonStability3Config
-from .llms.bedrock.image.amazon_nova_canvas_transformation import AmazonNovaCanvasConfig
-from .llms.bedrock.embed.amazon_titan_g1_transformation import AmazonTitanG1Config
-from .llms.bedrock.embed.amazon_titan_multimodal_transformation import (
-    AmazonTitanMultimodalEmbeddingG1Config,
-)
-from .llms.bedrock.embed.amazon_titan_v2_transformation import (
-    AmazonTitanV2Config,
-)
-from .llms.cohere.chat.transformation import CohereChatConfig
-from .llms.bedrock.embed.cohere_transformation import BedrockCohereEmbeddingConfig
-from .llms.openai.openai import OpenAIConfig, MistralEmbeddingConfig
-from .llms.openai.image_variations.transformation import OpenAIImageVariationConfig
-from .llms.deepinfra.chat.transformation import DeepInfraConfig
-from .llms.deepgram.audio_transcription.transformation import (
-    DeepgramAudioTranscriptionConfig,
-)
-from .llms.topaz.common_utils import TopazModelInfo
-from .llms.topaz.image_variations.transformation import TopazImageVariationConfig
-from litellm.llms.openai.completion.transformation import OpenAITextCompletionConfig
-from .llms.groq.chat.transformation import GroqChatConfig
-from .llms.voyage.embedding.transformation import VoyageEmbeddingConfig
-from .llms.infinity.embedding.transformation import InfinityEmbeddingConfig
-from .llms.azure_ai.chat.transformation import AzureAIStudioConfig
-from .llms.mistral.chat.transformation import MistralConfig
-from .llms.openai.responses.transformation import OpenAIResponsesAPIConfig
-from .llms.azure.responses.transformation import AzureOpenAIResponsesAPIConfig
-from .llms.azure.responses.o_series_transformation import AzureOpenAIOSeriesResponsesAPIConfig
-from .llms.openai.chat.o_series_transformation import (
-    OpenAIOSeriesConfig as OpenAIO1Config,  # maintain backwards compatibility
-    OpenAIOSeriesConfig,
-)
-
-from .llms.snowflake.chat.transformation import SnowflakeConfig
-from .llms.gradient_ai.chat.transformation import GradientAIConfig
-openaiOSeriesConfig = OpenAIOSeriesConfig()
-from .llms.openai.chat.gpt_transformation import (
-    OpenAIGPTConfig,
-)
-from .llms.openai.chat.gpt_5_transformation import (
-    OpenAIGPT5Config,
-)
-from .llms.openai.transcriptions.whisper_transformation import (
-    OpenAIWhisperAudioTranscriptionConfig,
-)
-from .llms.openai.transcriptions.gpt_transformation import (
-    OpenAIGPTAudioTranscriptionConfig,
-)
-
-openAIGPTConfig = OpenAIGPTConfig()
-from .llms.openai.chat.gpt_audio_transformation import (
-    OpenAIGPTAudioConfig,
-)
-
-openAIGPTAudioConfig = OpenAIGPTAudioConfig()
-openAIGPT5Config = OpenAIGPT5Config()
-
-from .llms.nvidia_nim.chat.transformation import NvidiaNimConfig
-from .llms.nvidia_nim.embed import NvidiaNimEmbeddingConfig
-
-nvidiaNimConfig = NvidiaNimConfig()
-nvidiaNimEmbeddingConfig = NvidiaNimEmbeddingConfig()
-
-from .llms.featherless_ai.chat.transformation import FeatherlessAIConfig
-from .llms.cerebras.chat import CerebrasConfig
-from .llms.sambanova.chat import SambanovaConfig
-from .llms.sambanova.embedding.transformation import SambaNovaEmbeddingConfig
-from .llms.ai21.chat.transformation import AI21ChatConfig
-from .llms.fireworks_ai.chat.transformation import FireworksAIConfig
-from .llms.fireworks_ai.completion.transformation import FireworksAITextCompletionConfig
-from .llms.fireworks_ai.audio_transcription.transformation import (
-    FireworksAIAudioTranscriptionConfig,
-)
-from .llms.fireworks_ai.embed.fireworks_ai_transformation import (
-    FireworksAIEmbeddingConfig,
-)
-from .llms.friendliai.chat.transformation import FriendliaiChatConfig
-from .llms.jina_ai.embedding.transformation import JinaAIEmbeddingConfig
-from .llms.xai.chat.transformation import XAIChatConfig
-from .llms.xai.common_utils import XAIModelInfo
-from .llms.volcengine import VolcEngineConfig
-from .llms.codestral.completion.transformation import CodestralTextCompletionConfig
-from .llms.azure.azure import (
-    AzureOpenAIError,
-    AzureOpenAIAssistantsAPIConfig,
-)
-from .llms.cometapi.chat.transformation import CometAPIConfig
-from .llms.azure.chat.gpt_transformation import AzureOpenAIConfig
-from .llms.azure.chat.gpt_5_transformation import AzureOpenAIGPT5Config
-from .llms.azure.completion.transformation import AzureOpenAITextConfig
-from .llms.hosted_vllm.chat.transformation import HostedVLLMChatConfig
-from .llms.llamafile.chat.transformation import LlamafileChatConfig
-from .llms.litellm_proxy.chat.transformation import LiteLLMProxyChatConfig
-from .llms.vllm.completion.transformation import VLLMConfig
-from .llms.deepseek.chat.transformation import DeepSeekChatConfig
-from .llms.lm_studio.chat.transformation import LMStudioChatConfig
-from .llms.lm_studio.embed.transformation import LmStudioEmbeddingConfig
-from .llms.nscale.chat.transformation import NscaleConfig
-from .llms.perplexity.chat.transformation import PerplexityChatConfig
-from .llms.azure.chat.o_series_transformation import AzureOpenAIO1Config
-from .llms.watsonx.completion.transformation import IBMWatsonXAIConfig
-from .llms.watsonx.chat.transformation import IBMWatsonXChatConfig
-from .llms.watsonx.embed.transformation import IBMWatsonXEmbeddingConfig
-from .llms.github_copilot.chat.transformation import GithubCopilotConfig
-from .llms.nebius.chat.transformation import NebiusConfig
-from .llms.dashscope.chat.transformation import DashScopeChatConfig
-from .llms.moonshot.chat.transformation import MoonshotChatConfig
-from .llms.v0.chat.transformation import V0ChatConfig
-from .llms.oci.chat.transformation import OCIChatConfig
-from .llms.morph.chat.transformation import MorphChatConfig
-from .llms.lambda_ai.chat.transformation import LambdaAIChatConfig
-from .llms.hyperbolic.chat.transformation import HyperbolicChatConfig
 from .main import *  # type: ignore
+# re-exports the integration modules `.main` already imported (via litellm_logging) - imports nothing new
 from .integrations import *
 from .llms.custom_httpx.async_client_cleanup import close_litellm_async_clients
 from .exceptions import (
@@ -3,6 +3,7 @@ from .caching import Cache, LiteLLMCacheType
 from .disk_cache import DiskCache
 from .dual_cache import DualCache
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_cluster_cache import RedisClusterCache
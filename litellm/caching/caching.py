@@ -8,7 +8,6 @@
 #  Thank you users! We ❤️ you! - Krrish & Ishaan
 
 import ast
-import hashlib
 import json
 import time
 import traceback
@@ -26,10 +25,12 @@ from litellm.types.utils import EmbeddingResponse, all_litellm_params
 
 from .azure_blob_cache import AzureBlobCache
 from .base_cache import BaseCache
+from .cache_key_hasher import CacheKeyHasher
 from .disk_cache import DiskCache
 from .dual_cache import DualCache  # noqa
 from .gcs_cache import GCSCache
 from .in_memory_cache import InMemoryCache
+from .local_semantic_cache import LocalSemanticCache
 from .qdrant_semantic_cache import QdrantSemanticCache
 from .redis_cache import RedisCache
 from .redis_cluster_cache import RedisClusterCache
@@ -106,16 +107,21 @@ class Cache:
         qdrant_collection_name: Optional[str] = None,
         qdrant_quantization_config: Optional[str] = None,
         qdrant_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        local_semantic_cache_embedding_model: str = "text-embedding-ada-002",
+        local_semantic_cache_max_size: Optional[int] = None,
+        local_semantic_cache_persist_path: Optional[str] = None,
         # GCP IAM authentication parameters
         gcp_service_account: Optional[str] = None,
         gcp_ssl_ca_certs: Optional[str] = None,
+        enable_request_coalescing: bool = False,
+        stream_replay_pacing: bool = False,
         **kwargs,
     ):
         """
         Initializes the cache based on the given type.
 
         Args:
-            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "s3" or "disk". Defaults to "local".
+            type (str, optional): The type of cache to initialize. Can be "local", "redis", "redis-semantic", "qdrant-semantic", "local-semantic", "s3" or "disk". Defaults to "local".
 
             # Redis Cache Args
             host (str, optional): The host address for the Redis cache. Required if type is "redis".
@@ -130,7 +136,12 @@ class Cache:
             qdrant_api_base (str, optional): The url for your qdrant cluster. Required if type is "qdrant-semantic".
             qdrant_api_key (str, optional): The api_key for the local or cloud qdrant cluster.
             qdrant_collection_name (str, optional): The name for your qdrant collection. Required if type is "qdrant-semantic".
-            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic" or "qdrant-semantic".
+            similarity_threshold (float, optional): The similarity threshold for semantic-caching, Required if type is "redis-semantic", "qdrant-semantic" or "local-semantic".
+
+            # Local Semantic Cache Args (requires numpy)
+            local_semantic_cache_embedding_model (str, optional): The embedding model for the local semantic cache. Defaults to "text-embedding-ada-002".
+            local_semantic_cache_max_size (int, optional): Max cached prompts, the least recently used are evicted past this. Defaults to LOCAL_SEMANTIC_CACHE_MAX_SIZE.
+            local_semantic_cache_persist_path (str, optional): Directory to persist the local semantic cache to. Defaults to None (in-memory only).
 
             # Disk Cache Args
             disk_cache_dir (str, optional): The directory for the disk cache. Defaults to None.
@@ -154,6 +165,8 @@ class Cache:
 
             # Common Cache Args
             supported_call_types (list, optional): List of call types to cache for. Defaults to cache == on for all call types.
+            enable_request_coalescing (bool, optional): If True, identical completion requests in flight at the same time share one upstream call. Defaults to False.
+            stream_replay_pacing (bool, optional): If True, cached streams are replayed with the chunk timing of the original response. Defaults to False.
             **kwargs: Additional keyword arguments for redis.Redis() cache
 
         Raises:
@@ -206,6 +219,13 @@ class Cache:
                 quantization_config=qdrant_quantization_config,
                 embedding_model=qdrant_semantic_cache_embedding_model,
             )
+        elif type == LiteLLMCacheType.LOCAL_SEMANTIC:
+            self.cache = LocalSemanticCache(
+                similarity_threshold=similarity_threshold,
+                embedding_model=local_semantic_cache_embedding_model,
+                max_size=local_semantic_cache_max_size,
+                persist_path=local_semantic_cache_persist_path,
+            )
         elif type == LiteLLMCacheType.LOCAL:
             self.cache = InMemoryCache()
         elif type == LiteLLMCacheType.S3:
@@ -248,6 +268,8 @@ class Cache:
         self.redis_flush_size = redis_flush_size
         self.ttl = ttl
         self.mode: CacheMode = mode or CacheMode.default_on
+        self.enable_request_coalescing = enable_request_coalescing
+        self.stream_replay_pacing = stream_replay_pacing
 
         if self.type == LiteLLMCacheType.LOCAL and default_in_memory_ttl is not None:
             self.ttl = default_in_memory_ttl
@@ -271,9 +293,6 @@ class Cache:
         Returns:
             str: The cache key generated from the arguments, or None if no cache key could be generated.
         """
-        cache_key = ""
-        # verbose_logger.debug("\nGetting Cache key. Kwargs: %s", kwargs)
-
         preset_cache_key = self._get_preset_cache_key_from_kwargs(**kwargs)
         if preset_cache_key is not None:
             verbose_logger.debug("\nReturning preset cache key: %s", preset_cache_key)
@@ -281,11 +300,12 @@ class Cache:
 
         combined_kwargs = ModelParamHelper._get_all_llm_api_params()
         litellm_param_kwargs = all_litellm_params
+        cache_key_params: List[Tuple[str, Any]] = []
         for param in kwargs:
             if param in combined_kwargs:
                 param_value: Optional[str] = self._get_param_value(param, kwargs)
                 if param_value is not None:
-                    cache_key += f"{str(param)}: {str(param_value)}"
+                    cache_key_params.append((param, param_value))
             elif (
                 param not in litellm_param_kwargs
             ):  # check if user passed in optional param - e.g. top_k
@@ -294,11 +314,14 @@ class Cache:
                 ):  # feature flagged for now
                     if kwargs[param] is None:
                         continue  # ignore None params
-                    param_value = kwargs[param]
-                    cache_key += f"{str(param)}: {str(param_value)}"
-
-        verbose_logger.debug("\nCreated cache key: %s", cache_key)
-        hashed_cache_key = Cache._get_hashed_cache_key(cache_key)
+                    cache_key_params.append((param, kwargs[param]))
+
+        # sorted, so the key doesn't depend on the order kwargs were passed in
+        hasher = CacheKeyHasher()
+        for param, param_value in sorted(cache_key_params, key=lambda p: p[0]):
+            hasher.update(param, param_value)
+        hashed_cache_key = hasher.hexdigest()
+        verbose_logger.debug("Hashed cache key (SHA-256): %s", hashed_cache_key)
         hashed_cache_key = self._add_namespace_to_cache_key(hashed_cache_key, **kwargs)
         self._set_preset_cache_key_in_kwargs(
             preset_cache_key=hashed_cache_key, **kwargs
@@ -386,25 +409,6 @@ class Cache:
             if "litellm_params" in kwargs:
                 kwargs["litellm_params"]["preset_cache_key"] = preset_cache_key
 
-    @staticmethod
-    def _get_hashed_cache_key(cache_key: str) -> str:
-        """
-        Get the hashed cache key for the given cache key.
-
-        Use hashlib to create a sha256 hash of the cache key
-
-        Args:
-            cache_key (str): The cache key to hash.
-
-        Returns:
-            str: The hashed cache key.
-        """
-        hash_object = hashlib.sha256(cache_key.encode())
-        # Hexadecimal representation of the hash
-        hash_hex = hash_object.hexdigest()
-        verbose_logger.debug("Hashed cache key (SHA-256): %s", hash_hex)
-        return hash_hex
-
     def _add_namespace_to_cache_key(self, hash_hex: str, **kwargs) -> str:
         """
         If a redis namespace is provided, add it to the cache key
@@ -18,6 +18,9 @@ import asyncio
 import datetime
 import inspect
 import threading
+import time
+import weakref
+from concurrent.futures import TimeoutError as FutureTimeoutError
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -31,12 +34,20 @@ from typing import (
     Union,
 )
 
+import httpx
 from pydantic import BaseModel
 
 import litellm
 from litellm._logging import print_verbose, verbose_logger
 from litellm.caching import InMemoryCache
 from litellm.caching.caching import S3Cache
+from litellm.caching.request_coalescing import RequestCoalescer, StreamTee
+from litellm.caching.stream_cache import (
+    InProgressStreamCache,
+    StreamCacheEntry,
+    is_cached_stream,
+)
+from litellm.litellm_core_utils.logging_dispatcher import logging_dispatcher
 from litellm.litellm_core_utils.logging_utils import (
     _assemble_complete_response_from_streaming_chunks,
 )
@@ -47,6 +58,7 @@ from litellm.types.utils import (
     Embedding,
     EmbeddingResponse,
     ModelResponse,
+    ModelResponseStream,
     TextCompletionResponse,
     TranscriptionResponse,
     Usage,
@@ -75,6 +87,8 @@ class CachingHandlerResponse(BaseModel):
 
 
 in_memory_cache_obj = InMemoryCache()
+request_coalescer = RequestCoalescer()
+in_progress_stream_cache = InProgressStreamCache()
 
 
 class LLMCachingHandler:
@@ -91,6 +105,9 @@ class LLMCachingHandler:
         self.request_kwargs = request_kwargs
         self.original_function = original_function
         self.start_time = start_time
+        self.stream_cache_key: Optional[str] = None
+        self.stream_cache_entry: Optional[StreamCacheEntry] = None
+        self._is_stream_cacheable: Optional[bool] = None
         if litellm.cache is not None and isinstance(litellm.cache.cache, RedisCache):
             self.dual_cache: Optional[DualCache] = DualCache(
                 redis_cache=litellm.cache.cache,
@@ -262,9 +279,14 @@ class LLMCachingHandler:
             original_function=original_function
         ):
             print_verbose("Checking Sync Cache")
-            cached_result = litellm.cache.get_cache(**new_kwargs)
+            cached_result = self._get_in_progress_stream_cache_entry(
+                kwargs=new_kwargs, is_async=False
+            ) or litellm.cache.get_cache(**new_kwargs)
             if cached_result is not None:
-                if "detail" in cached_result:
+                if (
+                    not isinstance(cached_result, StreamCacheEntry)
+                    and "detail" in cached_result
+                ):
                     # implies an error occurred
                     pass
                 else:
@@ -301,10 +323,13 @@ class LLMCachingHandler:
                         is_async=False,
                     )
 
-                    threading.Thread(
-                        target=logging_obj.success_handler,
-                        args=(cached_result, start_time, end_time, cache_hit),
-                    ).start()
+                    logging_dispatcher.submit(
+                        logging_obj.success_handler,
+                        cached_result,
+                        start_time,
+                        end_time,
+                        cache_hit,
+                    )
                     cache_key = litellm.cache._get_preset_cache_key_from_kwargs(
                         **kwargs
                     )
@@ -535,10 +560,13 @@ class LLMCachingHandler:
                 cached_result, start_time, end_time, cache_hit
             )
         )
-        threading.Thread(
-            target=logging_obj.success_handler,
-            args=(cached_result, start_time, end_time, cache_hit),
-        ).start()
+        logging_dispatcher.submit(
+            logging_obj.success_handler,
+            cached_result,
+            start_time,
+            end_time,
+            cache_hit,
+        )
 
     async def _retrieve_from_cache(
         self, call_type: str, kwargs: Dict[str, Any], args: Tuple[Any, ...]
@@ -594,6 +622,11 @@ class LLMCachingHandler:
                 if all(result is None for result in cached_result):
                     cached_result = None
         else:
+            cached_result = self._get_in_progress_stream_cache_entry(
+                kwargs=new_kwargs, is_async=True
+            )
+            if cached_result is not None:
+                return cached_result
             if litellm.cache._supports_async() is True:
                 ## check if dual cache is supported ##
                 cached_result = await litellm.cache.async_get_cache(
@@ -647,13 +680,15 @@ class LLMCachingHandler:
         if (
             call_type == CallTypes.acompletion.value
             or call_type == CallTypes.completion.value
-        ) and isinstance(cached_result, dict):
+        ) and isinstance(cached_result, (dict, StreamCacheEntry)):
             if kwargs.get("stream", False) is True:
                 cached_result = self._convert_cached_stream_response(
                     cached_result=cached_result,
                     call_type=call_type,
                     logging_obj=logging_obj,
                     model=model,
+                    kwargs=kwargs,
+                    args=args,
                 )
             else:
                 cached_result = convert_to_model_response_object(
@@ -670,6 +705,8 @@ class LLMCachingHandler:
                     call_type=call_type,
                     logging_obj=logging_obj,
                     model=model,
+                    kwargs=kwargs,
+                    args=args,
                 )
             else:
                 cached_result = TextCompletionResponse(**cached_result)
@@ -721,7 +758,12 @@ class LLMCachingHandler:
         call_type: str,
         logging_obj: LiteLLMLoggingObj,
         model: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
     ) -> CustomStreamWrapper:
+        """
+        Replays a cached stream. For an in-progress entry, the reader falls back to its own upstream call if the writer fails before the reader got a chunk.
+        """
         from litellm.utils import (
             CustomStreamWrapper,
             convert_to_streaming_response,
@@ -729,7 +771,28 @@ class LLMCachingHandler:
         )
 
         _stream_cached_result: Union[AsyncGenerator, Generator]
-        if (
+        if isinstance(cached_result, StreamCacheEntry) or is_cached_stream(
+            cached_result
+        ):
+            stream_cache_entry = (
+                cached_result
+                if isinstance(cached_result, StreamCacheEntry)
+                else StreamCacheEntry.from_cached_value(cached_result)
+            )
+            pace = litellm.cache is not None and litellm.cache.stream_replay_pacing
+            if call_type == CallTypes.acompletion.value:
+
+                async def _async_fallback():
+                    return await self.original_function(*args, **kwargs)
+
+                _stream_cached_result = stream_cache_entry.aiter_chunks(
+                    pace=pace, fallback=_async_fallback
+                )
+            else:
+                _stream_cached_result = stream_cache_entry.iter_chunks(
+                    pace=pace, fallback=lambda: self.original_function(*args, **kwargs)
+                )
+        elif (
             call_type == CallTypes.acompletion.value
             or call_type == CallTypes.atext_completion.value
         ):
@@ -888,15 +951,106 @@ class LLMCachingHandler:
             return True
         return False
 
-    async def _add_streaming_response_to_cache(self, processed_chunk: ModelResponse):
+    def _get_in_progress_stream_cache_entry(
+        self, kwargs: Dict[str, Any], is_async: bool
+    ) -> Optional[StreamCacheEntry]:
         """
-        Internal method to add the streaming response to the cache
+        Returns the entry of an identical stream this process is still writing to the cache, if there is one
+
+        Sync calls made on an event loop thread don't follow in-progress entries - waiting on the writer would block the loop.
+        """
+        if (
+            not in_progress_stream_cache.entries
+            or litellm.cache is None
+            or kwargs.get("stream", False) is not True
+            or litellm.cache.should_use_cache(**kwargs) is not True
+        ):
+            return None
+        if not is_async and _is_event_loop_running():
+            return None
+        return in_progress_stream_cache.get(litellm.cache.get_cache_key(**kwargs))
 
+    def _add_streaming_chunk_to_cache(self, chunk: ModelResponseStream):
+        """
+        Record a chunk of a completion stream.
 
-        - If 'streaming_chunk' has a 'finish_reason' then assemble a litellm.ModelResponse object
+        The first chunk starts an in-progress entry - identical streaming requests replay it while it's still being written. The chunks are written to the cache once the stream is done.
+        """
+        if self._is_stream_cacheable is None:
+            self._is_stream_cacheable = (
+                litellm.cache is not None
+                and self.original_function.__name__
+                in (CallTypes.completion.value, CallTypes.acompletion.value)
+                and self._should_store_result_in_cache(
+                    original_function=self.original_function,
+                    kwargs=self.request_kwargs,
+                )
+                and litellm.cache.should_use_cache(**self.request_kwargs) is True
+            )
+        if self._is_stream_cacheable is not True or litellm.cache is None:
+            return
+        if self.stream_cache_entry is None:
+            self.stream_cache_key = litellm.cache.get_cache_key(**self.request_kwargs)
+            self.stream_cache_entry = in_progress_stream_cache.start(
+                key=self.stream_cache_key, start_time=self.start_time.timestamp()
+            )
+            # a writer that is dropped before the stream is done fails the entry - readers don't wait on it
+            weakref.finalize(
+                self,
+                in_progress_stream_cache.fail,
+                key=self.stream_cache_key,
+                entry=self.stream_cache_entry,
+            )
+        if not self.stream_cache_entry.is_done:
+            self.stream_cache_entry.add_chunk(chunk.model_dump(exclude_none=True))
+
+    def _fail_stream_cache_entry(self):
+        """
+        The stream failed - drop its in-progress entry, readers fall back to their own upstream call
+        """
+        if self.stream_cache_entry is None or self.stream_cache_key is None:
+            return
+        in_progress_stream_cache.fail(
+            key=self.stream_cache_key, entry=self.stream_cache_entry
+        )
+
+    def _finish_stream_cache_entry(self) -> Optional[Dict[str, str]]:
+        """
+        Mark the in-progress entry done. Returns its cached value, or None if there's nothing (left) to write.
+        """
+        if (
+            self.stream_cache_entry is None
+            or self.stream_cache_key is None
+            or self.stream_cache_entry.is_done
+        ):
+            return None
+        in_progress_stream_cache.finish(
+            key=self.stream_cache_key, entry=self.stream_cache_entry
+        )
+        return self.stream_cache_entry.to_cached_value()
+
+    async def _add_streaming_response_to_cache(
+        self, processed_chunk: Optional[ModelResponse]
+    ):
+        """
+        Internal method to add the streaming response to the cache
+
+        - If the stream's chunks were recorded, cache the chunks
+        - Else if 'streaming_chunk' has a 'finish_reason' then assemble a litellm.ModelResponse object
         - Else append the chunk to self.async_streaming_chunks
 
         """
+        if self.stream_cache_entry is not None:
+            cached_stream = self._finish_stream_cache_entry()
+            if cached_stream is not None:
+                await self.async_set_cache(
+                    result=cached_stream,
+                    original_function=self.original_function,
+                    kwargs=self.request_kwargs,
+                )
+            return
+        if processed_chunk is None:
+            return
 
         complete_streaming_response: Optional[
             Union[ModelResponse, TextCompletionResponse]
@@ -916,10 +1070,20 @@ class LLMCachingHandler:
                 kwargs=self.request_kwargs,
             )
 
-    def _sync_add_streaming_response_to_cache(self, processed_chunk: ModelResponse):
+    def _sync_add_streaming_response_to_cache(
+        self, processed_chunk: Optional[ModelResponse]
+    ):
         """
         Sync internal method to add the streaming response to the cache
         """
+        if self.stream_cache_entry is not None:
+            cached_stream = self._finish_stream_cache_entry()
+            if cached_stream is not None:
+                self.sync_set_cache(result=cached_stream, kwargs=self.request_kwargs)
+            return
+        if processed_chunk is None:
+            return
+
         complete_streaming_response: Optional[
             Union[ModelResponse, TextCompletionResponse]
         ] = _assemble_complete_response_from_streaming_chunks(
@@ -938,6 +1102,259 @@ class LLMCachingHandler:
                 kwargs=self.request_kwargs,
             )
 
+    @staticmethod
+    def _get_request_coalescing_timeout(kwargs: Dict[str, Any]) -> Optional[float]:
+        """
+        Max. time a waiter waits for the leader's response - the request's own `timeout`, like the leader's call.
+        """
+        timeout = (
+            kwargs.get("timeout")
+            or kwargs.get("request_timeout")
+            or litellm.request_timeout
+        )
+        if isinstance(timeout, httpx.Timeout):
+            return timeout.read
+        if isinstance(timeout, (int, float)):
+            return float(timeout)
+        return None
+
+    @staticmethod
+    def _get_request_coalescing_timeout_error(
+        model: str, kwargs: Dict[str, Any], timeout: Optional[float]
+    ) -> "litellm.Timeout":
+        return litellm.Timeout(
+            message="Timed out after {}s waiting for an identical in-flight request".format(
+                timeout
+            ),
+            model=model,
+            llm_provider=kwargs.get("custom_llm_provider", None) or "",
+        )
+
+    def _get_request_coalescing_key(
+        self,
+        call_type: str,
+        kwargs: Dict[str, Any],
+        args: Optional[Tuple[Any, ...]] = None,
+    ) -> Optional[str]:
+        """
+        Returns the cache key to coalesce this request on, or None if request coalescing doesn't apply
+
+        Only completion / acompletion requests are coalesced, and only if `litellm.cache` was initialized with `enable_request_coalescing=True`
+        """
+        if (
+            litellm.cache is None
+            or litellm.cache.enable_request_coalescing is not True
+            or call_type
+            not in (CallTypes.completion.value, CallTypes.acompletion.value)
+            or kwargs.get("acompletion", False)
+            is True  # sync completion() call made by acompletion() - returns a coroutine
+            or kwargs.get("caching", None) is False
+            or kwargs.get("cache", {}).get("no-cache", False) is True
+            or not self._is_call_type_supported_by_cache(
+                original_function=self.original_function
+            )
+        ):
+            return None
+        new_kwargs = kwargs.copy()
+        new_kwargs.update(
+            convert_args_to_kwargs(
+                self.original_function,
+                args,
+            )
+        )
+        return litellm.cache.get_cache_key(**new_kwargs)
+
+    async def _async_call_with_request_coalescing(
+        self,
+        original_function: Callable,
+        model: str,
+        logging_obj: LiteLLMLoggingObj,
+        start_time: datetime.datetime,
+        call_type: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> Tuple[Any, bool]:
+        """
+        Makes the model call - if an identical request is already in flight, waits for its response instead.
+
+        Returns:
+            Tuple[Any, bool]: the response, and whether it was coalesced. A coalesced response is already logged (as a cache hit) and should be returned as is.
+        """
+        key = self._get_request_coalescing_key(
+            call_type=call_type, kwargs=kwargs, args=args
+        )
+        if key is None:
+            return await original_function(*args, **kwargs), False
+
+        in_flight_request, is_leader = request_coalescer.join(
+            key=key, loop=asyncio.get_running_loop()
+        )
+        if in_flight_request is None:
+            return await original_function(*args, **kwargs), False
+        if is_leader:
+            try:
+                result = await original_function(*args, **kwargs)
+            except BaseException as e:
+                request_coalescer.set_exception(
+                    key=key, in_flight_request=in_flight_request, exception=e
+                )
+                raise
+            return (
+                request_coalescer.set_response(
+                    key=key, in_flight_request=in_flight_request, response=result
+                ),
+                False,
+            )
+
+        wait_start_time = time.time()
+        timeout = self._get_request_coalescing_timeout(kwargs=kwargs)
+        try:
+            response = await asyncio.wait_for(
+                asyncio.wrap_future(in_flight_request.response), timeout=timeout
+            )
+        except asyncio.TimeoutError:
+            raise self._get_request_coalescing_timeout_error(
+                model=model, kwargs=kwargs, timeout=timeout
+            )
+        if response is None:  # leader was cancelled
+            return await original_function(*args, **kwargs), False
+        asyncio.create_task(
+            request_coalescer.async_log_coalesced_request(
+                call_type=call_type, duration=time.time() - wait_start_time
+            )
+        )
+        result = self._convert_coalesced_response(
+            response=response,
+            model=model,
+            logging_obj=logging_obj,
+            kwargs=kwargs,
+            is_async=True,
+        )
+        if not isinstance(response, StreamTee):
+            self._async_log_cache_hit_on_callbacks(
+                logging_obj=logging_obj,
+                cached_result=result,
+                start_time=start_time,
+                end_time=datetime.datetime.now(),
+                cache_hit=True,
+            )
+        return result, True
+
+    def _sync_call_with_request_coalescing(
+        self,
+        original_function: Callable,
+        model: str,
+        logging_obj: LiteLLMLoggingObj,
+        start_time: datetime.datetime,
+        call_type: str,
+        kwargs: Dict[str, Any],
+        args: Tuple[Any, ...],
+    ) -> Tuple[Any, bool]:
+        """
+        Sync version of `_async_call_with_request_coalescing`
+        """
+        key = self._get_request_coalescing_key(
+            call_type=call_type, kwargs=kwargs, args=args
+        )
+        if key is None:
+            return original_function(*args, **kwargs), False
+
+        in_flight_request, is_leader = request_coalescer.join(key=key)
+        if in_flight_request is None:
+            return original_function(*args, **kwargs), False
+        if is_leader:
+            try:
+                result = original_function(*args, **kwargs)
+            except BaseException as e:
+                request_coalescer.set_exception(
+                    key=key, in_flight_request=in_flight_request, exception=e
+                )
+                raise
+            return (
+                request_coalescer.set_response(
+                    key=key, in_flight_request=in_flight_request, response=result
+                ),
+                False,
+            )
+
+        wait_start_time = time.time()
+        timeout = self._get_request_coalescing_timeout(kwargs=kwargs)
+        try:
+            response = in_flight_request.response.result(timeout=timeout)
+        except FutureTimeoutError:
+            raise self._get_request_coalescing_timeout_error(
+                model=model, kwargs=kwargs, timeout=timeout
+            )
+        if response is None:  # leader was cancelled
+            return original_function(*args, **kwargs), False
+        request_coalescer.log_coalesced_request(
+            call_type=call_type, duration=time.time() - wait_start_time
+        )
+        result = self._convert_coalesced_response(
+            response=response,
+            model=model,
+            logging_obj=logging_obj,
+            kwargs=kwargs,
+            is_async=False,
+        )
+        if not isinstance(response, StreamTee):
+            logging_dispatcher.submit(
+                logging_obj.success_handler,
+                result,
+                start_time,
+                datetime.datetime.now(),
+                True,
+            )
+        return result, True
+
+    def _convert_coalesced_response(
+        self,
+        response: Any,
+        model: str,
+        logging_obj: LiteLLMLoggingObj,
+        kwargs: Dict[str, Any],
+        is_async: bool,
+    ) -> Any:
+        """
+        Give a waiter its own copy of the leader's response.
+
+        Streams are replayed from the leader's StreamTee. The waiter's request is logged as a cache hit - it never made an upstream call.
+        """
+        from litellm.utils import CustomStreamWrapper
+
+        model, custom_llm_provider, _, _ = litellm.get_llm_provider(
+            model=model,
+            custom_llm_provider=kwargs.get("custom_llm_provider", None),
+            api_base=kwargs.get("api_base", None),
+            api_key=kwargs.get("api_key", None),
+        )
+        if isinstance(response, StreamTee):
+            result: Any = CustomStreamWrapper(
+                completion_stream=(
+                    response.aiter_chunks(copy_chunks=True)
+                    if is_async
+                    else response.iter_chunks(copy_chunks=True)
+                ),
+                model=model,
+                custom_llm_provider="cached_response",
+                logging_obj=logging_obj,
+            )
+        elif isinstance(response, BaseModel):
+            result = response.model_copy(deep=True)
+        else:
+            result = response
+        self._update_litellm_logging_obj_environment(
+            logging_obj=logging_obj,
+            model=model,
+            kwargs=kwargs,
+            cached_result=result,
+            is_async=is_async,
+            custom_llm_provider=custom_llm_provider,
+        )
+        if hasattr(result, "_hidden_params"):
+            result._hidden_params["coalesced_request"] = True
+        return result
+
     def _update_litellm_logging_obj_environment(
         self,
         logging_obj: LiteLLMLoggingObj,
@@ -1018,3 +1435,11 @@ def convert_args_to_kwargs(
                 args_to_kwargs[param_name] = arg
 
     return args_to_kwargs
+
+
+def _is_event_loop_running() -> bool:
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
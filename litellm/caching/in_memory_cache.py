@@ -8,17 +8,25 @@ Has 4 methods:
     - async_get_cache
 """
 
+import asyncio
+import heapq
 import json
 import sys
 import time
-from typing import TYPE_CHECKING, Any, List, Optional
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 if TYPE_CHECKING:
+    from litellm._service_logger import ServiceLogging
     from litellm.types.caching import RedisPipelineIncrementOperation
 
 from pydantic import BaseModel
 
-from litellm.constants import MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
+from litellm.constants import (
+    DEFAULT_MAX_SIZE_IN_MEMORY_CACHE,
+    MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB,
+)
+from litellm.types.caching import InMemoryCacheStats
 
 from .base_cache import BaseCache
 
@@ -26,26 +34,44 @@ from .base_cache import BaseCache
 class InMemoryCache(BaseCache):
     def __init__(
         self,
-        max_size_in_memory: Optional[int] = 200,
+        max_size_in_memory: Optional[int] = DEFAULT_MAX_SIZE_IN_MEMORY_CACHE,
         default_ttl: Optional[
             int
         ] = 600,  # default ttl is 10 minutes. At maximum litellm rate limiting logic requires objects to be in memory for 1 minute
         max_size_per_item: Optional[int] = 1024,  # 1MB = 1024KB
+        namespace_max_size_in_memory: Optional[Dict[str, int]] = None,
     ):
         """
-        max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Use 200 items as a default
+        max_size_in_memory [int]: Maximum number of items in cache. done to prevent memory leaks. Least recently used items are evicted past it. Use 10,000 items as a default
+        namespace_max_size_in_memory [dict]: Optional per-namespace item budgets, keyed by key prefix. e.g. {"deployment:": 50}
         """
         self.max_size_in_memory = (
-            max_size_in_memory or 200
-        )  # set an upper bound of 200 items in-memory
+            max_size_in_memory or DEFAULT_MAX_SIZE_IN_MEMORY_CACHE
+        )  # set an upper bound of 10,000 items in-memory
         self.default_ttl = default_ttl or 600
         self.max_size_per_item = (
             max_size_per_item or MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB
         )  # 1MB = 1024KB
 
-        # in-memory cache
-        self.cache_dict: dict = {}
+        # in-memory cache - ordered by recency of use (LRU first)
+        self.cache_dict: OrderedDict = OrderedDict()
         self.ttl_dict: dict = {}
+        # min-heap of (expiry_time, key). Entries are lazily invalidated - an entry is stale if ttl_dict[key] != expiry_time
+        self.expiration_heap: List[Tuple[float, str]] = []
+
+        # per-namespace budgets - namespace prefix -> keys in LRU order
+        self.namespace_max_size_in_memory: Dict[str, int] = (
+            namespace_max_size_in_memory or {}
+        )
+        self.namespace_keys: Dict[str, OrderedDict] = {
+            namespace: OrderedDict() for namespace in self.namespace_max_size_in_memory
+        }
+
+        # counters - exposed via get_cache_stats / async_emit_cache_stats
+        self.cache_hits: int = 0
+        self.cache_misses: int = 0
+        self.cache_evictions: int = 0
+        self.cache_expirations: int = 0
 
     def check_value_size(self, value: Any):
         """
@@ -93,12 +119,67 @@ class InMemoryCache(BaseCache):
         """
         return key in self.ttl_dict and time.time() > self.ttl_dict[key]
 
+    def _get_key_namespace(self, key: str) -> Optional[str]:
+        """
+        Return the configured namespace (key prefix) a key belongs to, if any
+        """
+        if not self.namespace_max_size_in_memory or not isinstance(key, str):
+            return None
+        for namespace in self.namespace_max_size_in_memory:
+            if key.startswith(namespace):
+                return namespace
+        return None
+
     def _remove_key(self, key: str) -> None:
         """
         Remove a key from both cache_dict and ttl_dict
         """
         self.cache_dict.pop(key, None)
         self.ttl_dict.pop(key, None)
+        if self.namespace_keys:
+            namespace = self._get_key_namespace(key)
+            if namespace is not None:
+                self.namespace_keys[namespace].pop(key, None)
+
+    def _set_key_ttl(self, key: str, ttl_time: float) -> None:
+        """
+        Set the expiry time of a key, and track it in the expiration heap
+        """
+        self.ttl_dict[key] = ttl_time
+        heapq.heappush(self.expiration_heap, (ttl_time, key))
+        # compact stale heap entries (left behind by deleted / evicted keys), amortized O(1)
+        if len(self.expiration_heap) > 2 * max(len(self.ttl_dict), 64):
+            self.expiration_heap = [(v, k) for k, v in self.ttl_dict.items()]
+            heapq.heapify(self.expiration_heap)
+
+    def _evict_expired_keys(self, current_time: Optional[float] = None) -> None:
+        """
+        Pop expired keys off the expiration heap. Only touches expired (or stale) entries.
+        """
+        current_time = current_time or time.time()
+        heap = self.expiration_heap
+        while heap and heap[0][0] < current_time:
+            ttl_time, key = heapq.heappop(heap)
+            if self.ttl_dict.get(key) == ttl_time:  # skip stale entries
+                self._remove_key(key)
+                self.cache_expirations += 1
+
+    def _evict_lru_keys(self, key: str) -> None:
+        """
+        Make room for `key` - evict least recently used keys until the global / namespace budget allows one more item.
+        """
+        if self.namespace_keys:
+            namespace = self._get_key_namespace(key)
+            if namespace is not None:
+                namespace_keys = self.namespace_keys[namespace]
+                max_size = self.namespace_max_size_in_memory[namespace]
+                while namespace_keys and len(namespace_keys) >= max_size:
+                    self._remove_key(next(iter(namespace_keys)))
+                    self.cache_evictions += 1
+
+        while self.cache_dict and len(self.cache_dict) >= self.max_size_in_memory:
+            self._remove_key(next(iter(self.cache_dict)))
+            self.cache_evictions += 1
 
     def evict_cache(self):
         """
@@ -111,10 +192,12 @@ class InMemoryCache(BaseCache):
         - 2. When ttl is set: the item will remain in memory for at least that amount of time
         - 3. the size of in-memory cache is bounded
 
+        Note: set_cache does not call this (full scan). It pops expired keys off the expiration heap and falls back to LRU eviction.
         """
         for key in list(self.ttl_dict.keys()):
             if self._is_key_expired(key):
                 self._remove_key(key)
+                self.cache_expirations += 1
 
                 # de-reference the removed item
                 # https://www.geeksforgeeks.org/diagnosing-and-fixing-memory-leaks-in-python/
@@ -134,18 +217,30 @@ class InMemoryCache(BaseCache):
             return False
 
     def set_cache(self, key, value, **kwargs):
-        if len(self.cache_dict) >= self.max_size_in_memory:
-            # only evict when cache is full
-            self.evict_cache()
         if not self.check_value_size(value):
             return
 
+        current_time = time.time()
+        if key in self.cache_dict:
+            self.cache_dict.move_to_end(key)
+        else:
+            if len(self.cache_dict) >= self.max_size_in_memory:
+                # only evict when cache is full - expired keys first, then least recently used
+                self._evict_expired_keys(current_time=current_time)
+            self._evict_lru_keys(key)
+
         self.cache_dict[key] = value
+        if self.namespace_keys:
+            namespace = self._get_key_namespace(key)
+            if namespace is not None:
+                self.namespace_keys[namespace][key] = None
+                self.namespace_keys[namespace].move_to_end(key)
+
         if self.allow_ttl_override(key):  # if ttl is not set, set it to default ttl
             if "ttl" in kwargs and kwargs["ttl"] is not None:
-                self.ttl_dict[key] = time.time() + float(kwargs["ttl"])
+                self._set_key_ttl(key, current_time + float(kwargs["ttl"]))
             else:
-                self.ttl_dict[key] = time.time() + self.default_ttl
+                self._set_key_ttl(key, current_time + self.default_ttl)
 
     async def async_set_cache(self, key, value, **kwargs):
         self.set_cache(key=key, value=value, **kwargs)
@@ -182,13 +277,18 @@ class InMemoryCache(BaseCache):
     def get_cache(self, key, **kwargs):
         if key in self.cache_dict:
             if self.evict_element_if_expired(key):
+                self.cache_expirations += 1
+                self.cache_misses += 1
                 return None
+            self.cache_hits += 1
+            self.cache_dict.move_to_end(key)
             original_cached_response = self.cache_dict[key]
             try:
                 cached_response = json.loads(original_cached_response)
             except Exception:
                 cached_response = original_cached_response
             return cached_response
+        self.cache_misses += 1
         return None
 
     def batch_get_cache(self, keys: list, **kwargs):
@@ -236,6 +336,9 @@ class InMemoryCache(BaseCache):
     def flush_cache(self):
         self.cache_dict.clear()
         self.ttl_dict.clear()
+        self.expiration_heap.clear()
+        for namespace_keys in self.namespace_keys.values():
+            namespace_keys.clear()
 
     async def disconnect(self):
         pass
@@ -256,3 +359,44 @@ class InMemoryCache(BaseCache):
         # sorted ttl dict by ttl
         sorted_ttl_dict = sorted(self.ttl_dict.items(), key=lambda x: x[1])
         return [key for key, _ in sorted_ttl_dict[:n]]
+
+    def get_cache_stats(self) -> InMemoryCacheStats:
+        """
+        Get hit / miss / eviction counters and the current size of the cache
+        """
+        return InMemoryCacheStats(
+            hits=self.cache_hits,
+            misses=self.cache_misses,
+            evictions=self.cache_evictions,
+            expirations=self.cache_expirations,
+            size=len(self.cache_dict),
+            max_size=self.max_size_in_memory,
+        )
+
+    async def async_emit_cache_stats(
+        self,
+        service_logger_obj: "ServiceLogging",
+        cache_name: str = "in_memory_cache",
+    ) -> None:
+        """
+        Emit cache stats as gauges to ServiceLogging (e.g. `prometheus_system`)
+
+        Each stat is emitted with gauge label `<cache_name>_<stat>`, e.g. `user_api_key_cache_hits`
+        """
+        from litellm.types.services import ServiceTypes
+
+        stats = self.get_cache_stats()
+        await asyncio.gather(
+            *[
+                service_logger_obj.async_service_success_hook(
+                    service=ServiceTypes.IN_MEMORY_CACHE,
+                    duration=0,
+                    call_type="async_emit_cache_stats",
+                    event_metadata={
+                        "gauge_labels": f"{cache_name}_{stat_name}",
+                        "gauge_value": stat_value,
+                    },
+                )
+                for stat_name, stat_value in stats.items()
+            ]
+        )
@@ -0,0 +1,707 @@
+"""
+Local Semantic Cache implementation
+
+Semantic caching without an external vector DB - prompt embeddings are held in an in-process index on NumPy arrays.
+
+- a lookup for a cache key that was stored returns without an embedding call
+- below `LOCAL_SEMANTIC_CACHE_IVF_MIN_SIZE` prompts, lookups scan every cached vector. Above it, they search the `LOCAL_SEMANTIC_CACHE_IVF_NPROBE` nearest clusters of an IVF (k-means) index, (re)trained in a background thread
+- concurrent async lookups share one embedding request. Async lookups / stores search and update the index in a worker thread, off the event loop
+- the least recently used prompts are evicted past `max_size`
+- with `persist_path`, each process claims its own `<persist_path>/worker-<n>` dir (via a file lock), so workers sharing a `persist_path` don't overwrite each other's files. Vectors are memory-mapped from `<worker dir>/vectors.npy`, entries are written to `<worker dir>/entries.json` on `disconnect()` / exit
+
+Requires `numpy`.
+"""
+
+import asyncio
+import atexit
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import IO, TYPE_CHECKING, Any, Dict, List, Optional, Set, Tuple
+
+import litellm
+from litellm._logging import print_verbose
+from litellm.constants import (
+    LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_SIZE,
+    LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_WAIT_MS,
+    LOCAL_SEMANTIC_CACHE_IVF_MIN_SIZE,
+    LOCAL_SEMANTIC_CACHE_IVF_NPROBE,
+    LOCAL_SEMANTIC_CACHE_MAX_SIZE,
+)
+from litellm.litellm_core_utils.prompt_templates.common_utils import (
+    get_str_from_messages,
+)
+
+from .base_cache import BaseCache
+
+if TYPE_CHECKING:
+    import numpy as np
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None  # type: ignore
+
+# candidates checked per lookup, for entries that are expired or belong to another model
+_SEARCH_TOP_K = 8
+# embeddings of recent lookups, by cache key - reused when the response is stored
+_MAX_RECENT_EMBEDDINGS = 1024
+
+WORKER_DIR_PREFIX = "worker-"
+
+
+def _claim_worker_dir(persist_path: str) -> Tuple[str, Optional[IO]]:
+    """
+    Claim the first `worker-<n>` dir under `persist_path` no other process holds a lock on.
+
+    Returns (worker dir, lock file). The lock is held until the lock file is closed.
+    """
+    if fcntl is None:
+        worker_dir = os.path.join(persist_path, f"{WORKER_DIR_PREFIX}0")
+        os.makedirs(worker_dir, exist_ok=True)
+        return worker_dir, None
+    n = 0
+    while True:
+        worker_dir = os.path.join(persist_path, f"{WORKER_DIR_PREFIX}{n}")
+        os.makedirs(worker_dir, exist_ok=True)
+        lock_file = open(os.path.join(worker_dir, "lock"), "a")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            return worker_dir, lock_file
+        except OSError:
+            lock_file.close()
+            n += 1
+
+
+class _SemanticCacheEntry:
+    __slots__ = ("key", "model", "value", "expires_at")
+
+    def __init__(
+        self, key: str, model: Optional[str], value: Any, expires_at: Optional[float]
+    ):
+        self.key = key
+        self.model = model
+        self.value = value
+        self.expires_at = expires_at
+
+
+class _VectorIndex:
+    """
+    Fixed-capacity matrix of normalized vectors (one row per slot), searched by cosine similarity.
+
+    `add` / `remove` must not be called concurrently (`LocalSemanticCache` serializes them). `search` can run alongside them - rows written during a search may be missed, callers re-check the returned slots.
+    """
+
+    def __init__(
+        self,
+        capacity: int,
+        dim: int,
+        ivf_min_size: int,
+        nprobe: int,
+        path: Optional[str] = None,
+    ):
+        import numpy
+
+        self.np = numpy
+        self.dim = dim
+        self.ivf_min_size = ivf_min_size
+        self.nprobe = nprobe
+        self.vectors = self._allocate(capacity=capacity, dim=dim, path=path)
+        self.valid = numpy.zeros(capacity, dtype=bool)
+        self.clusters = numpy.full(capacity, -1, dtype=numpy.int32)
+        self.centroids: Optional["np.ndarray"] = None
+        self.num_valid = 0
+        self.high_water = 0  # slots >= high_water have never been used
+        self._num_valid_at_last_train = 0
+        # guards the IVF state (`centroids`, `clusters`) against the training thread
+        self._ivf_lock = threading.Lock()
+        self._training_thread: Optional[threading.Thread] = None
+        # slots added / removed while training - re-assigned once training finishes
+        self._changed_slots: Set[int] = set()
+
+    def _allocate(self, capacity: int, dim: int, path: Optional[str]) -> "np.ndarray":
+        numpy = self.np
+        if path is None:
+            return numpy.zeros((capacity, dim), dtype=numpy.float32)
+        if os.path.exists(path):
+            vectors = numpy.lib.format.open_memmap(path, mode="r+")
+            if vectors.shape == (capacity, dim) and vectors.dtype == numpy.float32:
+                return vectors
+            del vectors
+        return numpy.lib.format.open_memmap(
+            path, mode="w+", dtype=numpy.float32, shape=(capacity, dim)
+        )
+
+    def add(self, slot: int, vector: "np.ndarray") -> None:
+        self.vectors[slot] = vector
+        if not self.valid[slot]:
+            self.valid[slot] = True
+            self.num_valid += 1
+        self.high_water = max(self.high_water, slot + 1)
+        with self._ivf_lock:
+            if self.centroids is not None:
+                self.clusters[slot] = int(self.np.argmax(self.centroids @ vector))
+            if self._training_thread is not None:
+                self._changed_slots.add(slot)
+            elif (
+                self.num_valid >= self.ivf_min_size
+                and self.num_valid >= 2 * self._num_valid_at_last_train
+            ):
+                self._start_training()
+
+    def remove(self, slot: int) -> None:
+        if self.valid[slot]:
+            self.valid[slot] = False
+            self.num_valid -= 1
+            with self._ivf_lock:
+                self.clusters[slot] = -1
+                if self._training_thread is not None:
+                    self._changed_slots.add(slot)
+
+    def search(self, vector: "np.ndarray", k: int) -> List[Tuple[int, float]]:
+        """Returns up to `k` (slot, similarity) pairs, most similar first"""
+        numpy = self.np
+        high_water = self.high_water
+        if self.num_valid == 0:
+            return []
+        with self._ivf_lock:
+            centroids, clusters = self.centroids, self.clusters
+        if centroids is None:
+            # scan every row - no copy of the matrix, unlike indexing it with the valid slots
+            candidates = numpy.arange(high_water)
+            sims = self.vectors[:high_water] @ vector
+            sims[~self.valid[:high_water]] = -numpy.inf
+        else:
+            nprobe = min(self.nprobe, len(centroids))
+            centroid_sims = centroids @ vector
+            probes = numpy.argpartition(-centroid_sims, nprobe - 1)[:nprobe]
+            candidates = numpy.flatnonzero(numpy.isin(clusters[:high_water], probes))
+            if len(candidates) == 0:
+                return []
+            sims = self.vectors[candidates] @ vector
+
+        k = min(k, len(candidates))
+        top = numpy.argpartition(-sims, k - 1)[:k]
+        top = top[numpy.argsort(-sims[top])]
+        return [
+            (int(candidates[i]), float(sims[i])) for i in top if sims[i] != -numpy.inf
+        ]
+
+    def _start_training(self) -> None:
+        """Train the IVF index in a background thread, on a copy of the current vectors' slots and a sample of them"""
+        numpy = self.np
+        slots = numpy.flatnonzero(self.valid)
+        num_clusters = max(1, int(numpy.sqrt(len(slots))))
+        rng = numpy.random.default_rng(0)
+        # fancy indexing copies the sampled rows
+        sample = self.vectors[
+            rng.choice(slots, size=min(len(slots), num_clusters * 64), replace=False)
+        ]
+        self._num_valid_at_last_train = len(slots)
+        self._training_thread = threading.Thread(
+            target=self._train,
+            args=(slots, sample, num_clusters),
+            name="litellm-local-semantic-cache-train",
+            daemon=True,
+        )
+        self._training_thread.start()
+
+    def _train(
+        self, slots: "np.ndarray", sample: "np.ndarray", num_clusters: int
+    ) -> None:
+        """Spherical k-means on `sample`, then assign every vector in `slots` to its nearest centroid"""
+        try:
+            self._train_ivf(slots=slots, sample=sample, num_clusters=num_clusters)
+        finally:
+            with self._ivf_lock:
+                self._training_thread = None
+                self._changed_slots = set()
+
+    def _train_ivf(
+        self, slots: "np.ndarray", sample: "np.ndarray", num_clusters: int
+    ) -> None:
+        numpy = self.np
+        rng = numpy.random.default_rng(0)
+        centroids = sample[rng.choice(len(sample), num_clusters, replace=False)]
+        for _ in range(10):
+            assignments = numpy.argmax(sample @ centroids.T, axis=1)
+            sums = numpy.zeros_like(centroids)
+            numpy.add.at(sums, assignments, sample)
+            norms = numpy.linalg.norm(sums, axis=1, keepdims=True)
+            centroids = numpy.where(
+                norms > 0, sums / numpy.maximum(norms, 1e-12), centroids
+            )
+
+        centroids = centroids.astype(numpy.float32)
+        clusters = numpy.full(len(self.clusters), -1, dtype=numpy.int32)
+        for start in range(0, len(slots), 4096):
+            chunk = slots[start : start + 4096]
+            clusters[chunk] = numpy.argmax(self.vectors[chunk] @ centroids.T, axis=1)
+
+        with self._ivf_lock:
+            for slot in self._changed_slots:
+                clusters[slot] = (
+                    int(numpy.argmax(centroids @ self.vectors[slot]))
+                    if self.valid[slot]
+                    else -1
+                )
+            self.clusters, self.centroids = clusters, centroids
+
+
+class LocalSemanticCache(BaseCache):
+    """
+    In-process semantic cache for LLM responses.
+
+    Like `RedisSemanticCache` / `QdrantSemanticCache`, a lookup returns the response of the most similar cached prompt, if its similarity is at least `similarity_threshold`.
+    """
+
+    def __init__(
+        self,
+        similarity_threshold: Optional[float] = None,
+        embedding_model: str = "text-embedding-ada-002",
+        max_size: Optional[int] = None,
+        persist_path: Optional[str] = None,
+        ivf_min_size: int = LOCAL_SEMANTIC_CACHE_IVF_MIN_SIZE,
+        ivf_nprobe: int = LOCAL_SEMANTIC_CACHE_IVF_NPROBE,
+        embedding_batch_size: int = LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_SIZE,
+        embedding_batch_wait_ms: float = LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_WAIT_MS,
+        **kwargs,
+    ):
+        """
+        Args:
+            similarity_threshold: Minimum cosine similarity (0.0 to 1.0) for a cache hit
+            embedding_model: Model used to embed prompts
+            max_size: Max cached prompts, the least recently used are evicted past this. Defaults to LOCAL_SEMANTIC_CACHE_MAX_SIZE
+            persist_path: Directory to persist the cache to. In-memory only if None
+            ivf_min_size: Number of cached prompts above which lookups use the IVF index
+            ivf_nprobe: Number of IVF clusters searched per lookup
+            embedding_batch_size: Max prompts per embedding request
+            embedding_batch_wait_ms: How long concurrent async lookups wait to share an embedding request
+
+        Raises:
+            ValueError: If similarity_threshold is not provided
+        """
+        import numpy
+
+        if similarity_threshold is None:
+            raise ValueError("similarity_threshold must be provided, passed None")
+
+        self.np = numpy
+        self.similarity_threshold = similarity_threshold
+        self.embedding_model = embedding_model
+        self.max_size = max_size or LOCAL_SEMANTIC_CACHE_MAX_SIZE
+        self.persist_path = persist_path
+        self.ivf_min_size = ivf_min_size
+        self.ivf_nprobe = ivf_nprobe
+        self.embedding_batch_size = embedding_batch_size
+        self.embedding_batch_wait_ms = embedding_batch_wait_ms
+
+        self._lock = threading.Lock()
+        # created on the first embedding, once the embedding size is known
+        self._index: Optional[_VectorIndex] = None
+        # slot -> entry, least recently used first
+        self._entries: "OrderedDict[int, _SemanticCacheEntry]" = OrderedDict()
+        self._slots_by_key: Dict[str, int] = {}
+        self._free_slots: List[int] = []
+        self._recent_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
+
+        self._pending_prompts: List[Tuple[str, asyncio.Future]] = []
+        self._pending_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending_flush: Optional[asyncio.TimerHandle] = None
+
+        self._persist_dir: Optional[str] = None
+        self._persist_lock_file: Optional[IO] = None
+        if persist_path is not None:
+            os.makedirs(persist_path, exist_ok=True)
+            self._persist_dir, self._persist_lock_file = _claim_worker_dir(persist_path)
+            self._load()
+            atexit.register(self.persist)
+
+    ### INDEX ###
+    def _normalize(self, embedding: List[float]) -> "np.ndarray":
+        vector = self.np.asarray(embedding, dtype=self.np.float32)
+        norm = self.np.linalg.norm(vector)
+        return vector / norm if norm > 0 else vector
+
+    def _get_index(self, dim: int) -> _VectorIndex:
+        if self._index is None or self._index.dim != dim:
+            if self._index is not None:  # embedding model changed
+                self._entries.clear()
+                self._slots_by_key.clear()
+                self._free_slots.clear()
+            self._index = _VectorIndex(
+                capacity=self.max_size,
+                dim=dim,
+                ivf_min_size=self.ivf_min_size,
+                nprobe=self.ivf_nprobe,
+                path=self._vectors_path,
+            )
+        return self._index
+
+    @property
+    def _vectors_path(self) -> Optional[str]:
+        if self._persist_dir is None:
+            return None
+        return os.path.join(self._persist_dir, "vectors.npy")
+
+    def _remove_slot(self, slot: int) -> None:
+        entry = self._entries.pop(slot)
+        if self._slots_by_key.get(entry.key) == slot:
+            del self._slots_by_key[entry.key]
+        if self._index is not None:
+            self._index.remove(slot)
+        self._free_slots.append(slot)
+
+    def _get_hit(
+        self, slot: int, model: Optional[str]
+    ) -> Optional[_SemanticCacheEntry]:
+        """Entry in `slot` if it's live and was stored for `model`. Marks it as recently used."""
+        entry = self._entries.get(slot)
+        if entry is None:
+            return None
+        if entry.expires_at is not None and entry.expires_at < time.time():
+            self._remove_slot(slot)
+            return None
+        if model is not None and entry.model is not None and entry.model != model:
+            return None
+        self._entries.move_to_end(slot)
+        return entry
+
+    def _get_exact(self, key: str, model: Optional[str]) -> Optional[Any]:
+        with self._lock:
+            slot = self._slots_by_key.get(key)
+            if slot is None:
+                return None
+            entry = self._get_hit(slot, model)
+            return entry.value if entry is not None else None
+
+    def _search(
+        self, vector: "np.ndarray", model: Optional[str]
+    ) -> Tuple[Optional[Any], float]:
+        """Returns (cached value, similarity) of the most similar live entry, or (None, best similarity)"""
+        with self._lock:
+            index = self._get_index(dim=len(vector))
+        # the scan doesn't hold the lock - the candidates' similarities are re-computed under it, since their slots may have been re-used meanwhile
+        candidates = index.search(vector, k=_SEARCH_TOP_K)
+        with self._lock:
+            if index is not self._index:
+                return None, 0.0
+            rechecked = sorted(
+                (
+                    (float(index.vectors[slot] @ vector), slot)
+                    for slot, _ in candidates
+                    if index.valid[slot]
+                ),
+                reverse=True,
+            )
+            best_similarity = 0.0
+            for similarity, slot in rechecked:
+                best_similarity = max(best_similarity, similarity)
+                if similarity < self.similarity_threshold:
+                    break
+                entry = self._get_hit(slot, model)
+                if entry is not None:
+                    return entry.value, similarity
+            return None, best_similarity
+
+    def _add(
+        self,
+        key: str,
+        vector: "np.ndarray",
+        model: Optional[str],
+        value: Any,
+        ttl: Optional[int],
+    ) -> None:
+        with self._lock:
+            index = self._get_index(dim=len(vector))
+            slot = self._slots_by_key.get(key)
+            if slot is not None:
+                self._remove_slot(slot)
+            if self._free_slots:
+                slot = self._free_slots.pop()
+            elif len(self._entries) < self.max_size:
+                slot = len(self._entries)
+            else:
+                slot = next(iter(self._entries))  # least recently used
+                self._remove_slot(slot)
+                self._free_slots.pop()
+
+            index.add(slot, vector)
+            self._entries[slot] = _SemanticCacheEntry(
+                key=key,
+                model=model,
+                value=value,
+                expires_at=time.time() + ttl if ttl is not None else None,
+            )
+            self._slots_by_key[key] = slot
+
+    def _remember_embedding(self, key: str, vector: "np.ndarray") -> None:
+        self._recent_embeddings[key] = vector
+        if len(self._recent_embeddings) > _MAX_RECENT_EMBEDDINGS:
+            self._recent_embeddings.popitem(last=False)
+
+    async def _run_in_thread(self, fn, *args, **kwargs):
+        """Run an index operation in a worker thread - searches and IVF updates are CPU-bound"""
+        return await asyncio.get_running_loop().run_in_executor(
+            None, partial(fn, *args, **kwargs)
+        )
+
+    ### EMBEDDINGS ###
+    def _get_embedding(self, prompt: str) -> "np.ndarray":
+        embedding_response = litellm.embedding(
+            model=self.embedding_model,
+            input=prompt,
+            cache={"no-store": True, "no-cache": True},
+        )
+        return self._normalize(embedding_response["data"][0]["embedding"])
+
+    async def _async_embed_batch(self, prompts: List[str]) -> List[List[float]]:
+        """One embedding request for `prompts` - through the proxy's router if the embedding model is a proxy model"""
+        from litellm.proxy.proxy_server import llm_model_list, llm_router
+
+        router_model_names = (
+            [m["model_name"] for m in llm_model_list]
+            if llm_model_list is not None
+            else []
+        )
+        if llm_router is not None and self.embedding_model in router_model_names:
+            embedding_response = await llm_router.aembedding(
+                model=self.embedding_model,
+                input=prompts,
+                cache={"no-store": True, "no-cache": True},
+                metadata={"semantic-cache-embedding": True},
+            )
+        else:
+            embedding_response = await litellm.aembedding(
+                model=self.embedding_model,
+                input=prompts,
+                cache={"no-store": True, "no-cache": True},
+            )
+        data = sorted(embedding_response["data"], key=lambda d: d["index"])
+        return [d["embedding"] for d in data]
+
+    async def _get_async_embedding(self, prompt: str) -> "np.ndarray":
+        """
+        Embed `prompt`. Prompts embedded concurrently (within `embedding_batch_wait_ms`) share one embedding request.
+        """
+        loop = asyncio.get_running_loop()
+        if self._pending_loop is not None and self._pending_loop is not loop:
+            # batches are per event loop
+            return self._normalize((await self._async_embed_batch([prompt]))[0])
+
+        future: asyncio.Future = loop.create_future()
+        self._pending_prompts.append((prompt, future))
+        self._pending_loop = loop
+        if len(self._pending_prompts) >= self.embedding_batch_size:
+            self._flush_pending_prompts()
+        elif self._pending_flush is None:
+            self._pending_flush = loop.call_later(
+                self.embedding_batch_wait_ms / 1000, self._flush_pending_prompts
+            )
+        return await future
+
+    def _flush_pending_prompts(self) -> None:
+        if self._pending_flush is not None:
+            self._pending_flush.cancel()
+            self._pending_flush = None
+        batch, self._pending_prompts = self._pending_prompts, []
+        self._pending_loop = None
+        if batch:
+            asyncio.ensure_future(self._resolve_batch(batch))
+
+    async def _resolve_batch(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        try:
+            embeddings = await self._async_embed_batch([prompt for prompt, _ in batch])
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(self._normalize(embedding))
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+
+    ### BaseCache ###
+    def _get_ttl(self, **kwargs) -> Optional[int]:
+        ttl = kwargs.get("ttl")
+        if ttl is not None:
+            ttl = int(ttl)
+        return ttl
+
+    def set_cache(self, key: str, value: Any, **kwargs) -> None:
+        print_verbose(f"Local semantic-cache set_cache, kwargs: {kwargs}")
+        try:
+            messages = kwargs.get("messages", [])
+            if not messages:
+                print_verbose("No messages provided for semantic caching")
+                return
+            vector = self._recent_embeddings.pop(key, None)
+            if vector is None:
+                vector = self._get_embedding(get_str_from_messages(messages))
+            self._add(
+                key=key,
+                vector=vector,
+                model=kwargs.get("model"),
+                value=value,
+                ttl=self._get_ttl(**kwargs),
+            )
+        except Exception as e:
+            print_verbose(f"Error setting value in the local semantic cache: {str(e)}")
+
+    def get_cache(self, key: str, **kwargs) -> Any:
+        print_verbose(f"Local semantic-cache get_cache, kwargs: {kwargs}")
+        try:
+            messages = kwargs.get("messages", [])
+            if not messages:
+                print_verbose("No messages provided for semantic cache lookup")
+                return None
+            model = kwargs.get("model")
+            cached_value = self._get_exact(key, model)
+            if cached_value is not None:
+                return cached_value
+
+            vector = self._get_embedding(get_str_from_messages(messages))
+            self._remember_embedding(key, vector)
+            cached_value, similarity = self._search(vector, model)
+            print_verbose(
+                f"Local semantic-cache similarity: {similarity}, threshold: {self.similarity_threshold}"
+            )
+            return cached_value
+        except Exception as e:
+            print_verbose(f"Error retrieving from the local semantic cache: {str(e)}")
+            return None
+
+    async def async_set_cache(self, key: str, value: Any, **kwargs) -> None:
+        print_verbose(f"Async local semantic-cache set_cache, kwargs: {kwargs}")
+        try:
+            messages = kwargs.get("messages", [])
+            if not messages:
+                print_verbose("No messages provided for semantic caching")
+                return
+            vector = self._recent_embeddings.pop(key, None)
+            if vector is None:
+                vector = await self._get_async_embedding(
+                    get_str_from_messages(messages)
+                )
+            await self._run_in_thread(
+                self._add,
+                key=key,
+                vector=vector,
+                model=kwargs.get("model"),
+                value=value,
+                ttl=self._get_ttl(**kwargs),
+            )
+        except Exception as e:
+            print_verbose(f"Error in async_set_cache: {str(e)}")
+
+    async def async_get_cache(self, key: str, **kwargs) -> Any:
+        print_verbose(f"Async local semantic-cache get_cache, kwargs: {kwargs}")
+        try:
+            messages = kwargs.get("messages", [])
+            if not messages:
+                print_verbose("No messages provided for semantic cache lookup")
+                kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+                return None
+            model = kwargs.get("model")
+            cached_value = self._get_exact(key, model)
+            if cached_value is not None:
+                kwargs.setdefault("metadata", {})["semantic-similarity"] = 1.0
+                return cached_value
+
+            vector = await self._get_async_embedding(get_str_from_messages(messages))
+            self._remember_embedding(key, vector)
+            cached_value, similarity = await self._run_in_thread(
+                self._search, vector, model
+            )
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = similarity
+            return cached_value
+        except Exception as e:
+            print_verbose(f"Error in async_get_cache: {str(e)}")
+            kwargs.setdefault("metadata", {})["semantic-similarity"] = 0.0
+            return None
+
+    async def async_set_cache_pipeline(
+        self, cache_list: List[Tuple[str, Any]], **kwargs
+    ) -> None:
+        try:
+            await asyncio.gather(
+                *(
+                    self.async_set_cache(key, value, **kwargs)
+                    for key, value in cache_list
+                )
+            )
+        except Exception as e:
+            print_verbose(f"Error in async_set_cache_pipeline: {str(e)}")
+
+    async def disconnect(self):
+        self.persist()
+
+    ### PERSISTENCE ###
+    def persist(self) -> None:
+        """Flush the vectors to disk and write the entries. No-op without `persist_path`."""
+        if self._persist_dir is None:
+            return
+        with self._lock:
+            if self._index is None:
+                return
+            if hasattr(self._index.vectors, "flush"):
+                self._index.vectors.flush()
+            entries = [
+                {
+                    "slot": slot,
+                    "key": entry.key,
+                    "model": entry.model,
+                    "value": entry.value,
+                    "expires_at": entry.expires_at,
+                }
+                for slot, entry in self._entries.items()  # least recently used first
+            ]
+            data = {
+                "embedding_model": self.embedding_model,
+                "dim": self._index.dim,
+                "max_size": self.max_size,
+                "entries": entries,
+            }
+        tmp_path = os.path.join(self._persist_dir, "entries.json.tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(data, f, default=str)
+        os.replace(tmp_path, os.path.join(self._persist_dir, "entries.json"))
+
+    def _load(self) -> None:
+        entries_path = os.path.join(self._persist_dir or "", "entries.json")
+        if not os.path.exists(entries_path) or self._vectors_path is None:
+            return
+        try:
+            with open(entries_path) as f:
+                data = json.load(f)
+            if (
+                data.get("embedding_model") != self.embedding_model
+                or data.get("max_size") != self.max_size
+                or not os.path.exists(self._vectors_path)
+            ):
+                print_verbose(
+                    "Local semantic-cache: persisted cache doesn't match the config, starting empty"
+                )
+                return
+            index = self._get_index(dim=int(data["dim"]))
+            now = time.time()
+            for item in data["entries"]:
+                if item["expires_at"] is not None and item["expires_at"] < now:
+                    continue
+                slot = int(item["slot"])
+                index.add(slot, index.vectors[slot])
+                self._entries[slot] = _SemanticCacheEntry(
+                    key=item["key"],
+                    model=item["model"],
+                    value=item["value"],
+                    expires_at=item["expires_at"],
+                )
+                self._slots_by_key[item["key"]] = slot
+            used_slots = set(self._entries)
+            self._free_slots = [
+                slot for slot in range(index.high_water) if slot not in used_slots
+            ]
+        except Exception as e:
+            print_verbose(f"Error loading the local semantic cache: {str(e)}")
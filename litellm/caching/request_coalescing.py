@@ -0,0 +1,427 @@
+"""
+Single-flight coalescing for identical in-flight LLM API requests.
+
+When several identical requests (same cache key) are in flight at the same time, only the first one - the leader - calls the LLM API. The others wait for the leader's response instead of making their own upstream call.
+
+For streaming requests, the leader's stream is tee'd - every waiter gets its own stream, replaying the same chunks as they arrive.
+
+Used by `LLMCachingHandler` when `litellm.cache` is initialized with `enable_request_coalescing=True`.
+"""
+
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from pydantic import BaseModel
+
+import litellm
+from litellm._logging import verbose_logger
+from litellm.constants import REQUEST_COALESCING_STREAM_IDLE_TIMEOUT
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.types.caching import RequestCoalescingStats
+from litellm.types.services import ServiceTypes
+
+if TYPE_CHECKING:
+    from litellm._service_logger import ServiceLogging
+
+
+class StreamTee:
+    """
+    Replays the chunks of one upstream stream to any number of readers.
+
+    Chunks are kept until the stream is done, so a reader that joins late still gets every chunk. The upstream stream is read by whichever reader is furthest ahead - a reader that stops early does not stall the others.
+
+    Readers are counted - once the last one is closed before the stream is done, the upstream stream is closed and the chunks are dropped.
+    """
+
+    def __init__(
+        self,
+        stream: CustomStreamWrapper,
+        on_done: Optional[Callable[[], None]] = None,
+    ):
+        self.stream = stream
+        self.chunks: List[Any] = []
+        self.is_done = False
+        self.exception: Optional[Exception] = None
+        self.on_done = on_done
+        self.readers = 0
+        self.last_read_time = time.monotonic()
+        self._async_lock = asyncio.Lock()
+        self._sync_lock = threading.Lock()
+        self._readers_lock = threading.Lock()
+
+    def _mark_done(self, exception: Optional[Exception] = None):
+        self.exception = exception
+        self.is_done = True
+        if self.on_done is not None:
+            self.on_done()
+
+    def is_idle(self) -> bool:
+        """
+        True if the stream is not done, but nothing was read from it for `REQUEST_COALESCING_STREAM_IDLE_TIMEOUT` seconds
+        """
+        return (
+            not self.is_done
+            and time.monotonic() - self.last_read_time
+            > REQUEST_COALESCING_STREAM_IDLE_TIMEOUT
+        )
+
+    def add_reader(self):
+        with self._readers_lock:
+            self.readers += 1
+
+    def _release_reader(self) -> bool:
+        """
+        Returns True if this was the last reader of a stream that is not done - the caller closes the upstream stream.
+        """
+        with self._readers_lock:
+            self.readers -= 1
+            if self.readers > 0 or self.is_done:
+                return False
+            self.chunks = []
+            self._mark_done(exception=RuntimeError("Stream was closed by all readers"))
+            return True
+
+    def _get_upstream_stream(self) -> Any:
+        return getattr(self.stream, "completion_stream", self.stream)
+
+    async def _aclose_stream(self):
+        aclose = getattr(self._get_upstream_stream(), "aclose", None)
+        if aclose is None:
+            return
+        try:
+            await aclose()
+        except Exception as e:
+            verbose_logger.debug("Error closing coalesced stream: %s", str(e))
+
+    def _close_stream(self):
+        close = getattr(self._get_upstream_stream(), "close", None)
+        if close is None:
+            return
+        try:
+            close()
+        except Exception as e:
+            verbose_logger.debug("Error closing coalesced stream: %s", str(e))
+
+    async def _async_read_chunk(self, index: int):
+        async with self._async_lock:
+            if index < len(self.chunks) or self.is_done:
+                return  # another reader got here first
+            try:
+                self.chunks.append(await self.stream.__anext__())
+                self.last_read_time = time.monotonic()
+            except StopAsyncIteration:
+                self._mark_done()
+            except Exception as e:
+                self._mark_done(exception=e)
+
+    def _sync_read_chunk(self, index: int):
+        with self._sync_lock:
+            if index < len(self.chunks) or self.is_done:
+                return
+            try:
+                self.chunks.append(next(self.stream))
+                self.last_read_time = time.monotonic()
+            except StopIteration:
+                self._mark_done()
+            except Exception as e:
+                self._mark_done(exception=e)
+
+    def aiter_chunks(self, copy_chunks: bool = False) -> AsyncIterator[Any]:
+        """
+        Returns a new reader. The reader is counted from here on, until it is exhausted or closed.
+        """
+        self.add_reader()
+        return self._aiter_chunks(copy_chunks=copy_chunks)
+
+    def iter_chunks(self, copy_chunks: bool = False) -> Iterator[Any]:
+        """
+        Sync version of `aiter_chunks`
+        """
+        self.add_reader()
+        return self._iter_chunks(copy_chunks=copy_chunks)
+
+    async def _aiter_chunks(self, copy_chunks: bool = False) -> AsyncIterator[Any]:
+        index = 0
+        try:
+            while True:
+                # read before the chunks - the last chunk is added before is_done is set
+                is_done = self.is_done
+                if index < len(self.chunks):
+                    chunk = self.chunks[index]
+                    index += 1
+                    yield _copy_chunk(chunk) if copy_chunks else chunk
+                elif is_done:
+                    if self.exception is not None:
+                        raise self.exception
+                    return
+                else:
+                    await self._async_read_chunk(index)
+        finally:
+            if self._release_reader():
+                await self._aclose_stream()
+
+    def _iter_chunks(self, copy_chunks: bool = False) -> Iterator[Any]:
+        index = 0
+        try:
+            while True:
+                # read before the chunks - the last chunk is added before is_done is set
+                is_done = self.is_done
+                if index < len(self.chunks):
+                    chunk = self.chunks[index]
+                    index += 1
+                    yield _copy_chunk(chunk) if copy_chunks else chunk
+                elif is_done:
+                    if self.exception is not None:
+                        raise self.exception
+                    return
+                else:
+                    self._sync_read_chunk(index)
+        finally:
+            if self._release_reader():
+                self._close_stream()
+
+
+def _copy_chunk(chunk: Any) -> Any:
+    if isinstance(chunk, BaseModel):
+        return chunk.model_copy(deep=True)
+    return chunk
+
+
+class CoalescedStreamWrapper(CustomStreamWrapper):
+    """
+    The leader's view of a coalesced stream.
+
+    Chunks are read through the StreamTee, so waiters see the same chunks. The upstream CustomStreamWrapper still handles logging + caching for the leader's request - `_hidden_params` are shared with it, and attributes it sets while streaming are read from it.
+
+    The leader counts as a reader of the StreamTee until its stream is exhausted or closed.
+    """
+
+    def __init__(self, stream_tee: StreamTee):
+        stream = stream_tee.stream
+        super().__init__(
+            completion_stream=None,
+            model=stream.model,
+            logging_obj=stream.logging_obj,
+            custom_llm_provider=stream.custom_llm_provider,
+            stream_options=stream.stream_options,
+            make_call=stream.make_call,
+            _response_headers=stream._response_headers,
+        )
+        self._hidden_params = stream._hidden_params
+        self.stream_tee = stream_tee
+        self._chunk_iterator: Optional[Any] = None
+        stream_tee.add_reader()
+
+    def __getattr__(self, name: str) -> Any:
+        stream_tee = self.__dict__.get("stream_tee")
+        if stream_tee is None:
+            raise AttributeError(name)
+        return getattr(stream_tee.stream, name)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._chunk_iterator is None:
+            self._chunk_iterator = self.stream_tee._iter_chunks()
+        return next(self._chunk_iterator)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._chunk_iterator is None:
+            self._chunk_iterator = self.stream_tee._aiter_chunks()
+        return await self._chunk_iterator.__anext__()
+
+    def close(self):
+        """
+        Stop reading - if the leader was the last reader, the upstream stream is closed
+        """
+        if self._chunk_iterator is not None:
+            self._chunk_iterator.close()
+            return
+        # a generator closed before it started skips its `finally` - release the reader here
+        self._chunk_iterator = self.stream_tee._iter_chunks()
+        self._chunk_iterator.close()
+        if self.stream_tee._release_reader():
+            self.stream_tee._close_stream()
+
+    async def aclose(self):
+        if self._chunk_iterator is not None:
+            await self._chunk_iterator.aclose()
+            return
+        self._chunk_iterator = self.stream_tee._aiter_chunks()
+        await self._chunk_iterator.aclose()
+        if self.stream_tee._release_reader():
+            await self.stream_tee._aclose_stream()
+
+
+class InFlightRequest:
+    """
+    One upstream call, shared by the leader and every request coalesced into it.
+
+    `response` resolves to the leader's response (a StreamTee for streaming requests), the leader's exception, or None if the leader was cancelled - waiters then make their own call.
+    """
+
+    def __init__(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.response: Future = Future()
+        # a waiter that gets cancelled must not cancel the response for everyone else
+        self.response.set_running_or_notify_cancel()
+        self.loop = loop
+
+
+class RequestCoalescer:
+    """
+    Tracks in-flight requests by cache key.
+
+    `join` returns the in-flight request for the key and whether the caller is its leader. The leader calls `set_response` (or `set_exception`) once the upstream call returns.
+
+    Streams nothing was read from for `REQUEST_COALESCING_STREAM_IDLE_TIMEOUT` seconds are no longer joined - they are dropped from the in-flight requests.
+    """
+
+    def __init__(self):
+        self.in_flight_requests: Dict[str, InFlightRequest] = {}
+        self.upstream_requests = 0
+        self.coalesced_requests = 0
+        self.service_logger_obj: Optional["ServiceLogging"] = None
+        self._lock = threading.Lock()
+        self._last_idle_sweep_time = time.monotonic()
+
+    def _get_idle_stream_tee(
+        self, in_flight_request: InFlightRequest
+    ) -> Optional[StreamTee]:
+        # only streams stay in flight once their response is set
+        if not in_flight_request.response.done():
+            return None
+        stream_tee = in_flight_request.response.result()
+        if isinstance(stream_tee, StreamTee) and stream_tee.is_idle():
+            return stream_tee
+        return None
+
+    def _drop_idle_streams(self):
+        """
+        Drop every idle stream from the in-flight requests. Runs at most once every `REQUEST_COALESCING_STREAM_IDLE_TIMEOUT` seconds. Caller holds `self._lock`.
+        """
+        now = time.monotonic()
+        if now - self._last_idle_sweep_time < REQUEST_COALESCING_STREAM_IDLE_TIMEOUT:
+            return
+        self._last_idle_sweep_time = now
+        for key, in_flight_request in list(self.in_flight_requests.items()):
+            if self._get_idle_stream_tee(in_flight_request) is not None:
+                verbose_logger.debug("Dropping idle coalesced stream: %s", key)
+                del self.in_flight_requests[key]
+
+    def join(
+        self, key: str, loop: Optional[asyncio.AbstractEventLoop] = None
+    ) -> Tuple[Optional[InFlightRequest], bool]:
+        """
+        Returns (in_flight_request, is_leader).
+
+        Returns (None, False) if the in-flight request belongs to another event loop - its stream can't be shared across loops, so the caller makes its own call.
+        """
+        with self._lock:
+            self._drop_idle_streams()
+            in_flight_request = self.in_flight_requests.get(key)
+            if (
+                in_flight_request is not None
+                and self._get_idle_stream_tee(in_flight_request) is not None
+            ):
+                del self.in_flight_requests[key]
+                in_flight_request = None
+            if in_flight_request is None:
+                in_flight_request = InFlightRequest(loop=loop)
+                self.in_flight_requests[key] = in_flight_request
+                self.upstream_requests += 1
+                return in_flight_request, True
+            if in_flight_request.loop is not loop:
+                return None, False
+            self.coalesced_requests += 1
+            verbose_logger.debug("Coalescing request into in-flight request: %s", key)
+            return in_flight_request, False
+
+    def leave(self, key: str, in_flight_request: InFlightRequest):
+        with self._lock:
+            if self.in_flight_requests.get(key) is in_flight_request:
+                del self.in_flight_requests[key]
+
+    def set_response(self, key: str, in_flight_request: InFlightRequest, response: Any):
+        """
+        Share the leader's response with every waiter.
+
+        Streaming responses are wrapped in a StreamTee - the key stays in flight until the stream is done (or closed by all its readers, or idle), so requests arriving mid-stream still join it. The leader gets a CoalescedStreamWrapper back.
+        """
+        if isinstance(response, CustomStreamWrapper):
+            stream_tee = StreamTee(
+                stream=response, on_done=lambda: self.leave(key, in_flight_request)
+            )
+            in_flight_request.response.set_result(stream_tee)
+            return CoalescedStreamWrapper(stream_tee=stream_tee)
+        self.leave(key, in_flight_request)
+        in_flight_request.response.set_result(response)
+        return response
+
+    def set_exception(
+        self,
+        key: str,
+        in_flight_request: InFlightRequest,
+        exception: BaseException,
+    ):
+        """
+        Share the leader's exception with every waiter.
+
+        If the leader was cancelled (not an `Exception`), waiters get None and make their own call instead.
+        """
+        self.leave(key, in_flight_request)
+        if isinstance(exception, Exception):
+            in_flight_request.response.set_exception(exception)
+        else:
+            in_flight_request.response.set_result(None)
+
+    def get_stats(self) -> RequestCoalescingStats:
+        return RequestCoalescingStats(
+            in_flight_requests=len(self.in_flight_requests),
+            upstream_requests=self.upstream_requests,
+            coalesced_requests=self.coalesced_requests,
+        )
+
+    def _get_service_logger_obj(self) -> "ServiceLogging":
+        from litellm._service_logger import ServiceLogging
+
+        if self.service_logger_obj is None:
+            self.service_logger_obj = ServiceLogging()
+        return self.service_logger_obj
+
+    async def async_log_coalesced_request(self, call_type: str, duration: float):
+        """
+        Count a coalesced request on ServiceLogging (e.g. `prometheus_system`). `duration` is how long it waited on the leader.
+        """
+        if not litellm.service_callback:
+            return
+        await self._get_service_logger_obj().async_service_success_hook(
+            service=ServiceTypes.REQUEST_COALESCING,
+            duration=duration,
+            call_type=call_type,
+        )
+
+    def log_coalesced_request(self, call_type: str, duration: float):
+        if not litellm.service_callback:
+            return
+        self._get_service_logger_obj().service_success_hook(
+            service=ServiceTypes.REQUEST_COALESCING,
+            duration=duration,
+            call_type=call_type,
+        )
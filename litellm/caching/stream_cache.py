@@ -0,0 +1,261 @@
+"""
+Chunk-level caching for streaming responses.
+
+A streaming response is cached as the sequence of chunks the caller received, with the time each chunk arrived (relative to the request start). A cache hit replays the chunks one by one - optionally paced to the original timing, so time-to-first-token matches the original request.
+
+While a stream is still being written, identical requests in this process replay it from the in-progress entry, following the writer as new chunks arrive. If the writer fails, readers that haven't returned a chunk yet fall back to their own upstream call.
+
+Cached value: {"cached_stream_chunks": <base64 of zlib-compressed records>}. Each record is `<offset_ms: uint32><length: uint32><chunk json>`.
+"""
+
+import asyncio
+import base64
+import json
+import struct
+import threading
+import time
+import zlib
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+)
+
+from litellm.constants import STREAM_CACHE_READER_TIMEOUT
+from litellm.types.utils import ModelResponseStream
+
+CACHED_STREAM_CHUNKS_KEY = "cached_stream_chunks"
+_RECORD_HEADER = struct.Struct("<II")
+
+
+class StreamCacheWriterError(Exception):
+    """
+    The writer of an in-progress entry failed, or stopped sending chunks
+    """
+
+
+def encode_stream_chunks(chunks: List[Tuple[float, dict]]) -> str:
+    """
+    Encode (offset in seconds, chunk dict) pairs into the compact cached format
+    """
+    records = bytearray()
+    for offset, chunk in chunks:
+        chunk_bytes = json.dumps(chunk, separators=(",", ":")).encode("utf-8")
+        records += _RECORD_HEADER.pack(int(offset * 1000), len(chunk_bytes))
+        records += chunk_bytes
+    return base64.b64encode(zlib.compress(bytes(records))).decode("ascii")
+
+
+def decode_stream_chunks(data: str) -> List[Tuple[float, dict]]:
+    records = zlib.decompress(base64.b64decode(data))
+    chunks: List[Tuple[float, dict]] = []
+    position = 0
+    while position < len(records):
+        offset_ms, length = _RECORD_HEADER.unpack_from(records, position)
+        position += _RECORD_HEADER.size
+        chunks.append(
+            (offset_ms / 1000, json.loads(records[position : position + length]))
+        )
+        position += length
+    return chunks
+
+
+def is_cached_stream(cached_result: Any) -> bool:
+    return isinstance(cached_result, dict) and CACHED_STREAM_CHUNKS_KEY in cached_result
+
+
+class StreamCacheEntry:
+    """
+    The chunks of one streaming response, plus their offsets from the request start.
+
+    Readers iterate with `iter_chunks` / `aiter_chunks`. If the entry is still being written, they wait for the writer's next chunk - and give up after `STREAM_CACHE_READER_TIMEOUT` seconds without one, or once the writer fails.
+    """
+
+    def __init__(self, start_time: Optional[float] = None):
+        self.start_time = start_time if start_time is not None else time.time()
+        self.chunks: List[Tuple[float, dict]] = []
+        self.is_done = False
+        self.is_failed = False
+        self.last_updated = time.time()
+        self._condition = threading.Condition()
+        self._async_waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+
+    @classmethod
+    def from_cached_value(cls, cached_value: dict) -> "StreamCacheEntry":
+        entry = cls()
+        entry.chunks = decode_stream_chunks(cached_value[CACHED_STREAM_CHUNKS_KEY])
+        entry.is_done = True
+        return entry
+
+    def to_cached_value(self) -> Dict[str, str]:
+        return {CACHED_STREAM_CHUNKS_KEY: encode_stream_chunks(self.chunks)}
+
+    def add_chunk(self, chunk: dict):
+        with self._condition:
+            self.last_updated = time.time()
+            self.chunks.append((self.last_updated - self.start_time, chunk))
+            self._notify_readers()
+
+    def finish(self):
+        with self._condition:
+            self.is_done = True
+            self._notify_readers()
+
+    def fail(self):
+        """
+        Wake every reader with a `StreamCacheWriterError`. No-op if the entry is already done.
+        """
+        with self._condition:
+            if self.is_done:
+                return
+            self.is_failed = True
+            self.is_done = True
+            self._notify_readers()
+
+    def _notify_readers(self):
+        self._condition.notify_all()
+        async_waiters, self._async_waiters = self._async_waiters, []
+        for loop, future in async_waiters:
+            loop.call_soon_threadsafe(_resolve_future, future)
+
+    def _wait_for_chunk(self, index: int):
+        with self._condition:
+            if not self._condition.wait_for(
+                lambda: index < len(self.chunks) or self.is_done,
+                timeout=STREAM_CACHE_READER_TIMEOUT,
+            ):
+                raise StreamCacheWriterError(
+                    f"Timed out waiting on the cached stream writer, after {STREAM_CACHE_READER_TIMEOUT}s"
+                )
+
+    async def _async_wait_for_chunk(self, index: int):
+        loop = asyncio.get_running_loop()
+        with self._condition:
+            if index < len(self.chunks) or self.is_done:
+                return
+            future = loop.create_future()
+            self._async_waiters.append((loop, future))
+        try:
+            await asyncio.wait_for(future, timeout=STREAM_CACHE_READER_TIMEOUT)
+        except asyncio.TimeoutError:
+            raise StreamCacheWriterError(
+                f"Timed out waiting on the cached stream writer, after {STREAM_CACHE_READER_TIMEOUT}s"
+            )
+
+    def iter_chunks(
+        self,
+        pace: bool = False,
+        fallback: Optional[Callable[[], Iterator[Any]]] = None,
+    ) -> Iterator[Any]:
+        """
+        Replay the chunks. If `pace` is True, each chunk is held back until its original offset from the start of the replay.
+
+        If the writer fails before any chunk was returned, the chunks of `fallback()` are returned instead.
+        """
+        replay_start_time = time.time()
+        index = 0
+        try:
+            while True:
+                # read before the chunks - the last chunk is added before is_done is set
+                is_done = self.is_done
+                if index < len(self.chunks):
+                    offset, chunk = self.chunks[index]
+                    index += 1
+                    if pace:
+                        delay = replay_start_time + offset - time.time()
+                        if delay > 0:
+                            time.sleep(delay)
+                    yield ModelResponseStream(**chunk)
+                elif is_done:
+                    if self.is_failed:
+                        raise StreamCacheWriterError("The cached stream writer failed")
+                    return
+                else:
+                    self._wait_for_chunk(index)
+        except StreamCacheWriterError:
+            if index > 0 or fallback is None:
+                raise
+        yield from fallback()
+
+    async def aiter_chunks(
+        self,
+        pace: bool = False,
+        fallback: Optional[Callable[[], Awaitable[AsyncIterator[Any]]]] = None,
+    ) -> AsyncIterator[Any]:
+        replay_start_time = time.time()
+        index = 0
+        try:
+            while True:
+                # read before the chunks - the last chunk is added before is_done is set
+                is_done = self.is_done
+                if index < len(self.chunks):
+                    offset, chunk = self.chunks[index]
+                    index += 1
+                    if pace:
+                        delay = replay_start_time + offset - time.time()
+                        if delay > 0:
+                            await asyncio.sleep(delay)
+                    yield ModelResponseStream(**chunk)
+                elif is_done:
+                    if self.is_failed:
+                        raise StreamCacheWriterError("The cached stream writer failed")
+                    return
+                else:
+                    await self._async_wait_for_chunk(index)
+        except StreamCacheWriterError:
+            if index > 0 or fallback is None:
+                raise
+        async for chunk in await fallback():
+            yield chunk
+
+
+def _resolve_future(future: asyncio.Future):
+    if not future.done():
+        future.set_result(None)
+
+
+class InProgressStreamCache:
+    """
+    Streams being written to the cache by this process, by cache key.
+
+    An entry whose writer fails is dropped right away. An entry that hasn't had a new chunk for `STREAM_CACHE_READER_TIMEOUT` seconds is dropped on the next `get` - its writer stopped reading the stream.
+    """
+
+    def __init__(self):
+        self.entries: Dict[str, StreamCacheEntry] = {}
+        self._lock = threading.Lock()
+
+    def start(self, key: str, start_time: float) -> StreamCacheEntry:
+        entry = StreamCacheEntry(start_time=start_time)
+        with self._lock:
+            self.entries[key] = entry
+        return entry
+
+    def get(self, key: str) -> Optional[StreamCacheEntry]:
+        entry = self.entries.get(key)
+        if (
+            entry is not None
+            and time.time() - entry.last_updated > STREAM_CACHE_READER_TIMEOUT
+        ):
+            self.fail(key=key, entry=entry)
+            return None
+        return entry
+
+    def finish(self, key: str, entry: StreamCacheEntry):
+        entry.finish()
+        self._remove(key=key, entry=entry)
+
+    def fail(self, key: str, entry: StreamCacheEntry):
+        entry.fail()
+        self._remove(key=key, entry=entry)
+
+    def _remove(self, key: str, entry: StreamCacheEntry):
+        with self._lock:
+            if self.entries.get(key) is entry:
+                del self.entries[key]
@@ -4,6 +4,21 @@ from typing import List, Literal
 ROUTER_MAX_FALLBACKS = int(os.getenv("ROUTER_MAX_FALLBACKS", 5))
 DEFAULT_BATCH_SIZE = int(os.getenv("DEFAULT_BATCH_SIZE", 512))
 DEFAULT_FLUSH_INTERVAL_SECONDS = int(os.getenv("DEFAULT_FLUSH_INTERVAL_SECONDS", 5))
+DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE = int(
+    os.getenv("DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE", 10000)
+)
+DEFAULT_BATCH_LOGGER_MAX_BATCH_BYTES = int(
+    os.getenv("DEFAULT_BATCH_LOGGER_MAX_BATCH_BYTES", 0)
+)  # 0 = batches are only bounded by batch size
+DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES = int(
+    os.getenv("DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES", 4)
+)
+DEFAULT_BATCH_LOGGER_MAX_FLUSH_RETRIES = int(
+    os.getenv("DEFAULT_BATCH_LOGGER_MAX_FLUSH_RETRIES", 3)
+)
+DEFAULT_BATCH_LOGGER_RETRY_BACKOFF_SECONDS = float(
+    os.getenv("DEFAULT_BATCH_LOGGER_RETRY_BACKOFF_SECONDS", 0.5)
+)
 DEFAULT_S3_FLUSH_INTERVAL_SECONDS = int(
     os.getenv("DEFAULT_S3_FLUSH_INTERVAL_SECONDS", 10)
 )
@@ -26,6 +41,9 @@ DEFAULT_MAX_TOKENS = int(os.getenv("DEFAULT_MAX_TOKENS", 4096))
 DEFAULT_ALLOWED_FAILS = int(os.getenv("DEFAULT_ALLOWED_FAILS", 3))
 DEFAULT_REDIS_SYNC_INTERVAL = int(os.getenv("DEFAULT_REDIS_SYNC_INTERVAL", 1))
 DEFAULT_COOLDOWN_TIME_SECONDS = int(os.getenv("DEFAULT_COOLDOWN_TIME_SECONDS", 5))
+DEFAULT_COOLDOWN_PUBSUB_RETRY_INTERVAL_SECONDS = float(
+    os.getenv("DEFAULT_COOLDOWN_PUBSUB_RETRY_INTERVAL_SECONDS", 10)
+)  # min. time between restarts of the cooldown redis pub/sub listener, after it stopped (e.g. redis is down)
 DEFAULT_REPLICATE_POLLING_RETRIES = int(
     os.getenv("DEFAULT_REPLICATE_POLLING_RETRIES", 5)
 )
@@ -35,6 +53,14 @@ DEFAULT_REPLICATE_POLLING_DELAY_SECONDS = int(
 DEFAULT_IMAGE_TOKEN_COUNT = int(os.getenv("DEFAULT_IMAGE_TOKEN_COUNT", 250))
 DEFAULT_IMAGE_WIDTH = int(os.getenv("DEFAULT_IMAGE_WIDTH", 300))
 DEFAULT_IMAGE_HEIGHT = int(os.getenv("DEFAULT_IMAGE_HEIGHT", 300))
+IMAGE_DIMENSIONS_CACHE_SIZE = int(os.getenv("IMAGE_DIMENSIONS_CACHE_SIZE", 1024))
+IMAGE_DIMENSIONS_FAILED_PROBE_TTL_SECONDS = float(
+    os.getenv("IMAGE_DIMENSIONS_FAILED_PROBE_TTL_SECONDS", 60)
+)
+IMAGE_PROBE_MAX_BYTES = int(
+    os.getenv("IMAGE_PROBE_MAX_BYTES", 262144)
+)  # 256KB - enough to get past the EXIF / ICC segments of most JPEGs
+IMAGE_PROBE_TIMEOUT_SECONDS = float(os.getenv("IMAGE_PROBE_TIMEOUT_SECONDS", 5))
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 1024)
 )  # 1MB = 1024KB
@@ -60,7 +86,11 @@ MAX_TOKEN_TRIMMING_ATTEMPTS = int(
 
 
 ########## Networking constants ##############################################################
-_DEFAULT_TTL_FOR_HTTPX_CLIENTS = 3600  # 1 hour, re-use the same httpx client for 1 hour
+_DEFAULT_TTL_FOR_HTTPX_CLIENTS = 3600  # 1 hour, re-use the same httpx client until it's idle for 1 hour
+MAX_HTTP_CLIENT_POOL_SIZE = int(os.getenv("MAX_HTTP_CLIENT_POOL_SIZE", 200))
+AIOHTTP_CONNECTOR_LIMIT_PER_HOST = int(
+    os.getenv("AIOHTTP_CONNECTOR_LIMIT_PER_HOST", 0)
+)  # 0 = no per-host limit
 
 ########### v2 Architecture constants for managing writing updates to the database ###########
 REDIS_UPDATE_BUFFER_KEY = "litellm_spend_update_buffer"
@@ -69,9 +99,40 @@ REDIS_DAILY_TEAM_SPEND_UPDATE_BUFFER_KEY = "litellm_daily_team_spend_update_buff
 REDIS_DAILY_TAG_SPEND_UPDATE_BUFFER_KEY = "litellm_daily_tag_spend_update_buffer"
 MAX_REDIS_BUFFER_DEQUEUE_COUNT = int(os.getenv("MAX_REDIS_BUFFER_DEQUEUE_COUNT", 100))
 MAX_SIZE_IN_MEMORY_QUEUE = int(os.getenv("MAX_SIZE_IN_MEMORY_QUEUE", 10000))
+DEFAULT_MAX_SIZE_IN_MEMORY_CACHE = int(
+    os.getenv("DEFAULT_MAX_SIZE_IN_MEMORY_CACHE", 10000)
+)  # hard bound - least recently used keys are evicted past it
 MAX_IN_MEMORY_QUEUE_FLUSH_COUNT = int(
     os.getenv("MAX_IN_MEMORY_QUEUE_FLUSH_COUNT", 1000)
 )
+SPEND_UPDATE_MAX_ROWS_PER_STATEMENT = int(
+    os.getenv("SPEND_UPDATE_MAX_ROWS_PER_STATEMENT", 1000)
+)  # rows per `UPDATE ... FROM (VALUES ...)` spend update statement
+SPEND_UPDATE_MIN_FLUSH_INTERVAL_SECONDS = float(
+    os.getenv("SPEND_UPDATE_MIN_FLUSH_INTERVAL_SECONDS", 1)
+)
+SPEND_UPDATE_MAX_FLUSH_INTERVAL_MULTIPLIER = float(
+    os.getenv("SPEND_UPDATE_MAX_FLUSH_INTERVAL_MULTIPLIER", 4)
+)  # max spend update interval, as a multiple of `proxy_batch_write_at`
+SPEND_LOG_JOURNAL_DIR = os.getenv(
+    "SPEND_LOG_JOURNAL_DIR", None
+)  # if set, spend logs are buffered in an on-disk journal instead of in memory
+SPEND_LOG_JOURNAL_MAX_SIZE_MB = int(os.getenv("SPEND_LOG_JOURNAL_MAX_SIZE_MB", 1024))
+SPEND_LOG_JOURNAL_SEGMENT_SIZE_MB = int(
+    os.getenv("SPEND_LOG_JOURNAL_SEGMENT_SIZE_MB", 16)
+)
+SPEND_LOG_JOURNAL_FSYNC = os.getenv(
+    "SPEND_LOG_JOURNAL_FSYNC", "interval"
+)  # "always", "interval" or "never"
+SPEND_LOG_JOURNAL_FSYNC_INTERVAL_SECONDS = float(
+    os.getenv("SPEND_LOG_JOURNAL_FSYNC_INTERVAL_SECONDS", 1)
+)
+SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE = int(
+    os.getenv("SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE", 1000)
+)
+SPEND_LOG_JOURNAL_MAX_ROWS_PER_FLUSH = int(
+    os.getenv("SPEND_LOG_JOURNAL_MAX_ROWS_PER_FLUSH", 20000)
+)
 ###############################################################################################
 MINIMUM_PROMPT_CACHE_TOKEN_COUNT = int(
     os.getenv("MINIMUM_PROMPT_CACHE_TOKEN_COUNT", 1024)
@@ -90,6 +151,9 @@ REPLICATE_MODEL_NAME_WITH_ID_LENGTH = int(
 FUNCTION_DEFINITION_TOKEN_COUNT = int(os.getenv("FUNCTION_DEFINITION_TOKEN_COUNT", 9))
 SYSTEM_MESSAGE_TOKEN_COUNT = int(os.getenv("SYSTEM_MESSAGE_TOKEN_COUNT", 4))
 TOOL_CHOICE_OBJECT_TOKEN_COUNT = int(os.getenv("TOOL_CHOICE_OBJECT_TOKEN_COUNT", 4))
+TOKEN_COUNT_CACHE_SIZE = int(
+    os.getenv("TOKEN_COUNT_CACHE_SIZE", 10000)
+)  # per-message / per-tool-set token counts, keyed by (tokenizer id, content digest)
 DEFAULT_MOCK_RESPONSE_PROMPT_TOKEN_COUNT = int(
     os.getenv("DEFAULT_MOCK_RESPONSE_PROMPT_TOKEN_COUNT", 10)
 )
@@ -138,6 +202,12 @@ REPEATED_STREAMING_CHUNK_LIMIT = int(
     os.getenv("REPEATED_STREAMING_CHUNK_LIMIT", 100)
 )  # catch if model starts looping the same chunk while streaming. Uses high default to prevent false positives.
 DEFAULT_MAX_LRU_CACHE_SIZE = int(os.getenv("DEFAULT_MAX_LRU_CACHE_SIZE", 16))
+GET_LLM_PROVIDER_CACHE_SIZE = int(
+    os.getenv("GET_LLM_PROVIDER_CACHE_SIZE", 1024)
+)  # (model, custom_llm_provider, api_base) -> resolved provider, for `get_llm_provider`
+MAX_PATTERN_MATCH_ROUTER_CACHE_SIZE = int(
+    os.getenv("MAX_PATTERN_MATCH_ROUTER_CACHE_SIZE", 1000)
+)
 INITIAL_RETRY_DELAY = float(os.getenv("INITIAL_RETRY_DELAY", 0.5))
 MAX_RETRY_DELAY = float(os.getenv("MAX_RETRY_DELAY", 8.0))
 JITTER = float(os.getenv("JITTER", 0.75))
@@ -147,6 +217,15 @@ DEFAULT_IN_MEMORY_TTL = int(
 DEFAULT_POLLING_INTERVAL = float(
     os.getenv("DEFAULT_POLLING_INTERVAL", 0.03)
 )  # default polling interval for the scheduler
+DEFAULT_SCHEDULER_WAKEUP_INTERVAL = float(
+    os.getenv("DEFAULT_SCHEDULER_WAKEUP_INTERVAL", 1.0)
+)  # max time a queued request waits before re-checking the queue, if no slot-freed event wakes it up
+DEFAULT_SCHEDULER_REDIS_QUEUE_TTL = int(
+    os.getenv("DEFAULT_SCHEDULER_REDIS_QUEUE_TTL", 3600)
+)  # requests older than this are dropped from the scheduler's redis queue - e.g. left behind by dead instances
+DEFAULT_SCHEDULER_PUBLISH_INTERVAL = float(
+    os.getenv("DEFAULT_SCHEDULER_PUBLISH_INTERVAL", 0.05)
+)  # min time between two slot-freed events published for a model group - events in between are batched
 AZURE_OPERATION_POLLING_TIMEOUT = int(os.getenv("AZURE_OPERATION_POLLING_TIMEOUT", 120))
 REDIS_SOCKET_TIMEOUT = float(os.getenv("REDIS_SOCKET_TIMEOUT", 0.1))
 REDIS_CONNECTION_POOL_TIMEOUT = int(os.getenv("REDIS_CONNECTION_POOL_TIMEOUT", 5))
@@ -171,7 +250,22 @@ TOGETHER_AI_EMBEDDING_150_M = int(os.getenv("TOGETHER_AI_EMBEDDING_150_M", 150))
 TOGETHER_AI_EMBEDDING_350_M = int(os.getenv("TOGETHER_AI_EMBEDDING_350_M", 350))
 QDRANT_SCALAR_QUANTILE = float(os.getenv("QDRANT_SCALAR_QUANTILE", 0.99))
 QDRANT_VECTOR_SIZE = int(os.getenv("QDRANT_VECTOR_SIZE", 1536))
+LOCAL_SEMANTIC_CACHE_MAX_SIZE = int(os.getenv("LOCAL_SEMANTIC_CACHE_MAX_SIZE", 10000))
+LOCAL_SEMANTIC_CACHE_IVF_MIN_SIZE = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_IVF_MIN_SIZE", 50000)
+)  # below this, lookups scan every cached vector
+LOCAL_SEMANTIC_CACHE_IVF_NPROBE = int(os.getenv("LOCAL_SEMANTIC_CACHE_IVF_NPROBE", 8))
+LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_SIZE = int(
+    os.getenv("LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_SIZE", 64)
+)
+LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_WAIT_MS = float(
+    os.getenv("LOCAL_SEMANTIC_CACHE_EMBEDDING_BATCH_WAIT_MS", 5)
+)
 CACHED_STREAMING_CHUNK_DELAY = float(os.getenv("CACHED_STREAMING_CHUNK_DELAY", 0.02))
+STREAM_CACHE_READER_TIMEOUT = float(os.getenv("STREAM_CACHE_READER_TIMEOUT", 60))
+REQUEST_COALESCING_STREAM_IDLE_TIMEOUT = float(
+    os.getenv("REQUEST_COALESCING_STREAM_IDLE_TIMEOUT", 60)
+)
 MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB = int(
     os.getenv("MAX_SIZE_PER_ITEM_IN_MEMORY_CACHE_IN_KB", 512)
 )
@@ -191,6 +285,20 @@ FIREWORKS_AI_16_B = int(os.getenv("FIREWORKS_AI_16_B", 16))
 FIREWORKS_AI_80_B = int(os.getenv("FIREWORKS_AI_80_B", 80))
 #### Logging callback constants ####
 REDACTED_BY_LITELM_STRING = "REDACTED_BY_LITELM"
+LOGGING_DISPATCHER_MAX_QUEUE_SIZE = int(
+    os.getenv("LOGGING_DISPATCHER_MAX_QUEUE_SIZE", 10000)
+)
+LOGGING_DISPATCHER_BATCH_SIZE = int(os.getenv("LOGGING_DISPATCHER_BATCH_SIZE", 512))
+LOGGING_DISPATCHER_NUM_WORKERS = int(os.getenv("LOGGING_DISPATCHER_NUM_WORKERS", 16))
+LOGGING_DISPATCHER_MAX_LAG_SECONDS = float(
+    os.getenv("LOGGING_DISPATCHER_MAX_LAG_SECONDS", 0)
+)
+LOGGING_DISPATCHER_DROP_POLICY = os.getenv(
+    "LOGGING_DISPATCHER_DROP_POLICY", "drop_oldest"
+)  # "drop_oldest" or "drop_newest"
+LOGGING_DISPATCHER_SHUTDOWN_TIMEOUT_SECONDS = float(
+    os.getenv("LOGGING_DISPATCHER_SHUTDOWN_TIMEOUT_SECONDS", 5)
+)
 MAX_LANGFUSE_INITIALIZED_CLIENTS = int(
     os.getenv("MAX_LANGFUSE_INITIALIZED_CLIENTS", 50)
 )
@@ -780,6 +888,9 @@ DEFAULT_SOFT_BUDGET = float(
 )  # by default all litellm proxy keys have a soft budget of 50.0
 # makes it clear this is a rate limit error for a litellm virtual key
 RATE_LIMIT_ERROR_MESSAGE_FOR_VIRTUAL_KEY = "LiteLLM Virtual Key user_api_key_hash"
+MAX_IN_MEMORY_RATE_LIMIT_COUNTERS = int(
+    os.getenv("MAX_IN_MEMORY_RATE_LIMIT_COUNTERS", 100_000)
+)  # LRU bound on the per-key counters held in-process by the v3 rate limiter
 
 # pass through route constansts
 BEDROCK_AGENT_RUNTIME_PASS_THROUGH_ROUTES = [
@@ -858,6 +969,8 @@ SPECIAL_LITELLM_AUTH_TOKEN = ["ui-token"]
 DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL = int(
     os.getenv("DEFAULT_MANAGEMENT_OBJECT_IN_MEMORY_CACHE_TTL", 60)
 )
+AUTH_RESULT_CACHE_MAX_SIZE = int(os.getenv("AUTH_RESULT_CACHE_MAX_SIZE", 0))
+AUTH_RESULT_CACHE_TTL_SECONDS = int(os.getenv("AUTH_RESULT_CACHE_TTL_SECONDS", 60))
 
 # Sentry Scrubbing Configuration
 SENTRY_DENYLIST = [
@@ -1421,14 +1421,15 @@ Model Info:
                 }
             )
 
-        if len(self.log_queue) >= self.batch_size:
+        if self.should_flush():
             await self.flush_queue()
 
-    async def async_send_batch(self):
-        if not self.log_queue:
+    async def async_send_batch(self, batch: Optional[List] = None):
+        batch = self.log_queue if batch is None else batch
+        if not batch:
             return
 
-        squashed_queue = squash_payloads(self.log_queue)
+        squashed_queue = squash_payloads(batch)
         tasks = [
             send_to_webhook(
                 slackAlertingInstance=self, item=item["item"], count=item["count"]
@@ -1436,7 +1437,7 @@ Model Info:
             for item in squashed_queue.values()
         ]
         await asyncio.gather(*tasks)
-        self.log_queue.clear()
+        batch.clear()
 
     async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         """Log deployment latency"""
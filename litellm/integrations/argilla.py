@@ -262,7 +262,7 @@ class ArgillaLogger(CustomBatchLogger):
                 f"Langsmith, event added to queue. Will flush in {self.flush_interval} seconds..."
             )
 
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 self._send_batch()
 
         except Exception:
@@ -309,7 +309,7 @@ class ArgillaLogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 await self.flush_queue()
         except Exception:
             verbose_logger.exception(
@@ -335,24 +335,25 @@ class ArgillaLogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 await self.flush_queue()
         except Exception:
             verbose_logger.exception(
                 "Langsmith Layer Error - error logging async failure event."
             )
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
         sends runs to /batch endpoint
 
-        Sends runs from self.log_queue
+        Sends runs from `batch` (defaults to self.log_queue)
 
-        Returns: None
+        Returns: False if the batch couldn't be sent
 
         Raises: Does not raise an exception, will only verbose_logger.exception()
         """
-        if not self.log_queue:
+        batch = self.log_queue if batch is None else batch
+        if not batch:
             return
 
         argilla_api_base = self.default_credentials["ARGILLA_BASE_URL"]
@@ -369,7 +370,7 @@ class ArgillaLogger(CustomBatchLogger):
                 url=url,
                 data=json.dumps(
                     {
-                        "items": self.log_queue,
+                        "items": batch,
                     }
                 ),
                 headers=headers,
@@ -383,9 +384,11 @@ class ArgillaLogger(CustomBatchLogger):
                 )
             else:
                 verbose_logger.debug(
-                    "Batch of %s runs successfully created", len(self.log_queue)
+                    "Batch of %s runs successfully created", len(batch)
                 )
         except httpx.HTTPStatusError:
             verbose_logger.exception("Argilla HTTP Error")
+            return False
         except Exception:
             verbose_logger.exception("Argilla Layer Error")
+            return False
@@ -122,30 +122,34 @@ class AzureBlobStorageLogger(CustomBatchLogger):
             verbose_logger.exception(f"AzureBlobStorageLogger Layer Error - {str(e)}")
             pass
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
-        Sends the in memory logs queue to Azure Blob Storage
+        Sends `batch` (defaults to the in memory logs queue) to Azure Blob Storage
 
-        Raises:
-            Raises a NON Blocking verbose_logger.exception if an error occurs
+        Returns False if an upload failed - the uploaded payloads are removed from `batch`. Errors are logged with a NON Blocking verbose_logger.exception
         """
+        batch = self.log_queue if batch is None else batch
+        num_uploaded = 0
         try:
-            if not self.log_queue:
+            if not batch:
                 verbose_logger.exception("Datadog: log_queue does not exist")
                 return
 
             verbose_logger.debug(
                 "AzureBlobStorageLogger - about to flush %s events",
-                len(self.log_queue),
+                len(batch),
             )
 
-            for payload in self.log_queue:
+            for payload in batch:
                 await self.async_upload_payload_to_azure_blob_storage(payload=payload)
+                num_uploaded += 1
 
         except Exception as e:
             verbose_logger.exception(
                 f"AzureBlobStorageLogger Error sending batch API - {str(e)}"
             )
+            del batch[:num_uploaded]
+            return False
 
     async def async_upload_payload_to_azure_blob_storage(
         self, payload: StandardLoggingPayload
@@ -1,38 +1,160 @@
 """
-Custom Logger that handles batching logic 
+Custom Logger that handles batching logic
 
 Use this if you want your logs to be stored in memory and flushed periodically.
+
+- `log_queue` is bounded - once `max_queue_size` events are queued, the oldest events are dropped
+- `flush_queue` sends the queue in batches of `batch_size` events (and `max_batch_bytes`, if set)
+- up to `max_concurrent_flushes` batches are sent at the same time, failed batches are retried with backoff
+
+Subclasses implement `async_send_batch(batch)` - `batch` is the list of events to send. Return False (or raise) if the batch wasn't sent, to have it retried - events removed from `batch` (e.g. the ones that were sent) aren't retried.
+Subclasses whose `async_send_batch` takes no `batch` send `self.log_queue` in one call, without retries.
 """
 
 import asyncio
+import gzip
+import inspect
 import time
-from typing import List, Optional
+from typing import Any, List, Optional, Tuple
 
 import litellm
 from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_BATCH_LOGGER_MAX_BATCH_BYTES,
+    DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES,
+    DEFAULT_BATCH_LOGGER_MAX_FLUSH_RETRIES,
+    DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE,
+    DEFAULT_BATCH_LOGGER_RETRY_BACKOFF_SECONDS,
+)
 from litellm.integrations.custom_logger import CustomLogger
+from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
+
+
+class LogQueue(list):
+    """
+    `list` with a max length - appending to a full queue drops the oldest events.
+
+    If `track_bytes` is set, the JSON-encoded size of every event is tracked, for byte-bounded batches.
+    """
+
+    def __init__(self, iterable=(), maxlen: int = 0, track_bytes: bool = False):
+        super().__init__()
+        self.maxlen = maxlen
+        self.track_bytes = track_bytes
+        self.sizes: List[int] = []
+        self.num_bytes = 0
+        self.num_dropped = 0
+        self.extend(iterable)
+
+    def append(self, item: Any) -> None:
+        super().append(item)
+        self._track_sizes([item])
+
+    def extend(self, items) -> None:
+        items = list(items)
+        super().extend(items)
+        self._track_sizes(items)
+
+    def clear(self) -> None:
+        super().clear()
+        self.sizes.clear()
+        self.num_bytes = 0
+
+    def take_all(self) -> Tuple[List, List[int]]:
+        """Empty the queue, returning its events and their sizes"""
+        items, sizes = list(self), self.sizes
+        super().clear()
+        self.sizes = []
+        self.num_bytes = 0
+        return items, sizes
+
+    def _track_sizes(self, items: List) -> None:
+        if self.track_bytes:
+            sizes = [len(safe_dumps(item).encode("utf-8")) for item in items]
+            self.sizes.extend(sizes)
+            self.num_bytes += sum(sizes)
+
+        overflow = len(self) - self.maxlen
+        if self.maxlen > 0 and overflow > 0:
+            del self[:overflow]
+            if self.track_bytes:
+                self.num_bytes -= sum(self.sizes[:overflow])
+                del self.sizes[:overflow]
+            if self.num_dropped == 0:
+                verbose_logger.warning(
+                    "CustomBatchLogger: log queue is full (%s events), dropping the oldest events. Increase DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE if this is expected.",
+                    self.maxlen,
+                )
+            self.num_dropped += overflow
+
+
+def _encode_batch(batch: List, compress: bool) -> bytes:
+    data = safe_dumps(batch).encode("utf-8")
+    if compress:
+        data = gzip.compress(data)
+    return data
 
 
 class CustomBatchLogger(CustomLogger):
+    max_queue_size: int = DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE
+    max_batch_bytes: int = DEFAULT_BATCH_LOGGER_MAX_BATCH_BYTES
+
     def __init__(
         self,
         flush_lock: Optional[asyncio.Lock] = None,
         batch_size: Optional[int] = None,
         flush_interval: Optional[int] = None,
+        max_queue_size: Optional[int] = None,
+        max_batch_bytes: Optional[int] = None,
+        max_concurrent_flushes: Optional[int] = None,
+        max_flush_retries: Optional[int] = None,
         **kwargs,
     ) -> None:
         """
         Args:
             flush_lock (Optional[asyncio.Lock], optional): Lock to use when flushing the queue. Defaults to None. Only used for custom loggers that do batching
+            max_queue_size (Optional[int], optional): Max events held in memory, the oldest events are dropped past this. Defaults to DEFAULT_BATCH_LOGGER_MAX_QUEUE_SIZE
+            max_batch_bytes (Optional[int], optional): Max JSON-encoded size of a batch, 0 = no limit. Defaults to DEFAULT_BATCH_LOGGER_MAX_BATCH_BYTES
+            max_concurrent_flushes (Optional[int], optional): Max batches sent at the same time. Defaults to DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES
+            max_flush_retries (Optional[int], optional): Retries for a batch whose `async_send_batch` raised or returned False. Defaults to DEFAULT_BATCH_LOGGER_MAX_FLUSH_RETRIES
         """
+        self.max_queue_size = max_queue_size or self.max_queue_size
+        if max_batch_bytes is not None:
+            self.max_batch_bytes = max_batch_bytes
         self.log_queue: List = []
         self.flush_interval = flush_interval or litellm.DEFAULT_FLUSH_INTERVAL_SECONDS
         self.batch_size: int = batch_size or litellm.DEFAULT_BATCH_SIZE
+        self.max_flush_retries: int = (
+            max_flush_retries
+            if max_flush_retries is not None
+            else DEFAULT_BATCH_LOGGER_MAX_FLUSH_RETRIES
+        )
+        self.max_concurrent_flushes: int = (
+            max_concurrent_flushes or DEFAULT_BATCH_LOGGER_MAX_CONCURRENT_FLUSHES
+        )
+        self._flush_semaphore: Optional[asyncio.Semaphore] = None
         self.last_flush_time = time.time()
         self.flush_lock = flush_lock
 
         super().__init__(**kwargs)
 
+    @property
+    def log_queue(self) -> LogQueue:
+        return self._log_queue
+
+    @log_queue.setter
+    def log_queue(self, value: List) -> None:
+        self._log_queue = LogQueue(
+            value, maxlen=self.max_queue_size, track_bytes=self.max_batch_bytes > 0
+        )
+
+    def should_flush(self) -> bool:
+        """True if the queue holds a full batch (by event count or by bytes)"""
+        return len(self._log_queue) >= self.batch_size or (
+            self.max_batch_bytes > 0
+            and self._log_queue.num_bytes >= self.max_batch_bytes
+        )
+
     async def periodic_flush(self):
         while True:
             await asyncio.sleep(self.flush_interval)
@@ -45,14 +167,91 @@ class CustomBatchLogger(CustomLogger):
         if self.flush_lock is None:
             return
 
+        if not self._async_send_batch_accepts_batch():
+            async with self.flush_lock:
+                if self._log_queue:
+                    await self.async_send_batch()
+                    self._log_queue.clear()
+                    self.last_flush_time = time.time()
+            return
+
         async with self.flush_lock:
-            if self.log_queue:
-                verbose_logger.debug(
-                    "CustomLogger: Flushing batch of %s events", len(self.log_queue)
+            if not self._log_queue:
+                return
+            items, sizes = self._log_queue.take_all()
+            self.last_flush_time = time.time()
+
+        batches = self._split_into_batches(items=items, sizes=sizes)
+        verbose_logger.debug(
+            "CustomLogger: Flushing %s events in %s batches", len(items), len(batches)
+        )
+        await asyncio.gather(*(self._send_batch_with_retries(b) for b in batches))
+
+    def _async_send_batch_accepts_batch(self) -> bool:
+        try:
+            parameters = inspect.signature(self.async_send_batch).parameters
+        except (TypeError, ValueError):
+            return False
+        return "batch" in parameters
+
+    def _split_into_batches(self, items: List, sizes: List[int]) -> List[List]:
+        if self.max_batch_bytes <= 0 or len(sizes) != len(items):
+            return [
+                items[i : i + self.batch_size]
+                for i in range(0, len(items), self.batch_size)
+            ]
+
+        batches: List[List] = []
+        batch: List = []
+        batch_bytes = 0
+        for item, size in zip(items, sizes):
+            if batch and (
+                len(batch) >= self.batch_size
+                or batch_bytes + size > self.max_batch_bytes
+            ):
+                batches.append(batch)
+                batch, batch_bytes = [], 0
+            batch.append(item)
+            batch_bytes += size
+        if batch:
+            batches.append(batch)
+        return batches
+
+    async def _send_batch_with_retries(self, batch: List) -> None:
+        if self._flush_semaphore is None:
+            self._flush_semaphore = asyncio.Semaphore(self.max_concurrent_flushes)
+        async with self._flush_semaphore:
+            for attempt in range(self.max_flush_retries + 1):
+                error = "async_send_batch returned False"
+                try:
+                    if await self.async_send_batch(batch=batch) is not False:
+                        return
+                except Exception as e:
+                    error = str(e)
+                if attempt == self.max_flush_retries:
+                    verbose_logger.error(
+                        "CustomLogger: Dropping batch of %s events after %s attempts - %s",
+                        len(batch),
+                        attempt + 1,
+                        error,
+                    )
+                    return
+                await asyncio.sleep(
+                    DEFAULT_BATCH_LOGGER_RETRY_BACKOFF_SECONDS * 2**attempt
                 )
-                await self.async_send_batch()
-                self.log_queue.clear()
-                self.last_flush_time = time.time()
 
-    async def async_send_batch(self, *args, **kwargs):
+    async def async_encode_batch(self, batch: List, compress: bool = False) -> bytes:
+        """
+        JSON-encode (and optionally gzip) a batch in a worker thread, so large batches don't block the event loop.
+        """
+        return await asyncio.get_running_loop().run_in_executor(
+            None, _encode_batch, batch, compress
+        )
+
+    async def async_send_batch(
+        self, batch: Optional[List] = None, *args, **kwargs
+    ) -> Optional[bool]:
+        """
+        Send `batch` (defaults to `self.log_queue`). Return False if it wasn't sent.
+        """
         pass
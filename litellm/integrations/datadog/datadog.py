@@ -138,29 +138,29 @@ class DataDogLogger(
             )
             pass
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
-        Sends the in memory logs queue to datadog api
+        Sends `batch` (defaults to the in memory logs queue) to datadog api
 
         Logs sent to /api/v2/logs
 
         DD Ref: https://docs.datadoghq.com/api/latest/logs/
 
-        Raises:
-            Raises a NON Blocking verbose_logger.exception if an error occurs
+        Returns False if the batch couldn't be sent - doesn't raise, errors are logged with verbose_logger.exception
         """
+        batch = self.log_queue if batch is None else batch
         try:
-            if not self.log_queue:
+            if not batch:
                 verbose_logger.exception("Datadog: log_queue does not exist")
                 return
 
             verbose_logger.debug(
                 "Datadog - about to flush %s events on %s",
-                len(self.log_queue),
+                len(batch),
                 self.intake_url,
             )
 
-            response = await self.async_send_compressed_data(self.log_queue)
+            response = await self.async_send_compressed_data(batch)
             if response.status_code == 413:
                 verbose_logger.exception(DD_ERRORS.DATADOG_413_ERROR.value)
                 return
@@ -180,6 +180,7 @@ class DataDogLogger(
             verbose_logger.exception(
                 f"Datadog Error sending batch API - {str(e)}\n{traceback.format_exc()}"
             )
+            return False
 
     def log_success_event(self, kwargs, response_obj, start_time, end_time):
         """
@@ -244,8 +245,8 @@ class DataDogLogger(
             f"Datadog, event added to queue. Will flush in {self.flush_interval} seconds..."
         )
 
-        if len(self.log_queue) >= self.batch_size:
-            await self.async_send_batch()
+        if self.should_flush():
+            await self.flush_queue()
 
     def _create_datadog_logging_payload_helper(
         self,
@@ -316,10 +317,7 @@ class DataDogLogger(
         "Datadog recommends sending your logs compressed. Add the Content-Encoding: gzip header to the request when sending"
         """
 
-        import gzip
-
-        from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
-        compressed_data = gzip.compress(safe_dumps(data).encode("utf-8"))
+        compressed_data = await self.async_encode_batch(data, compress=True)
         response = await self.async_client.post(
             url=self.intake_url,
             data=compressed_data,  # type: ignore
@@ -96,21 +96,20 @@ class DataDogLLMObsLogger(DataDogLogger, CustomBatchLogger):
             verbose_logger.debug(f"DataDogLLMObs: Payload: {payload}")
             self.log_queue.append(payload)
 
-            if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+            if self.should_flush():
+                await self.flush_queue()
         except Exception as e:
             verbose_logger.exception(
                 f"DataDogLLMObs: Error logging success event - {str(e)}"
             )
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
+        batch = self.log_queue if batch is None else batch
         try:
-            if not self.log_queue:
+            if not batch:
                 return
 
-            verbose_logger.debug(
-                f"DataDogLLMObs: Flushing {len(self.log_queue)} events"
-            )
+            verbose_logger.debug(f"DataDogLLMObs: Flushing {len(batch)} events")
 
             # Prepare the payload
             payload = {
@@ -119,7 +118,7 @@ class DataDogLLMObsLogger(DataDogLogger, CustomBatchLogger):
                     attributes=DDSpanAttributes(
                         ml_app=self._get_datadog_service(),
                         tags=[self._get_datadog_tags()],
-                        spans=self.log_queue,
+                        spans=batch,
                     ),
                 ),
             }
@@ -141,13 +140,15 @@ class DataDogLLMObsLogger(DataDogLogger, CustomBatchLogger):
             verbose_logger.debug(
                 f"DataDogLLMObs: Successfully sent batch - status_code: {response.status_code}"
             )
-            self.log_queue.clear()
+            batch.clear()
         except httpx.HTTPStatusError as e:
             verbose_logger.exception(
                 f"DataDogLLMObs: Error sending batch - {e.response.text}"
             )
+            return False
         except Exception as e:
             verbose_logger.exception(f"DataDogLLMObs: Error sending batch - {str(e)}")
+            return False
 
     def create_llm_obs_payload(
         self, kwargs: Dict, start_time: datetime, end_time: datetime
@@ -98,9 +98,9 @@ class GCSBucketLogger(GCSBucketBase, AdditionalLoggingUtils):
         except Exception as e:
             verbose_logger.exception(f"GCS Bucket logging error: {str(e)}")
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
-        Process queued logs in batch - sends logs to GCS Bucket
+        Process queued logs in batch (defaults to self.log_queue) - sends logs to GCS Bucket
 
 
         GCS Bucket does not have a Batch endpoint to batch upload logs
@@ -110,10 +110,11 @@ class GCSBucketLogger(GCSBucketBase, AdditionalLoggingUtils):
             - during async_send_batch, we make 1 POST request per log to GCS Bucket
 
         """
-        if not self.log_queue:
+        batch = self.log_queue if batch is None else batch
+        if not batch:
             return
 
-        for log_item in self.log_queue:
+        for log_item in batch:
             logging_payload = log_item["payload"]
             kwargs = log_item["kwargs"]
             response_obj = log_item.get("response_obj", None) or {}
@@ -143,8 +144,8 @@ class GCSBucketLogger(GCSBucketBase, AdditionalLoggingUtils):
                 )
                 pass
 
-        # Clear the queue after processing
-        self.log_queue.clear()
+        # Clear the batch after processing
+        batch.clear()
 
     def _get_object_name(
         self, kwargs: Dict, logging_payload: StandardLoggingPayload, response_obj: Any
@@ -134,8 +134,8 @@ class GcsPubSubLogger(CustomBatchLogger):
                 # New logging payload, StandardLoggingPayload
                 self.log_queue.append(standard_logging_payload)
 
-            if len(self.log_queue) >= self.batch_size:
-                await self.async_send_batch()
+            if self.should_flush():
+                await self.flush_queue()
 
         except Exception as e:
             verbose_logger.exception(
@@ -143,27 +143,32 @@ class GcsPubSubLogger(CustomBatchLogger):
             )
             pass
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
-        Sends the batch of messages to Pub/Sub
+        Sends the batch of messages (defaults to self.log_queue) to Pub/Sub
+
+        Returns False if any message couldn't be published - `batch` is left with those messages
         """
+        batch = self.log_queue if batch is None else batch
+        failed_messages: List = []
         try:
-            if not self.log_queue:
+            if not batch:
                 return
 
-            verbose_logger.debug(
-                f"PubSub - about to flush {len(self.log_queue)} events"
-            )
+            verbose_logger.debug(f"PubSub - about to flush {len(batch)} events")
 
-            for message in self.log_queue:
-                await self.publish_message(message)
+            for message in batch:
+                if await self.publish_message(message) is None:
+                    failed_messages.append(message)
 
         except Exception as e:
             verbose_logger.exception(
                 f"PubSub Error sending batch - {str(e)}\n{traceback.format_exc()}"
             )
-        finally:
-            self.log_queue.clear()
+            return False
+        batch[:] = failed_messages
+        if failed_messages:
+            return False
 
     async def publish_message(
         self, message: Union[SpendLogsPayload, StandardLoggingPayload]
@@ -237,7 +237,7 @@ class LangsmithLogger(CustomBatchLogger):
                 f"Langsmith, event added to queue. Will flush in {self.flush_interval} seconds..."
             )
 
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 self._send_batch()
 
         except Exception:
@@ -278,7 +278,7 @@ class LangsmithLogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 await self.flush_queue()
         except Exception:
             verbose_logger.exception(
@@ -316,18 +316,18 @@ class LangsmithLogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 await self.flush_queue()
         except Exception:
             verbose_logger.exception(
                 "Langsmith Layer Error - error logging async failure event."
             )
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
         Handles sending batches of runs to Langsmith
 
-        self.log_queue contains LangsmithQueueObjects
+        `batch` (defaults to self.log_queue) contains LangsmithQueueObjects
             Each LangsmithQueueObject has the following:
                 - "credentials" - credentials to use for the request (langsmith_api_key, langsmith_project, langsmith_base_url)
                 - "data" - data to log on to langsmith for the request
@@ -336,19 +336,27 @@ class LangsmithLogger(CustomBatchLogger):
         This function
          - groups the queue objects by credentials
          - loops through each unique credentials and sends batches to Langsmith
+         - removes the sent queue objects from `batch`, and returns False if any credentials' batch failed - so only those are retried
 
 
         This was added to support key/team based logging on langsmith
         """
-        if not self.log_queue:
+        batch = self.log_queue if batch is None else batch
+        if not batch:
             return
 
-        batch_groups = self._group_batches_by_credentials()
+        batch_groups = self._group_batches_by_credentials(batch)
+        failed_queue_objects: List[LangsmithQueueObject] = []
         for batch_group in batch_groups.values():
-            await self._log_batch_on_langsmith(
+            sent = await self._log_batch_on_langsmith(
                 credentials=batch_group.credentials,
                 queue_objects=batch_group.queue_objects,
             )
+            if sent is False:
+                failed_queue_objects.extend(batch_group.queue_objects)
+        if failed_queue_objects:
+            batch[:] = failed_queue_objects
+            return False
 
     def _add_endpoint_to_url(
         self, url: str, endpoint: str, api_version: str = "/api/v1"
@@ -373,7 +381,7 @@ class LangsmithLogger(CustomBatchLogger):
             credentials: LangsmithCredentialsObject
             queue_objects: List[LangsmithQueueObject]
 
-        Returns: None
+        Returns: False if the batch couldn't be sent
 
         Raises: Does not raise an exception, will only verbose_logger.exception()
         """
@@ -400,22 +408,28 @@ class LangsmithLogger(CustomBatchLogger):
                 )
             else:
                 verbose_logger.debug(
-                    f"Batch of {len(self.log_queue)} runs successfully created"
+                    f"Batch of {len(elements_to_log)} runs successfully created"
                 )
         except httpx.HTTPStatusError as e:
             verbose_logger.exception(
                 f"Langsmith HTTP Error: {e.response.status_code} - {e.response.text}"
             )
+            return False
         except Exception:
             verbose_logger.exception(
                 f"Langsmith Layer Error - {traceback.format_exc()}"
             )
+            return False
 
-    def _group_batches_by_credentials(self) -> Dict[CredentialsKey, BatchGroup]:
-        """Groups queue objects by credentials using a proper key structure"""
+    def _group_batches_by_credentials(
+        self, queue_objects: Optional[List[LangsmithQueueObject]] = None
+    ) -> Dict[CredentialsKey, BatchGroup]:
+        """Groups queue objects (defaults to self.log_queue) by credentials using a proper key structure"""
         log_queue_by_credentials: Dict[CredentialsKey, BatchGroup] = {}
 
-        for queue_object in self.log_queue:
+        if queue_objects is None:
+            queue_objects = self.log_queue
+        for queue_object in queue_objects:
             credentials = queue_object["credentials"]
             key = CredentialsKey(
                 api_key=credentials["LANGSMITH_API_KEY"],
@@ -59,7 +59,7 @@ class LiteralAILogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 self._send_batch()
         except Exception:
             verbose_logger.exception(
@@ -76,7 +76,7 @@ class LiteralAILogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 self._send_batch()
         except Exception:
             verbose_logger.exception(
@@ -125,7 +125,7 @@ class LiteralAILogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 await self.flush_queue()
         except Exception:
             verbose_logger.exception(
@@ -142,20 +142,21 @@ class LiteralAILogger(CustomBatchLogger):
                 len(self.log_queue),
                 self.batch_size,
             )
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 await self.flush_queue()
         except Exception:
             verbose_logger.exception(
                 "Literal AI Layer Error - error logging async failure event."
             )
 
-    async def async_send_batch(self):
-        if not self.log_queue:
+    async def async_send_batch(self, batch: Optional[List] = None):
+        batch = self.log_queue if batch is None else batch
+        if not batch:
             return
 
         url = f"{self.literalai_api_url}/api/graphql"
-        query = self._steps_query_builder(self.log_queue)
-        variables = self._steps_variables_builder(self.log_queue)
+        query = self._steps_query_builder(batch)
+        variables = self._steps_variables_builder(batch)
 
         try:
             response = await self.async_httpx_client.post(
@@ -171,15 +172,15 @@ class LiteralAILogger(CustomBatchLogger):
                     f"Literal AI Error: {response.status_code} - {response.text}"
                 )
             else:
-                verbose_logger.debug(
-                    f"Batch of {len(self.log_queue)} runs successfully created"
-                )
+                verbose_logger.debug(f"Batch of {len(batch)} runs successfully created")
         except httpx.HTTPStatusError as e:
             verbose_logger.exception(
                 f"Literal AI HTTP Error: {e.response.status_code} - {e.response.text}"
             )
+            return False
         except Exception:
             verbose_logger.exception("Literal AI Layer Error")
+            return False
 
     def _prepare_log_data(self, kwargs, response_obj, start_time, end_time) -> dict:
         logging_payload: Optional[StandardLoggingPayload] = kwargs.get(
@@ -5,7 +5,7 @@ Opik Logger that logs LLM events to an Opik server
 import asyncio
 import json
 import traceback
-from typing import Dict, List
+from typing import Dict, List, Optional
 
 from litellm._logging import verbose_logger
 from litellm.integrations.custom_batch_logger import CustomBatchLogger
@@ -89,7 +89,7 @@ class OpikLogger(CustomBatchLogger):
                 f"OpikLogger added event to log_queue - Will flush in {self.flush_interval} seconds..."
             )
 
-            if len(self.log_queue) >= self.batch_size:
+            if self.should_flush():
                 verbose_logger.debug("OpikLogger - Flushing batch")
                 await self.flush_queue()
         except Exception as e:
@@ -135,7 +135,10 @@ class OpikLogger(CustomBatchLogger):
                 f"OpikLogger failed to log success event - {str(e)}\n{traceback.format_exc()}"
             )
 
-    async def _submit_batch(self, url: str, headers: Dict[str, str], batch: Dict):
+    async def _submit_batch(
+        self, url: str, headers: Dict[str, str], batch: Dict
+    ) -> bool:
+        """Returns False if the batch couldn't be sent"""
         try:
             response = await self.async_httpx_client.post(
                 url=url, headers=headers, json=batch  # type: ignore
@@ -150,8 +153,10 @@ class OpikLogger(CustomBatchLogger):
                 verbose_logger.info(
                     f"OpikLogger - {len(self.log_queue)} Opik events submitted"
                 )
+            return True
         except Exception as e:
             verbose_logger.exception(f"OpikLogger failed to send batch - {str(e)}")
+            return False
 
     def _create_opik_headers(self):
         headers = {}
@@ -162,26 +167,35 @@ class OpikLogger(CustomBatchLogger):
             headers["authorization"] = self.opik_api_key
         return headers
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
+        batch = self.log_queue if batch is None else batch
         verbose_logger.info("Calling async_send_batch")
-        if not self.log_queue:
+        if not batch:
             return
 
         # Split the log_queue into traces and spans
-        traces, spans = get_traces_and_spans_from_payload(self.log_queue)
+        traces, spans = get_traces_and_spans_from_payload(batch)
 
         # Send trace batch
+        traces_sent = spans_sent = True
         if len(traces) > 0:
-            await self._submit_batch(
+            traces_sent = await self._submit_batch(
                 url=self.trace_url, headers=self.headers, batch={"traces": traces}
             )
             verbose_logger.info(f"Sent {len(traces)} traces")
         if len(spans) > 0:
-            await self._submit_batch(
+            spans_sent = await self._submit_batch(
                 url=self.span_url, headers=self.headers, batch={"spans": spans}
             )
             verbose_logger.info(f"Sent {len(spans)} spans")
 
+        # keep only the payloads that weren't sent, to be retried
+        if not traces_sent or not spans_sent:
+            batch[:] = [
+                x for x in batch if (traces_sent if "type" not in x else spans_sent)
+            ]
+            return False
+
     def _create_opik_payload(  # noqa: PLR0915
         self, kwargs, response_obj, start_time, end_time
     ) -> List[Dict]:
@@ -320,17 +320,18 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
         except Exception as e:
             verbose_logger.exception(f"Error uploading to s3: {str(e)}")
 
-    async def async_send_batch(self):
+    async def async_send_batch(self, batch: Optional[List] = None):
         """
 
-        Sends runs from self.log_queue
+        Sends runs from `batch` (defaults to self.log_queue)
 
         Returns: None
 
         Raises: Does not raise an exception, will only verbose_logger.exception()
         """
-        verbose_logger.debug(f"s3_v2 logger - sending batch of {len(self.log_queue)}")
-        if not self.log_queue:
+        batch = self.log_queue if batch is None else batch
+        verbose_logger.debug(f"s3_v2 logger - sending batch of {len(batch)}")
+        if not batch:
             return
 
         #########################################################
@@ -338,7 +339,7 @@ class S3Logger(CustomBatchLogger, BaseAWSLLM):
         #  the log queue can be bounded by DEFAULT_S3_BATCH_SIZE
         #  see custom_batch_logger.py which triggers the flush
         #########################################################
-        for payload in self.log_queue:
+        for payload in batch:
             asyncio.create_task(self.async_upload_data_to_s3(payload))
 
     def create_s3_batch_logging_element(
@@ -200,14 +200,13 @@ class SQSLogger(CustomBatchLogger, BaseAWSLLM):
         except Exception as e:
             verbose_logger.exception(f"sqs Layer Error - {str(e)}")
 
-    async def async_send_batch(self) -> None:
-        verbose_logger.debug(
-            f"sqs logger - sending batch of {len(self.log_queue)}"
-        )
-        if not self.log_queue:
+    async def async_send_batch(self, batch: Optional[List] = None) -> None:
+        batch = self.log_queue if batch is None else batch
+        verbose_logger.debug(f"sqs logger - sending batch of {len(batch)}")
+        if not batch:
             return
 
-        for payload in self.log_queue:
+        for payload in batch:
             asyncio.create_task(self.async_send_message(payload))
 
     async def async_send_message(self, payload: StandardLoggingPayload) -> None:
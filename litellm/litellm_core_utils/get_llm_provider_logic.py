@@ -1,9 +1,14 @@
-from typing import Optional, Tuple
+import threading
+from collections import OrderedDict
+from typing import Hashable, Literal, Optional, Tuple
 
 import httpx
 
 import litellm
-from litellm.constants import REPLICATE_MODEL_NAME_WITH_ID_LENGTH
+from litellm.constants import (
+    GET_LLM_PROVIDER_CACHE_SIZE,
+    REPLICATE_MODEL_NAME_WITH_ID_LENGTH,
+)
 from litellm.secret_managers.main import get_secret, get_secret_str
 
 from ..types.router import LiteLLM_Params
@@ -85,6 +90,63 @@ def handle_anthropic_text_model_custom_llm_provider(
     return model, custom_llm_provider
 
 
+# how a (model, custom_llm_provider, api_base) resolves - the parts that don't depend on env vars / api keys:
+# ("resolved", model, custom_llm_provider) - returned with no dynamic api key and the api base passed in
+# ("openai_compatible", model, "") - the `provider/model` string passed to `_get_openai_compatible_provider_info`, which reads the env on every call
+_ProviderRoute = Tuple[Literal["resolved", "openai_compatible"], str, str]
+
+
+class _ProviderRouteCache:
+    """bounded LRU of `_ProviderRoute`s, keyed on (model, custom_llm_provider, api_base)"""
+
+    def __init__(self, max_size: int = GET_LLM_PROVIDER_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[Hashable, _ProviderRoute]" = OrderedDict()
+
+    @staticmethod
+    def get_cache_key(
+        model: str, custom_llm_provider: Optional[str], api_base: Optional[str]
+    ) -> Optional[Hashable]:
+        if (
+            isinstance(model, str)
+            and isinstance(custom_llm_provider, (str, type(None)))
+            and isinstance(api_base, (str, type(None)))
+        ):
+            return model, custom_llm_provider, api_base
+        return None
+
+    def get(self, key: Optional[Hashable]) -> Optional[_ProviderRoute]:
+        if key is None:
+            return None
+        with self._lock:
+            route = self._cache.get(key)
+            if route is not None:
+                self._cache.move_to_end(key)
+            return route
+
+    def set(self, key: Optional[Hashable], route: _ProviderRoute) -> None:
+        if key is None or self.max_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = route
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def flush_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+_provider_route_cache = _ProviderRouteCache()
+
+
+def flush_get_llm_provider_cache() -> None:
+    """call when the model / provider lists `get_llm_provider` reads from change - e.g. on `litellm.register_model`"""
+    _provider_route_cache.flush_cache()
+
+
 def get_llm_provider(  # noqa: PLR0915
     model: str,
     custom_llm_provider: Optional[str] = None,
@@ -100,6 +162,8 @@ def get_llm_provider(  # noqa: PLR0915
     Raises Error - if unable to map model to a provider
 
     Return model, custom_llm_provider, dynamic_api_key, api_base
+
+    How the model string resolves is cached per (model, custom_llm_provider, api_base) - api keys / api bases from the env are still read on every call.
     """
     try:
         if litellm.LiteLLMProxyChatConfig._should_use_litellm_proxy_by_default(
@@ -109,6 +173,25 @@ def get_llm_provider(  # noqa: PLR0915
                 model=model, api_base=api_base, api_key=api_key
             )
 
+        route_cache_key = None
+        if litellm_params is None and not (
+            api_key and api_key.startswith("os.environ/")
+        ):
+            route_cache_key = _ProviderRouteCache.get_cache_key(
+                model, custom_llm_provider, api_base
+            )
+            route = _provider_route_cache.get(route_cache_key)
+            if route is not None:
+                route_type, route_model, route_provider = route
+                if route_type == "openai_compatible":
+                    return _get_openai_compatible_provider_info(
+                        model=route_model,
+                        api_base=api_base,
+                        api_key=api_key,
+                        dynamic_api_key=None,
+                    )
+                return route_model, route_provider, None, api_base
+
         ## IF LITELLM PARAMS GIVEN ##
         if litellm_params:
             assert (
@@ -125,6 +208,9 @@ def get_llm_provider(  # noqa: PLR0915
         if model.split("/", 1)[0] == "azure":
             if _is_non_openai_azure_model(model):
                 custom_llm_provider = "openai"
+                _provider_route_cache.set(
+                    route_cache_key, ("resolved", model, custom_llm_provider)
+                )
                 return model, custom_llm_provider, dynamic_api_key, api_base
 
         ### Handle cases when custom_llm_provider is set to cohere/command-r-plus but it should use cohere_chat route
@@ -151,6 +237,7 @@ def get_llm_provider(  # noqa: PLR0915
             and len(model.split("/"))
             > 1  # handle edge case where user passes in `litellm --model mistral` https://github.com/BerriAI/litellm/issues/1351
         ):
+            _provider_route_cache.set(route_cache_key, ("openai_compatible", model, ""))
             return _get_openai_compatible_provider_info(
                 model=model,
                 api_base=api_base,
@@ -170,6 +257,9 @@ def get_llm_provider(  # noqa: PLR0915
                         dynamic_api_key
                     )
                 )
+            _provider_route_cache.set(
+                route_cache_key, ("resolved", model, custom_llm_provider)
+            )
             return model, custom_llm_provider, dynamic_api_key, api_base
         # check if api base is a known openai compatible endpoint
         if api_base:
@@ -392,6 +482,11 @@ def get_llm_provider(  # noqa: PLR0915
                     dynamic_api_key
                 )
             )
+        # ai21 reads its api base / key from the env - don't cache it
+        if custom_llm_provider != "ai21_chat":
+            _provider_route_cache.set(
+                route_cache_key, ("resolved", model, custom_llm_provider)
+            )
         return model, custom_llm_provider, dynamic_api_key, api_base
     except Exception as e:
         if isinstance(e, litellm.exceptions.BadRequestError):
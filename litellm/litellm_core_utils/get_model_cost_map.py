@@ -6,26 +6,41 @@ This can be disabled by setting the LITELLM_LOCAL_MODEL_COST_MAP environment var
 ```
 export LITELLM_LOCAL_MODEL_COST_MAP=True
 ```
+
+On `import litellm`, the bundled backup is loaded and the remote map is fetched in a background thread - see `start_background_model_cost_map_refresh`.
 """
 
 import os
+import threading
+from typing import Callable, Optional
 
 import httpx
 
+from litellm._logging import verbose_logger
 
-def get_model_cost_map(url: str) -> dict:
-    if (
+
+def _use_local_model_cost_map() -> bool:
+    return bool(
         os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False)
         or os.getenv("LITELLM_LOCAL_MODEL_COST_MAP", False) == "True"
-    ):
-        import importlib.resources
-        import json
+    )
+
+
+def get_bundled_model_cost_map() -> dict:
+    """Load the model cost map shipped with litellm (`model_prices_and_context_window_backup.json`)"""
+    import importlib.resources
+    import json
+
+    with importlib.resources.open_text(
+        "litellm", "model_prices_and_context_window_backup.json"
+    ) as f:
+        content = json.load(f)
+        return content
 
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
-            content = json.load(f)
-            return content
+
+def get_model_cost_map(url: str) -> dict:
+    if _use_local_model_cost_map():
+        return get_bundled_model_cost_map()
 
     try:
         response = httpx.get(
@@ -35,11 +50,72 @@ def get_model_cost_map(url: str) -> dict:
         content = response.json()
         return content
     except Exception:
-        import importlib.resources
-        import json
-
-        with importlib.resources.open_text(
-            "litellm", "model_prices_and_context_window_backup.json"
-        ) as f:
-            content = json.load(f)
-            return content
+        return get_bundled_model_cost_map()
+
+
+def refresh_model_cost_map(url: str, model_cost: dict) -> dict:
+    """
+    Fetch the remote model cost map, and return the entries it adds to or updates in `model_cost` (loaded from the bundled backup).
+
+    `model_cost` isn't modified. Entries changed since the backup was loaded (e.g. via `litellm.register_model`) are kept.
+    """
+    response = httpx.get(url, timeout=5)
+    response.raise_for_status()
+    remote_model_cost: dict = response.json()
+    bundled_model_cost = get_bundled_model_cost_map()
+
+    model_cost_updates = {}
+    for key, value in remote_model_cost.items():
+        current_value = model_cost.get(key)
+        if current_value is not None and (
+            current_value != bundled_model_cost.get(key) or current_value == value
+        ):
+            continue
+        model_cost_updates[key] = value
+    return model_cost_updates
+
+
+def _refresh_model_cost_map_in_background(
+    url: str,
+    model_cost: dict,
+    on_refresh: Callable[[dict], None],
+):
+    try:
+        model_cost_updates = refresh_model_cost_map(url=url, model_cost=model_cost)
+        if model_cost_updates:
+            on_refresh(model_cost_updates)
+        verbose_logger.debug(
+            "Refreshed model cost map from %s, %s entries updated",
+            url,
+            len(model_cost_updates),
+        )
+    except Exception as e:
+        verbose_logger.debug(
+            "Failed to refresh model cost map from %s, using the bundled map: %s",
+            url,
+            str(e),
+        )
+
+
+def start_background_model_cost_map_refresh(
+    url: str,
+    model_cost: dict,
+    on_refresh: Callable[[dict], None],
+) -> Optional[threading.Thread]:
+    """
+    Fetch the remote model cost map from `url` in a daemon thread, so `import litellm` doesn't block on the network.
+
+    `on_refresh` is called (in the thread) with the entries to add to / update in `model_cost` - it should swap in an updated copy, not modify `model_cost` in place, since other threads may be iterating it.
+
+    No-op if `LITELLM_LOCAL_MODEL_COST_MAP` is set.
+    """
+    if _use_local_model_cost_map():
+        return None
+    thread = threading.Thread(
+        target=_refresh_model_cost_map_in_background,
+        kwargs={"url": url, "model_cost": model_cost, "on_refresh": on_refresh},
+        name="litellm-model-cost-map-refresh",
+        daemon=True,
+    )
+    thread.start()
+    return thread
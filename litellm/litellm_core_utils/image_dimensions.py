@@ -0,0 +1,363 @@
+"""
+Image dimensions for token counting, without downloading the image.
+
+- Only the start of an image is read - a `Range` request for the first `IMAGE_PROBE_MAX_BYTES`, streamed and parsed as it arrives, the connection is closed once the PNG / JPEG / GIF / WebP header is parsed
+- base64 payloads are decoded from the start, until the header is parsed
+- dimensions are cached in a bounded LRU, by URL, and by digest for base64 payloads. Images whose dimensions can't be read aren't probed again for `IMAGE_DIMENSIONS_FAILED_PROBE_TTL_SECONDS`
+- `get_image_dimensions` never blocks a running event loop - on a cache miss inside the loop, the URL is probed in the background and the default dimensions are returned
+"""
+
+import asyncio
+import base64
+import binascii
+import hashlib
+import struct
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Hashable, Optional, Set, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    DEFAULT_IMAGE_HEIGHT,
+    DEFAULT_IMAGE_WIDTH,
+    IMAGE_DIMENSIONS_CACHE_SIZE,
+    IMAGE_DIMENSIONS_FAILED_PROBE_TTL_SECONDS,
+    IMAGE_PROBE_MAX_BYTES,
+    IMAGE_PROBE_TIMEOUT_SECONDS,
+)
+
+ImageDimensions = Tuple[int, int]
+
+# base64 chars decoded before the digest cache is checked - enough for the header of most images
+_BASE64_FIRST_CHUNK_CHARS = 4096
+
+
+def get_image_type(image_data: bytes) -> Optional[str]:
+    """take an image (really only the first ~100 bytes max are needed)
+    and return 'png' 'gif' 'jpeg' 'webp' 'heic' or None. method added to
+    allow deprecation of imghdr in 3.13"""
+
+    if image_data[0:8] == b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a":
+        return "png"
+
+    if image_data[0:4] == b"GIF8" and image_data[5:6] == b"a":
+        return "gif"
+
+    if image_data[0:3] == b"\xff\xd8\xff":
+        return "jpeg"
+
+    if image_data[4:8] == b"ftyp":
+        return "heic"
+
+    if image_data[0:4] == b"RIFF" and image_data[8:12] == b"WEBP":
+        return "webp"
+
+    return None
+
+
+def _parse_jpeg_dimensions(image_data: bytes) -> Optional[ImageDimensions]:
+    # walk the segments until the start-of-frame segment, which holds the dimensions
+    offset = 2
+    while True:
+        while offset < len(image_data) and image_data[offset] == 0xFF:
+            offset += 1  # marker + fill bytes
+        if offset >= len(image_data):
+            return None
+        marker = image_data[offset]
+        offset += 1
+        if marker == 0xD8 or marker == 0x01 or 0xD0 <= marker <= 0xD7:
+            continue  # no payload
+        if 0xC0 <= marker <= 0xCF and marker not in (0xC4, 0xC8, 0xCC):
+            if offset + 7 > len(image_data):
+                return None
+            h, w = struct.unpack(">HH", image_data[offset + 3 : offset + 7])
+            return w, h
+        if offset + 2 > len(image_data):
+            return None
+        offset += struct.unpack(">H", image_data[offset : offset + 2])[0]
+
+
+def parse_image_dimensions(image_data: bytes) -> Optional[ImageDimensions]:
+    """
+    Dimensions of a PNG / JPEG / GIF / WebP image, from the start of its bytes.
+
+    Returns None if `image_data` ends before the dimensions, or isn't a supported image.
+    """
+    img_type = get_image_type(image_data)
+
+    if img_type == "png" and len(image_data) >= 24:
+        w, h = struct.unpack(">LL", image_data[16:24])
+        return w, h
+    elif img_type == "gif" and len(image_data) >= 10:
+        w, h = struct.unpack("<HH", image_data[6:10])
+        return w, h
+    elif img_type == "jpeg":
+        return _parse_jpeg_dimensions(image_data)
+    elif img_type == "webp" and len(image_data) >= 30:
+        # For WebP, the dimensions are stored at different offsets depending on the format
+        # Check for VP8X (extended format)
+        if image_data[12:16] == b"VP8X":
+            w = struct.unpack("<I", image_data[24:27] + b"\x00")[0] + 1
+            h = struct.unpack("<I", image_data[27:30] + b"\x00")[0] + 1
+            return w, h
+        # Check for VP8 (lossy format)
+        elif image_data[12:16] == b"VP8 ":
+            w = struct.unpack("<H", image_data[26:28])[0] & 0x3FFF
+            h = struct.unpack("<H", image_data[28:30])[0] & 0x3FFF
+            return w, h
+        # Check for VP8L (lossless format)
+        elif image_data[12:16] == b"VP8L":
+            bits = struct.unpack("<I", image_data[21:25])[0]
+            w = (bits & 0x3FFF) + 1
+            h = ((bits >> 14) & 0x3FFF) + 1
+            return w, h
+    return None
+
+
+def _is_unsupported(image_data: bytes) -> bool:
+    """True if reading more of the image can't help"""
+    if len(image_data) < 32:
+        return False
+    return get_image_type(image_data) in (None, "heic")
+
+
+class ImageDimensionsProber:
+    """
+    Usage:
+        prober = ImageDimensionsProber()
+        width, height = await prober.async_get_image_dimensions(url_or_base64)
+        width, height = prober.get_image_dimensions(url_or_base64)  # sync, never blocks a running event loop
+    """
+
+    def __init__(
+        self,
+        max_size: int = IMAGE_DIMENSIONS_CACHE_SIZE,
+        max_probe_bytes: int = IMAGE_PROBE_MAX_BYTES,
+        timeout: float = IMAGE_PROBE_TIMEOUT_SECONDS,
+        failed_probe_ttl: float = IMAGE_DIMENSIONS_FAILED_PROBE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.max_probe_bytes = max_probe_bytes
+        self.timeout = timeout
+        self.failed_probe_ttl = failed_probe_ttl
+        self._lock = threading.Lock()
+        # url / digest of a base64 payload -> dimensions, least recently used first
+        self._cache: "OrderedDict[Hashable, ImageDimensions]" = OrderedDict()
+        # url / digest whose dimensions couldn't be read -> time it can be probed again, oldest first
+        self._failed: "OrderedDict[Hashable, float]" = OrderedDict()
+        self._in_flight: Dict[
+            Tuple[asyncio.AbstractEventLoop, str],
+            "asyncio.Task[Optional[ImageDimensions]]",
+        ] = {}
+        self._background_probes: Set[asyncio.Task] = set()
+
+    ### CACHE ###
+    def _get_cached(self, key: Hashable) -> Optional[ImageDimensions]:
+        """Cached dimensions - the default dimensions for a recently failed probe"""
+        with self._lock:
+            dimensions = self._cache.get(key)
+            if dimensions is not None:
+                self._cache.move_to_end(key)
+                return dimensions
+            retry_at = self._failed.get(key)
+            if retry_at is not None:
+                if time.time() < retry_at:
+                    return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+                del self._failed[key]
+            return None
+
+    def _set_cached(self, key: Hashable, dimensions: ImageDimensions) -> None:
+        with self._lock:
+            self._cache[key] = dimensions
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def _set_failed(self, key: Hashable) -> None:
+        if self.failed_probe_ttl <= 0:
+            return
+        with self._lock:
+            self._failed[key] = time.time() + self.failed_probe_ttl
+            self._failed.move_to_end(key)
+            while len(self._failed) > self.max_size:
+                self._failed.popitem(last=False)
+
+    ### BASE64 ###
+    def _get_base64_dimensions(self, data: str) -> Optional[ImageDimensions]:
+        _header, separator, encoded = data.partition(",")
+        if not separator:
+            return None
+        try:
+            dimensions = parse_image_dimensions(
+                base64.b64decode(encoded[:_BASE64_FIRST_CHUNK_CHARS])
+            )
+            if dimensions is not None:
+                return dimensions
+        except (binascii.Error, ValueError):
+            pass  # e.g. whitespace in the payload - chunk isn't a multiple of 4 chars
+
+        # header is past the first chunk - decoding more is worth caching
+        digest = hashlib.sha256(encoded.encode("utf-8")).digest()
+        dimensions = self._get_cached(digest)
+        if dimensions is not None:
+            return dimensions
+
+        num_chars = _BASE64_FIRST_CHUNK_CHARS
+        while num_chars < len(encoded):
+            num_chars *= 2
+            try:
+                image_data = base64.b64decode(encoded[:num_chars])
+            except (binascii.Error, ValueError):
+                try:
+                    image_data = base64.b64decode(encoded)
+                except (binascii.Error, ValueError):
+                    break
+                num_chars = len(encoded)
+            dimensions = parse_image_dimensions(image_data)
+            if dimensions is not None:
+                self._set_cached(digest, dimensions)
+                return dimensions
+            if _is_unsupported(image_data):
+                break
+        self._set_failed(digest)
+        return None
+
+    ### URLS ###
+    def _range_headers(self) -> Dict[str, str]:
+        return {"Range": f"bytes=0-{self.max_probe_bytes - 1}"}
+
+    def _probe_url(self, url: str) -> Optional[ImageDimensions]:
+        from litellm.llms.custom_httpx.http_handler import _get_httpx_client
+
+        client = _get_httpx_client()
+        image_data = b""
+        # servers that ignore `Range` send the whole image - stop reading once the header is parsed
+        with client.client.stream(
+            "GET",
+            url,
+            headers=self._range_headers(),
+            follow_redirects=True,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            for chunk in response.iter_bytes():
+                image_data += chunk
+                dimensions = parse_image_dimensions(image_data)
+                if dimensions is not None:
+                    return dimensions
+                if (
+                    _is_unsupported(image_data)
+                    or len(image_data) >= self.max_probe_bytes
+                ):
+                    return None
+        return None
+
+    async def _async_probe_url(self, url: str) -> Optional[ImageDimensions]:
+        from litellm.llms.custom_httpx.http_handler import get_async_httpx_client
+        from litellm.types.llms.custom_http import httpxSpecialProvider
+
+        client = get_async_httpx_client(llm_provider=httpxSpecialProvider.PromptFactory)
+        image_data = b""
+        async with client.client.stream(
+            "GET",
+            url,
+            headers=self._range_headers(),
+            follow_redirects=True,
+            timeout=self.timeout,
+        ) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes():
+                image_data += chunk
+                dimensions = parse_image_dimensions(image_data)
+                if dimensions is not None:
+                    return dimensions
+                if (
+                    _is_unsupported(image_data)
+                    or len(image_data) >= self.max_probe_bytes
+                ):
+                    return None
+        return None
+
+    async def _async_probe_and_cache(self, url: str) -> Optional[ImageDimensions]:
+        try:
+            dimensions = await self._async_probe_url(url)
+        except Exception as e:
+            verbose_logger.debug(
+                "ImageDimensionsProber: error probing %s - %s", url, str(e)
+            )
+            dimensions = None
+        if dimensions is None:
+            self._set_failed(url)
+        else:
+            self._set_cached(url, dimensions)
+        return dimensions
+
+    ### PUBLIC ###
+    async def async_get_image_dimensions(self, data: str) -> ImageDimensions:
+        """
+        Width and height of an image URL or base64 data URL. Default dimensions if they can't be read.
+
+        Concurrent calls for the same URL share one request.
+        """
+        if data.startswith("data:"):
+            return self._get_base64_dimensions(data) or (
+                DEFAULT_IMAGE_WIDTH,
+                DEFAULT_IMAGE_HEIGHT,
+            )
+
+        dimensions = self._get_cached(data)
+        if dimensions is not None:
+            return dimensions
+
+        key = (asyncio.get_running_loop(), data)
+        task = self._in_flight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._async_probe_and_cache(data))
+            self._in_flight[key] = task
+            task.add_done_callback(lambda _: self._in_flight.pop(key, None))
+        return await asyncio.shield(task) or (DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT)
+
+    def get_image_dimensions(self, data: str) -> ImageDimensions:
+        """
+        Sync version of `async_get_image_dimensions`.
+
+        Inside a running event loop, a URL that isn't cached is probed in the background - this call returns the default dimensions instead of blocking the loop.
+        """
+        if data.startswith("data:"):
+            return self._get_base64_dimensions(data) or (
+                DEFAULT_IMAGE_WIDTH,
+                DEFAULT_IMAGE_HEIGHT,
+            )
+
+        dimensions = self._get_cached(data)
+        if dimensions is not None:
+            return dimensions
+
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None:
+            if (loop, data) not in self._in_flight:
+                task = loop.create_task(self.async_get_image_dimensions(data))
+                self._background_probes.add(task)
+                task.add_done_callback(self._background_probes.discard)
+            return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+
+        try:
+            dimensions = self._probe_url(data)
+        except Exception as e:
+            verbose_logger.debug(
+                "ImageDimensionsProber: error probing %s - %s", data, str(e)
+            )
+            dimensions = None
+        if dimensions is None:
+            self._set_failed(data)
+            return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+        self._set_cached(data, dimensions)
+        return dimensions
+
+
+image_dimensions_prober = ImageDimensionsProber()
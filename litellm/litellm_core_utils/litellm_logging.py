@@ -63,6 +63,7 @@ from litellm.litellm_core_utils.get_litellm_params import get_litellm_params
 from litellm.litellm_core_utils.llm_cost_calc.tool_call_cost_tracking import (
     StandardBuiltInToolCostTracking,
 )
+from litellm.litellm_core_utils.logging_dispatcher import logging_dispatcher
 from litellm.litellm_core_utils.model_param_helper import ModelParamHelper
 from litellm.litellm_core_utils.redact_messages import (
     redact_message_input_output_from_custom_logger,
@@ -111,7 +112,7 @@ from litellm.types.utils import (
     TranscriptionResponse,
     Usage,
 )
-from litellm.utils import _get_base_model_from_metadata, executor, print_verbose
+from litellm.utils import _get_base_model_from_metadata, print_verbose
 
 from ..integrations.argilla import ArgillaLogger
 from ..integrations.arize.arize_phoenix import ArizePhoenixLogger
@@ -2779,12 +2780,12 @@ class Logging(LiteLLMLoggingBaseClass):
         """
         Handles calling success callbacks for Async calls.
 
-        Why: Some callbacks - `langfuse`, `s3` are sync callbacks. We need to call them in the executor.
+        Why: Some callbacks - `langfuse`, `s3` are sync callbacks. We need to call them off the event loop, in the logging dispatcher.
         """
         if self._should_run_sync_callbacks_for_async_calls() is False:
             return
 
-        executor.submit(
+        logging_dispatcher.submit(
             self.success_handler,
             result,
             start_time,
@@ -0,0 +1,260 @@
+"""
+Runs logging work (e.g. `Logging.success_handler`, streaming chunk logging) off the request path.
+
+Replaces a `ThreadPoolExecutor.submit` / `threading.Thread` per logging event:
+- events are queued per callback instance (e.g. one queue per `Logging` object), so each instance's events run in order
+- queues are run by a pool of up to `LOGGING_DISPATCHER_NUM_WORKERS` threads, each owning an event loop for coroutine functions - a slow (blocking) callback only holds up its own queue and one worker
+- a worker takes up to `LOGGING_DISPATCHER_BATCH_SIZE` events from a queue at a time, then moves on to the next queue
+- at most `LOGGING_DISPATCHER_MAX_QUEUE_SIZE` events are queued - under load, events are dropped (and a warning logged) instead of piling up work
+- events that waited longer than `LOGGING_DISPATCHER_MAX_LAG_SECONDS` are dropped (0 = never)
+
+Per-callback (qualified name) queue depth, lag and drop counts are available via `logging_dispatcher.get_stats()`.
+"""
+
+import asyncio
+import atexit
+import inspect
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+from litellm._logging import verbose_logger
+from litellm.constants import (
+    LOGGING_DISPATCHER_BATCH_SIZE,
+    LOGGING_DISPATCHER_DROP_POLICY,
+    LOGGING_DISPATCHER_MAX_LAG_SECONDS,
+    LOGGING_DISPATCHER_MAX_QUEUE_SIZE,
+    LOGGING_DISPATCHER_NUM_WORKERS,
+    LOGGING_DISPATCHER_SHUTDOWN_TIMEOUT_SECONDS,
+)
+from litellm.types.utils import LoggingDispatcherStats
+
+# (time enqueued, callable, args, kwargs)
+_LoggingEvent = Tuple[float, Callable, tuple, dict]
+
+
+def _get_callback_name(fn: Callable) -> str:
+    return getattr(fn, "__qualname__", None) or repr(fn)
+
+
+def _get_queue_key(fn: Callable) -> int:
+    """
+    Queue key for `fn` - the instance a bound method belongs to, else the callable itself.
+
+    Queued events hold a reference to `fn`, so the id can't be reused while the queue exists.
+    """
+    return id(getattr(fn, "__self__", fn))
+
+
+class LoggingDispatcher:
+    def __init__(
+        self,
+        max_queue_size: int = LOGGING_DISPATCHER_MAX_QUEUE_SIZE,
+        batch_size: int = LOGGING_DISPATCHER_BATCH_SIZE,
+        max_lag_seconds: float = LOGGING_DISPATCHER_MAX_LAG_SECONDS,
+        drop_policy: str = LOGGING_DISPATCHER_DROP_POLICY,
+        num_workers: int = LOGGING_DISPATCHER_NUM_WORKERS,
+    ):
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self.max_lag_seconds = max_lag_seconds
+        self.drop_policy = drop_policy
+        self.num_workers = max(num_workers, 1)
+
+        self._condition = threading.Condition()  # wakes up idle workers
+        self._flushed = threading.Condition(self._condition)  # wakes up `flush`
+        self._queues: Dict[int, Deque[_LoggingEvent]] = {}
+        # queues waiting for a worker, oldest first. A queue is either waiting, or being run by a worker - never both
+        self._ready: Deque[int] = deque()
+        self._scheduled: Set[int] = set()
+        self._num_queued = 0
+        self._num_busy_workers = 0
+        self._num_idle_workers = 0
+        self._stats: Dict[str, LoggingDispatcherStats] = {}
+        self._workers: List[threading.Thread] = []
+        self._pid: Optional[int] = None
+
+    def submit(self, fn: Callable, *args: Any, **kwargs: Any) -> None:
+        """
+        Queue `fn(*args, **kwargs)`. If `fn` returns an awaitable, it's awaited on the worker's event loop.
+        """
+        name = _get_callback_name(fn)
+        key = _get_queue_key(fn)
+        with self._condition:
+            self._check_pid()
+            if name not in self._stats:
+                self._stats[name] = LoggingDispatcherStats(
+                    queued=0, processed=0, dropped=0, errors=0, lag_seconds=0.0
+                )
+            if self._num_queued >= self.max_queue_size and not self._drop_oldest():
+                self._record_dropped(name=name, dropped=1)
+                return
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = deque()
+            queue.append((time.time(), fn, args, kwargs))
+            self._num_queued += 1
+            if key not in self._scheduled:
+                self._scheduled.add(key)
+                self._ready.append(key)
+                self._wake_worker()
+
+    def get_stats(self) -> Dict[str, LoggingDispatcherStats]:
+        """Per-callback queue depth, processed / dropped / error counts and lag"""
+        with self._condition:
+            queued: Dict[str, int] = {}
+            for queue in self._queues.values():
+                for _, fn, _, _ in queue:
+                    name = _get_callback_name(fn)
+                    queued[name] = queued.get(name, 0) + 1
+            return {
+                name: LoggingDispatcherStats(
+                    **{**stats, "queued": queued.get(name, 0)}  # type: ignore
+                )
+                for name, stats in self._stats.items()
+            }
+
+    def flush(
+        self, timeout: float = LOGGING_DISPATCHER_SHUTDOWN_TIMEOUT_SECONDS
+    ) -> bool:
+        """
+        Block until every queued event has been run. Returns False on timeout.
+        """
+        if threading.current_thread() in self._workers:
+            return False
+        with self._condition:
+            return self._flushed.wait_for(
+                lambda: (self._num_queued == 0 and self._num_busy_workers == 0)
+                or self._pid != os.getpid(),
+                timeout=timeout,
+            )
+
+    def _check_pid(self) -> None:
+        if self._pid == os.getpid():
+            return
+        # first event, or first event after a fork - the parent's workers don't exist in this process
+        self._pid = os.getpid()
+        self._queues.clear()
+        self._ready.clear()
+        self._scheduled.clear()
+        self._num_queued = 0
+        self._num_busy_workers = 0
+        self._num_idle_workers = 0
+        self._workers = []
+
+    def _wake_worker(self) -> None:
+        if self._num_idle_workers > 0:
+            # claimed here, not by the woken worker - so events submitted before it wakes up go to another worker
+            self._num_idle_workers -= 1
+            self._condition.notify()
+        elif len(self._workers) < self.num_workers:
+            worker = threading.Thread(
+                target=self._run,
+                name=f"litellm-logging-dispatcher-{len(self._workers)}",
+                daemon=True,
+            )
+            self._workers.append(worker)
+            worker.start()
+
+    def _drop_oldest(self) -> bool:
+        """
+        With the `drop_oldest` policy, drop the first event of the queue that's been waiting longest. Returns False if nothing was dropped.
+        """
+        if self.drop_policy == "drop_newest":
+            return False
+        for key in self._ready:
+            queue = self._queues[key]
+            if queue:
+                _, fn, _, _ = queue.popleft()
+                self._num_queued -= 1
+                self._record_dropped(name=_get_callback_name(fn), dropped=1)
+                return True
+        return False
+
+    def _record_dropped(self, name: str, dropped: int) -> None:
+        stats = self._stats[name]
+        stats["dropped"] += dropped
+        verbose_logger.warning(
+            "LoggingDispatcher: dropped %s logging event(s) for %s (%s dropped so far). Increase LOGGING_DISPATCHER_MAX_QUEUE_SIZE / LOGGING_DISPATCHER_MAX_LAG_SECONDS if this is expected.",
+            dropped,
+            name,
+            stats["dropped"],
+        )
+
+    def _run(self) -> None:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        while True:
+            # the batch only lives in `_run_next_batch`'s frame, so a worker waiting for events doesn't keep the last batch (e.g. logging objects, streams) alive
+            self._run_next_batch(loop=loop)
+
+    def _run_next_batch(self, loop: asyncio.AbstractEventLoop) -> None:
+        key, batch = self._get_next_batch()
+        try:
+            self._run_batch(loop=loop, batch=batch)
+        finally:
+            with self._condition:
+                self._num_busy_workers -= 1
+                if self._queues.get(key):
+                    # picked up again by this worker, after the queues waiting before it
+                    self._ready.append(key)
+                else:
+                    self._queues.pop(key, None)
+                    self._scheduled.discard(key)
+                if self._num_busy_workers == 0 and self._num_queued == 0:
+                    self._flushed.notify_all()
+
+    def _get_next_batch(self) -> Tuple[int, List[_LoggingEvent]]:
+        """Wait for a queue with events, then take up to `batch_size` events from it"""
+        with self._condition:
+            while True:
+                while not self._ready:
+                    self._num_idle_workers += 1
+                    self._condition.wait()
+                key = self._ready.popleft()
+                queue = self._queues[key]
+                if queue:
+                    break
+                # emptied by `drop_oldest`
+                del self._queues[key]
+                self._scheduled.discard(key)
+            batch = [queue.popleft() for _ in range(min(len(queue), self.batch_size))]
+            self._num_queued -= len(batch)
+            self._num_busy_workers += 1
+            return key, batch
+
+    def _run_batch(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        batch: List[_LoggingEvent],
+    ) -> None:
+        for enqueued_at, fn, args, kwargs in batch:
+            name = _get_callback_name(fn)
+            lag_seconds = time.time() - enqueued_at
+            if self.max_lag_seconds > 0 and lag_seconds > self.max_lag_seconds:
+                with self._condition:
+                    self._stats[name]["lag_seconds"] = lag_seconds
+                    self._record_dropped(name=name, dropped=1)
+                continue
+            processed = errors = 0
+            try:
+                result = fn(*args, **kwargs)
+                if inspect.isawaitable(result):
+                    loop.run_until_complete(result)
+                processed = 1
+            except Exception as e:
+                errors = 1
+                verbose_logger.exception(
+                    "LoggingDispatcher: %s raised an exception - %s", name, str(e)
+                )
+            with self._condition:
+                stats = self._stats[name]
+                stats["processed"] += processed
+                stats["errors"] += errors
+                stats["lag_seconds"] = lag_seconds
+
+
+logging_dispatcher = LoggingDispatcher()
+atexit.register(logging_dispatcher.flush)
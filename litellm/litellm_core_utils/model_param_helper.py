@@ -1,4 +1,5 @@
-from typing import Set
+from functools import lru_cache
+from typing import FrozenSet, Set
 
 from openai.types.chat.completion_create_params import (
     CompletionCreateParamsNonStreaming,
@@ -37,21 +38,27 @@ class ModelParamHelper:
         return set(["messages", "prompt", "input"])
 
     @staticmethod
-    def _get_relevant_args_to_use_for_logging() -> Set[str]:
+    @lru_cache(maxsize=1)
+    def _get_relevant_args_to_use_for_logging() -> FrozenSet[str]:
         """
         Gets all relevant llm api params besides the ones with prompt content
+
+        Computed once - the result is shared, don't mutate it.
         """
         all_openai_llm_api_params = ModelParamHelper._get_all_llm_api_params()
         # Exclude parameters that contain prompt content
         combined_kwargs = all_openai_llm_api_params.difference(
             set(ModelParamHelper.get_exclude_params_for_model_parameters())
         )
-        return combined_kwargs
+        return frozenset(combined_kwargs)
 
     @staticmethod
-    def _get_all_llm_api_params() -> Set[str]:
+    @lru_cache(maxsize=1)
+    def _get_all_llm_api_params() -> FrozenSet[str]:
         """
         Gets the supported kwargs for each call type and combines them
+
+        Computed once - the result is shared, don't mutate it.
         """
         chat_completion_kwargs = (
             ModelParamHelper._get_litellm_supported_chat_completion_kwargs()
@@ -73,7 +80,7 @@ class ModelParamHelper:
             rerank_kwargs,
         )
         combined_kwargs = combined_kwargs.difference(exclude_kwargs)
-        return combined_kwargs
+        return frozenset(combined_kwargs)
 
     @staticmethod
     def get_litellm_provider_specific_params_for_chat_params() -> Set[str]:
@@ -0,0 +1,237 @@
+"""
+Provider registry - dispatch on `LlmProviders` with a dict lookup, instead of a chain of `if provider == ...` branches.
+
+- chat configs: `LlmProviders` -> the name of its config class on the `litellm` module (resolved on each call, so the lazy import only happens for the providers that are used), or a factory for providers whose config depends on the model
+- completion handlers: `LlmProviders` -> the handler `completion()` calls for providers that need no provider-specific setup. Registered by `litellm.main`; providers without a handler use the branches in `completion()`
+"""
+
+import threading
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional
+
+import litellm
+from litellm.types.utils import LlmProviders
+
+if TYPE_CHECKING:
+    from litellm.llms.base_llm.chat.transformation import BaseConfig
+else:
+    BaseConfig = Any
+
+ChatConfigFactory = Callable[[str], Optional[BaseConfig]]
+"""
+Type for a function that returns the chat config for a model.
+"""
+
+CompletionHandler = Callable[..., Any]
+"""
+Type for a function that makes the completion call for a provider - takes the same kwargs as `BaseLLMHTTPHandler.completion`.
+"""
+
+# provider -> name of its chat config class on the `litellm` module
+_CHAT_CONFIG_NAMES: Dict[LlmProviders, str] = {
+    LlmProviders.DEEPSEEK: "DeepSeekChatConfig",
+    LlmProviders.GROQ: "GroqChatConfig",
+    LlmProviders.BYTEZ: "BytezChatConfig",
+    LlmProviders.DATABRICKS: "DatabricksConfig",
+    LlmProviders.XAI: "XAIChatConfig",
+    LlmProviders.LAMBDA_AI: "LambdaAIChatConfig",
+    LlmProviders.LLAMA: "LlamaAPIConfig",
+    LlmProviders.TEXT_COMPLETION_OPENAI: "OpenAITextCompletionConfig",
+    LlmProviders.COHERE_CHAT: "CohereChatConfig",
+    LlmProviders.COHERE: "CohereConfig",
+    LlmProviders.SNOWFLAKE: "SnowflakeConfig",
+    LlmProviders.CLARIFAI: "ClarifaiConfig",
+    LlmProviders.ANTHROPIC: "AnthropicConfig",
+    LlmProviders.ANTHROPIC_TEXT: "AnthropicTextConfig",
+    LlmProviders.VERTEX_AI_BETA: "VertexGeminiConfig",
+    LlmProviders.CLOUDFLARE: "CloudflareChatConfig",
+    LlmProviders.SAGEMAKER_CHAT: "SagemakerChatConfig",
+    LlmProviders.SAGEMAKER: "SagemakerConfig",
+    LlmProviders.FIREWORKS_AI: "FireworksAIConfig",
+    LlmProviders.FRIENDLIAI: "FriendliaiChatConfig",
+    LlmProviders.WATSONX: "IBMWatsonXChatConfig",
+    LlmProviders.WATSONX_TEXT: "IBMWatsonXAIConfig",
+    LlmProviders.EMPOWER: "EmpowerChatConfig",
+    LlmProviders.GITHUB: "GithubChatConfig",
+    LlmProviders.GITHUB_COPILOT: "GithubCopilotConfig",
+    LlmProviders.CUSTOM: "OpenAILikeChatConfig",
+    LlmProviders.CUSTOM_OPENAI: "OpenAILikeChatConfig",
+    LlmProviders.OPENAI_LIKE: "OpenAILikeChatConfig",
+    LlmProviders.AIOHTTP_OPENAI: "AiohttpOpenAIChatConfig",
+    LlmProviders.HOSTED_VLLM: "HostedVLLMChatConfig",
+    LlmProviders.LLAMAFILE: "LlamafileChatConfig",
+    LlmProviders.LM_STUDIO: "LMStudioChatConfig",
+    LlmProviders.GALADRIEL: "GaladrielChatConfig",
+    LlmProviders.REPLICATE: "ReplicateConfig",
+    LlmProviders.HUGGINGFACE: "HuggingFaceChatConfig",
+    LlmProviders.TOGETHER_AI: "TogetherAIConfig",
+    LlmProviders.OPENROUTER: "OpenrouterConfig",
+    LlmProviders.COMETAPI: "CometAPIConfig",
+    LlmProviders.DATAROBOT: "DataRobotConfig",
+    LlmProviders.GEMINI: "GoogleAIStudioGeminiConfig",
+    LlmProviders.AI21: "AI21ChatConfig",
+    LlmProviders.AI21_CHAT: "AI21ChatConfig",
+    LlmProviders.AZURE_AI: "AzureAIStudioConfig",
+    LlmProviders.AZURE_TEXT: "AzureOpenAITextConfig",
+    LlmProviders.NLP_CLOUD: "NLPCloudConfig",
+    LlmProviders.OOBABOOGA: "OobaboogaConfig",
+    LlmProviders.OLLAMA_CHAT: "OllamaChatConfig",
+    LlmProviders.DEEPINFRA: "DeepInfraConfig",
+    LlmProviders.PERPLEXITY: "PerplexityChatConfig",
+    LlmProviders.MISTRAL: "MistralConfig",
+    LlmProviders.CODESTRAL: "MistralConfig",
+    LlmProviders.NVIDIA_NIM: "NvidiaNimConfig",
+    LlmProviders.CEREBRAS: "CerebrasConfig",
+    LlmProviders.VOLCENGINE: "VolcEngineConfig",
+    LlmProviders.TEXT_COMPLETION_CODESTRAL: "CodestralTextCompletionConfig",
+    LlmProviders.SAMBANOVA: "SambanovaConfig",
+    LlmProviders.MARITALK: "MaritalkConfig",
+    LlmProviders.VLLM: "VLLMConfig",
+    LlmProviders.OLLAMA: "OllamaConfig",
+    LlmProviders.PREDIBASE: "PredibaseConfig",
+    LlmProviders.TRITON: "TritonConfig",
+    LlmProviders.PETALS: "PetalsConfig",
+    LlmProviders.FEATHERLESS_AI: "FeatherlessAIConfig",
+    LlmProviders.NOVITA: "NovitaConfig",
+    LlmProviders.NEBIUS: "NebiusConfig",
+    LlmProviders.DASHSCOPE: "DashScopeChatConfig",
+    LlmProviders.MOONSHOT: "MoonshotChatConfig",
+    LlmProviders.V0: "V0ChatConfig",
+    LlmProviders.MORPH: "MorphChatConfig",
+    LlmProviders.LITELLM_PROXY: "LiteLLMProxyChatConfig",
+    LlmProviders.GRADIENT_AI: "GradientAIConfig",
+    LlmProviders.NSCALE: "NscaleConfig",
+    LlmProviders.OCI: "OCIChatConfig",
+    LlmProviders.HYPERBOLIC: "HyperbolicChatConfig",
+}
+
+
+def _get_openai_chat_config(model: str) -> Optional[BaseConfig]:
+    if litellm.openaiOSeriesConfig.is_model_o_series_model(model=model):
+        return litellm.openaiOSeriesConfig
+    elif litellm.OpenAIGPT5Config.is_model_gpt_5_model(model=model):
+        return litellm.OpenAIGPT5Config()
+    return litellm.OpenAIGPTConfig()
+
+
+def _get_vertex_ai_chat_config(model: str) -> Optional[BaseConfig]:
+    if "gemini" in model:
+        return litellm.VertexGeminiConfig()
+    elif "claude" in model:
+        return litellm.VertexAIAnthropicConfig()
+    elif model in litellm.vertex_mistral_models:
+        if "codestral" in model:
+            return litellm.CodestralTextCompletionConfig()
+        else:
+            return litellm.MistralConfig()
+    elif model in litellm.vertex_ai_ai21_models:
+        return litellm.VertexAIAi21Config()
+    else:  # use generic openai-like param mapping
+        return litellm.VertexAILlama3Config()
+
+
+def _get_azure_chat_config(model: str) -> Optional[BaseConfig]:
+    if litellm.AzureOpenAIO1Config().is_o_series_model(model=model):
+        return litellm.AzureOpenAIO1Config()
+    if litellm.AzureOpenAIGPT5Config.is_model_gpt_5_model(model=model):
+        return litellm.AzureOpenAIGPT5Config()
+    return litellm.AzureOpenAIConfig()
+
+
+def _get_bedrock_chat_config(model: str) -> Optional[BaseConfig]:
+    from litellm.llms.bedrock.common_utils import BedrockModelInfo
+
+    bedrock_route = BedrockModelInfo.get_bedrock_route(model)
+    bedrock_invoke_provider = litellm.BedrockLLM.get_bedrock_invoke_provider(
+        model=model
+    )
+
+    base_model = BedrockModelInfo.get_base_model(model)
+
+    if bedrock_route == "converse" or bedrock_route == "converse_like":
+        return litellm.AmazonConverseConfig()
+    elif bedrock_route == "agent":
+        from litellm.llms.bedrock.chat.invoke_agent.transformation import (
+            AmazonInvokeAgentConfig,
+        )
+
+        return AmazonInvokeAgentConfig()
+    elif bedrock_invoke_provider == "amazon":  # amazon titan llms
+        return litellm.AmazonTitanConfig()
+    elif bedrock_invoke_provider == "anthropic":
+        if (
+            base_model
+            in litellm.AmazonAnthropicConfig.get_legacy_anthropic_model_names()
+        ):
+            return litellm.AmazonAnthropicConfig()
+        else:
+            return litellm.AmazonAnthropicClaudeConfig()
+    elif (
+        bedrock_invoke_provider == "meta" or bedrock_invoke_provider == "llama"
+    ):  # amazon / meta llms
+        return litellm.AmazonLlamaConfig()
+    elif bedrock_invoke_provider == "ai21":  # ai21 llms
+        return litellm.AmazonAI21Config()
+    elif bedrock_invoke_provider == "cohere":  # cohere models on bedrock
+        return litellm.AmazonCohereConfig()
+    elif bedrock_invoke_provider == "mistral":  # mistral models on bedrock
+        return litellm.AmazonMistralConfig()
+    elif bedrock_invoke_provider == "deepseek_r1":  # deepseek models on bedrock
+        return litellm.AmazonDeepSeekR1Config()
+    elif bedrock_invoke_provider == "nova":
+        return litellm.AmazonInvokeNovaConfig()
+    else:
+        return litellm.AmazonInvokeConfig()
+
+
+class ProviderRegistry:
+    """
+    Usage:
+        provider_registry.get_chat_config(model="gpt-4o", provider=LlmProviders.OPENAI)
+
+        provider_registry.register_completion_handler(LlmProviders.XAI, base_llm_http_handler.completion)
+        provider_registry.get_completion_handler("xai")
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._chat_config_factories: Dict[LlmProviders, ChatConfigFactory] = {
+            LlmProviders.OPENAI: _get_openai_chat_config,
+            LlmProviders.VERTEX_AI: _get_vertex_ai_chat_config,
+            LlmProviders.AZURE: _get_azure_chat_config,
+            LlmProviders.BEDROCK: _get_bedrock_chat_config,
+        }
+        self._completion_handlers: Dict[LlmProviders, CompletionHandler] = {}
+
+    def register_chat_config(
+        self, provider: LlmProviders, factory: ChatConfigFactory
+    ) -> None:
+        with self._lock:
+            self._chat_config_factories[provider] = factory
+
+    def get_chat_config(
+        self, model: str, provider: LlmProviders
+    ) -> Optional[BaseConfig]:
+        factory = self._chat_config_factories.get(provider)
+        if factory is not None:
+            return factory(model)
+        config_name = _CHAT_CONFIG_NAMES.get(provider)
+        if config_name is not None:
+            return getattr(litellm, config_name)()
+        return None
+
+    def register_completion_handler(
+        self, provider: LlmProviders, handler: CompletionHandler
+    ) -> None:
+        with self._lock:
+            self._completion_handlers[provider] = handler
+
+    def get_completion_handler(
+        self, provider: Optional[str]
+    ) -> Optional[CompletionHandler]:
+        """`LlmProviders` is a `str` enum - a plain provider string finds its handler"""
+        if provider is None:
+            return None
+        return self._completion_handlers.get(provider)  # type: ignore
+
+
+provider_registry = ProviderRegistry()
@@ -0,0 +1,140 @@
+"""
+Lightweight streaming chunk - for the per-token chunks of an OpenAI-compatible stream.
+
+Building a `ModelResponseStream` (+ `StreamingChoices`, `Delta`) runs pydantic validation on every token. Provider iterators return a `StreamingChunk` instead, for chunks that only carry a text / reasoning delta, and `CustomStreamWrapper` builds the chunk it returns straight from its fields - one pydantic object per token, instead of one per processing step.
+
+Reading anything else off a `StreamingChunk` (e.g. `.choices`) converts it to the `ModelResponseStream` it stands for.
+"""
+
+from typing import Any, List, Optional
+
+from litellm.types.utils import ModelResponseStream
+
+# chunk keys a `StreamingChunk` carries (or, like the system fingerprint, are dropped when parsing OpenAI-compatible chunks) - a chunk with any other non-null key (e.g. usage) needs the full `ModelResponseStream`
+_STREAMING_CHUNK_KEYS = frozenset(
+    {"id", "object", "created", "model", "choices", "system_fingerprint"}
+)
+# delta keys a `StreamingChunk` can represent - anything else (tool calls, audio, annotations, provider specific fields) needs the full `Delta`
+_STREAMING_CHUNK_DELTA_KEYS = frozenset({"role", "content", "reasoning_content"})
+_STREAMING_CHUNK_CHOICE_KEYS = frozenset(
+    {"index", "delta", "finish_reason", "logprobs"}
+)
+
+
+class StreamingChunk:
+    """
+    Usage:
+        streaming_chunk = StreamingChunk.from_openai_chunk(chunk)
+        if streaming_chunk is None:  # not a plain text / reasoning delta
+            return ModelResponseStream(**chunk)
+        return streaming_chunk
+    """
+
+    __slots__ = (
+        "id",
+        "created",
+        "model",
+        "index",
+        "role",
+        "content",
+        "reasoning_content",
+        "_choices",
+        "_model_response_stream",
+    )
+
+    def __init__(
+        self,
+        id: str,
+        created: int,
+        model: str,
+        choices: List[dict],
+    ):
+        choice = choices[0]
+        delta = choice["delta"]
+        self.id = id
+        self.created = created
+        self.model = model
+        self.index: Optional[int] = choice.get("index", 0)
+        self.role: Optional[str] = delta.get("role")
+        self.content: Optional[str] = delta.get("content")
+        self.reasoning_content: Optional[str] = delta.get("reasoning_content")
+        self._choices = choices
+        self._model_response_stream: Optional[ModelResponseStream] = None
+
+    @classmethod
+    def from_openai_chunk(cls, chunk: dict) -> Optional["StreamingChunk"]:
+        """
+        Returns None, unless the chunk has 1 choice with a non-empty text / reasoning delta - and no finish reason, logprobs or usage
+        """
+        if any(
+            value is not None
+            for key, value in chunk.items()
+            if key not in _STREAMING_CHUNK_KEYS
+        ):
+            return None
+        choices = chunk.get("choices")
+        if not isinstance(choices, list) or len(choices) != 1:
+            return None
+        choice = choices[0]
+        if (
+            not isinstance(choice, dict)
+            or not _STREAMING_CHUNK_CHOICE_KEYS.issuperset(choice)
+            or choice.get("finish_reason") is not None
+            or choice.get("logprobs") is not None
+            or not isinstance(choice.get("index", 0), (int, type(None)))
+        ):
+            return None
+        delta = choice.get("delta")
+        if not isinstance(delta, dict) or not _STREAMING_CHUNK_DELTA_KEYS.issuperset(
+            delta
+        ):
+            return None
+        content = delta.get("content")
+        reasoning_content = delta.get("reasoning_content")
+        if not isinstance(content, (str, type(None))) or not isinstance(
+            reasoning_content, (str, type(None))
+        ):
+            return None
+        if not content and reasoning_content is None:
+            return None
+        if (
+            not isinstance(chunk.get("id"), str)
+            or not isinstance(chunk.get("created"), int)
+            or not isinstance(chunk.get("model"), str)
+        ):
+            return None
+        return cls(
+            id=chunk["id"],
+            created=chunk["created"],
+            model=chunk["model"],
+            choices=choices,
+        )
+
+    def to_model_response_stream(self) -> ModelResponseStream:
+        """The `ModelResponseStream` this chunk stands for - built on first use"""
+        if self._model_response_stream is None:
+            self._model_response_stream = ModelResponseStream(
+                id=self.id,
+                object="chat.completion.chunk",
+                created=self.created,
+                model=self.model,
+                choices=self._choices,
+            )
+        return self._model_response_stream
+
+    def __getattr__(self, name: str) -> Any:
+        # only called for attributes that aren't slots
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(self.to_model_response_stream(), name)
+
+    def __getitem__(self, key: str) -> Any:
+        return self.to_model_response_stream()[key]
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.to_model_response_stream()
+
+    def __repr__(self) -> str:
+        return "StreamingChunk(id={!r}, model={!r}, content={!r}, reasoning_content={!r})".format(
+            self.id, self.model, self.content, self.reasoning_content
+        )
@@ -12,11 +12,15 @@ from litellm.types.utils import (
     Choices,
     CompletionTokensDetails,
     CompletionTokensDetailsWrapper,
+    Delta,
     Function,
     FunctionCall,
     ModelResponse,
     ModelResponseStream,
     PromptTokensDetailsWrapper,
+    StreamingChoices,
+    TextChoices,
+    TextCompletionResponse,
     Usage,
 )
 from litellm.utils import print_verbose, token_counter
@@ -318,7 +322,8 @@ class ChunkProcessor:
             id=id,
         )
 
-    def _usage_chunk_calculation_helper(self, usage_chunk: Usage) -> dict:
+    @staticmethod
+    def _usage_chunk_calculation_helper(usage_chunk: Usage) -> dict:
         prompt_tokens = 0
         completion_tokens = 0
         ## anthropic prompt caching information ##
@@ -363,7 +368,8 @@ class ChunkProcessor:
             "prompt_tokens_details": prompt_tokens_details,
         }
 
-    def count_reasoning_tokens(self, response: ModelResponse) -> int:
+    @staticmethod
+    def count_reasoning_tokens(response: ModelResponse) -> int:
         reasoning_tokens = 0
         for choice in response.choices:
             if (
@@ -377,89 +383,94 @@ class ChunkProcessor:
 
         return reasoning_tokens
 
-    def _calculate_usage_per_chunk(
-        self,
-        chunks: List[Union[Dict[str, Any], ModelResponse]],
-    ) -> "UsagePerChunk":
+    @staticmethod
+    def _get_initial_usage_per_chunk() -> "UsagePerChunk":
         from litellm.types.litellm_core_utils.streaming_chunk_builder_utils import (
             UsagePerChunk,
         )
 
-        # # Update usage information if needed
-        prompt_tokens = 0
-        completion_tokens = 0
-        ## anthropic prompt caching information ##
-        cache_creation_input_tokens: Optional[int] = None
-        cache_read_input_tokens: Optional[int] = None
+        return UsagePerChunk(
+            prompt_tokens=0,
+            completion_tokens=0,
+            ## anthropic prompt caching information ##
+            cache_creation_input_tokens=None,
+            cache_read_input_tokens=None,
+            web_search_requests=None,
+            completion_tokens_details=None,
+            prompt_tokens_details=None,
+        )
 
-        web_search_requests: Optional[int] = None
-        completion_tokens_details: Optional[CompletionTokensDetails] = None
-        prompt_tokens_details: Optional[PromptTokensDetailsWrapper] = None
-        for chunk in chunks:
-            usage_chunk: Optional[Usage] = None
-            if "usage" in chunk:
-                usage_chunk = chunk["usage"]
-            elif (
-                isinstance(chunk, ModelResponse)
-                or isinstance(chunk, ModelResponseStream)
-            ) and hasattr(chunk, "_hidden_params"):
-                usage_chunk = chunk._hidden_params.get("usage", None)
+    @staticmethod
+    def _update_usage_per_chunk(
+        usage_per_chunk: "UsagePerChunk",
+        chunk: Union[Dict[str, Any], ModelResponse, ModelResponseStream],
+    ) -> None:
+        """Fold the usage of `chunk` into `usage_per_chunk`, in place"""
+        usage_chunk: Optional[Usage] = None
+        if "usage" in chunk:
+            usage_chunk = chunk["usage"]
+        elif (
+            isinstance(chunk, ModelResponse) or isinstance(chunk, ModelResponseStream)
+        ) and hasattr(chunk, "_hidden_params"):
+            usage_chunk = chunk._hidden_params.get("usage", None)
 
-            if usage_chunk is not None:
-                usage_chunk_dict = self._usage_chunk_calculation_helper(usage_chunk)
-                if (
-                    usage_chunk_dict["prompt_tokens"] is not None
-                    and usage_chunk_dict["prompt_tokens"] > 0
-                ):
-                    prompt_tokens = usage_chunk_dict["prompt_tokens"]
-                if (
-                    usage_chunk_dict["completion_tokens"] is not None
-                    and usage_chunk_dict["completion_tokens"] > 0
-                ):
-                    completion_tokens = usage_chunk_dict["completion_tokens"]
-                if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_creation_input_tokens"] > 0
-                    or cache_creation_input_tokens is None
-                ):
-                    cache_creation_input_tokens = usage_chunk_dict[
-                        "cache_creation_input_tokens"
-                    ]
-                if usage_chunk_dict["cache_read_input_tokens"] is not None and (
-                    usage_chunk_dict["cache_read_input_tokens"] > 0
-                    or cache_read_input_tokens is None
-                ):
-                    cache_read_input_tokens = usage_chunk_dict[
-                        "cache_read_input_tokens"
-                    ]
-                if usage_chunk_dict["completion_tokens_details"] is not None:
-                    completion_tokens_details = usage_chunk_dict[
-                        "completion_tokens_details"
-                    ]
-                if (
-                    usage_chunk_dict["prompt_tokens_details"] is not None
-                    and getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                        None,
-                    )
-                    is not None
-                ):
-                    web_search_requests = getattr(
-                        usage_chunk_dict["prompt_tokens_details"],
-                        "web_search_requests",
-                    )
+        if usage_chunk is None:
+            return
+        usage_chunk_dict = ChunkProcessor._usage_chunk_calculation_helper(usage_chunk)
+        if (
+            usage_chunk_dict["prompt_tokens"] is not None
+            and usage_chunk_dict["prompt_tokens"] > 0
+        ):
+            usage_per_chunk["prompt_tokens"] = usage_chunk_dict["prompt_tokens"]
+        if (
+            usage_chunk_dict["completion_tokens"] is not None
+            and usage_chunk_dict["completion_tokens"] > 0
+        ):
+            usage_per_chunk["completion_tokens"] = usage_chunk_dict["completion_tokens"]
+        if usage_chunk_dict["cache_creation_input_tokens"] is not None and (
+            usage_chunk_dict["cache_creation_input_tokens"] > 0
+            or usage_per_chunk["cache_creation_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_creation_input_tokens"] = usage_chunk_dict[
+                "cache_creation_input_tokens"
+            ]
+        if usage_chunk_dict["cache_read_input_tokens"] is not None and (
+            usage_chunk_dict["cache_read_input_tokens"] > 0
+            or usage_per_chunk["cache_read_input_tokens"] is None
+        ):
+            usage_per_chunk["cache_read_input_tokens"] = usage_chunk_dict[
+                "cache_read_input_tokens"
+            ]
+        if usage_chunk_dict["completion_tokens_details"] is not None:
+            usage_per_chunk["completion_tokens_details"] = usage_chunk_dict[
+                "completion_tokens_details"
+            ]
+        if (
+            usage_chunk_dict["prompt_tokens_details"] is not None
+            and getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+                None,
+            )
+            is not None
+        ):
+            usage_per_chunk["web_search_requests"] = getattr(
+                usage_chunk_dict["prompt_tokens_details"],
+                "web_search_requests",
+            )
 
-                prompt_tokens_details = usage_chunk_dict["prompt_tokens_details"]
+        usage_per_chunk["prompt_tokens_details"] = usage_chunk_dict[
+            "prompt_tokens_details"
+        ]
 
-        return UsagePerChunk(
-            prompt_tokens=prompt_tokens,
-            completion_tokens=completion_tokens,
-            cache_creation_input_tokens=cache_creation_input_tokens,
-            cache_read_input_tokens=cache_read_input_tokens,
-            web_search_requests=web_search_requests,
-            completion_tokens_details=completion_tokens_details,
-            prompt_tokens_details=prompt_tokens_details,
-        )
+    def _calculate_usage_per_chunk(
+        self,
+        chunks: List[Union[Dict[str, Any], ModelResponse]],
+    ) -> "UsagePerChunk":
+        usage_per_chunk = self._get_initial_usage_per_chunk()
+        for chunk in chunks:
+            self._update_usage_per_chunk(usage_per_chunk, chunk)
+        return usage_per_chunk
 
     def calculate_usage(
         self,
@@ -472,10 +483,26 @@ class ChunkProcessor:
         """
         Calculate usage for the given chunks.
         """
-        returned_usage = Usage()
-        # # Update usage information if needed
+        return self.build_usage(
+            calculated_usage_per_chunk=self._calculate_usage_per_chunk(chunks=chunks),
+            model=model,
+            completion_output=completion_output,
+            messages=messages,
+            reasoning_tokens=reasoning_tokens,
+        )
 
-        calculated_usage_per_chunk = self._calculate_usage_per_chunk(chunks=chunks)
+    @staticmethod
+    def build_usage(
+        calculated_usage_per_chunk: "UsagePerChunk",
+        model: str,
+        completion_output: str,
+        messages: Optional[List] = None,
+        reasoning_tokens: Optional[int] = None,
+    ) -> Usage:
+        """
+        Usage from the usage reported in the chunks - prompt / completion tokens are counted if they weren't reported.
+        """
+        returned_usage = Usage()
         prompt_tokens = calculated_usage_per_chunk["prompt_tokens"]
         completion_tokens = calculated_usage_per_chunk["completion_tokens"]
         ## anthropic prompt caching information ##
@@ -566,6 +593,453 @@ class ChunkProcessor:
         return returned_usage
 
 
+class StreamingChunkAccumulator:
+    """
+    Builds the complete response of a stream as its chunks arrive - `add_chunk` for every chunk, `build` once the stream is done.
+
+    Same result as `stream_chunk_builder(chunks)`, but the chunks aren't kept - only the first / last chunk, the streamed text and tool call arguments, and the running usage.
+    """
+
+    def __init__(self) -> None:
+        self.first_chunk: Optional[Any] = None
+        self.last_chunk: Optional[Any] = None
+        self.num_chunks = 0
+        self.id = ""
+        self.finish_reason: Optional[str] = "stop"
+        self._is_text_completion = False
+        self._error: Optional[Exception] = (
+            None  # raised by `build`, so a bad chunk doesn't break the stream
+        )
+
+        # None until a chunk has the field
+        self._content: Optional[List[str]] = None
+        self._reasoning_content: Optional[List[str]] = None
+        self._text: List[str] = []
+        self._tool_calls: Optional[Dict[int, Dict[str, Any]]] = None
+        self._function_call_name: Optional[str] = None
+        self._function_call_arguments: Optional[List[str]] = None
+        self._has_thinking_blocks = False
+        self._thinking_text: Optional[List[str]] = None
+        self._thinking_data: Optional[str] = None
+        self._thinking_signature: Optional[str] = None
+        self._thinking_type: Literal["thinking", "redacted_thinking"] = "thinking"
+        self._audio: Optional[Dict[str, Any]] = None
+
+        self._usage_per_chunk = ChunkProcessor._get_initial_usage_per_chunk()
+        # most recent usage - see `get_total_usage`
+        self._total_prompt_tokens = 0
+        self._total_completion_tokens = 0
+
+    def add_chunk(self, chunk: Any) -> None:
+        if self._error is not None:
+            return
+        try:
+            self._add_chunk(chunk)
+        except Exception as e:
+            self._error = e
+
+    def _add_chunk(self, chunk: Any) -> None:
+        if self.first_chunk is None:
+            self.first_chunk = chunk
+            self._is_text_completion = len(chunk["choices"]) > 0 and isinstance(
+                chunk["choices"][0], TextChoices
+            )
+        self.last_chunk = chunk
+        self.num_chunks += 1
+
+        if self._is_text_completion:
+            for choice in chunk["choices"]:
+                if (
+                    choice is not None
+                    and hasattr(choice, "text")
+                    and choice.get("text") is not None
+                ):
+                    self._text.append(choice.get("text"))
+            return
+
+        if not self.id and chunk.get("id"):
+            self.id = chunk["id"]
+        self._update_total_usage(chunk)
+        ChunkProcessor._update_usage_per_chunk(self._usage_per_chunk, chunk)
+
+        if "choices" not in chunk or len(chunk["choices"]) == 0:
+            return
+        if hasattr(chunk["choices"][0], "finish_reason"):
+            self.finish_reason = chunk["choices"][0].finish_reason
+        elif "finish_reason" in chunk["choices"][0]:
+            self.finish_reason = chunk["choices"][0]["finish_reason"]
+
+        delta = chunk["choices"][0]["delta"]
+        if "tool_calls" in delta and delta["tool_calls"] is not None:
+            self._add_tool_calls(chunk)
+        if "function_call" in delta and delta["function_call"] is not None:
+            self._add_function_call(chunk)
+        if "content" in delta and delta["content"] is not None:
+            if self._content is None:
+                self._content = []
+            self._add_content(chunk, "content", self._content)
+        if "thinking_blocks" in delta and delta["thinking_blocks"] is not None:
+            self._add_thinking_blocks(chunk)
+        if "reasoning_content" in delta and delta["reasoning_content"] is not None:
+            if self._reasoning_content is None:
+                self._reasoning_content = []
+            self._add_content(chunk, "reasoning_content", self._reasoning_content)
+        if "audio" in delta and delta["audio"] is not None:
+            self._add_audio(chunk)
+
+    def _update_total_usage(self, chunk: Any) -> None:
+        if "usage" in chunk and chunk["usage"] is not None:
+            if "prompt_tokens" in chunk["usage"]:
+                self._total_prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
+            if "completion_tokens" in chunk["usage"]:
+                self._total_completion_tokens = (
+                    chunk["usage"].get("completion_tokens", 0) or 0
+                )
+
+    @staticmethod
+    def _add_content(chunk: Any, delta_key: str, content_list: List[str]) -> None:
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            content = delta.get(delta_key, "")
+            if content is None:
+                continue  # openai v1.0.0 sets content = None for chunks
+            content_list.append(content)
+
+    def _add_tool_calls(self, chunk: Any) -> None:
+        if self._tool_calls is None:
+            self._tool_calls = {}
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            for tool_call in delta.get("tool_calls", []):
+                if not tool_call or not hasattr(tool_call, "function"):
+                    continue
+
+                index = getattr(tool_call, "index", 0)
+                tool_call_data = self._tool_calls.setdefault(
+                    index, {"id": None, "name": None, "type": None, "arguments": []}
+                )
+                if hasattr(tool_call, "id") and tool_call.id:
+                    tool_call_data["id"] = tool_call.id
+                if hasattr(tool_call, "type") and tool_call.type:
+                    tool_call_data["type"] = tool_call.type
+                if hasattr(tool_call.function, "name") and tool_call.function.name:
+                    tool_call_data["name"] = tool_call.function.name
+                if (
+                    hasattr(tool_call.function, "arguments")
+                    and tool_call.function.arguments
+                ):
+                    tool_call_data["arguments"].append(tool_call.function.arguments)
+
+    def _add_function_call(self, chunk: Any) -> None:
+        if self._function_call_arguments is None:
+            self._function_call_arguments = []
+            self._function_call_name = chunk["choices"][0]["delta"][
+                "function_call"
+            ].name
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            function_call = delta.get("function_call", "")
+            if function_call:
+                self._function_call_arguments.append(function_call.arguments)
+
+    def _add_thinking_blocks(self, chunk: Any) -> None:
+        self._has_thinking_blocks = True
+        for choice in chunk["choices"]:
+            delta = choice.get("delta", {})
+            thinking = delta.get("thinking_blocks", None)
+            if not thinking or not isinstance(thinking, list):
+                continue
+            for thinking_block in thinking:
+                thinking_type = thinking_block.get("type", None)
+                if thinking_type and thinking_type == "redacted_thinking":
+                    self._thinking_type = "redacted_thinking"
+                    self._thinking_data = thinking_block.get("data", None)
+                else:
+                    self._thinking_type = "thinking"
+                    thinking_text = thinking_block.get("thinking", None)
+                    if thinking_text:
+                        if self._thinking_text is None:
+                            self._thinking_text = []
+                        self._thinking_text.append(thinking_text)
+                    self._thinking_signature = thinking_block.get("signature", None)
+
+    def _add_audio(self, chunk: Any) -> None:
+        if self._audio is None:
+            self._audio = {"data": [], "transcript": [], "expires_at": None, "id": None}
+        for choice in chunk["choices"]:
+            delta = choice.get("delta") or {}
+            audio: Optional[ChatCompletionAudioDelta] = delta.get("audio")
+            if audio is None:
+                continue
+            for k, v in audio.items():
+                if k == "data" and v is not None and isinstance(v, str):
+                    self._audio["data"].append(v)
+                elif k == "transcript" and v is not None and isinstance(v, str):
+                    self._audio["transcript"].append(v)
+                elif k == "expires_at" and v is not None and isinstance(v, int):
+                    self._audio["expires_at"] = v
+                elif k == "id" and v is not None and isinstance(v, str):
+                    self._audio["id"] = v
+
+    def get_total_usage(self) -> Usage:
+        """Usage of the most recent chunk that reported usage - it has the total usage up to then"""
+        return Usage(
+            prompt_tokens=self._total_prompt_tokens,
+            completion_tokens=self._total_completion_tokens,
+            total_tokens=self._total_prompt_tokens + self._total_completion_tokens,
+        )
+
+    def _get_tool_calls(self) -> List[ChatCompletionMessageToolCall]:
+        tool_calls_list: List[ChatCompletionMessageToolCall] = []
+        for index in sorted((self._tool_calls or {}).keys()):
+            tool_call_data = (self._tool_calls or {})[index]
+            if tool_call_data["id"] and tool_call_data["name"]:
+                combined_arguments = "".join(tool_call_data["arguments"]) or "{}"
+                tool_calls_list.append(
+                    ChatCompletionMessageToolCall(
+                        id=tool_call_data["id"],
+                        function=Function(
+                            arguments=combined_arguments,
+                            name=tool_call_data["name"],
+                        ),
+                        type=tool_call_data["type"] or "function",
+                    )
+                )
+        return tool_calls_list
+
+    def _get_thinking_blocks(
+        self,
+    ) -> Optional[
+        List[
+            Union["ChatCompletionThinkingBlock", "ChatCompletionRedactedThinkingBlock"]
+        ]
+    ]:
+        from litellm.types.llms.openai import (
+            ChatCompletionRedactedThinkingBlock,
+            ChatCompletionThinkingBlock,
+        )
+
+        combined_thinking_text = (
+            "".join(self._thinking_text) if self._thinking_text is not None else None
+        )
+        if (
+            combined_thinking_text
+            and self._thinking_type == "thinking"
+            and self._thinking_signature
+        ):
+            return [
+                ChatCompletionThinkingBlock(
+                    type="thinking",
+                    thinking=combined_thinking_text,
+                    signature=self._thinking_signature,
+                )
+            ]
+        elif self._thinking_data and self._thinking_type == "redacted_thinking":
+            return [
+                ChatCompletionRedactedThinkingBlock(
+                    type="redacted_thinking",
+                    data=self._thinking_data,
+                )
+            ]
+        return None
+
+    def _get_audio(self) -> ChatCompletionAudioResponse:
+        audio = self._audio or {}
+        return ChatCompletionAudioResponse(
+            data=concatenate_base64_list(audio.get("data", [])),
+            expires_at=audio.get("expires_at") or int(time.time() + 3600),
+            transcript="".join(audio.get("transcript", [])),
+            id=audio.get("id"),
+        )
+
+    def build(
+        self, messages: Optional[list] = None, logging_obj: Optional[Any] = None
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        The complete response, from the chunks added so far. None if no chunks were added.
+
+        Raises the first error hit while adding a chunk.
+        """
+        if self.first_chunk is None:
+            return None
+        if self._error is not None:
+            raise self._error
+        if self._is_text_completion:
+            return self._build_text_completion_response(messages=messages)
+
+        import litellm
+        from litellm.litellm_core_utils.prompt_templates.common_utils import (
+            get_content_from_model_response,
+        )
+
+        first_chunk = self.first_chunk
+        model = first_chunk["model"]
+        response = ModelResponse(
+            **{
+                "id": self.id,
+                "object": first_chunk["object"],
+                "created": first_chunk["created"],
+                "model": model,
+                "system_fingerprint": first_chunk.get("system_fingerprint", None),
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {
+                            "role": first_chunk["choices"][0]["delta"]["role"],
+                            "content": "",
+                        },
+                        "finish_reason": self.finish_reason,
+                    }
+                ],
+                "usage": {
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "total_tokens": 0,
+                },
+            }
+        )
+        if self.last_chunk is not None:
+            response._hidden_params = self.last_chunk.get("_hidden_params", {})
+
+        _choice = cast(Choices, response.choices[0])
+        if self._tool_calls is not None:
+            _choice.message.content = None
+            _choice.message.tool_calls = self._get_tool_calls()
+        if self._function_call_arguments is not None:
+            _choice.message.content = None
+            _choice.message.function_call = FunctionCall(
+                name=self._function_call_name,
+                arguments="".join(self._function_call_arguments),
+            )
+        if self._content is not None:
+            response["choices"][0]["message"]["content"] = "".join(self._content)
+        if self._has_thinking_blocks:
+            response["choices"][0]["message"][
+                "thinking_blocks"
+            ] = self._get_thinking_blocks()
+        if self._reasoning_content is not None:
+            response["choices"][0]["message"]["reasoning_content"] = "".join(
+                self._reasoning_content
+            )
+        if self._audio is not None:
+            _choice.message.audio = self._get_audio()
+
+        usage = ChunkProcessor.build_usage(
+            calculated_usage_per_chunk=self._usage_per_chunk,
+            model=model,
+            completion_output=get_content_from_model_response(response),
+            messages=messages,
+            reasoning_tokens=ChunkProcessor.count_reasoning_tokens(response),
+        )
+        setattr(response, "usage", usage)
+
+        # Add cost to usage object if include_cost_in_streaming_usage is True
+        if litellm.include_cost_in_streaming_usage and logging_obj is not None:
+            setattr(
+                usage, "cost", logging_obj._response_cost_calculator(result=response)
+            )
+        return response
+
+    def get_chunks(
+        self, messages: Optional[list] = None
+    ) -> List[Union[ModelResponseStream, TextCompletionResponse]]:
+        """
+        The chunks added so far, folded into a single chunk - `stream_chunk_builder` builds the same complete response from it.
+
+        The chunks themselves aren't kept. Empty if no chunks were added.
+        """
+        response = self.build(messages=messages)
+        if response is None:
+            return []
+        if isinstance(response, TextCompletionResponse):
+            return [response]
+
+        message = cast(Choices, response.choices[0]).message
+        audio = getattr(message, "audio", None)
+        tool_calls = [
+            {
+                "index": index,
+                "id": tool_call.id,
+                "type": tool_call.type,
+                "function": {
+                    "name": tool_call.function.name,
+                    "arguments": tool_call.function.arguments,
+                },
+            }
+            for index, tool_call in enumerate(message.tool_calls or [])
+        ]
+        chunk = ModelResponseStream(
+            id=response.id,
+            created=response.created,
+            model=response.model,
+            system_fingerprint=response.system_fingerprint,
+            choices=[
+                StreamingChoices(
+                    index=0,
+                    finish_reason=response.choices[0].finish_reason,
+                    delta=Delta(
+                        role=message.role,
+                        content=message.content,
+                        function_call=message.function_call,
+                        tool_calls=tool_calls or None,
+                        audio=audio.model_dump() if audio is not None else None,
+                        reasoning_content=getattr(message, "reasoning_content", None),
+                        thinking_blocks=getattr(message, "thinking_blocks", None),
+                    ),
+                )
+            ],
+            usage=getattr(response, "usage", None),
+        )
+        chunk._hidden_params = response._hidden_params
+        return [chunk]
+
+    def _build_text_completion_response(
+        self, messages: Optional[list] = None
+    ) -> TextCompletionResponse:
+        first_chunk = self.first_chunk
+        last_chunk = self.last_chunk
+        model = first_chunk["model"]
+        combined_content = "".join(self._text)
+        response = {
+            "id": first_chunk["id"],
+            "object": first_chunk["object"],
+            "created": first_chunk["created"],
+            "model": model,
+            "system_fingerprint": first_chunk.get("system_fingerprint", None),
+            "choices": [
+                {
+                    "text": combined_content,
+                    "index": 0,
+                    "logprobs": last_chunk["choices"][0]["logprobs"],
+                    "finish_reason": last_chunk["choices"][0]["finish_reason"],
+                }
+            ],
+            "usage": {
+                "prompt_tokens": None,
+                "completion_tokens": None,
+                "total_tokens": None,
+            },
+        }
+        try:
+            response["usage"]["prompt_tokens"] = token_counter(
+                model=model, messages=messages
+            )
+        except (
+            Exception
+        ):  # don't allow this failing to block a complete streaming response from being returned
+            print_verbose("token_counter failed, assuming prompt tokens is 0")
+            response["usage"]["prompt_tokens"] = 0
+        response["usage"]["completion_tokens"] = token_counter(
+            model=model,
+            text=combined_content,
+            count_response_tokens=True,  # count_response_tokens is a Flag to tell token counter this is a response, No need to add extra tokens we do for input messages
+        )
+        response["usage"]["total_tokens"] = (
+            response["usage"]["prompt_tokens"] + response["usage"]["completion_tokens"]
+        )
+        return TextCompletionResponse(**response)
+
+
 def concatenate_base64_list(base64_strings: List[str]) -> str:
     """
     Concatenates a list of base64-encoded strings.
@@ -2,11 +2,10 @@ import asyncio
 import collections.abc
 import datetime
 import json
-import threading
 import time
 import traceback
 import uuid
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+from typing import Any, Callable, Deque, Dict, List, Optional, Union, cast
 
 import httpx
 from pydantic import BaseModel
@@ -17,7 +16,8 @@ from litellm.litellm_core_utils.model_response_utils import (
     is_model_response_stream_empty,
 )
 from litellm.litellm_core_utils.redact_messages import LiteLLMLoggingObject
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.logging_dispatcher import logging_dispatcher
+from litellm.litellm_core_utils.streaming_chunk import StreamingChunk
 from litellm.types.llms.openai import ChatCompletionChunk
 from litellm.types.router import GenericLiteLLMParams
 from litellm.types.utils import Delta
@@ -26,6 +26,7 @@ from litellm.types.utils import (
     ModelResponse,
     ModelResponseStream,
     StreamingChoices,
+    TextCompletionResponse,
     Usage,
 )
 
@@ -36,6 +37,31 @@ from .llm_response_utils.get_api_base import get_api_base
 from .rules import Rules
 
 
+# providers with their own branch in `CustomStreamWrapper.chunk_creator` - their chunks don't take the `StreamingChunk` fast path
+_PROVIDERS_WITH_OWN_CHUNK_HANDLING = frozenset(
+    {
+        "replicate",
+        "predibase",
+        "baseten",
+        "ai21",
+        "maritalk",
+        "vllm",
+        "aleph_alpha",
+        "nlp_cloud",
+        "vertex_ai",
+        "petals",
+        "palm",
+        "triton",
+        "text-completion-openai",
+        "text-completion-codestral",
+        "azure_text",
+        "cached_response",
+        "azure",  # takes the model from each chunk
+        "sagemaker",  # strips special tokens
+    }
+)
+
+
 def is_async_iterable(obj: Any) -> bool:
     """
     Check if an object is an async iterable (can be used with 'async for').
@@ -49,10 +75,11 @@ def is_async_iterable(obj: Any) -> bool:
     return isinstance(obj, collections.abc.AsyncIterable)
 
 
-def print_verbose(print_statement):
+def print_verbose(print_statement, *args):
+    """`args` are %-formatted into `print_statement` only when printing - keeps per-chunk calls cheap"""
     try:
         if litellm.set_verbose:
-            print(print_statement)  # noqa
+            print(print_statement % args if args else print_statement)  # noqa
     except Exception:
         pass
 
@@ -134,9 +161,16 @@ class CustomStreamWrapper:
             True if self.check_send_stream_usage(self.stream_options) else False
         )
         self.tool_call = False
-        self.chunks: List = (
-            []
-        )  # keep track of the returned chunks - used for calculating the input/output tokens for stream options
+        from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+            StreamingChunkAccumulator,
+        )
+
+        # folds the chunks into the complete response as they arrive - used for calculating the input/output tokens for stream options
+        self.stream_accumulator = StreamingChunkAccumulator()
+        # content of the most recent chunks - for `safety_checker`
+        self._recent_chunk_contents: Deque[Optional[str]] = collections.deque(
+            maxlen=litellm.REPEATED_STREAMING_CHUNK_LIMIT
+        )
         self.is_function_call = self.check_is_function_call(logging_obj=logging_obj)
         self.created: Optional[int] = None
 
@@ -190,12 +224,11 @@ class CustomStreamWrapper:
 
         Raises - InternalServerError, if LLM enters infinite loop while streaming
         """
-        if len(self.chunks) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
-            # Get the last n chunks
-            last_chunks = self.chunks[-litellm.REPEATED_STREAMING_CHUNK_LIMIT :]
-
-            # Extract the relevant content from the chunks
-            last_contents = [chunk.choices[0].delta.content for chunk in last_chunks]
+        if len(self._recent_chunk_contents) >= litellm.REPEATED_STREAMING_CHUNK_LIMIT:
+            # Get the content of the last n chunks
+            last_contents = list(self._recent_chunk_contents)[
+                -litellm.REPEATED_STREAMING_CHUNK_LIMIT :
+            ]
 
             # Check if all extracted contents are identical
             if all(content == last_contents[0] for content in last_contents):
@@ -213,6 +246,45 @@ class CustomStreamWrapper:
                         llm_provider="",
                     )
 
+    def _accumulate_chunk(self, chunk: ModelResponseStream) -> None:
+        self.stream_accumulator.add_chunk(chunk)
+        content: Optional[str] = None
+        if len(chunk.choices) > 0:
+            content = getattr(getattr(chunk.choices[0], "delta", None), "content", None)
+        self._recent_chunk_contents.append(content)
+
+    @property
+    def chunks(self) -> List[Union[ModelResponseStream, TextCompletionResponse]]:
+        """
+        The chunks streamed so far, for `litellm.stream_chunk_builder(chunks)` - folded into a single chunk, the individual chunks aren't kept.
+
+        Read-only. Use `build_complete_streaming_response` for the complete response.
+        """
+        return self.stream_accumulator.get_chunks(messages=self.messages)
+
+    def build_complete_streaming_response(
+        self,
+    ) -> Optional[Union[ModelResponse, TextCompletionResponse]]:
+        """
+        The complete response, from the chunks streamed so far - same as `litellm.stream_chunk_builder(chunks)`.
+        """
+        try:
+            return self.stream_accumulator.build(
+                messages=self.messages, logging_obj=self.logging_obj
+            )
+        except Exception as e:
+            verbose_logger.exception(
+                "CustomStreamWrapper.build_complete_streaming_response() - Exception occurred - {}".format(
+                    str(e)
+                )
+            )
+            raise litellm.APIError(
+                status_code=500,
+                message="Error building chunks for logging/streaming usage calculation",
+                llm_provider="",
+                model="",
+            )
+
     def check_special_tokens(self, chunk: str, finish_reason: Optional[str]):
         """
         Output parse <s> / </s> special tokens for sagemaker + hf streaming.
@@ -426,7 +498,7 @@ class CustomStreamWrapper:
 
     def handle_openai_chat_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             str_line = chunk
             text = ""
             is_finished = False
@@ -477,7 +549,7 @@ class CustomStreamWrapper:
 
     def handle_azure_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -498,7 +570,7 @@ class CustomStreamWrapper:
 
     def handle_openai_text_completion_chunk(self, chunk):
         try:
-            print_verbose(f"\nRaw OpenAI Chunk\n{chunk}\n")
+            print_verbose("\nRaw OpenAI Chunk\n%s\n", chunk)
             text = ""
             is_finished = False
             finish_reason = None
@@ -625,18 +697,17 @@ class CustomStreamWrapper:
             "model": _model,
             **chunk_dict,
         }
-
-        model_response = ModelResponseStream(**args)
         if self.response_id is not None:
-            model_response.id = self.response_id
-        if self.system_fingerprint is not None:
-            model_response.system_fingerprint = self.system_fingerprint
-
+            args["id"] = self.response_id
         if (
             self.created is not None
         ):  # maintain same 'created' across all chunks - https://github.com/BerriAI/litellm/issues/11437
-            model_response.created = self.created
-        else:
+            args["created"] = self.created
+
+        model_response = ModelResponseStream(**args)
+        if self.system_fingerprint is not None:
+            model_response.system_fingerprint = self.system_fingerprint
+        if self.created is None:
             self.created = model_response.created
         if hidden_params is not None:
             model_response._hidden_params = hidden_params
@@ -777,7 +848,10 @@ class CustomStreamWrapper:
         )
 
         print_verbose(
-            f"completion_obj: {completion_obj}, model_response.choices[0]: {model_response.choices[0]}, response_obj: {response_obj}"
+            "completion_obj: %s, model_response.choices[0]: %s, response_obj: %s",
+            completion_obj,
+            model_response.choices[0],
+            response_obj,
         )
         is_chunk_non_empty = self.is_chunk_non_empty(
             completion_obj, model_response, response_obj
@@ -862,7 +936,7 @@ class CustomStreamWrapper:
 
                 # Default - return StopIteration
                 if hasattr(model_response, "usage"):
-                    self.chunks.append(model_response)
+                    self._accumulate_chunk(model_response)
                 raise StopIteration
             # flush any remaining holding chunk
             if len(self.holding_chunk) > 0:
@@ -904,7 +978,7 @@ class CustomStreamWrapper:
             return model_response
         else:
             if hasattr(model_response, "usage"):
-                self.chunks.append(model_response)
+                self._accumulate_chunk(model_response)
             return
 
     def _optional_combine_thinking_block_in_choices(
@@ -952,7 +1026,66 @@ class CustomStreamWrapper:
                 del model_response.choices[0].delta.reasoning_content
         return
 
+    def _can_use_streaming_chunk_fast_path(self) -> bool:
+        """
+        True if `chunk_creator` only copies a `StreamingChunk`'s text / reasoning delta into the chunk it returns - no finish reason, special token or thinking block handling
+        """
+        return (
+            self.received_finish_reason is None
+            and not self.merge_reasoning_content_in_choices
+            and not self.holding_chunk
+            and self.model != "replicate"
+            and self.custom_llm_provider not in _PROVIDERS_WITH_OWN_CHUNK_HANDLING
+            and self.custom_llm_provider not in litellm._custom_providers
+        )
+
+    def streaming_chunk_creator(self, chunk: StreamingChunk) -> ModelResponseStream:
+        """
+        `chunk_creator` for a `StreamingChunk` - builds the returned chunk once, from the chunk's fields.
+
+        Returns the same chunk as `chunk_creator(chunk.to_model_response_stream())`.
+        """
+        self.safety_checker()
+        self.intermittent_finish_reason = None
+        # the role is only sent in the first chunk
+        role = None if self.sent_first_chunk else "assistant"
+        self.sent_first_chunk = True
+
+        model_response = self.model_response_creator(
+            chunk={
+                "choices": [
+                    StreamingChoices(
+                        index=chunk.index,
+                        delta=Delta(
+                            content=chunk.content,
+                            role=role,
+                            reasoning_content=chunk.reasoning_content,
+                            provider_specific_fields=None,
+                        ),
+                    )
+                ]
+            }
+        )
+        model_response = self.set_model_id(chunk.id, model_response)
+        # OpenAI-compatible chunks are parsed without their system fingerprint
+        model_response.system_fingerprint = self.system_fingerprint = None
+        model_response.model = self.model
+        setattr(model_response, "citations", None)
+        return model_response
+
     def chunk_creator(self, chunk: Any):  # type: ignore  # noqa: PLR0915
+        if isinstance(chunk, StreamingChunk):
+            if self._can_use_streaming_chunk_fast_path():
+                try:
+                    return self.streaming_chunk_creator(chunk=chunk)
+                except Exception as e:
+                    setattr(e, "message", str(e))
+                    raise exception_type(
+                        model=self.model,
+                        custom_llm_provider=self.custom_llm_provider,
+                        original_exception=e,
+                    )
+            chunk = chunk.to_model_response_stream()
         model_response = self.model_response_creator()
         response_obj: Dict[str, Any] = {}
         try:
@@ -1448,9 +1581,26 @@ class CustomStreamWrapper:
         """
         self.logging_loop = loop
 
+    def cache_streaming_chunk(self, chunk: ModelResponseStream, cache_hit: bool):
+        """
+        Hands each chunk returned to the caller to the caching handler - streams are cached chunk by chunk
+        """
+        if not cache_hit and self.logging_obj._llm_caching_handler is not None:
+            self.logging_obj._llm_caching_handler._add_streaming_chunk_to_cache(chunk)
+
+    def fail_streaming_cache_entry(self):
+        """
+        Drops the stream's in-progress cache entry - readers following it fall back to their own upstream call
+        """
+        _llm_caching_handler = getattr(self.logging_obj, "_llm_caching_handler", None)
+        if _llm_caching_handler is not None:
+            _llm_caching_handler._fail_stream_cache_entry()
+
     def cache_streaming_response(self, processed_chunk, cache_hit: bool):
         """
         Caches the streaming response
+
+        `processed_chunk` is the complete response (None if it couldn't be built) - the caching handler stores the chunks it was given via `cache_streaming_chunk`, and only falls back to the complete response if there are none
         """
         if not cache_hit and self.logging_obj._llm_caching_handler is not None:
             self.logging_obj._llm_caching_handler._sync_add_streaming_response_to_cache(
@@ -1466,9 +1616,11 @@ class CustomStreamWrapper:
                 processed_chunk
             )
 
-    def run_success_logging_and_cache_storage(self, processed_chunk, cache_hit: bool):
+    async def run_success_logging_and_cache_storage(
+        self, processed_chunk, cache_hit: bool
+    ):
         """
-        Runs success logging in a thread and adds the response to the cache
+        Runs success logging for a chunk. Awaited on the logging dispatcher's event loop.
         """
         if litellm.disable_streaming_logging is True:
             """
@@ -1479,20 +1631,17 @@ class CustomStreamWrapper:
             """
             return
         ## ASYNC LOGGING
-        # Create an event loop for the new thread
         if self.logging_loop is not None:
-            future = asyncio.run_coroutine_threadsafe(
+            # not awaited - the dispatcher shouldn't wait on the caller's loop
+            asyncio.run_coroutine_threadsafe(
                 self.logging_obj.async_success_handler(
                     processed_chunk, None, None, cache_hit
                 ),
                 loop=self.logging_loop,
             )
-            future.result()
         else:
-            asyncio.run(
-                self.logging_obj.async_success_handler(
-                    processed_chunk, None, None, cache_hit
-                )
+            await self.logging_obj.async_success_handler(
+                processed_chunk, None, None, cache_hit
             )
         ## SYNC LOGGING
         self.logging_obj.success_handler(processed_chunk, None, None, cache_hit)
@@ -1534,12 +1683,14 @@ class CustomStreamWrapper:
                     chunk = next(self.completion_stream)
                 if chunk is not None and chunk != b"":
                     print_verbose(
-                        f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}; custom_llm_provider: {self.custom_llm_provider}"
+                        "PROCESSED CHUNK PRE CHUNK CREATOR: %s; custom_llm_provider: %s",
+                        chunk,
+                        self.custom_llm_provider,
                     )
                     response: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
-                    print_verbose(f"PROCESSED CHUNK POST CHUNK CREATOR: {response}")
+                    print_verbose("PROCESSED CHUNK POST CHUNK CREATOR: %s", response)
 
                     if response is None:
                         continue
@@ -1548,7 +1699,7 @@ class CustomStreamWrapper:
                             completion_start_time=datetime.datetime.now()
                         )
                     ## LOGGING
-                    executor.submit(
+                    logging_dispatcher.submit(
                         self.run_success_logging_and_cache_storage,
                         response,
                         cache_hit,
@@ -1562,7 +1713,7 @@ class CustomStreamWrapper:
                         input=self.response_uptil_now, model=self.model
                     )
                     # HANDLE STREAM OPTIONS
-                    self.chunks.append(response)
+                    self._accumulate_chunk(response)
                     if hasattr(
                         response, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1586,18 +1737,15 @@ class CustomStreamWrapper:
                             continue
                     # add usage as hidden param
                     if self.sent_last_chunk is True and self.stream_options is None:
-                        usage = calculate_total_usage(chunks=self.chunks)
+                        usage = self.stream_accumulator.get_total_usage()
                         response._hidden_params["usage"] = usage
                     # RETURN RESULT
+                    self.cache_streaming_chunk(chunk=response, cache_hit=cache_hit)
                     return response
 
         except StopIteration:
             if self.sent_last_chunk is True:
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
-                )
+                complete_streaming_response = self.build_complete_streaming_response()
 
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
@@ -1606,13 +1754,14 @@ class CustomStreamWrapper:
                         "usage",
                         getattr(complete_streaming_response, "usage"),
                     )
-                    self.cache_streaming_response(
-                        processed_chunk=complete_streaming_response.model_copy(
-                            deep=True
-                        ),
-                        cache_hit=cache_hit,
-                    )
-                    executor.submit(
+                if self.sent_stream_usage is False and self.send_stream_usage is True:
+                    self.cache_streaming_chunk(chunk=response, cache_hit=cache_hit)
+                self.cache_streaming_response(
+                    processed_chunk=complete_streaming_response,
+                    cache_hit=cache_hit,
+                )
+                if complete_streaming_response is not None:
+                    logging_dispatcher.submit(
                         self.logging_obj.success_handler,
                         complete_streaming_response.model_copy(deep=True),
                         None,
@@ -1620,7 +1769,7 @@ class CustomStreamWrapper:
                         cache_hit,
                     )
                 else:
-                    executor.submit(
+                    logging_dispatcher.submit(
                         self.logging_obj.success_handler,
                         response,
                         None,
@@ -1635,21 +1784,23 @@ class CustomStreamWrapper:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
                 if self.stream_options is None:  # add usage as hidden param
-                    usage = calculate_total_usage(chunks=self.chunks)
+                    usage = self.stream_accumulator.get_total_usage()
                     processed_chunk._hidden_params["usage"] = usage
                 ## LOGGING
-                executor.submit(
+                logging_dispatcher.submit(
                     self.run_success_logging_and_cache_storage,
                     processed_chunk,
                     cache_hit,
                 )  # log response
+                self.cache_streaming_chunk(chunk=processed_chunk, cache_hit=cache_hit)
                 return processed_chunk
         except Exception as e:
+            self.fail_streaming_cache_entry()
             traceback_exception = traceback.format_exc()
             # LOG FAILURE - handle streaming failure logging in the _next_ object, remove `handle_failure` once it's deprecated
-            threading.Thread(
-                target=self.logging_obj.failure_handler, args=(e, traceback_exception)
-            ).start()
+            logging_dispatcher.submit(
+                self.logging_obj.failure_handler, e, traceback_exception
+            )
             if isinstance(e, OpenAIError):
                 raise e
             else:
@@ -1702,14 +1853,14 @@ class CustomStreamWrapper:
                     # chunk_creator() does logging/stream chunk building. We need to let it know its being called in_async_func, so we don't double add chunks.
                     # __anext__ also calls async_success_handler, which does logging
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: {chunk}"
+                        "PROCESSED ASYNC CHUNK PRE CHUNK CREATOR: %s", chunk
                     )
 
                     processed_chunk: Optional[ModelResponseStream] = self.chunk_creator(
                         chunk=chunk
                     )
                     verbose_logger.debug(
-                        f"PROCESSED ASYNC CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                        "PROCESSED ASYNC CHUNK POST CHUNK CREATOR: %s", processed_chunk
                     )
                     if processed_chunk is None:
                         continue
@@ -1727,7 +1878,7 @@ class CustomStreamWrapper:
                     self.rules.post_call_rules(
                         input=self.response_uptil_now, model=self.model
                     )
-                    self.chunks.append(processed_chunk)
+                    self._accumulate_chunk(processed_chunk)
                     if hasattr(
                         processed_chunk, "usage"
                     ):  # remove usage from chunk, only send on final chunk
@@ -1746,7 +1897,10 @@ class CustomStreamWrapper:
 
                         if is_empty:
                             continue
-                    print_verbose(f"final returned processed chunk: {processed_chunk}")
+                    print_verbose("final returned processed chunk: %s", processed_chunk)
+                    self.cache_streaming_chunk(
+                        chunk=processed_chunk, cache_hit=cache_hit
+                    )
                     return processed_chunk
                 raise StopAsyncIteration
             else:  # temporary patch for non-aiohttp async calls
@@ -1759,12 +1913,12 @@ class CustomStreamWrapper:
                     else:
                         chunk = next(self.completion_stream)
                     if chunk is not None and chunk != b"":
-                        print_verbose(f"PROCESSED CHUNK PRE CHUNK CREATOR: {chunk}")
+                        print_verbose("PROCESSED CHUNK PRE CHUNK CREATOR: %s", chunk)
                         processed_chunk: Optional[ModelResponseStream] = (
                             self.chunk_creator(chunk=chunk)
                         )
                         print_verbose(
-                            f"PROCESSED CHUNK POST CHUNK CREATOR: {processed_chunk}"
+                            "PROCESSED CHUNK POST CHUNK CREATOR: %s", processed_chunk
                         )
                         if processed_chunk is None:
                             continue
@@ -1780,16 +1934,15 @@ class CustomStreamWrapper:
                             input=self.response_uptil_now, model=self.model
                         )
                         # RETURN RESULT
-                        self.chunks.append(processed_chunk)
+                        self._accumulate_chunk(processed_chunk)
+                        self.cache_streaming_chunk(
+                            chunk=processed_chunk, cache_hit=cache_hit
+                        )
                         return processed_chunk
         except (StopAsyncIteration, StopIteration):
             if self.sent_last_chunk is True:
                 # log the final chunk with accurate streaming values
-                complete_streaming_response = litellm.stream_chunk_builder(
-                    chunks=self.chunks,
-                    messages=self.messages,
-                    logging_obj=self.logging_obj,
-                )
+                complete_streaming_response = self.build_complete_streaming_response()
                 response = self.model_response_creator()
                 if complete_streaming_response is not None:
                     setattr(
@@ -1797,14 +1950,14 @@ class CustomStreamWrapper:
                         "usage",
                         getattr(complete_streaming_response, "usage"),
                     )
-                    asyncio.create_task(
-                        self.async_cache_streaming_response(
-                            processed_chunk=complete_streaming_response.model_copy(
-                                deep=True
-                            ),
-                            cache_hit=cache_hit,
-                        )
+                if self.sent_stream_usage is False and self.send_stream_usage is True:
+                    self.cache_streaming_chunk(chunk=response, cache_hit=cache_hit)
+                asyncio.create_task(
+                    self.async_cache_streaming_response(
+                        processed_chunk=complete_streaming_response,
+                        cache_hit=cache_hit,
                     )
+                )
                 if self.sent_stream_usage is False and self.send_stream_usage is True:
                     self.sent_stream_usage = True
                     return response
@@ -1818,7 +1971,7 @@ class CustomStreamWrapper:
                     )
                 )
 
-                executor.submit(
+                logging_dispatcher.submit(
                     self.logging_obj.success_handler,
                     complete_streaming_response,
                     cache_hit=cache_hit,
@@ -1830,8 +1983,10 @@ class CustomStreamWrapper:
             else:
                 self.sent_last_chunk = True
                 processed_chunk = self.finish_reason_handler()
+                self.cache_streaming_chunk(chunk=processed_chunk, cache_hit=cache_hit)
                 return processed_chunk
         except httpx.TimeoutException as e:  # if httpx read timeout error occues
+            self.fail_streaming_cache_entry()
             traceback_exception = traceback.format_exc()
             ## ADD DEBUG INFORMATION - E.G. LITELLM REQUEST TIMEOUT
             traceback_exception += "\nLiteLLM Default Request Timeout - {}".format(
@@ -1839,23 +1994,22 @@ class CustomStreamWrapper:
             )
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                logging_dispatcher.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
                 asyncio.create_task(
                     self.logging_obj.async_failure_handler(e, traceback_exception)
                 )
             raise e
         except Exception as e:
+            self.fail_streaming_cache_entry()
             traceback_exception = traceback.format_exc()
             if self.logging_obj is not None:
                 ## LOGGING
-                threading.Thread(
-                    target=self.logging_obj.failure_handler,
-                    args=(e, traceback_exception),
-                ).start()  # log response
+                logging_dispatcher.submit(
+                    self.logging_obj.failure_handler, e, traceback_exception
+                )  # log response
                 # Handle any exceptions that might occur during streaming
                 asyncio.create_task(
                     self.logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
@@ -1918,26 +2072,6 @@ class CustomStreamWrapper:
         return chunk
 
 
-def calculate_total_usage(chunks: List[ModelResponse]) -> Usage:
-    """Assume most recent usage chunk has total usage uptil then."""
-    prompt_tokens: int = 0
-    completion_tokens: int = 0
-    for chunk in chunks:
-        if "usage" in chunk:
-            if "prompt_tokens" in chunk["usage"]:
-                prompt_tokens = chunk["usage"].get("prompt_tokens", 0) or 0
-            if "completion_tokens" in chunk["usage"]:
-                completion_tokens = chunk["usage"].get("completion_tokens", 0) or 0
-
-    returned_usage_chunk = Usage(
-        prompt_tokens=prompt_tokens,
-        completion_tokens=completion_tokens,
-        total_tokens=prompt_tokens + completion_tokens,
-    )
-
-    return returned_usage_chunk
-
-
 def generic_chunk_has_all_required_fields(chunk: dict) -> bool:
     """
     Checks if the provided chunk dictionary contains all required fields for GenericStreamingChunk.
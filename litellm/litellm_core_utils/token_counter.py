@@ -1,25 +1,33 @@
 # What is this?
 ## Helper utilities for token counting
-import base64
-import io
-import struct
-from typing import Callable, List, Literal, Optional, Tuple, Union, cast
+from functools import lru_cache
+from typing import Callable, Dict, List, Literal, Optional, Tuple, Union, cast
 
 import tiktoken
 
 import litellm
 from litellm import verbose_logger
 from litellm.constants import (
-    DEFAULT_IMAGE_HEIGHT,
     DEFAULT_IMAGE_TOKEN_COUNT,
-    DEFAULT_IMAGE_WIDTH,
+    DEFAULT_MAX_LRU_CACHE_SIZE,
     MAX_LONG_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_SHORT_SIDE_FOR_IMAGE_HIGH_RES,
     MAX_TILE_HEIGHT,
     MAX_TILE_WIDTH,
 )
 from litellm.litellm_core_utils.default_encoding import encoding as default_encoding
-from litellm.llms.custom_httpx.http_handler import _get_httpx_client
+from litellm.litellm_core_utils.image_dimensions import (  # noqa: F401
+    get_image_type,
+    image_dimensions_prober,
+)
+from litellm.litellm_core_utils.tokenizer_backends import (
+    BaseTokenizerBackend,
+    TiktokenTokenizerBackend,
+    TokenCountCache,
+    TokenCountCacheKey,
+    get_huggingface_tokenizer_backend,
+    token_count_cache,
+)
 from litellm.types.llms.openai import (
     AllMessageValues,
     ChatCompletionNamedToolChoiceParam,
@@ -160,34 +168,13 @@ def calculate_tiles_needed(
     return total_tiles
 
 
-def get_image_type(image_data: bytes) -> Union[str, None]:
-    """take an image (really only the first ~100 bytes max are needed)
-    and return 'png' 'gif' 'jpeg' 'webp' 'heic' or None. method added to
-    allow deprecation of imghdr in 3.13"""
-
-    if image_data[0:8] == b"\x89\x50\x4e\x47\x0d\x0a\x1a\x0a":
-        return "png"
-
-    if image_data[0:4] == b"GIF8" and image_data[5:6] == b"a":
-        return "gif"
-
-    if image_data[0:3] == b"\xff\xd8\xff":
-        return "jpeg"
-
-    if image_data[4:8] == b"ftyp":
-        return "heic"
-
-    if image_data[0:4] == b"RIFF" and image_data[8:12] == b"WEBP":
-        return "webp"
-
-    return None
-
-
 def get_image_dimensions(
     data: str,
 ) -> Tuple[int, int]:
     """
-    Async Function to get the dimensions of an image from a URL or base64 encoded string.
+    Function to get the dimensions of an image from a URL or base64 encoded string.
+
+    Only the start of the image is read, and the dimensions are cached. Inside a running event loop, an uncached URL is probed in the background and the default dimensions are returned - see `ImageDimensionsProber`.
 
     Args:
         data (str): The URL or base64 encoded string of the image.
@@ -195,61 +182,7 @@ def get_image_dimensions(
     Returns:
         Tuple[int, int]: The width and height of the image.
     """
-    img_data = None
-    try:
-        # Try to open as URL
-        client = _get_httpx_client()
-        response = client.get(data)
-        img_data = response.read()
-    except Exception:
-        # If not URL, assume it's base64
-        _header, encoded = data.split(",", 1)
-        img_data = base64.b64decode(encoded)
-
-    img_type = get_image_type(img_data)
-
-    if img_type == "png":
-        w, h = struct.unpack(">LL", img_data[16:24])
-        return w, h
-    elif img_type == "gif":
-        w, h = struct.unpack("<HH", img_data[6:10])
-        return w, h
-    elif img_type == "jpeg":
-        with io.BytesIO(img_data) as fhandle:
-            fhandle.seek(0)
-            size = 2
-            ftype = 0
-            while not 0xC0 <= ftype <= 0xCF or ftype in (0xC4, 0xC8, 0xCC):
-                fhandle.seek(size, 1)
-                byte = fhandle.read(1)
-                while ord(byte) == 0xFF:
-                    byte = fhandle.read(1)
-                ftype = ord(byte)
-                size = struct.unpack(">H", fhandle.read(2))[0] - 2
-            fhandle.seek(1, 1)
-            h, w = struct.unpack(">HH", fhandle.read(4))
-        return w, h
-    elif img_type == "webp":
-        # For WebP, the dimensions are stored at different offsets depending on the format
-        # Check for VP8X (extended format)
-        if img_data[12:16] == b"VP8X":
-            w = struct.unpack("<I", img_data[24:27] + b"\x00")[0] + 1
-            h = struct.unpack("<I", img_data[27:30] + b"\x00")[0] + 1
-            return w, h
-        # Check for VP8 (lossy format)
-        elif img_data[12:16] == b"VP8 ":
-            w = struct.unpack("<H", img_data[26:28])[0] & 0x3FFF
-            h = struct.unpack("<H", img_data[28:30])[0] & 0x3FFF
-            return w, h
-        # Check for VP8L (lossless format)
-        elif img_data[12:16] == b"VP8L":
-            bits = struct.unpack("<I", img_data[21:25])[0]
-            w = (bits & 0x3FFF) + 1
-            h = ((bits >> 14) & 0x3FFF) + 1
-            return w, h
-
-    # return sensible default image dimensions if unable to get dimensions
-    return DEFAULT_IMAGE_WIDTH, DEFAULT_IMAGE_HEIGHT
+    return image_dimensions_prober.get_image_dimensions(data)
 
 
 def calculate_img_tokens(
@@ -298,6 +231,8 @@ TokenCounterFunction = Callable[[str], int]
 Type for a function that counts tokens in a string.
 """
 
+CustomTokenizer = Union[dict, SelectTokenizerResponse, BaseTokenizerBackend]
+
 
 class _MessageCountParams:
     """
@@ -307,7 +242,7 @@ class _MessageCountParams:
     def __init__(
         self,
         model: str,
-        custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]],
+        custom_tokenizer: Optional[CustomTokenizer],
     ):
         from litellm.utils import print_verbose
 
@@ -329,12 +264,13 @@ class _MessageCountParams:
             )
             self.tokens_per_message = 3
             self.tokens_per_name = 1
-        self.count_function = _get_count_function(model, custom_tokenizer)
+        self.tokenizer = _get_tokenizer_backend(model, custom_tokenizer)
+        self.count_function = self.tokenizer.count_tokens
 
 
 def token_counter(
     model="",
-    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    custom_tokenizer: Optional[CustomTokenizer] = None,
     text: Optional[Union[str, List[str]]] = None,
     messages: Optional[List[Union[AllMessageValues, Message]]] = None,
     count_response_tokens: Optional[bool] = False,
@@ -348,7 +284,7 @@ def token_counter(
 
     Args:
     model (str): The name of the model to use for tokenization. Default is an empty string.
-    custom_tokenizer (Optional[dict]): A custom tokenizer created with the `create_pretrained_tokenizer` or `create_tokenizer` method. Must be a dictionary with a string value for `type` and Tokenizer for `tokenizer`. Default is None.
+    custom_tokenizer (Optional[dict]): A custom tokenizer created with the `create_pretrained_tokenizer` or `create_tokenizer` method, or a `BaseTokenizerBackend`. A dictionary must have a string value for `type` and Tokenizer for `tokenizer`. Default is None.
     text (str): The raw text string to be passed to the model. Default is None.
     messages (Optional[List[AllMessageValues]]): Alternative to passing in text. A list of dictionaries representing messages with "role" and "content" keys. Default is None.
     count_response_tokens (Optional[bool]): set to True to indicate we are processing a stream response.
@@ -402,7 +338,7 @@ def token_counter(
                 [message.get("role", None) == "system" for message in new_messages]
             )
             num_tokens += _count_extra(
-                params.count_function, tools, tool_choice, includes_system_message
+                params.tokenizer, tools, tool_choice, includes_system_message
             )
 
     else:
@@ -411,6 +347,27 @@ def token_counter(
     return num_tokens
 
 
+def batch_token_counter(
+    texts: List[str],
+    model: str = "",
+    custom_tokenizer: Optional[CustomTokenizer] = None,
+) -> List[int]:
+    """
+    Count the number of tokens in each of `texts`, tokenizing them in one batch call.
+
+    Args:
+    texts (List[str]): The texts to count tokens in.
+    model (str): The name of the model to use for tokenization. Default is an empty string.
+    custom_tokenizer (Optional[dict]): Same as `token_counter`.
+
+    Returns:
+    List[int]: The number of tokens in each text.
+    """
+    if litellm.disable_token_counter is True:
+        return [0] * len(texts)
+    return _get_tokenizer_backend(model, custom_tokenizer).count_tokens_batch(texts)
+
+
 def _count_messages(
     params: _MessageCountParams,
     messages: List[AllMessageValues],
@@ -420,6 +377,8 @@ def _count_messages(
     """
     Count the number of tokens in a list of messages.
 
+    Text-only messages are counted once per tokenizer - their counts are cached by content digest, and the messages that aren't cached are tokenized in one batch.
+
     Args:
         params (_MessageCountParams): The parameters for counting tokens.
         messages (List[AllMessageValues]): The list of messages to count tokens in.
@@ -427,55 +386,164 @@ def _count_messages(
         default_token_count (Optional[int]): The default number of tokens to return for a message block, if an error occurs.
     """
     num_tokens = 0
-    if len(messages) == 0:
-        return num_tokens
+    # cache key -> (message, its texts, number of times it's in `messages`)
+    uncached_messages: Dict[
+        TokenCountCacheKey, Tuple[AllMessageValues, List[str], int]
+    ] = {}
     for message in messages:
         num_tokens += params.tokens_per_message
-        for key, value in message.items():
-            if value is None:
-                pass
-            elif key == "tool_calls":
-                if isinstance(value, List):
-                    for tool_call in value:
-                        if "function" in tool_call:
-                            function_arguments = tool_call["function"].get(
-                                "arguments", []
-                            )
-                            num_tokens += params.count_function(str(function_arguments))
-                        else:
-                            raise ValueError(
-                                f"Unsupported tool call {tool_call} must contain a function key"
-                            )
+        if isinstance(message.get("name"), str):
+            num_tokens += params.tokens_per_name
+
+        texts = _get_message_texts(message)
+        if texts is None:
+            num_tokens += _count_message_content(
+                params, message, use_default_image_token_count, default_token_count
+            )
+            continue
+        cache_key = TokenCountCache.get_cache_key(
+            params.tokenizer.tokenizer_id, "message", message
+        )
+        cached_num_tokens = token_count_cache.get(cache_key)
+        if cached_num_tokens is not None:
+            num_tokens += cached_num_tokens
+        elif cache_key in uncached_messages:
+            _, texts, num_copies = uncached_messages[cache_key]
+            uncached_messages[cache_key] = (message, texts, num_copies + 1)
+        else:
+            uncached_messages[cache_key] = (message, texts, 1)
+
+    if uncached_messages:
+        num_tokens += _count_uncached_messages(
+            params,
+            uncached_messages,
+            use_default_image_token_count,
+            default_token_count,
+        )
+    return num_tokens
+
+
+def _get_message_texts(message: AllMessageValues) -> Optional[List[str]]:
+    """
+    The strings that make up the content of a text-only message.
+
+    Returns None if the message needs `_count_message_content` - e.g. it has images, or an invalid tool call / content block.
+    """
+    texts: List[str] = []
+    for key, value in message.items():
+        if value is None:
+            pass
+        elif key == "tool_calls":
+            if not isinstance(value, List):
+                return None
+            for tool_call in value:
+                if not isinstance(tool_call, dict) or not isinstance(
+                    tool_call.get("function"), dict
+                ):
+                    return None
+                texts.append(str(tool_call["function"].get("arguments", [])))
+        elif isinstance(value, str):
+            texts.append(value)
+        elif key == "content" and isinstance(value, List):
+            for c in value:
+                if isinstance(c, str):
+                    texts.append(c)
+                elif (
+                    isinstance(c, dict)
+                    and c.get("type") == "text"
+                    and isinstance(c.get("text"), str)
+                ):
+                    texts.append(c["text"])
                 else:
-                    raise ValueError(
-                        f"Unsupported type {type(value)} for key tool_calls in message {message}"
-                    )
-            elif isinstance(value, str):
-                num_tokens += params.count_function(value)
-                if key == "name":
-                    num_tokens += params.tokens_per_name
-            elif key == "content" and isinstance(value, List):
-                num_tokens += _count_content_list(
-                    params.count_function,
-                    value,
-                    use_default_image_token_count,
-                    default_token_count,
-                )
+                    return None
+    return texts
+
+
+def _count_uncached_messages(
+    params: _MessageCountParams,
+    uncached_messages: Dict[
+        TokenCountCacheKey, Tuple[AllMessageValues, List[str], int]
+    ],
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    """
+    Tokenize the texts of every uncached message in one batch, and cache each message's count.
+    """
+    all_texts = [text for _, texts, _ in uncached_messages.values() for text in texts]
+    try:
+        text_counts = params.tokenizer.count_tokens_batch(all_texts)
+    except Exception:
+        # e.g. a disallowed special token - count message by message, to surface the same errors / defaults
+        return sum(
+            _count_message_content(
+                params, message, use_default_image_token_count, default_token_count
+            )
+            * num_copies
+            for message, _, num_copies in uncached_messages.values()
+        )
+
+    num_tokens = 0
+    offset = 0
+    for cache_key, (_, texts, num_copies) in uncached_messages.items():
+        message_num_tokens = sum(text_counts[offset : offset + len(texts)])
+        offset += len(texts)
+        token_count_cache.set(cache_key, message_num_tokens)
+        num_tokens += message_num_tokens * num_copies
+    return num_tokens
+
+
+def _count_message_content(
+    params: _MessageCountParams,
+    message: AllMessageValues,
+    use_default_image_token_count: bool,
+    default_token_count: Optional[int],
+) -> int:
+    """
+    Count the number of tokens in the content of a message - excluding the per-message / per-name tokens.
+    """
+    num_tokens = 0
+    for key, value in message.items():
+        if value is None:
+            pass
+        elif key == "tool_calls":
+            if isinstance(value, List):
+                for tool_call in value:
+                    if "function" in tool_call:
+                        function_arguments = tool_call["function"].get("arguments", [])
+                        num_tokens += params.count_function(str(function_arguments))
+                    else:
+                        raise ValueError(
+                            f"Unsupported tool call {tool_call} must contain a function key"
+                        )
             else:
-                # Skip unsupported keys instead of raising an error
-                continue
+                raise ValueError(
+                    f"Unsupported type {type(value)} for key tool_calls in message {message}"
+                )
+        elif isinstance(value, str):
+            num_tokens += params.count_function(value)
+        elif key == "content" and isinstance(value, List):
+            num_tokens += _count_content_list(
+                params.count_function,
+                value,
+                use_default_image_token_count,
+                default_token_count,
+            )
+        else:
+            # Skip unsupported keys instead of raising an error
+            continue
     return num_tokens
 
 
 def _count_extra(
-    count_function: TokenCounterFunction,
+    tokenizer: BaseTokenizerBackend,
     tools: Optional[List[ChatCompletionToolParam]],
     tool_choice: Optional[ChatCompletionNamedToolChoiceParam],
     includes_system_message: bool,
 ) -> int:
     """Count extra tokens for function definitions and tool choices.
     Args:
-        count_function (TokenCounterFunction): The function to count tokens.
+        tokenizer (BaseTokenizerBackend): The tokenizer to count tokens with.
         tools (Optional[List[ChatCompletionToolParam]]): The available tools.
         tool_choice (Optional[ChatCompletionNamedToolChoiceParam]): The tool choice.
         includes_system_message (bool): Whether the messages include a system message.
@@ -484,7 +552,7 @@ def _count_extra(
     num_tokens = 3  # every reply is primed with <|start|>assistant<|message|>
 
     if tools:
-        num_tokens += count_function(_format_function_definitions(tools))
+        num_tokens += _count_tools(tokenizer, tools)
         num_tokens += 9  # Additional tokens for function definition of tools
     # If there's a system message and tools are present, subtract four tokens
     if tools and includes_system_message:
@@ -496,49 +564,83 @@ def _count_extra(
         num_tokens += 1
     elif isinstance(tool_choice, dict):
         num_tokens += 7
-        num_tokens += count_function(str(tool_choice["function"]["name"]))
+        num_tokens += tokenizer.count_tokens(str(tool_choice["function"]["name"]))
 
     return num_tokens
 
 
+def _count_tools(
+    tokenizer: BaseTokenizerBackend, tools: List[ChatCompletionToolParam]
+) -> int:
+    """Count the tokens in the function definitions of `tools` - once per tool-set digest."""
+    cache_key = TokenCountCache.get_cache_key(tokenizer.tokenizer_id, "tools", tools)
+    num_tokens = token_count_cache.get(cache_key)
+    if num_tokens is None:
+        num_tokens = tokenizer.count_tokens(_format_function_definitions(tools))
+        token_count_cache.set(cache_key, num_tokens)
+    return num_tokens
+
+
 def _get_count_function(
     model: Optional[str],
-    custom_tokenizer: Optional[Union[dict, SelectTokenizerResponse]] = None,
+    custom_tokenizer: Optional[CustomTokenizer] = None,
 ) -> TokenCounterFunction:
     """
     Get the function to count tokens based on the model and custom tokenizer."""
-    from litellm.utils import _select_tokenizer, print_verbose
+    return _get_tokenizer_backend(model, custom_tokenizer).count_tokens
 
-    if model is not None or custom_tokenizer is not None:
-        tokenizer_json = custom_tokenizer or _select_tokenizer(model)  # type: ignore
-        if tokenizer_json["type"] == "huggingface_tokenizer":
 
-            def count_tokens(text: str) -> int:
-                enc = tokenizer_json["tokenizer"].encode(text)
-                return len(enc.ids)
+def _get_tokenizer_backend(
+    model: Optional[str],
+    custom_tokenizer: Optional[CustomTokenizer] = None,
+) -> BaseTokenizerBackend:
+    """
+    Get the tokenizer backend based on the model and custom tokenizer.
 
-        elif tokenizer_json["type"] == "openai_tokenizer":
-            model_to_use = _fix_model_name(model)  # type: ignore
-            try:
-                if "gpt-4o" in model_to_use:
-                    encoding = tiktoken.get_encoding("o200k_base")
-                else:
-                    encoding = tiktoken.encoding_for_model(model_to_use)
-            except KeyError:
-                print_verbose("Warning: model not found. Using cl100k_base encoding.")
-                encoding = tiktoken.get_encoding("cl100k_base")
+    Resolved once per model - `_select_tokenizer` / `tiktoken.encoding_for_model` aren't re-run on every call.
+    """
+    if isinstance(custom_tokenizer, BaseTokenizerBackend):
+        return custom_tokenizer
+    if custom_tokenizer is not None:
+        return _get_backend_for_tokenizer_json(model, custom_tokenizer)
+    if model is not None:
+        return _get_model_tokenizer_backend(model)
+    return _default_tokenizer_backend
 
-            def count_tokens(text: str) -> int:
-                return len(encoding.encode(text))
 
-        else:
-            raise ValueError("Unsupported tokenizer type")
+@lru_cache(maxsize=DEFAULT_MAX_LRU_CACHE_SIZE)
+def _get_model_tokenizer_backend(model: str) -> BaseTokenizerBackend:
+    from litellm.utils import _select_tokenizer
+
+    return _get_backend_for_tokenizer_json(model, _select_tokenizer(model))
+
+
+def _get_backend_for_tokenizer_json(
+    model: Optional[str],
+    tokenizer_json: Union[dict, SelectTokenizerResponse],
+) -> BaseTokenizerBackend:
+    from litellm.utils import print_verbose
+
+    if tokenizer_json["type"] == "huggingface_tokenizer":
+        return get_huggingface_tokenizer_backend(tokenizer_json["tokenizer"])
+    elif tokenizer_json["type"] == "openai_tokenizer":
+        model_to_use = _fix_model_name(model)  # type: ignore
+        try:
+            if "gpt-4o" in model_to_use:
+                encoding = tiktoken.get_encoding("o200k_base")
+            else:
+                encoding = tiktoken.encoding_for_model(model_to_use)
+        except KeyError:
+            print_verbose("Warning: model not found. Using cl100k_base encoding.")
+            encoding = tiktoken.get_encoding("cl100k_base")
+        return TiktokenTokenizerBackend(encoding)
     else:
+        raise ValueError("Unsupported tokenizer type")
 
-        def count_tokens(text: str) -> int:
-            return len(default_encoding.encode(text, disallowed_special=()))
 
-    return count_tokens
+_default_tokenizer_backend = TiktokenTokenizerBackend(
+    default_encoding, disallowed_special=()
+)
 
 
 def _fix_model_name(model: str) -> str:
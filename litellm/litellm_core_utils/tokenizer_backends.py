@@ -0,0 +1,156 @@
+"""
+Tokenizer backends for token counting, and a memoized token-count cache.
+
+- `BaseTokenizerBackend` - counts the tokens in one text, or a batch of texts in one call. Subclass it to plug a custom tokenizer into `token_counter` / `batch_token_counter` (pass it as `custom_tokenizer`)
+- `tokenizer_id` identifies the tokenizer, so counts can be cached across calls - two backends with the same id must count the same
+- `TokenCountCache` - bounded LRU of token counts, keyed by (tokenizer id, content digest). `token_counter` caches counts per message and per tool-set, so a growing conversation only tokenizes its new turns
+"""
+
+import itertools
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Collection, List, Literal, Optional, Tuple, Union
+
+from litellm.caching.cache_key_hasher import CacheKeyHasher
+from litellm.constants import DEFAULT_MAX_LRU_CACHE_SIZE, TOKEN_COUNT_CACHE_SIZE
+
+TokenCountCacheKey = Tuple[str, str]
+
+# below this many texts, tiktoken's thread pool costs more than it saves
+_MIN_TIKTOKEN_THREADED_BATCH_SIZE = 8
+
+
+class BaseTokenizerBackend:
+    """
+    Usage:
+        class MyTokenizerBackend(BaseTokenizerBackend):
+            tokenizer_id = "my-tokenizer"
+
+            def count_tokens(self, text: str) -> int:
+                ...
+
+        litellm.token_counter(messages=messages, custom_tokenizer=MyTokenizerBackend())
+    """
+
+    tokenizer_id: str
+
+    def count_tokens(self, text: str) -> int:
+        raise NotImplementedError
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        """Override to tokenize `texts` in one call"""
+        return [self.count_tokens(text) for text in texts]
+
+
+class TiktokenTokenizerBackend(BaseTokenizerBackend):
+    def __init__(
+        self,
+        encoding: Any,
+        disallowed_special: Union[Literal["all"], Collection[str]] = "all",
+    ):
+        self.encoding = encoding
+        self.disallowed_special = disallowed_special
+        # special tokens raise unless they're allowed - a different count function
+        self.tokenizer_id = "tiktoken:{}:{}".format(
+            encoding.name, "strict" if disallowed_special == "all" else "lenient"
+        )
+
+    def count_tokens(self, text: str) -> int:
+        return len(
+            self.encoding.encode(text, disallowed_special=self.disallowed_special)
+        )
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        num_threads = min(os.cpu_count() or 1, 8)
+        if num_threads == 1 or len(texts) < _MIN_TIKTOKEN_THREADED_BATCH_SIZE:
+            return super().count_tokens_batch(texts)
+        return [
+            len(tokens)
+            for tokens in self.encoding.encode_batch(
+                texts,
+                num_threads=num_threads,
+                disallowed_special=self.disallowed_special,
+            )
+        ]
+
+
+class HuggingfaceTokenizerBackend(BaseTokenizerBackend):
+    _ids = itertools.count()
+
+    def __init__(self, tokenizer: Any):
+        self.tokenizer = tokenizer
+        # never reused - a new backend for a tokenizer can't hit counts cached for an old one
+        self.tokenizer_id = f"huggingface:{next(self._ids)}"
+
+    def count_tokens(self, text: str) -> int:
+        return len(self.tokenizer.encode(text).ids)
+
+    def count_tokens_batch(self, texts: List[str]) -> List[int]:
+        if not hasattr(self.tokenizer, "encode_batch"):
+            return super().count_tokens_batch(texts)
+        return [len(encoding.ids) for encoding in self.tokenizer.encode_batch(texts)]
+
+
+# id(tokenizer) -> backend. The backend holds a reference to its tokenizer, so the id can't be reused while it's in here
+_huggingface_backends: "OrderedDict[int, HuggingfaceTokenizerBackend]" = OrderedDict()
+_huggingface_backends_lock = threading.Lock()
+
+
+def get_huggingface_tokenizer_backend(tokenizer: Any) -> HuggingfaceTokenizerBackend:
+    """The same backend - and tokenizer id - for every call with the same tokenizer object"""
+    with _huggingface_backends_lock:
+        backend = _huggingface_backends.get(id(tokenizer))
+        if backend is None or backend.tokenizer is not tokenizer:
+            backend = HuggingfaceTokenizerBackend(tokenizer)
+            _huggingface_backends[id(tokenizer)] = backend
+        _huggingface_backends.move_to_end(id(tokenizer))
+        while len(_huggingface_backends) > DEFAULT_MAX_LRU_CACHE_SIZE:
+            _huggingface_backends.popitem(last=False)
+        return backend
+
+
+class TokenCountCache:
+    """
+    Usage:
+        key = TokenCountCache.get_cache_key(tokenizer.tokenizer_id, "message", message)
+        num_tokens = token_count_cache.get(key)
+        if num_tokens is None:
+            num_tokens = ...
+            token_count_cache.set(key, num_tokens)
+    """
+
+    def __init__(self, max_size: int = TOKEN_COUNT_CACHE_SIZE):
+        self.max_size = max_size
+        self._lock = threading.Lock()
+        self._cache: "OrderedDict[TokenCountCacheKey, int]" = OrderedDict()
+
+    @staticmethod
+    def get_cache_key(tokenizer_id: str, kind: str, value: Any) -> TokenCountCacheKey:
+        """`kind` namespaces the digest - e.g. a message and a tool-set never share a key"""
+        hasher = CacheKeyHasher()
+        hasher.update(kind, value)
+        return tokenizer_id, hasher.hexdigest()
+
+    def get(self, key: TokenCountCacheKey) -> Optional[int]:
+        with self._lock:
+            num_tokens = self._cache.get(key)
+            if num_tokens is not None:
+                self._cache.move_to_end(key)
+            return num_tokens
+
+    def set(self, key: TokenCountCacheKey, num_tokens: int) -> None:
+        if self.max_size <= 0:
+            return
+        with self._lock:
+            self._cache[key] = num_tokens
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+
+    def flush_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+
+
+token_count_cache = TokenCountCache()
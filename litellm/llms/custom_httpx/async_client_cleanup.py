@@ -15,6 +15,8 @@ async def close_litellm_async_clients():
     import litellm
     from litellm.llms.custom_httpx.aiohttp_handler import BaseLLMAIOHTTPHandler
 
+    await litellm.http_client_pool.aclose_all()
+
     cache_dict = getattr(litellm.in_memory_llm_clients_cache, "cache_dict", {})
 
     for key, handler in cache_dict.items():
@@ -0,0 +1,328 @@
+"""
+Bounded pool of the httpx clients returned by `get_async_httpx_client` / `_get_httpx_client`.
+
+- Clients are keyed by their normalized config (provider, api base host, timeout, ssl settings, ...), so equivalent configs share a client - and its open connections.
+- Idle clients are evicted after `ttl` seconds without use. Over `max_size`, the least recently used client is evicted first.
+- Evicted clients are not closed under a caller that still holds them - they are closed once the last reference to them is dropped.
+"""
+
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Set, Tuple, Union
+from urllib.parse import urlparse
+
+import httpx
+
+from litellm.constants import (
+    _DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    MAX_HTTP_CLIENT_POOL_SIZE,
+)
+from litellm.types.llms.custom_http import HTTPClientPoolStats
+
+if TYPE_CHECKING:
+    from litellm.llms.custom_httpx.http_handler import AsyncHTTPHandler, HTTPHandler
+
+    PooledHTTPHandler = Union[AsyncHTTPHandler, HTTPHandler]
+else:
+    PooledHTTPHandler = Any
+
+HTTPClientPoolKey = Tuple[Any, ...]
+
+# new (tcp + tls) connections opened by litellm http clients, across all clients
+_connection_stats: Dict[str, int] = {"connections_opened": 0}
+
+_background_tasks: Set[asyncio.Task] = set()
+
+
+def _record_connection_opened(*args: Any, **kwargs: Any) -> None:
+    _connection_stats["connections_opened"] += 1
+
+
+def _sync_connection_trace(event_name: str, info: dict) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        _record_connection_opened()
+
+
+async def _async_connection_trace(event_name: str, info: dict) -> None:
+    if event_name == "connection.connect_tcp.complete":
+        _record_connection_opened()
+
+
+def add_sync_connection_trace(request: httpx.Request) -> None:
+    """httpx request hook - count new connections opened by the httpx transport"""
+    request.extensions.setdefault("trace", _sync_connection_trace)
+
+
+async def add_async_connection_trace(request: httpx.Request) -> None:
+    """httpx request hook - count new connections opened by the httpx transport"""
+    request.extensions.setdefault("trace", _async_connection_trace)
+
+
+async def on_aiohttp_connection_create_end(*args: Any, **kwargs: Any) -> None:
+    """aiohttp TraceConfig hook - count new connections opened by the aiohttp transport"""
+    _record_connection_opened()
+
+
+class _ObjectIdentity:
+    """
+    Hashable key part for a client param compared by identity - e.g. ssl.SSLContext, event hooks.
+
+    Holds a strong reference to the param, so its `id()` can't be reused by another object while the key is in the pool.
+    """
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: Any):
+        self.value = value
+
+    def __hash__(self) -> int:
+        return id(self.value)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ObjectIdentity) and other.value is self.value
+
+
+def _normalize_client_param(key: str, value: Any) -> Any:
+    if key == "timeout" and isinstance(value, (int, float)):
+        value = httpx.Timeout(value)
+    if isinstance(value, httpx.Timeout):
+        return ("timeout", value.connect, value.read, value.write, value.pool)
+    if value is None or isinstance(value, (str, bool, int, float)):
+        return value
+    # not compared by value - e.g. the client cert chain of an ssl.SSLContext can't be read back
+    return _ObjectIdentity(value)
+
+
+def _get_api_base_host(api_base: Optional[str]) -> Optional[str]:
+    if api_base is None:
+        return None
+    parsed_api_base = urlparse(api_base if "://" in api_base else f"//{api_base}")
+    return parsed_api_base.netloc.lower() or None
+
+
+def _get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:  # no running event loop
+        return None
+
+
+def _get_event_loop_id() -> Optional[int]:
+    loop = _get_running_loop()
+    return id(loop) if loop is not None else None
+
+
+def _close_http_client(
+    client: Union[httpx.Client, httpx.AsyncClient],
+    loop: Optional[asyncio.AbstractEventLoop],
+    on_closed: Callable[[], None],
+) -> None:
+    """
+    Called once a client was dropped by the pool, and by every caller holding it.
+
+    Async clients are closed on the event loop they were created on. `on_closed` is called once the client is actually closed.
+    """
+    if not isinstance(client, httpx.AsyncClient):
+        client.close()
+        on_closed()
+        return
+    if client.is_closed:
+        on_closed()
+        return
+    if loop is None or loop.is_closed():
+        return  # the event loop the client was bound to is gone - and its connections with it
+
+    async def _aclose() -> None:
+        await client.aclose()
+        on_closed()
+
+    def _schedule_aclose() -> None:
+        task = loop.create_task(_aclose())
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+    try:
+        # finalizers can run on any thread
+        loop.call_soon_threadsafe(_schedule_aclose)
+    except RuntimeError:  # loop closed in the meantime
+        return
+
+
+class _PooledHTTPClient:
+    __slots__ = ("handler", "last_used_at")
+
+    def __init__(self, handler: PooledHTTPHandler, last_used_at: float):
+        self.handler = handler
+        self.last_used_at = last_used_at
+
+
+class HTTPClientPool:
+    def __init__(
+        self,
+        max_size: int = MAX_HTTP_CLIENT_POOL_SIZE,
+        ttl: float = _DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.clients: "OrderedDict[HTTPClientPoolKey, _PooledHTTPClient]" = (
+            OrderedDict()
+        )
+        # every client created by the pool, until it's closed - including evicted clients still held by a caller
+        self.open_clients: "weakref.WeakSet[PooledHTTPHandler]" = weakref.WeakSet()
+
+        self.client_hits = 0
+        self.client_misses = 0
+        self.evictions = 0
+        self.clients_closed = 0
+
+    @staticmethod
+    def get_pool_key(
+        client_type: str,
+        llm_provider: Optional[str] = None,
+        params: Optional[dict] = None,
+        api_base: Optional[str] = None,
+    ) -> HTTPClientPoolKey:
+        """
+        Normalized, hashable key for a client config.
+
+        Async clients are bound to the event loop they were created on, so the running event loop is part of the key.
+        """
+        import litellm
+
+        normalized_params = tuple(
+            sorted(
+                (key, _normalize_client_param(key, value))
+                for key, value in (params or {}).items()
+            )
+        )
+        return (
+            client_type,
+            getattr(llm_provider, "value", llm_provider),
+            _get_api_base_host(api_base),
+            normalized_params,
+            # global transport settings, read when the client is created
+            litellm.disable_aiohttp_transport,
+            litellm.force_ipv4,
+            litellm.aiohttp_trust_env,
+            litellm.enable_http2,
+            litellm.ssl_verify,
+            litellm.ssl_certificate,
+            _get_event_loop_id() if client_type == "async" else None,
+        )
+
+    def get_client(
+        self,
+        key: HTTPClientPoolKey,
+        create_client: Callable[[], PooledHTTPHandler],
+    ) -> PooledHTTPHandler:
+        now = time.time()
+        pooled_client = self.clients.get(key)
+        if pooled_client is not None:
+            if (
+                now - pooled_client.last_used_at < self.ttl
+                and not pooled_client.handler.client.is_closed
+            ):
+                pooled_client.last_used_at = now
+                self.clients.move_to_end(key)
+                self.client_hits += 1
+                return pooled_client.handler
+            self._evict(key)
+
+        self.client_misses += 1
+        self._evict_idle_clients(now=now)
+
+        handler = create_client()
+        self.clients[key] = _PooledHTTPClient(handler=handler, last_used_at=now)
+        self.open_clients.add(handler)
+        weakref.finalize(
+            handler,
+            _close_http_client,
+            handler.client,
+            _get_running_loop() if key[0] == "async" else None,
+            self._on_client_closed,
+        )
+
+        while len(self.clients) > self.max_size:
+            self._evict(next(iter(self.clients)))
+        return handler
+
+    def _on_client_closed(self) -> None:
+        self.clients_closed += 1
+
+    def _evict(self, key: HTTPClientPoolKey) -> None:
+        """
+        Drop the pool's reference to the client. It's closed once no caller holds it anymore.
+        """
+        if self.clients.pop(key, None) is not None:
+            self.evictions += 1
+
+    def _evict_idle_clients(self, now: float) -> None:
+        """
+        Clients are kept in LRU order, so idle clients are at the front.
+        """
+        while self.clients:
+            key, pooled_client = next(iter(self.clients.items()))
+            if now - pooled_client.last_used_at < self.ttl:
+                break
+            self._evict(key)
+
+    def flush(self) -> None:
+        for key in list(self.clients.keys()):
+            self._evict(key)
+
+    async def aclose_all(self) -> None:
+        """
+        Close every client created by the pool, e.g. on shutdown.
+        """
+        self.flush()
+        for handler in list(self.open_clients):
+            client = handler.client
+            if client.is_closed:
+                continue
+            if isinstance(client, httpx.AsyncClient):
+                await client.aclose()
+            else:
+                client.close()
+
+    def get_open_connections(self) -> int:
+        from aiohttp import ClientSession
+
+        from litellm.llms.custom_httpx.aiohttp_transport import AiohttpTransport
+
+        open_connections = 0
+        for handler in list(self.open_clients):
+            transport = getattr(handler.client, "_transport", None)
+            try:
+                if isinstance(transport, AiohttpTransport):
+                    if isinstance(transport.client, ClientSession):
+                        connector: Any = transport.client.connector
+                        open_connections += len(connector._acquired) + sum(
+                            len(conns) for conns in connector._conns.values()
+                        )
+                elif isinstance(
+                    transport, (httpx.HTTPTransport, httpx.AsyncHTTPTransport)
+                ):
+                    open_connections += len(transport._pool.connections)
+            except Exception:  # private attributes of the transports
+                continue
+        return open_connections
+
+    def get_stats(self) -> HTTPClientPoolStats:
+        total_requests = self.client_hits + self.client_misses
+        return HTTPClientPoolStats(
+            pooled_clients=len(self.clients),
+            open_clients=sum(
+                1 for handler in list(self.open_clients) if not handler.client.is_closed
+            ),
+            open_connections=self.get_open_connections(),
+            connections_opened=_connection_stats["connections_opened"],
+            client_hits=self.client_hits,
+            client_misses=self.client_misses,
+            reuse_ratio=(
+                self.client_hits / total_requests if total_requests > 0 else 0.0
+            ),
+            evictions=self.evictions,
+            clients_closed=self.clients_closed,
+        )
@@ -2,17 +2,36 @@ import asyncio
 import os
 import ssl
 import time
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Mapping, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Union,
+    cast,
+)
 
 import certifi
 import httpx
-from aiohttp import ClientSession, TCPConnector
+from aiohttp import ClientSession, TCPConnector, TraceConfig
 from httpx import USE_CLIENT_DEFAULT, AsyncHTTPTransport, HTTPTransport
 from httpx._types import RequestFiles
 
 import litellm
 from litellm._logging import verbose_logger
-from litellm.constants import _DEFAULT_TTL_FOR_HTTPX_CLIENTS
+from litellm.constants import (
+    _DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    AIOHTTP_CONNECTOR_LIMIT_PER_HOST,
+)
+from litellm.llms.custom_httpx.http_client_pool import (
+    HTTPClientPool,
+    add_async_connection_trace,
+    add_sync_connection_trace,
+    on_aiohttp_connection_create_end,
+)
 from litellm.litellm_core_utils.logging_utils import track_llm_api_timing
 from litellm.types.llms.custom_http import *
 
@@ -202,6 +221,16 @@ class AsyncHTTPHandler:
             ssl_verify=ssl_config if isinstance(ssl_config, bool) else None,
         )
 
+        if transport is None or isinstance(transport, AsyncHTTPTransport):
+            # count new connections opened by the httpx transport
+            event_hooks = {
+                **(event_hooks or {}),
+                "request": [
+                    add_async_connection_trace,
+                    *(event_hooks or {}).get("request", []),
+                ],
+            }
+
         return httpx.AsyncClient(
             transport=transport,
             event_hooks=event_hooks,
@@ -213,6 +242,7 @@ class AsyncHTTPHandler:
             verify=ssl_config,
             cert=cert,
             headers=headers,
+            http2=_should_use_http2(),
         )
 
     async def close(self):
@@ -596,6 +626,7 @@ class AsyncHTTPHandler:
         """
         connector_kwargs: Dict[str, Any] = {
             "local_addr": ("0.0.0.0", 0) if litellm.force_ipv4 else None,
+            "limit_per_host": AIOHTTP_CONNECTOR_LIMIT_PER_HOST,
         }
         
         if ssl_context is not None:
@@ -633,11 +664,16 @@ class AsyncHTTPHandler:
         if str_to_bool(os.getenv("AIOHTTP_TRUST_ENV", "False")) is True:
             trust_env = True
 
+        # count new connections opened by the aiohttp transport
+        trace_config = TraceConfig()
+        trace_config.on_connection_create_end.append(on_aiohttp_connection_create_end)
+
         verbose_logger.debug("Creating AiohttpTransport...")
         return LiteLLMAiohttpTransport(
             client=lambda: ClientSession(
                 connector=TCPConnector(**connector_kwargs),
                 trust_env=trust_env,
+                trace_configs=[trace_config],
             ),
         )
 
@@ -650,7 +686,9 @@ class AsyncHTTPHandler:
         - [Default] If force_ipv4 is False, it will return None
         """
         if litellm.force_ipv4:
-            return AsyncHTTPTransport(local_address="0.0.0.0")
+            return AsyncHTTPTransport(
+                local_address="0.0.0.0", http2=_should_use_http2()
+            )
         else:
             return None
 
@@ -687,6 +725,8 @@ class HTTPHandler:
                 verify=ssl_config,
                 cert=cert,
                 headers=headers,
+                event_hooks={"request": [add_sync_connection_trace]},
+                http2=_should_use_http2(),
             )
         else:
             self.client = client
@@ -911,78 +951,79 @@ class HTTPHandler:
         Some users have seen httpx ConnectionError when using ipv6 - forcing ipv4 resolves the issue for them
         """
         if litellm.force_ipv4:
-            return HTTPTransport(local_address="0.0.0.0")
+            return HTTPTransport(local_address="0.0.0.0", http2=_should_use_http2())
         else:
             return None
 
 
+def _should_use_http2() -> bool:
+    """
+    HTTP/2 is opt-in (litellm.enable_http2) and needs the `h2` package - `pip install httpx[http2]`.
+
+    Only applies to httpx transports, aiohttp does not support HTTP/2.
+    """
+    if litellm.enable_http2 is not True:
+        return False
+    try:
+        import h2  # noqa: F401
+    except ImportError:
+        verbose_logger.debug("litellm.enable_http2 is set, but `h2` is not installed")
+        return False
+    return True
+
+
 def get_async_httpx_client(
     llm_provider: Union[LlmProviders, httpxSpecialProvider],
     params: Optional[dict] = None,
+    api_base: Optional[str] = None,
 ) -> AsyncHTTPHandler:
     """
-    Retrieves the async HTTP client from the cache
+    Retrieves the async HTTP client from the client pool
     If not present, creates a new client
 
-    Caches the new client and returns it.
+    Clients are shared by all callers with the same provider, api_base host and params.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
+    _pool_key = HTTPClientPool.get_pool_key(
+        client_type="async",
+        llm_provider=llm_provider,
+        params=params,
+        api_base=api_base,
+    )
 
-    _cache_key_name = "async_httpx_client" + _params_key_name + llm_provider
-    _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
+    def _create_client() -> AsyncHTTPHandler:
+        if params is not None:
+            return AsyncHTTPHandler(**params)
+        return AsyncHTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
 
-    if params is not None:
-        _new_client = AsyncHTTPHandler(**params)
-    else:
-        _new_client = AsyncHTTPHandler(
-            timeout=httpx.Timeout(timeout=600.0, connect=5.0)
-        )
-
-    litellm.in_memory_llm_clients_cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    return cast(
+        AsyncHTTPHandler,
+        litellm.http_client_pool.get_client(
+            key=_pool_key, create_client=_create_client
+        ),
     )
-    return _new_client
 
 
-def _get_httpx_client(params: Optional[dict] = None) -> HTTPHandler:
+def _get_httpx_client(
+    params: Optional[dict] = None, api_base: Optional[str] = None
+) -> HTTPHandler:
     """
-    Retrieves the HTTP client from the cache
+    Retrieves the HTTP client from the client pool
     If not present, creates a new client
 
-    Caches the new client and returns it.
+    Clients are shared by all callers with the same api_base host and params.
     """
-    _params_key_name = ""
-    if params is not None:
-        for key, value in params.items():
-            try:
-                _params_key_name += f"{key}_{value}"
-            except Exception:
-                pass
-
-    _cache_key_name = "httpx_client" + _params_key_name
-
-    _cached_client = litellm.in_memory_llm_clients_cache.get_cache(_cache_key_name)
-    if _cached_client:
-        return _cached_client
+    _pool_key = HTTPClientPool.get_pool_key(
+        client_type="sync", params=params, api_base=api_base
+    )
 
-    if params is not None:
-        _new_client = HTTPHandler(**params)
-    else:
-        _new_client = HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
+    def _create_client() -> HTTPHandler:
+        if params is not None:
+            return HTTPHandler(**params)
+        return HTTPHandler(timeout=httpx.Timeout(timeout=600.0, connect=5.0))
 
-    litellm.in_memory_llm_clients_cache.set_cache(
-        key=_cache_key_name,
-        value=_new_client,
-        ttl=_DEFAULT_TTL_FOR_HTTPX_CLIENTS,
+    return cast(
+        HTTPHandler,
+        litellm.http_client_pool.get_client(
+            key=_pool_key, create_client=_create_client
+        ),
     )
-    return _new_client
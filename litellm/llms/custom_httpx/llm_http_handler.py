@@ -234,6 +234,7 @@ class BaseLLMHTTPHandler:
             async_httpx_client = get_async_httpx_client(
                 llm_provider=litellm.LlmProviders(custom_llm_provider),
                 params={"ssl_verify": litellm_params.get("ssl_verify", None)},
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
@@ -462,7 +463,8 @@ class BaseLLMHTTPHandler:
 
         if client is None or not isinstance(client, HTTPHandler):
             sync_httpx_client = _get_httpx_client(
-                params={"ssl_verify": litellm_params.get("ssl_verify", None)}
+                params={"ssl_verify": litellm_params.get("ssl_verify", None)},
+                api_base=api_base,
             )
         else:
             sync_httpx_client = client
@@ -514,7 +516,8 @@ class BaseLLMHTTPHandler:
             sync_httpx_client = _get_httpx_client(
                 {
                     "ssl_verify": litellm_params.get("ssl_verify", None),
-                }
+                },
+                api_base=api_base,
             )
         else:
             sync_httpx_client = client
@@ -653,6 +656,7 @@ class BaseLLMHTTPHandler:
             async_httpx_client = get_async_httpx_client(
                 llm_provider=litellm.LlmProviders(custom_llm_provider),
                 params={"ssl_verify": litellm_params.get("ssl_verify", None)},
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
@@ -800,7 +804,7 @@ class BaseLLMHTTPHandler:
             )
 
         if client is None or not isinstance(client, HTTPHandler):
-            sync_httpx_client = _get_httpx_client()
+            sync_httpx_client = _get_httpx_client(api_base=api_base)
         else:
             sync_httpx_client = client
 
@@ -846,7 +850,8 @@ class BaseLLMHTTPHandler:
     ) -> EmbeddingResponse:
         if client is None or not isinstance(client, AsyncHTTPHandler):
             async_httpx_client = get_async_httpx_client(
-                llm_provider=litellm.LlmProviders(custom_llm_provider)
+                llm_provider=litellm.LlmProviders(custom_llm_provider),
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
@@ -932,7 +937,7 @@ class BaseLLMHTTPHandler:
             )
 
         if client is None or not isinstance(client, HTTPHandler):
-            sync_httpx_client = _get_httpx_client()
+            sync_httpx_client = _get_httpx_client(api_base=api_base)
         else:
             sync_httpx_client = client
 
@@ -974,7 +979,8 @@ class BaseLLMHTTPHandler:
     ) -> RerankResponse:
         if client is None or not isinstance(client, AsyncHTTPHandler):
             async_httpx_client = get_async_httpx_client(
-                llm_provider=litellm.LlmProviders(custom_llm_provider)
+                llm_provider=litellm.LlmProviders(custom_llm_provider),
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
@@ -1140,7 +1146,7 @@ class BaseLLMHTTPHandler:
         )
 
         if client is None or not isinstance(client, HTTPHandler):
-            client = _get_httpx_client()
+            client = _get_httpx_client(api_base=api_base)
 
         try:
             # Make the POST request - clean and simple, always use data and files
@@ -1211,6 +1217,7 @@ class BaseLLMHTTPHandler:
             async_httpx_client = get_async_httpx_client(
                 llm_provider=litellm.LlmProviders(custom_llm_provider),
                 params={"ssl_verify": litellm_params.get("ssl_verify", None)},
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
@@ -1258,7 +1265,8 @@ class BaseLLMHTTPHandler:
     ) -> Union[AnthropicMessagesResponse, AsyncIterator]:
         if client is None or not isinstance(client, AsyncHTTPHandler):
             async_httpx_client = get_async_httpx_client(
-                llm_provider=litellm.LlmProviders.ANTHROPIC
+                llm_provider=litellm.LlmProviders.ANTHROPIC,
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
@@ -2204,7 +2212,7 @@ class BaseLLMHTTPHandler:
             )
 
         if client is None or not isinstance(client, HTTPHandler):
-            sync_httpx_client = _get_httpx_client()
+            sync_httpx_client = _get_httpx_client(api_base=api_base)
         else:
             sync_httpx_client = client
 
@@ -2272,7 +2280,8 @@ class BaseLLMHTTPHandler:
         """
         if client is None or not isinstance(client, AsyncHTTPHandler):
             async_httpx_client = get_async_httpx_client(
-                llm_provider=provider_config.custom_llm_provider
+                llm_provider=provider_config.custom_llm_provider,
+                api_base=api_base,
             )
         else:
             async_httpx_client = client
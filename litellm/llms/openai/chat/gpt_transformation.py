@@ -30,6 +30,7 @@ from litellm.litellm_core_utils.prompt_templates.image_handling import (
     async_convert_url_to_base64,
     convert_url_to_base64,
 )
+from litellm.litellm_core_utils.streaming_chunk import StreamingChunk
 from litellm.llms.base_llm.base_model_iterator import BaseModelResponseIterator
 from litellm.llms.base_llm.base_utils import BaseLLMModelInfo
 from litellm.llms.base_llm.chat.transformation import BaseConfig, BaseLLMException
@@ -759,8 +760,12 @@ class OpenAIGPTConfig(BaseLLMModelInfo, BaseConfig):
 
 
 class OpenAIChatCompletionStreamingHandler(BaseModelResponseIterator):
-    def chunk_parser(self, chunk: dict) -> ModelResponseStream:
+    def chunk_parser(self, chunk: dict) -> Union[ModelResponseStream, StreamingChunk]:
         try:
+            # plain text / reasoning deltas - most chunks - skip building the pydantic objects
+            streaming_chunk = StreamingChunk.from_openai_chunk(chunk)
+            if streaming_chunk is not None:
+                return streaming_chunk
             return ModelResponseStream(
                 id=chunk["id"],
                 object="chat.completion.chunk",
@@ -3277,6 +3277,19 @@ class DBSpendUpdateTransactions(TypedDict):
     org_list_transactions: Optional[Dict[str, float]]
 
 
+class SpendLogJournalStats(TypedDict):
+    """
+    Backpressure stats for the on-disk spend log journal
+    """
+
+    pending_rows: int
+    size_bytes: int
+    max_size_bytes: int
+    segments: int
+    dropped_rows: int
+    quarantined_rows: int
+
+
 class SpendUpdateQueueItem(TypedDict, total=False):
     entity_type: Litellm_EntityType
     entity_id: str
@@ -47,6 +47,7 @@ from litellm.proxy._types import (
     SpecialModelNames,
     UserAPIKeyAuth,
 )
+from litellm.proxy.auth.auth_result_cache import auth_result_cache
 from litellm.proxy.auth.route_checks import RouteChecks
 from litellm.proxy.route_llm_request import route_request
 from litellm.proxy.utils import PrismaClient, ProxyLogging, log_db_metrics
@@ -834,6 +835,9 @@ async def _cache_team_object(
     ## CACHE REFRESH TIME!
     team_table.last_refreshed_at = time.time()
 
+    ## team values are merged into cached auth results - drop them
+    auth_result_cache.invalidate_team(team_id=team_id)
+
     await _cache_management_object(
         key=key,
         value=team_table,
@@ -869,6 +873,7 @@ async def _delete_cache_key_object(
     key = hashed_token
 
     user_api_key_cache.delete_cache(key=key)
+    auth_result_cache.invalidate_key(key=key)
 
     ## UPDATE REDIS CACHE ##
     if proxy_logging_obj is not None:
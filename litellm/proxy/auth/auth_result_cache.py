@@ -0,0 +1,194 @@
+"""
+In-memory cache of virtual key auth results.
+
+`_user_api_key_auth_builder` stores the key object it resolved (after the key + team lookups) and the key's user here. Repeat requests with the same key skip the key / team / user lookups. Request-dependent checks (model access, expiry, budgets, `common_checks`) still run on every request.
+
+Entries are dropped when the key, its team or its user is updated or deleted, and expire after `AUTH_RESULT_CACHE_TTL_SECONDS`.
+
+Disabled unless `AUTH_RESULT_CACHE_MAX_SIZE` is set - key objects written straight into `user_api_key_cache` aren't seen until the cached result expires.
+"""
+
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, Optional, Set
+
+import litellm
+from litellm.constants import AUTH_RESULT_CACHE_MAX_SIZE, AUTH_RESULT_CACHE_TTL_SECONDS
+from litellm.proxy._types import (
+    LiteLLM_UserTable,
+    SpecialModelNames,
+    UserAPIKeyAuth,
+    hash_token,
+)
+
+if TYPE_CHECKING:
+    from litellm.router import Router
+else:
+    Router = Any
+
+
+class AuthResult:
+    """
+    Cached auth result for one virtual key.
+
+    `valid_token` and `user_obj` are shared between requests - copy before mutating.
+    """
+
+    __slots__ = ("valid_token", "user_obj", "allowed_models", "expires_at")
+
+    def __init__(
+        self,
+        valid_token: UserAPIKeyAuth,
+        user_obj: Optional[LiteLLM_UserTable],
+        expires_at: float,
+    ):
+        self.valid_token = valid_token
+        self.user_obj = user_obj
+        self.allowed_models = _get_allowed_models(valid_token)
+        """Models the key can call by name. None if the key can call any model."""
+        self.expires_at = expires_at
+
+    def can_call_model(self, model: Any, llm_router: Optional[Router]) -> bool:
+        """
+        Returns True if the key can call `model` without running `can_key_call_model`.
+
+        Returns False if it's not known (e.g. the model is an alias or matches a wildcard) - callers fall back to `can_key_call_model`.
+        """
+        if not isinstance(model, str):
+            return False
+        if model in litellm.model_alias_map or (
+            llm_router is not None and model in llm_router.model_group_alias
+        ):
+            return False
+        if self.allowed_models is None:
+            return True
+        return model in self.allowed_models
+
+
+def _get_allowed_models(valid_token: UserAPIKeyAuth) -> Optional[FrozenSet[str]]:
+    models = valid_token.models
+    if (
+        len(models) == 0
+        or "*" in models
+        or SpecialModelNames.all_proxy_models.value in models
+    ):
+        return None
+    return frozenset(models)
+
+
+class AuthResultCache:
+    """
+    LRU + TTL cache of `AuthResult`, keyed by hashed token. A `max_size` of 0 disables it.
+    """
+
+    def __init__(
+        self,
+        max_size: int = AUTH_RESULT_CACHE_MAX_SIZE,
+        ttl: float = AUTH_RESULT_CACHE_TTL_SECONDS,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._results: "OrderedDict[str, AuthResult]" = OrderedDict()
+        self._tokens_by_team_id: Dict[str, Set[str]] = {}
+        self._tokens_by_user_id: Dict[str, Set[str]] = {}
+
+    def get(self, hashed_token: str) -> Optional[AuthResult]:
+        result = self._results.get(hashed_token)
+        if result is None:
+            return None
+        if result.expires_at < time.time():
+            self._remove(hashed_token)
+            return None
+        self._results.move_to_end(hashed_token)
+        return result
+
+    def set(
+        self,
+        hashed_token: str,
+        valid_token: UserAPIKeyAuth,
+        user_obj: Optional[LiteLLM_UserTable],
+    ) -> None:
+        if self.max_size <= 0:
+            return
+        self._remove(hashed_token)
+        while len(self._results) >= self.max_size:
+            self._remove(next(iter(self._results)))
+
+        self._results[hashed_token] = AuthResult(
+            valid_token=valid_token,
+            user_obj=user_obj,
+            expires_at=time.time() + self.ttl,
+        )
+        if valid_token.team_id is not None:
+            self._tokens_by_team_id.setdefault(valid_token.team_id, set()).add(
+                hashed_token
+            )
+        if valid_token.user_id is not None:
+            self._tokens_by_user_id.setdefault(valid_token.user_id, set()).add(
+                hashed_token
+            )
+
+    def _remove(self, hashed_token: str) -> None:
+        result = self._results.pop(hashed_token, None)
+        if result is None:
+            return
+        for index, _id in (
+            (self._tokens_by_team_id, result.valid_token.team_id),
+            (self._tokens_by_user_id, result.valid_token.user_id),
+        ):
+            if _id is None:
+                continue
+            tokens = index.get(_id)
+            if tokens is not None:
+                tokens.discard(hashed_token)
+                if not tokens:
+                    del index[_id]
+
+    ### INVALIDATION - called when a key / team / user is updated or deleted ###
+    def invalidate_key(self, key: str) -> None:
+        """`key` is a hashed token, or a raw `sk-` key"""
+        if key.startswith("sk-"):
+            key = hash_token(token=key)
+        self._remove(key)
+
+    def invalidate_team(self, team_id: str) -> None:
+        for hashed_token in list(self._tokens_by_team_id.get(team_id, ())):
+            self._remove(hashed_token)
+
+    def invalidate_user(self, user_id: str) -> None:
+        for hashed_token in list(self._tokens_by_user_id.get(user_id, ())):
+            self._remove(hashed_token)
+
+    def clear(self) -> None:
+        self._results.clear()
+        self._tokens_by_team_id.clear()
+        self._tokens_by_user_id.clear()
+
+    ### SPEND - keeps budget checks on cached results current between db syncs ###
+    def increment_key_spend(self, hashed_token: str, response_cost: float) -> None:
+        result = self._results.get(hashed_token)
+        if result is None:
+            return
+        valid_token = result.valid_token
+        update: Dict[str, float] = {"spend": valid_token.spend + response_cost}
+        if valid_token.team_spend is not None:
+            update["team_spend"] = valid_token.team_spend + response_cost
+        if valid_token.team_member_spend is not None:
+            update["team_member_spend"] = valid_token.team_member_spend + response_cost
+        result.valid_token = valid_token.model_copy(update=update)
+
+    def increment_user_spend(self, user_id: str, response_cost: float) -> None:
+        results = [
+            self._results[hashed_token]
+            for hashed_token in self._tokens_by_user_id.get(user_id, ())
+        ]
+        user_obj = next((r.user_obj for r in results if r.user_obj is not None), None)
+        if user_obj is None:
+            return
+        # keys of the same user share one user object
+        user_obj = user_obj.model_copy(update={"spend": user_obj.spend + response_cost})
+        for result in results:
+            result.user_obj = user_obj
+
+
+auth_result_cache = AuthResultCache()
@@ -14,6 +14,11 @@ from litellm.proxy._types import (
 
 from .auth_checks_organization import _user_is_org_admin
 
+try:
+    from litellm_enterprise.proxy.auth.route_checks import EnterpriseRouteChecks
+except ImportError:
+    EnterpriseRouteChecks = None  # type: ignore
+
 
 class RouteChecks:
     @staticmethod
@@ -21,14 +26,13 @@ class RouteChecks:
         """
         Check if management route is disabled and raise exception
         """
-        try:
-            from litellm_enterprise.proxy.auth.route_checks import EnterpriseRouteChecks
-
-            EnterpriseRouteChecks.should_call_route(route=route)
-        except HTTPException as e:
-            raise e
-        except Exception:
-            pass
+        if EnterpriseRouteChecks is not None:
+            try:
+                EnterpriseRouteChecks.should_call_route(route=route)
+            except HTTPException as e:
+                raise e
+            except Exception:
+                pass
 
         # Check if Virtual Key is allowed to call the route - Applies to all Roles
         RouteChecks.is_virtual_key_allowed_to_call_route(
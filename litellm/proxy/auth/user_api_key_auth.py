@@ -38,6 +38,7 @@ from litellm.proxy.auth.auth_checks import (
     is_valid_fallback_model,
 )
 from litellm.proxy.auth.auth_exception_handler import UserAPIKeyAuthExceptionHandler
+from litellm.proxy.auth.auth_result_cache import AuthResult, auth_result_cache
 from litellm.proxy.auth.auth_utils import (
     abbreviate_api_key,
     get_end_user_id_from_request_body,
@@ -652,19 +653,25 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
         # note: never string compare api keys, this is vulenerable to a time attack. Use secrets.compare_digest instead
         ### CHECK IF ADMIN ###
         # note: never string compare api keys, this is vulenerable to a time attack. Use secrets.compare_digest instead
-        ## Check CACHE
-        try:
-            valid_token = await get_key_object(
-                hashed_token=hash_token(api_key),
-                prisma_client=prisma_client,
-                user_api_key_cache=user_api_key_cache,
-                parent_otel_span=parent_otel_span,
-                proxy_logging_obj=proxy_logging_obj,
-                check_cache_only=True,
-            )
-        except Exception:
-            verbose_logger.debug("api key not found in cache.")
-            valid_token = None
+        ## Check AUTH RESULT CACHE - repeat requests skip the key / team / user lookups
+        hashed_api_key = hash_token(api_key)
+        auth_result: Optional[AuthResult] = auth_result_cache.get(hashed_api_key)
+        if auth_result is not None:
+            valid_token = auth_result.valid_token.model_copy()
+        else:
+            ## Check CACHE
+            try:
+                valid_token = await get_key_object(
+                    hashed_token=hashed_api_key,
+                    prisma_client=prisma_client,
+                    user_api_key_cache=user_api_key_cache,
+                    parent_otel_span=parent_otel_span,
+                    proxy_logging_obj=proxy_logging_obj,
+                    check_cache_only=True,
+                )
+            except Exception:
+                verbose_logger.debug("api key not found in cache.")
+                valid_token = None
 
         ## Check UI Hash Key
         if valid_token is None and get_secret_bool("EXPERIMENTAL_UI_LOGIN"):
@@ -686,7 +693,8 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
             return valid_token
 
         if (
-            valid_token is not None
+            auth_result is None
+            and valid_token is not None
             and isinstance(valid_token, UserAPIKeyAuth)
             and valid_token.team_id is not None
         ):
@@ -802,7 +810,7 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
                 )
             abbreviated_api_key = abbreviate_api_key(api_key=api_key)
             if api_key.startswith("sk-"):
-                api_key = hash_token(token=api_key)
+                api_key = hashed_api_key
 
             try:
                 valid_token = await get_key_object(
@@ -874,7 +882,10 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
                     request_data.get("fallbacks", None),
                 )
 
-                if model is not None:
+                if model is not None and not (
+                    auth_result is not None
+                    and auth_result.can_call_model(model=model, llm_router=llm_router)
+                ):
                     await can_key_call_model(
                         model=model,
                         llm_model_list=llm_model_list,
@@ -897,7 +908,9 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
                         )
 
             # Check 2. If user_id for this token is in budget - done in common_checks()
-            if valid_token.user_id is not None:
+            if auth_result is not None:
+                user_obj = auth_result.user_obj
+            elif valid_token.user_id is not None:
                 try:
                     user_obj = await get_user_object(
                         user_id=valid_token.user_id,
@@ -1087,15 +1100,24 @@ async def _user_api_key_auth_builder(  # noqa: PLR0915
                 raise HTTPException(401, detail="Invalid API key, no token associated")
             api_key = valid_token.token
 
-            # Add hashed token to cache
-            asyncio.create_task(
-                _cache_key_object(
-                    hashed_token=api_key,
-                    user_api_key_obj=valid_token,
-                    user_api_key_cache=user_api_key_cache,
-                    proxy_logging_obj=proxy_logging_obj,
+            if auth_result is None:
+                if api_key == hashed_api_key and (
+                    user_obj is not None or valid_token.user_id is None
+                ):
+                    auth_result_cache.set(
+                        hashed_token=hashed_api_key,
+                        valid_token=valid_token.model_copy(),
+                        user_obj=user_obj,
+                    )
+                # Add hashed token to cache
+                asyncio.create_task(
+                    _cache_key_object(
+                        hashed_token=api_key,
+                        user_api_key_obj=valid_token,
+                        user_api_key_cache=user_api_key_cache,
+                        proxy_logging_obj=proxy_logging_obj,
+                    )
                 )
-            )
 
             valid_token_dict = valid_token.model_dump(exclude_none=True)
             valid_token_dict.pop("token", None)
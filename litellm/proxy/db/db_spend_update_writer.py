@@ -10,7 +10,7 @@ import json
 import os
 import time
 import traceback
-from datetime import datetime, timedelta
+from datetime import datetime
 from typing import TYPE_CHECKING, Any, Dict, Literal, Optional, Union, cast, overload
 
 import litellm
@@ -30,12 +30,14 @@ from litellm.proxy._types import (
     SpendLogsPayload,
     SpendUpdateQueueItem,
 )
+from litellm.proxy.db.db_transaction_queue.base_update_queue import BaseUpdateQueue
 from litellm.proxy.db.db_transaction_queue.daily_spend_update_queue import (
     DailySpendUpdateQueue,
 )
 from litellm.proxy.db.db_transaction_queue.pod_lock_manager import PodLockManager
 from litellm.proxy.db.db_transaction_queue.redis_update_buffer import RedisUpdateBuffer
 from litellm.proxy.db.db_transaction_queue.spend_update_queue import SpendUpdateQueue
+from litellm.proxy.db.spend_commit_engine import SpendCommitEngine
 
 if TYPE_CHECKING:
     from litellm.proxy.utils import PrismaClient, ProxyLogging
@@ -63,6 +65,15 @@ class DBSpendUpdateWriter:
         self.daily_spend_update_queue = DailySpendUpdateQueue()
         self.daily_team_spend_update_queue = DailySpendUpdateQueue()
         self.daily_tag_spend_update_queue = DailySpendUpdateQueue()
+        self.spend_commit_engine = SpendCommitEngine()
+        self._moving_queues_to_redis = False
+        for queue in (
+            self.spend_update_queue,
+            self.daily_spend_update_queue,
+            self.daily_team_spend_update_queue,
+            self.daily_tag_spend_update_queue,
+        ):
+            queue.overflow_handler = self._move_in_memory_queues_to_redis
 
     async def update_database(
         # LiteLLM management object fields
@@ -338,6 +349,8 @@ class DBSpendUpdateWriter:
         )
         if prisma_client is not None and spend_logs_url is not None:
             prisma_client.spend_log_transactions.append(payload)
+        elif prisma_client is not None and prisma_client.spend_log_journal is not None:
+            await prisma_client.spend_log_journal.async_append(payload)
         elif prisma_client is not None:
             prisma_client.spend_log_transactions.append(payload)
         else:
@@ -462,6 +475,37 @@ class DBSpendUpdateWriter:
                     cronjob_id=DB_SPEND_UPDATE_JOB_NAME,
                 )
 
+    async def _move_in_memory_queues_to_redis(self, queue: BaseUpdateQueue) -> bool:
+        """
+        Overflow handler for the in-memory queues - called when a queue hits `MAX_SIZE_IN_MEMORY_QUEUE`.
+
+        Moves the queued updates to the redis buffer, if `use_redis_transaction_buffer` is enabled. The pod holding the lock commits them to the db on the next spend update job run.
+        """
+        if (
+            self.redis_cache is None
+            or not RedisUpdateBuffer._should_commit_spend_updates_to_redis()
+        ):
+            return False
+        if self._moving_queues_to_redis:
+            # another update is already moving the queues to redis
+            return True
+        self._moving_queues_to_redis = True
+        try:
+            verbose_proxy_logger.warning(
+                "%s is full (%s items). Moving in-memory spend updates to redis.",
+                queue.__class__.__name__,
+                queue.update_queue.qsize(),
+            )
+            await self.redis_update_buffer.store_in_memory_spend_updates_in_redis(
+                spend_update_queue=self.spend_update_queue,
+                daily_spend_update_queue=self.daily_spend_update_queue,
+                daily_team_spend_update_queue=self.daily_team_spend_update_queue,
+                daily_tag_spend_update_queue=self.daily_tag_spend_update_queue,
+            )
+        finally:
+            self._moving_queues_to_redis = False
+        return True
+
     async def _commit_spend_updates_to_db_without_redis_buffer(
         self,
         prisma_client: PrismaClient,
@@ -530,7 +574,7 @@ class DBSpendUpdateWriter:
             daily_spend_transactions=daily_tag_spend_update_transactions,
         )
 
-    async def _commit_spend_updates_to_db(  # noqa: PLR0915
+    async def _commit_spend_updates_to_db(
         self,
         prisma_client: PrismaClient,
         n_retry_times: int,
@@ -540,240 +584,23 @@ class DBSpendUpdateWriter:
         """
         Commits all the spend `UPDATE` transactions to the Database
 
+        Each table (user, end_user, key, team, team_member, org) is updated in a single statement - see `SpendCommitEngine`
         """
-        from litellm.proxy.utils import (
-            ProxyUpdateSpend,
-            _raise_failed_update_spend_exception,
-        )
-
-        ### UPDATE USER TABLE ###
-        user_list_transactions = db_spend_update_transactions["user_list_transactions"]
-        verbose_proxy_logger.debug(
-            "User Spend transactions: {}".format(user_list_transactions)
-        )
-        if (
-            user_list_transactions is not None
-            and len(user_list_transactions.keys()) > 0
-        ):
-            for i in range(n_retry_times + 1):
-                start_time = time.time()
-                try:
-                    async with prisma_client.db.tx(
-                        timeout=timedelta(seconds=60)
-                    ) as transaction:
-                        async with transaction.batch_() as batcher:
-                            for (
-                                user_id,
-                                response_cost,
-                            ) in user_list_transactions.items():
-                                batcher.litellm_usertable.update_many(
-                                    where={"user_id": user_id},
-                                    data={"spend": {"increment": response_cost}},
-                                )
-                    break
-                except DB_CONNECTION_ERROR_TYPES as e:
-                    if (
-                        i >= n_retry_times
-                    ):  # If we've reached the maximum number of retries
-                        _raise_failed_update_spend_exception(
-                            e=e,
-                            start_time=start_time,
-                            proxy_logging_obj=proxy_logging_obj,
-                        )
-                    # Optionally, sleep for a bit before retrying
-                    await asyncio.sleep(2**i)  # Exponential backoff
-                except Exception as e:
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-
-        ### UPDATE END-USER TABLE ###
-        end_user_list_transactions = db_spend_update_transactions[
-            "end_user_list_transactions"
-        ]
-        verbose_proxy_logger.debug(
-            "End-User Spend transactions: {}".format(end_user_list_transactions)
-        )
-        if (
-            end_user_list_transactions is not None
-            and len(end_user_list_transactions.keys()) > 0
-        ):
-            await ProxyUpdateSpend.update_end_user_spend(
-                n_retry_times=n_retry_times,
-                prisma_client=prisma_client,
-                proxy_logging_obj=proxy_logging_obj,
-                end_user_list_transactions=end_user_list_transactions,
-            )
-        ### UPDATE KEY TABLE ###
-        key_list_transactions = db_spend_update_transactions["key_list_transactions"]
-        verbose_proxy_logger.debug(
-            "KEY Spend transactions: {}".format(key_list_transactions)
-        )
-        if key_list_transactions is not None and len(key_list_transactions.keys()) > 0:
-            for i in range(n_retry_times + 1):
-                start_time = time.time()
-                try:
-                    async with prisma_client.db.tx(
-                        timeout=timedelta(seconds=60)
-                    ) as transaction:
-                        async with transaction.batch_() as batcher:
-                            for (
-                                token,
-                                response_cost,
-                            ) in key_list_transactions.items():
-                                batcher.litellm_verificationtoken.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                    where={"token": token},
-                                    data={"spend": {"increment": response_cost}},
-                                )
-                    break
-                except DB_CONNECTION_ERROR_TYPES as e:
-                    if (
-                        i >= n_retry_times
-                    ):  # If we've reached the maximum number of retries
-                        _raise_failed_update_spend_exception(
-                            e=e,
-                            start_time=start_time,
-                            proxy_logging_obj=proxy_logging_obj,
-                        )
-                    # Optionally, sleep for a bit before retrying
-                    await asyncio.sleep(2**i)  # Exponential backoff
-                except Exception as e:
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-
-        ### UPDATE TEAM TABLE ###
-        team_list_transactions = db_spend_update_transactions["team_list_transactions"]
-        verbose_proxy_logger.debug(
-            "Team Spend transactions: {}".format(team_list_transactions)
-        )
-        if (
-            team_list_transactions is not None
-            and len(team_list_transactions.keys()) > 0
-        ):
-            for i in range(n_retry_times + 1):
-                start_time = time.time()
-                try:
-                    async with prisma_client.db.tx(
-                        timeout=timedelta(seconds=60)
-                    ) as transaction:
-                        async with transaction.batch_() as batcher:
-                            for (
-                                team_id,
-                                response_cost,
-                            ) in team_list_transactions.items():
-                                verbose_proxy_logger.debug(
-                                    "Updating spend for team id={} by {}".format(
-                                        team_id, response_cost
-                                    )
-                                )
-                                batcher.litellm_teamtable.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                    where={"team_id": team_id},
-                                    data={"spend": {"increment": response_cost}},
-                                )
-                    break
-                except DB_CONNECTION_ERROR_TYPES as e:
-                    if (
-                        i >= n_retry_times
-                    ):  # If we've reached the maximum number of retries
-                        _raise_failed_update_spend_exception(
-                            e=e,
-                            start_time=start_time,
-                            proxy_logging_obj=proxy_logging_obj,
-                        )
-                    # Optionally, sleep for a bit before retrying
-                    await asyncio.sleep(2**i)  # Exponential backoff
-                except Exception as e:
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-
-        ### UPDATE TEAM Membership TABLE with spend ###
-        team_member_list_transactions = db_spend_update_transactions[
-            "team_member_list_transactions"
-        ]
-        verbose_proxy_logger.debug(
-            "Team Membership Spend transactions: {}".format(
-                team_member_list_transactions
-            )
+        await self.spend_commit_engine.commit_spend_updates(
+            prisma_client=prisma_client,
+            n_retry_times=n_retry_times,
+            proxy_logging_obj=proxy_logging_obj,
+            db_spend_update_transactions=db_spend_update_transactions,
         )
-        if (
-            team_member_list_transactions is not None
-            and len(team_member_list_transactions.keys()) > 0
-        ):
-            for i in range(n_retry_times + 1):
-                start_time = time.time()
-                try:
-                    async with prisma_client.db.tx(
-                        timeout=timedelta(seconds=60)
-                    ) as transaction:
-                        async with transaction.batch_() as batcher:
-                            for (
-                                key,
-                                response_cost,
-                            ) in team_member_list_transactions.items():
-                                # key is "team_id::<value>::user_id::<value>"
-                                team_id = key.split("::")[1]
-                                user_id = key.split("::")[3]
-
-                                batcher.litellm_teammembership.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                    where={"team_id": team_id, "user_id": user_id},
-                                    data={"spend": {"increment": response_cost}},
-                                )
-                    break
-                except DB_CONNECTION_ERROR_TYPES as e:
-                    if (
-                        i >= n_retry_times
-                    ):  # If we've reached the maximum number of retries
-                        _raise_failed_update_spend_exception(
-                            e=e,
-                            start_time=start_time,
-                            proxy_logging_obj=proxy_logging_obj,
-                        )
-                    # Optionally, sleep for a bit before retrying
-                    await asyncio.sleep(2**i)  # Exponential backoff
-                except Exception as e:
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
 
-        ### UPDATE ORG TABLE ###
-        org_list_transactions = db_spend_update_transactions["org_list_transactions"]
-        verbose_proxy_logger.debug(
-            "Org Spend transactions: {}".format(org_list_transactions)
+    def get_next_spend_update_interval(self, base_interval: float) -> float:
+        """
+        Seconds until the next spend update job run - adapts `base_interval` to the in-memory queue depth and db commit latency
+        """
+        return self.spend_commit_engine.get_next_flush_interval(
+            base_interval=base_interval,
+            queue_depth=self.spend_update_queue.update_queue.qsize(),
         )
-        if org_list_transactions is not None and len(org_list_transactions.keys()) > 0:
-            for i in range(n_retry_times + 1):
-                start_time = time.time()
-                try:
-                    async with prisma_client.db.tx(
-                        timeout=timedelta(seconds=60)
-                    ) as transaction:
-                        async with transaction.batch_() as batcher:
-                            for (
-                                org_id,
-                                response_cost,
-                            ) in org_list_transactions.items():
-                                batcher.litellm_organizationtable.update_many(  # 'update_many' prevents error from being raised if no row exists
-                                    where={"organization_id": org_id},
-                                    data={"spend": {"increment": response_cost}},
-                                )
-                    break
-                except DB_CONNECTION_ERROR_TYPES as e:
-                    if (
-                        i >= n_retry_times
-                    ):  # If we've reached the maximum number of retries
-                        _raise_failed_update_spend_exception(
-                            e=e,
-                            start_time=start_time,
-                            proxy_logging_obj=proxy_logging_obj,
-                        )
-                    # Optionally, sleep for a bit before retrying
-                    await asyncio.sleep(2**i)  # Exponential backoff
-                except Exception as e:
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
 
     # fmt: off
 
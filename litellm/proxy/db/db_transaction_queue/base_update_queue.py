@@ -2,7 +2,9 @@
 Base class for in memory buffer for database transactions
 """
 import asyncio
-from typing import Optional
+import time
+from collections import OrderedDict
+from typing import Awaitable, Callable, Generic, Optional, Tuple, TypeVar
 
 from litellm._logging import verbose_proxy_logger
 from litellm._service_logger import ServiceLogging
@@ -11,14 +13,86 @@ service_logger_obj = (
     ServiceLogging()
 )  # used for tracking metrics for In memory buffer, redis buffer, pod lock manager
 from litellm.constants import MAX_IN_MEMORY_QUEUE_FLUSH_COUNT, MAX_SIZE_IN_MEMORY_QUEUE
+from litellm.types.services import ServiceTypes
+
+T = TypeVar("T")
+
+
+class AggregatingUpdateQueue(Generic[T]):
+    """
+    Drop-in for `asyncio.Queue` that aggregates on insert.
+
+    An item is merged into the queued item with the same key (e.g. entity type + id), so the queue holds one item per key - memory grows with the number of distinct entities, not the number of requests.
+
+    Items are dequeued oldest key first.
+    """
+
+    def __init__(self):
+        # key -> (time the key was first enqueued, aggregated item)
+        self._items: "OrderedDict[str, Tuple[float, T]]" = OrderedDict()
+
+    def get_key(self, item: T) -> str:
+        raise NotImplementedError
+
+    def copy_item(self, item: T) -> T:
+        """Copy of the first item for a key - merged items must not mutate the caller's item"""
+        return item
+
+    def merge_item(self, aggregated_item: T, item: T) -> None:
+        """Merge `item` into `aggregated_item`, in place"""
+        raise NotImplementedError
+
+    async def put(self, item: T) -> None:
+        self.put_nowait(item)
+
+    def put_nowait(self, item: T) -> None:
+        key = self.get_key(item)
+        queued = self._items.get(key)
+        if queued is None:
+            self._items[key] = (time.time(), self.copy_item(item))
+        else:
+            self.merge_item(queued[1], item)
+
+    async def get(self) -> T:
+        return self.get_nowait()
+
+    def get_nowait(self) -> T:
+        if not self._items:
+            raise asyncio.QueueEmpty
+        _, (_, item) = self._items.popitem(last=False)
+        return item
+
+    def qsize(self) -> int:
+        return len(self._items)
+
+    def empty(self) -> bool:
+        return len(self._items) == 0
+
+    def has_key(self, item: T) -> bool:
+        return self.get_key(item) in self._items
+
+    def oldest_item_age(self) -> float:
+        """Seconds since the oldest queued key was first enqueued"""
+        if not self._items:
+            return 0.0
+        return time.time() - next(iter(self._items.values()))[0]
 
 
 class BaseUpdateQueue:
     """Base class for in memory buffer for database transactions"""
 
+    service_type: Optional[ServiceTypes] = None
+
     def __init__(self):
         self.update_queue = asyncio.Queue()
         self.MAX_SIZE_IN_MEMORY_QUEUE = MAX_SIZE_IN_MEMORY_QUEUE
+        self.overflow_handler: Optional[
+            Callable[["BaseUpdateQueue"], Awaitable[bool]]
+        ] = None
+        """
+        Called with this queue once it holds `MAX_SIZE_IN_MEMORY_QUEUE` keys. Moves queued updates elsewhere (e.g. the redis buffer) and returns True, or returns False if it couldn't. Set by `DBSpendUpdateWriter`.
+        """
+        self._warned_queue_full = False
 
     async def add_update(self, update):
         """Enqueue an update."""
@@ -28,8 +102,34 @@ class BaseUpdateQueue:
             queue_size=self.update_queue.qsize()
         )
 
+    async def _add_update_with_hard_cap(self, update):
+        """
+        Enqueue an update into an `AggregatingUpdateQueue`.
+
+        Once the queue holds `MAX_SIZE_IN_MEMORY_QUEUE` distinct keys, it overflows to `overflow_handler` before a new key is added.
+        """
+        verbose_proxy_logger.debug("Adding update to queue: %s", update)
+        if (
+            self.update_queue.qsize() >= self.MAX_SIZE_IN_MEMORY_QUEUE
+            and not self.update_queue.has_key(update)
+        ):
+            await self._handle_queue_full()
+        await self.update_queue.put(update)
+
+    async def _handle_queue_full(self):
+        if self.overflow_handler is not None and await self.overflow_handler(self):
+            return
+        if not self._warned_queue_full:
+            self._warned_queue_full = True
+            verbose_proxy_logger.warning(
+                "%s is full (%s items) and no overflow buffer is available. Enable `use_redis_transaction_buffer` to move queued updates to redis. Queue will grow with the number of distinct entities.",
+                self.__class__.__name__,
+                self.update_queue.qsize(),
+            )
+
     async def flush_all_updates_from_in_memory_queue(self):
         """Get all updates from the queue."""
+        await self._emit_queue_stats()
         updates = []
         while not self.update_queue.empty():
             # Circuit breaker to ensure we're not stuck dequeuing updates. Protect CPU utilization
@@ -41,6 +141,31 @@ class BaseUpdateQueue:
             updates.append(await self.update_queue.get())
         return updates
 
+    async def _emit_queue_stats(self):
+        """Emit the queue size and the age of its oldest item as gauges, e.g. on `prometheus_system`"""
+        if self.service_type is None or not isinstance(
+            self.update_queue, AggregatingUpdateQueue
+        ):
+            return
+        await service_logger_obj.async_service_success_hook(
+            service=self.service_type,
+            duration=0,
+            call_type="_emit_queue_stats",
+            event_metadata={
+                "gauge_labels": self.service_type,
+                "gauge_value": self.update_queue.qsize(),
+            },
+        )
+        await service_logger_obj.async_service_success_hook(
+            service=self.service_type,
+            duration=0,
+            call_type="_emit_queue_stats",
+            event_metadata={
+                "gauge_labels": f"{self.service_type.value}_oldest_item_age_seconds",
+                "gauge_value": self.update_queue.oldest_item_age(),
+            },
+        )
+
     async def _emit_new_item_added_to_queue_event(
         self,
         queue_size: Optional[int] = None,
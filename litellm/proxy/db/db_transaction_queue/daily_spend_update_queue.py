@@ -5,12 +5,67 @@ from typing import Dict, List, Optional
 from litellm._logging import verbose_proxy_logger
 from litellm.proxy._types import BaseDailySpendTransaction
 from litellm.proxy.db.db_transaction_queue.base_update_queue import (
+    AggregatingUpdateQueue,
     BaseUpdateQueue,
     service_logger_obj,
 )
 from litellm.types.services import ServiceTypes
 
 
+def _add_daily_spend_transaction(
+    daily_transaction: BaseDailySpendTransaction, payload: BaseDailySpendTransaction
+) -> None:
+    """Add the metrics of `payload` to `daily_transaction`, in place"""
+    daily_transaction["spend"] += payload["spend"]
+    daily_transaction["prompt_tokens"] += payload["prompt_tokens"]
+    daily_transaction["completion_tokens"] += payload["completion_tokens"]
+    daily_transaction["api_requests"] += payload["api_requests"]
+    daily_transaction["successful_requests"] += payload["successful_requests"]
+    daily_transaction["failed_requests"] += payload["failed_requests"]
+
+    # Add optional metrics cache_read_input_tokens and cache_creation_input_tokens
+    daily_transaction["cache_read_input_tokens"] = (
+        payload.get("cache_read_input_tokens", 0) or 0
+    ) + daily_transaction.get("cache_read_input_tokens", 0)
+
+    daily_transaction["cache_creation_input_tokens"] = (
+        payload.get("cache_creation_input_tokens", 0) or 0
+    ) + daily_transaction.get("cache_creation_input_tokens", 0)
+
+
+class AggregatingDailySpendUpdateQueue(
+    AggregatingUpdateQueue[Dict[str, BaseDailySpendTransaction]]
+):
+    """
+    Holds one `{daily_transaction_key: transaction}` item per daily_transaction_key (entity, date, api key, model, provider) - metrics for the same key are added on insert.
+
+    An update with several daily_transaction_keys is split into one item per key.
+    """
+
+    def get_key(self, item: Dict[str, BaseDailySpendTransaction]) -> str:
+        return next(iter(item))
+
+    def copy_item(
+        self, item: Dict[str, BaseDailySpendTransaction]
+    ) -> Dict[str, BaseDailySpendTransaction]:
+        return deepcopy(item)
+
+    def merge_item(
+        self,
+        aggregated_item: Dict[str, BaseDailySpendTransaction],
+        item: Dict[str, BaseDailySpendTransaction],
+    ) -> None:
+        for _key, payload in item.items():
+            _add_daily_spend_transaction(aggregated_item[_key], payload)
+
+    def put_nowait(self, item: Dict[str, BaseDailySpendTransaction]) -> None:
+        for _key, payload in item.items():
+            super().put_nowait({_key: payload})
+
+    def has_key(self, item: Dict[str, BaseDailySpendTransaction]) -> bool:
+        return all(_key in self._items for _key in item)
+
+
 class DailySpendUpdateQueue(BaseUpdateQueue):
     """
     In memory buffer for daily spend updates that should be committed to the database
@@ -24,7 +79,7 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
             }
         })
 
-    Queue contains a list of daily spend update transactions
+    Updates are aggregated by daily_transaction_key on insert - the queue contains one daily spend update transaction per key
 
     eg
         queue = [
@@ -51,21 +106,17 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
         ]
     """
 
+    service_type = ServiceTypes.IN_MEMORY_DAILY_SPEND_UPDATE_QUEUE
+
     def __init__(self):
         super().__init__()
-        self.update_queue: asyncio.Queue[Dict[str, BaseDailySpendTransaction]] = (
-            asyncio.Queue()
+        self.update_queue: AggregatingDailySpendUpdateQueue = (
+            AggregatingDailySpendUpdateQueue()
         )
 
     async def add_update(self, update: Dict[str, BaseDailySpendTransaction]):
-        """Enqueue an update."""
-        verbose_proxy_logger.debug("Adding update to queue: %s", update)
-        await self.update_queue.put(update)
-        if self.update_queue.qsize() >= self.MAX_SIZE_IN_MEMORY_QUEUE:
-            verbose_proxy_logger.warning(
-                "Spend update queue is full. Aggregating all entries in queue to concatenate entries."
-            )
-            await self.aggregate_queue_updates()
+        """Enqueue an update, aggregating it with any queued transaction for the same daily_transaction_key"""
+        await self._add_update_with_hard_cap(update)
 
     async def aggregate_queue_updates(self):
         """
@@ -107,27 +158,9 @@ class DailySpendUpdateQueue(BaseUpdateQueue):
         for _update in updates:
             for _key, payload in _update.items():
                 if _key in aggregated_daily_spend_update_transactions:
-                    daily_transaction = aggregated_daily_spend_update_transactions[_key]
-                    daily_transaction["spend"] += payload["spend"]
-                    daily_transaction["prompt_tokens"] += payload["prompt_tokens"]
-                    daily_transaction["completion_tokens"] += payload[
-                        "completion_tokens"
-                    ]
-                    daily_transaction["api_requests"] += payload["api_requests"]
-                    daily_transaction["successful_requests"] += payload[
-                        "successful_requests"
-                    ]
-                    daily_transaction["failed_requests"] += payload["failed_requests"]
-
-                    # Add optional metrics cache_read_input_tokens and cache_creation_input_tokens
-                    daily_transaction["cache_read_input_tokens"] = (
-                        payload.get("cache_read_input_tokens", 0) or 0
-                    ) + daily_transaction.get("cache_read_input_tokens", 0)
-
-                    daily_transaction["cache_creation_input_tokens"] = (
-                        payload.get("cache_creation_input_tokens", 0) or 0
-                    ) + daily_transaction.get("cache_creation_input_tokens", 0)
-
+                    _add_daily_spend_transaction(
+                        aggregated_daily_spend_update_transactions[_key], payload
+                    )
                 else:
                     aggregated_daily_spend_update_transactions[_key] = deepcopy(payload)
         return aggregated_daily_spend_update_transactions
@@ -0,0 +1,463 @@
+"""
+On-disk, append-only journal for spend logs waiting to be written to the database.
+
+Used instead of the in-memory `prisma_client.spend_log_transactions` list when `SPEND_LOG_JOURNAL_DIR` is set.
+
+- Spend logs are appended as json lines to segment files (`segment-<seq>.log`). A new segment is started once the current one reaches `SPEND_LOG_JOURNAL_SEGMENT_SIZE_MB`.
+- The journal is bounded to `SPEND_LOG_JOURNAL_MAX_SIZE_MB`. Once full, new spend logs are dropped (and counted) until the db writer catches up.
+- The db writer reads batches from the checkpoint, and moves the checkpoint forward once a batch is committed. Fully committed segments are deleted.
+- On restart, the journal resumes from the last checkpoint - spend logs written before a crash are not lost.
+
+Each process claims its own `worker-<n>` directory under `SPEND_LOG_JOURNAL_DIR` (via a file lock), so multiple workers can share one journal dir. On startup, the pending spend logs of `worker-<n>` dirs no process holds a lock on (e.g. left behind by a worker that didn't come back after a restart) are moved into the new worker's journal.
+
+The file I/O is blocking - async callers use the `async_*` methods, which run it in a thread.
+"""
+
+import asyncio
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import IO, Any, Callable, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import (
+    SPEND_LOG_JOURNAL_FSYNC,
+    SPEND_LOG_JOURNAL_FSYNC_INTERVAL_SECONDS,
+    SPEND_LOG_JOURNAL_MAX_SIZE_MB,
+    SPEND_LOG_JOURNAL_SEGMENT_SIZE_MB,
+)
+from litellm.proxy._types import SpendLogJournalStats
+from litellm.proxy.db.db_transaction_queue.base_update_queue import service_logger_obj
+from litellm.types.services import ServiceTypes
+
+try:
+    import fcntl
+except ImportError:  # windows
+    fcntl = None  # type: ignore
+
+SEGMENT_FILE_PREFIX = "segment-"
+SEGMENT_FILE_SUFFIX = ".log"
+CHECKPOINT_FILE_NAME = "checkpoint"
+QUARANTINE_FILE_NAME = "quarantine.log"
+SPEND_LOG_DATETIME_FIELDS = ("startTime", "endTime", "completionStartTime")
+
+WORKER_DIR_PREFIX = "worker-"
+
+# (segment seq, byte offset in the segment)
+JournalCursor = Tuple[int, int]
+
+T = TypeVar("T")
+
+
+def _json_default(obj: Any) -> Any:
+    if isinstance(obj, datetime):
+        return obj.isoformat()
+    return str(obj)
+
+
+def _spend_log_from_journal_line(line: bytes) -> dict:
+    """
+    Decode a journal line into a row for `litellm_spendlogs.create_many` - dict fields are json-encoded, datetime fields are parsed back into datetimes.
+    """
+    row = json.loads(line)
+    for k, v in row.items():
+        if isinstance(v, dict):
+            row[k] = json.dumps(v)
+        elif k in SPEND_LOG_DATETIME_FIELDS and isinstance(v, str):
+            row[k] = datetime.fromisoformat(v)
+    return row
+
+
+async def _run_in_thread(fn: Callable[..., T], *args: Any) -> T:
+    return await asyncio.get_running_loop().run_in_executor(None, fn, *args)
+
+
+def _segment_path(journal_dir: str, seq: int) -> str:
+    return os.path.join(
+        journal_dir, f"{SEGMENT_FILE_PREFIX}{seq:012d}{SEGMENT_FILE_SUFFIX}"
+    )
+
+
+def _list_segments(journal_dir: str) -> List[int]:
+    """Sorted seqs of the segments in `journal_dir`"""
+    return sorted(
+        int(file_name[len(SEGMENT_FILE_PREFIX) : -len(SEGMENT_FILE_SUFFIX)])
+        for file_name in os.listdir(journal_dir)
+        if file_name.startswith(SEGMENT_FILE_PREFIX)
+        and file_name.endswith(SEGMENT_FILE_SUFFIX)
+    )
+
+
+def _read_checkpoint(journal_dir: str) -> JournalCursor:
+    try:
+        with open(os.path.join(journal_dir, CHECKPOINT_FILE_NAME)) as f:
+            seq, offset = f.read().split()
+            return int(seq), int(offset)
+    except FileNotFoundError:
+        return 0, 0
+
+
+def _read_pending_lines(journal_dir: str) -> Iterator[bytes]:
+    """
+    Every complete journal line in `journal_dir` after its checkpoint
+    """
+    checkpoint = _read_checkpoint(journal_dir)
+    for seq in _list_segments(journal_dir):
+        if seq < checkpoint[0]:
+            continue
+        with open(_segment_path(journal_dir, seq), "rb") as f:
+            if seq == checkpoint[0]:
+                f.seek(checkpoint[1])
+            for line in f:
+                if line.endswith(b"\n"):
+                    yield line
+
+
+class SpendLogJournal:
+    """
+    Append-only spend log journal - see module docstring.
+
+    `append` is called per request. `read_batch` / `commit` / `quarantine` are called by the db writer.
+    """
+
+    def __init__(
+        self,
+        journal_dir: str,
+        max_size_bytes: int = SPEND_LOG_JOURNAL_MAX_SIZE_MB * 1024 * 1024,
+        segment_size_bytes: int = SPEND_LOG_JOURNAL_SEGMENT_SIZE_MB * 1024 * 1024,
+        fsync_policy: str = SPEND_LOG_JOURNAL_FSYNC,
+        fsync_interval_seconds: float = SPEND_LOG_JOURNAL_FSYNC_INTERVAL_SECONDS,
+    ):
+        if fsync_policy not in ("always", "interval", "never"):
+            raise ValueError(
+                f"Invalid spend log journal fsync policy={fsync_policy}. Expected one of 'always', 'interval', 'never'"
+            )
+        self.max_size_bytes = max_size_bytes
+        self.segment_size_bytes = segment_size_bytes
+        self.fsync_policy = fsync_policy
+        self.fsync_interval_seconds = fsync_interval_seconds
+        self.dropped_rows = 0
+        self.quarantined_rows = 0
+        self._lock = threading.Lock()
+        self._last_fsync_time = time.time()
+        self._is_full = False
+
+        self.journal_dir, self._dir_lock_file = self._claim_journal_dir(journal_dir)
+        self.checkpoint: JournalCursor = self._read_checkpoint()
+        self.segment_sizes: Dict[int, int] = self._recover_segments()
+        self.pending_rows = self._count_pending_rows()
+
+        self._write_seq = max(self.segment_sizes) if self.segment_sizes else 0
+        self._write_file = self._open_segment(self._write_seq)
+        self._adopt_orphaned_journal_dirs(journal_dir)
+        if self.pending_rows > 0:
+            verbose_proxy_logger.info(
+                "Recovered %s spend logs from journal %s",
+                self.pending_rows,
+                self.journal_dir,
+            )
+
+    ### SETUP / RECOVERY ###
+
+    @staticmethod
+    def _claim_journal_dir(journal_dir: str) -> Tuple[str, Optional[IO]]:
+        """
+        Claim the first `worker-<n>` dir no other process holds a lock on.
+
+        Returns (worker dir, lock file). The lock is held until the lock file is closed.
+        """
+        if fcntl is None:
+            worker_dir = os.path.join(journal_dir, "worker-0")
+            os.makedirs(worker_dir, exist_ok=True)
+            return worker_dir, None
+        n = 0
+        while True:
+            worker_dir = os.path.join(journal_dir, f"{WORKER_DIR_PREFIX}{n}")
+            os.makedirs(worker_dir, exist_ok=True)
+            lock_file = open(os.path.join(worker_dir, "lock"), "a")
+            try:
+                fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                return worker_dir, lock_file
+            except OSError:
+                lock_file.close()
+                n += 1
+
+    def _adopt_orphaned_journal_dirs(self, journal_dir: str):
+        """
+        Move the pending spend logs of every other `worker-<n>` dir no process holds a lock on into this journal, then delete them from that dir.
+
+        Rows are written here before they're deleted there - a crash in between writes them twice, which `create_many(skip_duplicates=True)` ignores.
+        """
+        if fcntl is None:
+            return
+        for dir_name in sorted(os.listdir(journal_dir)):
+            worker_dir = os.path.join(journal_dir, dir_name)
+            if (
+                not dir_name.startswith(WORKER_DIR_PREFIX)
+                or worker_dir == self.journal_dir
+                or not os.path.isdir(worker_dir)
+            ):
+                continue
+            with open(os.path.join(worker_dir, "lock"), "a") as lock_file:
+                try:
+                    fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    continue  # a live worker's journal
+                self._adopt_journal_dir(worker_dir)
+
+    def _adopt_journal_dir(self, worker_dir: str):
+        adopted_rows = 0
+        for line in _read_pending_lines(worker_dir):
+            if self._append_line(line):
+                adopted_rows += 1
+        with self._lock:
+            self._fsync()
+
+        quarantine_path = os.path.join(worker_dir, QUARANTINE_FILE_NAME)
+        if os.path.exists(quarantine_path):
+            with open(quarantine_path, "rb") as src, open(
+                os.path.join(self.journal_dir, QUARANTINE_FILE_NAME), "ab"
+            ) as dst:
+                dst.write(src.read())
+            os.remove(quarantine_path)
+        for seq in _list_segments(worker_dir):
+            os.remove(_segment_path(worker_dir, seq))
+        checkpoint_path = os.path.join(worker_dir, CHECKPOINT_FILE_NAME)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        if adopted_rows > 0:
+            verbose_proxy_logger.info(
+                "Moved %s spend logs from orphaned journal %s to %s",
+                adopted_rows,
+                worker_dir,
+                self.journal_dir,
+            )
+
+    def _segment_path(self, seq: int) -> str:
+        return _segment_path(self.journal_dir, seq)
+
+    def _read_checkpoint(self) -> JournalCursor:
+        return _read_checkpoint(self.journal_dir)
+
+    def _write_checkpoint(self, cursor: JournalCursor):
+        checkpoint_path = os.path.join(self.journal_dir, CHECKPOINT_FILE_NAME)
+        with open(checkpoint_path + ".tmp", "w") as f:
+            f.write(f"{cursor[0]} {cursor[1]}")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(checkpoint_path + ".tmp", checkpoint_path)
+        self.checkpoint = cursor
+
+    def _recover_segments(self) -> Dict[int, int]:
+        """
+        Returns {seq: size in bytes} for every segment on disk, after deleting already committed segments and truncating any partially written last line.
+        """
+        segment_sizes: Dict[int, int] = {}
+        for seq in _list_segments(self.journal_dir):
+            if seq < self.checkpoint[0]:
+                os.remove(self._segment_path(seq))
+                continue
+            segment_sizes[seq] = self._truncate_partial_line(self._segment_path(seq))
+        return segment_sizes
+
+    @staticmethod
+    def _truncate_partial_line(path: str) -> int:
+        with open(path, "rb+") as f:
+            data = f.read()
+            size = data.rfind(b"\n") + 1
+            if size != len(data):
+                verbose_proxy_logger.warning(
+                    "Truncating partially written spend log in journal segment %s",
+                    path,
+                )
+                f.truncate(size)
+        return size
+
+    def _count_pending_rows(self) -> int:
+        pending_rows = 0
+        for seq in sorted(self.segment_sizes):
+            with open(self._segment_path(seq), "rb") as f:
+                if seq == self.checkpoint[0]:
+                    f.seek(self.checkpoint[1])
+                pending_rows += sum(1 for _ in f)
+        return pending_rows
+
+    def _open_segment(self, seq: int) -> IO[bytes]:
+        self.segment_sizes.setdefault(seq, 0)
+        return open(self._segment_path(seq), "ab")
+
+    ### WRITE ###
+
+    @property
+    def size_bytes(self) -> int:
+        return sum(self.segment_sizes.values())
+
+    def append(self, payload: dict) -> bool:
+        """
+        Append a spend log to the journal.
+
+        Returns False if the journal is full - the spend log is dropped.
+        """
+        line = json.dumps(payload, default=_json_default).encode("utf-8") + b"\n"
+        return self._append_line(line)
+
+    async def async_append(self, payload: dict) -> bool:
+        """
+        `append`, run in a thread - the write (and fsync) don't block the event loop
+        """
+        return await _run_in_thread(self.append, payload)
+
+    def _append_line(self, line: bytes) -> bool:
+        with self._lock:
+            if self.size_bytes + len(line) > self.max_size_bytes:
+                self.dropped_rows += 1
+                if not self._is_full:
+                    self._is_full = True
+                    verbose_proxy_logger.warning(
+                        "Spend log journal %s is full (%s bytes). Dropping spend logs until the db writer catches up.",
+                        self.journal_dir,
+                        self.size_bytes,
+                    )
+                return False
+            self._is_full = False
+
+            if self.segment_sizes[self._write_seq] >= self.segment_size_bytes:
+                self._rotate_segment()
+            self._write_file.write(line)
+            self._write_file.flush()
+            self.segment_sizes[self._write_seq] += len(line)
+            self.pending_rows += 1
+            self._maybe_fsync()
+        return True
+
+    def _rotate_segment(self):
+        self._fsync()
+        self._write_file.close()
+        self._write_seq += 1
+        self._write_file = self._open_segment(self._write_seq)
+
+    def _maybe_fsync(self):
+        if self.fsync_policy == "always":
+            self._fsync()
+        elif (
+            self.fsync_policy == "interval"
+            and time.time() - self._last_fsync_time >= self.fsync_interval_seconds
+        ):
+            self._fsync()
+
+    def _fsync(self):
+        if self.fsync_policy == "never":
+            return
+        os.fsync(self._write_file.fileno())
+        self._last_fsync_time = time.time()
+
+    ### READ ###
+
+    def read_batch(self, max_rows: int) -> Tuple[List[dict], JournalCursor]:
+        """
+        Read up to `max_rows` spend logs from the checkpoint.
+
+        Returns (rows, cursor). Call `commit(cursor)` once the rows are written to the db - until then, the next `read_batch` returns the same rows.
+        """
+        rows: List[dict] = []
+        cursor = self.checkpoint
+        with self._lock:
+            segment_sizes = dict(self.segment_sizes)
+        for seq in sorted(segment_sizes):
+            if seq < cursor[0] or len(rows) >= max_rows:
+                continue
+            offset = cursor[1] if seq == cursor[0] else 0
+            with open(self._segment_path(seq), "rb") as f:
+                f.seek(offset)
+                while len(rows) < max_rows and offset < segment_sizes[seq]:
+                    line = f.readline()
+                    offset += len(line)
+                    try:
+                        rows.append(_spend_log_from_journal_line(line))
+                    except Exception as e:
+                        verbose_proxy_logger.error(
+                            "Skipping unreadable spend log in journal segment %s - %s",
+                            seq,
+                            str(e),
+                        )
+            cursor = (seq, offset)
+        return rows, cursor
+
+    async def async_read_batch(self, max_rows: int) -> Tuple[List[dict], JournalCursor]:
+        return await _run_in_thread(self.read_batch, max_rows)
+
+    def commit(self, cursor: JournalCursor, rows: int):
+        """
+        Move the checkpoint to `cursor` - `rows` spend logs were written to the db. Deletes fully committed segments.
+        """
+        with self._lock:
+            # start the next segment, so the committed one can be deleted
+            if (
+                cursor[0] == self._write_seq
+                and cursor[1] == self.segment_sizes[self._write_seq]
+                and cursor[1] >= self.segment_size_bytes
+            ):
+                self._rotate_segment()
+            if cursor[0] < self._write_seq and cursor[1] == self.segment_sizes.get(
+                cursor[0]
+            ):
+                cursor = (cursor[0] + 1, 0)
+            self._write_checkpoint(cursor)
+            for seq in [seq for seq in self.segment_sizes if seq < cursor[0]]:
+                os.remove(self._segment_path(seq))
+                del self.segment_sizes[seq]
+            self.pending_rows = max(self.pending_rows - rows, 0)
+
+    async def async_commit(self, cursor: JournalCursor, rows: int):
+        await _run_in_thread(self.commit, cursor, rows)
+
+    def quarantine(self, rows: List[dict], cursor: JournalCursor):
+        """
+        Move spend logs the db rejected (non-connection error) to the quarantine file, instead of dropping them. Moves the checkpoint past them.
+        """
+        with open(os.path.join(self.journal_dir, QUARANTINE_FILE_NAME), "a") as f:
+            for row in rows:
+                f.write(json.dumps(row, default=_json_default) + "\n")
+        self.quarantined_rows += len(rows)
+        self.commit(cursor=cursor, rows=len(rows))
+        verbose_proxy_logger.error(
+            "Moved %s spend logs the db rejected to %s",
+            len(rows),
+            os.path.join(self.journal_dir, QUARANTINE_FILE_NAME),
+        )
+
+    async def async_quarantine(self, rows: List[dict], cursor: JournalCursor):
+        await _run_in_thread(self.quarantine, rows, cursor)
+
+    ### STATS ###
+
+    def get_stats(self) -> SpendLogJournalStats:
+        return SpendLogJournalStats(
+            pending_rows=self.pending_rows,
+            size_bytes=self.size_bytes,
+            max_size_bytes=self.max_size_bytes,
+            segments=len(self.segment_sizes),
+            dropped_rows=self.dropped_rows,
+            quarantined_rows=self.quarantined_rows,
+        )
+
+    async def emit_stats(self):
+        """Emit the number of pending spend logs as a gauge - e.g. on `prometheus_system`"""
+        await service_logger_obj.async_service_success_hook(
+            service=ServiceTypes.SPEND_LOG_JOURNAL,
+            duration=0,
+            call_type="emit_stats",
+            event_metadata={
+                "gauge_labels": ServiceTypes.SPEND_LOG_JOURNAL,
+                "gauge_value": self.pending_rows,
+            },
+        )
+
+    def close(self):
+        with self._lock:
+            self._fsync()
+            self._write_file.close()
+            if self._dir_lock_file is not None:
+                self._dir_lock_file.close()
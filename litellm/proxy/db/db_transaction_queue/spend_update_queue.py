@@ -8,20 +8,44 @@ from litellm.proxy._types import (
     SpendUpdateQueueItem,
 )
 from litellm.proxy.db.db_transaction_queue.base_update_queue import (
+    AggregatingUpdateQueue,
     BaseUpdateQueue,
     service_logger_obj,
 )
 from litellm.types.services import ServiceTypes
 
 
+class AggregatingSpendUpdateQueue(AggregatingUpdateQueue[SpendUpdateQueueItem]):
+    """
+    Holds one SpendUpdateQueueItem per entity type + id - the response_cost of updates for the same entity is summed on insert
+    """
+
+    def get_key(self, item: SpendUpdateQueueItem) -> str:
+        return f"{item.get('entity_type')}:{item.get('entity_id')}"
+
+    def copy_item(self, item: SpendUpdateQueueItem) -> SpendUpdateQueueItem:
+        return SpendUpdateQueueItem(**item)  # type: ignore
+
+    def merge_item(
+        self, aggregated_item: SpendUpdateQueueItem, item: SpendUpdateQueueItem
+    ) -> None:
+        aggregated_item["response_cost"] = (
+            aggregated_item.get("response_cost", 0) or 0
+        ) + (item.get("response_cost", 0) or 0)
+
+
 class SpendUpdateQueue(BaseUpdateQueue):
     """
     In memory buffer for spend updates that should be committed to the database
+
+    Updates are aggregated by entity type + id on insert, so the queue holds at most one update per entity.
     """
 
+    service_type = ServiceTypes.IN_MEMORY_SPEND_UPDATE_QUEUE
+
     def __init__(self):
         super().__init__()
-        self.update_queue: asyncio.Queue[SpendUpdateQueueItem] = asyncio.Queue()
+        self.update_queue: AggregatingSpendUpdateQueue = AggregatingSpendUpdateQueue()
 
     async def flush_and_get_aggregated_db_spend_update_transactions(
         self,
@@ -32,16 +56,8 @@ class SpendUpdateQueue(BaseUpdateQueue):
         return self.get_aggregated_db_spend_update_transactions(updates)
 
     async def add_update(self, update: SpendUpdateQueueItem):
-        """Enqueue an update to the spend update queue"""
-        verbose_proxy_logger.debug("Adding update to queue: %s", update)
-        await self.update_queue.put(update)
-
-        # if the queue is full, aggregate the updates
-        if self.update_queue.qsize() >= self.MAX_SIZE_IN_MEMORY_QUEUE:
-            verbose_proxy_logger.warning(
-                "Spend update queue is full. Aggregating all entries in queue to concatenate entries."
-            )
-            await self.aggregate_queue_updates()
+        """Enqueue an update to the spend update queue, aggregating it with any queued update for the same entity"""
+        await self._add_update_with_hard_cap(update)
 
     async def aggregate_queue_updates(self):
         """Concatenate all updates in the queue to reduce the size of in-memory queue"""
@@ -0,0 +1,248 @@
+"""
+Commits aggregated spend increments (key, user, end_user, team, team_member, org) to the database.
+
+Each table is updated with one statement per `SPEND_UPDATE_MAX_ROWS_PER_STATEMENT` rows, instead of one `update_many` per entity:
+
+```sql
+UPDATE "LiteLLM_VerificationToken" AS t
+SET "spend" = t."spend" + v.spend, "updated_at" = now()
+FROM (VALUES ($1::text, $2::double precision), ...) AS v(token, spend)
+WHERE t."token" = v.token
+```
+
+Rows are sorted by id, so concurrent writers lock rows in the same order (avoids deadlocks). Each table's statements run in one transaction - a table the db rejects is skipped, the other tables are still committed.
+"""
+
+import asyncio
+import time
+from array import array
+from datetime import timedelta
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, List, NamedTuple, Optional, Tuple
+
+from litellm._logging import verbose_proxy_logger
+from litellm.constants import (
+    MAX_SIZE_IN_MEMORY_QUEUE,
+    SPEND_UPDATE_MAX_FLUSH_INTERVAL_MULTIPLIER,
+    SPEND_UPDATE_MAX_ROWS_PER_STATEMENT,
+    SPEND_UPDATE_MIN_FLUSH_INTERVAL_SECONDS,
+)
+from litellm.proxy._types import DB_CONNECTION_ERROR_TYPES, DBSpendUpdateTransactions
+from litellm.proxy.db.db_transaction_queue.base_update_queue import service_logger_obj
+from litellm.types.services import ServiceTypes
+
+if TYPE_CHECKING:
+    from litellm.proxy.utils import PrismaClient, ProxyLogging
+else:
+    PrismaClient = Any
+    ProxyLogging = Any
+
+
+class SpendUpdateTable(NamedTuple):
+    table_name: str
+    id_columns: Tuple[str, ...]
+    has_updated_at: bool = True
+    upsert: bool = False  # create missing rows (end users aren't created upfront)
+
+
+# DBSpendUpdateTransactions field -> table it's committed to
+SPEND_UPDATE_TABLES: Dict[str, SpendUpdateTable] = {
+    "user_list_transactions": SpendUpdateTable("LiteLLM_UserTable", ("user_id",)),
+    "end_user_list_transactions": SpendUpdateTable(
+        "LiteLLM_EndUserTable", ("user_id",), has_updated_at=False, upsert=True
+    ),
+    "key_list_transactions": SpendUpdateTable("LiteLLM_VerificationToken", ("token",)),
+    "team_list_transactions": SpendUpdateTable("LiteLLM_TeamTable", ("team_id",)),
+    "team_member_list_transactions": SpendUpdateTable(
+        "LiteLLM_TeamMembership", ("team_id", "user_id"), has_updated_at=False
+    ),
+    "org_list_transactions": SpendUpdateTable(
+        "LiteLLM_OrganizationTable", ("organization_id",)
+    ),
+}
+
+
+class SpendIncrementColumns:
+    """
+    Spend increments for one table, stored column-wise - one list per id column, plus a float64 array of increments.
+
+    Rows are sorted by id.
+    """
+
+    def __init__(self, table: SpendUpdateTable, transactions: Dict[str, float]):
+        self.table = table
+        self.id_columns: List[List[str]] = [[] for _ in table.id_columns]
+        self.spend = array("d")
+        for key in sorted(transactions):
+            for column, value in zip(self.id_columns, self._parse_ids(key)):
+                column.append(value)
+            self.spend.append(transactions[key])
+
+    def _parse_ids(self, key: str) -> Tuple[str, ...]:
+        if len(self.table.id_columns) == 1:
+            return (key,)
+        # team member keys are "team_id::<value>::user_id::<value>"
+        parts = key.split("::")
+        return tuple(parts[i * 2 + 1] for i in range(len(self.table.id_columns)))
+
+    def __len__(self) -> int:
+        return len(self.spend)
+
+    def get_query_args(self, start: int, end: int) -> List[Any]:
+        args: List[Any] = []
+        for i in range(start, end):
+            args.extend(column[i] for column in self.id_columns)
+            args.append(self.spend[i])
+        return args
+
+
+@lru_cache(maxsize=256)
+def get_spend_update_query(table: SpendUpdateTable, num_rows: int) -> str:
+    """
+    Build the `UPDATE ... FROM (VALUES ...)` statement (or `INSERT ... ON CONFLICT` for upsert tables) for `num_rows` rows.
+    """
+    num_columns = len(table.id_columns) + 1
+    values = ", ".join(
+        "("
+        + ", ".join(
+            [f"${row * num_columns + i + 1}::text" for i in range(num_columns - 1)]
+            + [f"${row * num_columns + num_columns}::double precision"]
+        )
+        + ")"
+        for row in range(num_rows)
+    )
+    id_columns = ", ".join(f'"{column}"' for column in table.id_columns)
+    if table.upsert:
+        return (
+            f'INSERT INTO "{table.table_name}" ({id_columns}, "spend") '
+            f"VALUES {values} "
+            f'ON CONFLICT ({id_columns}) DO UPDATE SET "spend" = "{table.table_name}"."spend" + EXCLUDED."spend"'
+        )
+    set_updated_at = ', "updated_at" = now()' if table.has_updated_at else ""
+    join_condition = " AND ".join(
+        f't."{column}" = v."{column}"' for column in table.id_columns
+    )
+    return (
+        f'UPDATE "{table.table_name}" AS t '
+        f'SET "spend" = t."spend" + v."spend"{set_updated_at} '
+        f'FROM (VALUES {values}) AS v({id_columns}, "spend") '
+        f"WHERE {join_condition}"
+    )
+
+
+class SpendCommitEngine:
+    """
+    Commits `DBSpendUpdateTransactions` to the db, and tracks how long each table takes to commit.
+
+    `get_next_flush_interval` shortens the spend update interval while the in-memory queue is filling up, and lengthens it while the db is slow.
+    """
+
+    def __init__(self):
+        self.db_latency_ewma: Optional[float] = None
+        self.table_stats: Dict[str, Dict[str, float]] = {}
+
+    async def commit_spend_updates(
+        self,
+        prisma_client: PrismaClient,
+        n_retry_times: int,
+        proxy_logging_obj: ProxyLogging,
+        db_spend_update_transactions: DBSpendUpdateTransactions,
+    ):
+        for field, table in SPEND_UPDATE_TABLES.items():
+            transactions = db_spend_update_transactions.get(field)  # type: ignore
+            verbose_proxy_logger.debug(
+                "%s spend transactions: %s", table.table_name, transactions
+            )
+            if not transactions:
+                continue
+            await self._commit_table(
+                prisma_client=prisma_client,
+                n_retry_times=n_retry_times,
+                proxy_logging_obj=proxy_logging_obj,
+                columns=SpendIncrementColumns(table=table, transactions=transactions),
+            )
+
+    async def _commit_table(
+        self,
+        prisma_client: PrismaClient,
+        n_retry_times: int,
+        proxy_logging_obj: ProxyLogging,
+        columns: SpendIncrementColumns,
+    ):
+        """
+        Commit one table's increments in a single transaction, retrying it on connection errors.
+
+        If the db rejects the table's statements, the failure is logged and nothing is committed for the table.
+        """
+        from litellm.proxy.utils import (
+            _log_failed_update_spend_exception,
+            _raise_failed_update_spend_exception,
+        )
+
+        start_time = time.time()
+        for i in range(n_retry_times + 1):
+            try:
+                async with prisma_client.db.tx(
+                    timeout=timedelta(seconds=60)
+                ) as transaction:
+                    for start in range(
+                        0, len(columns), SPEND_UPDATE_MAX_ROWS_PER_STATEMENT
+                    ):
+                        end = min(
+                            start + SPEND_UPDATE_MAX_ROWS_PER_STATEMENT, len(columns)
+                        )
+                        await transaction.execute_raw(
+                            get_spend_update_query(columns.table, end - start),
+                            *columns.get_query_args(start, end),
+                        )
+                break
+            except DB_CONNECTION_ERROR_TYPES as e:
+                if i >= n_retry_times:
+                    _raise_failed_update_spend_exception(
+                        e=e,
+                        start_time=start_time,
+                        proxy_logging_obj=proxy_logging_obj,
+                    )
+                await asyncio.sleep(2**i)  # Exponential backoff
+            except Exception as e:
+                _log_failed_update_spend_exception(
+                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+                )
+                return
+        await self._record_commit(
+            table_name=columns.table.table_name,
+            rows=len(columns),
+            duration=time.time() - start_time,
+        )
+
+    async def _record_commit(self, table_name: str, rows: int, duration: float):
+        self.db_latency_ewma = (
+            duration
+            if self.db_latency_ewma is None
+            else 0.8 * self.db_latency_ewma + 0.2 * duration
+        )
+        self.table_stats[table_name] = {"rows": rows, "latency": duration}
+        await service_logger_obj.async_service_success_hook(
+            service=ServiceTypes.SPEND_UPDATE_COMMIT,
+            duration=duration,
+            call_type=table_name,
+            event_metadata={"gauge_labels": table_name, "gauge_value": rows},
+        )
+
+    def get_next_flush_interval(self, base_interval: float, queue_depth: int) -> float:
+        """
+        - queue at least half full -> flush sooner, proportionally to how full it is
+        - db commits taking more than half the base interval -> back off, so fewer (larger) statements hit the db
+        """
+        interval = base_interval
+        if queue_depth >= MAX_SIZE_IN_MEMORY_QUEUE / 2:
+            interval = base_interval * (MAX_SIZE_IN_MEMORY_QUEUE / 2) / queue_depth
+        elif (
+            self.db_latency_ewma is not None
+            and self.db_latency_ewma > base_interval / 2
+        ):
+            interval = 2 * self.db_latency_ewma
+        return min(
+            max(interval, SPEND_UPDATE_MIN_FLUSH_INTERVAL_SECONDS),
+            base_interval * SPEND_UPDATE_MAX_FLUSH_INTERVAL_MULTIPLIER,
+        )
@@ -4,7 +4,9 @@ This is a rate limiter implementation based on a similar one by Envoy proxy.
 This is currently in development and not yet ready for production.
 """
 
+import math
 import os
+from collections import OrderedDict
 from datetime import datetime
 from typing import (
     TYPE_CHECKING,
@@ -22,6 +24,7 @@ from fastapi import HTTPException
 
 from litellm import DualCache
 from litellm._logging import verbose_proxy_logger
+from litellm.constants import MAX_IN_MEMORY_RATE_LIMIT_COUNTERS
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.proxy._types import UserAPIKeyAuth
 
@@ -41,34 +44,66 @@ BATCH_RATE_LIMITER_SCRIPT = """
 local results = {}
 local now = tonumber(ARGV[1])
 local window_size = tonumber(ARGV[2])
+local levels = {}
+local over_limit = false
 
--- Process each window/counter pair
+-- Drain each counter for the time since its descriptor was last checked (GCRA, leaky bucket form)
 for i = 1, #KEYS, 2 do
     local window_key = KEYS[i]
     local counter_key = KEYS[i + 1]
-    local increment_value = 1
-
-    -- Check if window exists and is valid
-    local window_start = redis.call('GET', window_key)
-    if not window_start or (now - tonumber(window_start)) >= window_size then
-        -- Reset window and counter
-        redis.call('SET', window_key, tostring(now))
-        redis.call('SET', counter_key, increment_value)
-        redis.call('EXPIRE', window_key, window_size)
-        redis.call('EXPIRE', counter_key, window_size)
-        table.insert(results, tostring(now)) -- window_start
-        table.insert(results, increment_value) -- counter
-    else
-        local counter = redis.call('INCR', counter_key)
-        table.insert(results, window_start) -- window_start
-        table.insert(results, counter) -- counter
+    local limit = tonumber(ARGV[2 + (i + 1) / 2])
+    local level = tonumber(redis.call('GET', counter_key) or '0')
+    local last_updated = tonumber(redis.call('GET', window_key) or (now - window_size))
+    local elapsed = math.min(now - last_updated, window_size)
+
+    if string.sub(counter_key, -22) ~= ':max_parallel_requests' then
+        level = math.max(0, level - elapsed * limit / window_size)
+    end
+
+    if level + 1 > limit then
+        over_limit = true
+    end
+    levels[(i + 1) / 2] = level
+end
+
+-- Only admit the request if every counter is under its limit
+for i = 1, #KEYS, 2 do
+    local window_key = KEYS[i]
+    local counter_key = KEYS[i + 1]
+    local level = levels[(i + 1) / 2]
+    local cost = 1
+    if string.sub(counter_key, -7) == ':tokens' then
+        cost = 0 -- tokens are added by the success callback
+    end
+    if over_limit then
+        cost = 0
     end
+
+    redis.call('SET', counter_key, level + cost, 'EX', window_size)
+    redis.call('SET', window_key, tostring(now), 'EX', window_size)
+    table.insert(results, tostring(now)) -- last updated
+    table.insert(results, math.ceil(level)) -- counter, before this request
 end
 
 return results
 """
 
 
+class RateLimitCounter:
+    """
+    In-process state of a single rate limit counter.
+
+    `level` drains at `limit / window_size` per second (GCRA, in its leaky bucket form) - so a burst of up to `limit` is allowed, and after that requests are admitted as the level drains, instead of all at once on a window edge.
+    """
+
+    __slots__ = ("level", "updated_at", "expires_at")
+
+    def __init__(self, level: float, updated_at: int, expires_at: int):
+        self.level = level
+        self.updated_at = updated_at
+        self.expires_at = expires_at  # same as the redis key ttl
+
+
 class RateLimitDescriptorRateLimitObject(TypedDict, total=False):
     requests_per_unit: Optional[int]
     tokens_per_unit: Optional[int]
@@ -113,73 +148,109 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
             self.batch_rate_limiter_script = None
 
         self.window_size = int(os.getenv("LITELLM_RATE_LIMIT_WINDOW_SIZE", 60))
+        self.in_memory_counters: "OrderedDict[str, RateLimitCounter]" = OrderedDict()
+        self.max_in_memory_counters = MAX_IN_MEMORY_RATE_LIMIT_COUNTERS
+
+    def _get_in_memory_counter(
+        self, counter_key: str, now_int: int
+    ) -> RateLimitCounter:
+        counter = self.in_memory_counters.get(counter_key)
+        if counter is None:
+            counter = RateLimitCounter(
+                level=0, updated_at=now_int, expires_at=now_int + self.window_size
+            )
+            self.in_memory_counters[counter_key] = counter
+            if len(self.in_memory_counters) > self.max_in_memory_counters:
+                self.in_memory_counters.popitem(last=False)
+        else:
+            self.in_memory_counters.move_to_end(counter_key)
+        return counter
+
+    def _get_counter_limit(
+        self, counter_key: str, key_metadata: Dict[str, Any]
+    ) -> Optional[int]:
+        if counter_key.endswith(":requests"):
+            return key_metadata["requests_limit"]
+        elif counter_key.endswith(":max_parallel_requests"):
+            return key_metadata["max_parallel_requests_limit"]
+        elif counter_key.endswith(":tokens"):
+            return key_metadata["tokens_limit"]
+        return None
+
+    def _get_counter_cost(self, counter_key: str) -> int:
+        """
+        Tokens are only known after the call, and are added by the success callback.
+        """
+        return 0 if counter_key.endswith(":tokens") else 1
 
-    async def in_memory_cache_sliding_window(
+    def in_memory_sliding_window(
         self,
         keys: List[str],
+        key_metadata: Dict[str, Any],
         now_int: int,
         window_size: int,
     ) -> List[Any]:
         """
-        Implement sliding window rate limiting logic using in-memory cache operations.
-        This follows the same logic as the Redis Lua script but uses async cache operations.
+        Drain the in-process counters for each window/counter pair, and return their current level.
+
+        Same algorithm and return format as BATCH_RATE_LIMITER_SCRIPT. Synchronous, so the check and the increment in `should_rate_limit` can't interleave with another request.
         """
         results: List[Any] = []
-
-        # Process each window/counter pair
         for i in range(0, len(keys), 2):
             window_key = keys[i]
             counter_key = keys[i + 1]
-            increment_value = 1
-
-            # Get the window start time
-            window_start = await self.internal_usage_cache.async_get_cache(
-                key=window_key,
-                litellm_parent_otel_span=None,
-                local_only=True,
-            )
-
-            # Check if window exists and is valid
-            if window_start is None or (now_int - int(window_start)) >= window_size:
-                # Reset window and counter
-                await self.internal_usage_cache.async_set_cache(
-                    key=window_key,
-                    value=str(now_int),
-                    ttl=window_size,
-                    litellm_parent_otel_span=None,
-                    local_only=True,
-                )
-                await self.internal_usage_cache.async_set_cache(
-                    key=counter_key,
-                    value=increment_value,
-                    ttl=window_size,
-                    litellm_parent_otel_span=None,
-                    local_only=True,
-                )
-                results.append(str(now_int))  # window_start
-                results.append(increment_value)  # counter
-            else:
-                # Increment the counter
-                current_counter = await self.internal_usage_cache.async_get_cache(
-                    key=counter_key,
-                    litellm_parent_otel_span=None,
-                    local_only=True,
-                )
-                new_counter_value = (
-                    int(current_counter) if current_counter is not None else 0
-                ) + increment_value
-                await self.internal_usage_cache.async_set_cache(
-                    key=counter_key,
-                    value=new_counter_value,
-                    ttl=window_size,
-                    litellm_parent_otel_span=None,
-                    local_only=True,
-                )
-                results.append(window_start)  # window_start
-                results.append(new_counter_value)  # counter
+            counter = self._get_in_memory_counter(counter_key, now_int)
+
+            if now_int >= counter.expires_at:
+                counter.level = 0
+            elif not counter_key.endswith(":max_parallel_requests"):
+                limit = self._get_counter_limit(counter_key, key_metadata[window_key])
+                elapsed = min(now_int - counter.updated_at, window_size)
+                if limit is not None and elapsed > 0:
+                    counter.level = max(
+                        0, counter.level - elapsed * limit / window_size
+                    )
+            counter.updated_at = now_int
+            counter.expires_at = now_int + window_size
 
+            results.append(str(now_int))  # last updated
+            results.append(math.ceil(counter.level))  # counter
         return results
 
+    def _update_in_memory_counters(
+        self,
+        keys: List[str],
+        cache_values: List[Any],
+        now_int: int,
+        is_over_limit: bool,
+    ) -> None:
+        """
+        Set the in-process counters to the level returned by BATCH_RATE_LIMITER_SCRIPT, plus the cost of this request if it was admitted.
+        """
+        for i in range(1, len(keys), 2):
+            counter_key = keys[i]
+            counter = self._get_in_memory_counter(counter_key, now_int)
+            counter.level = float(cache_values[i] or 0)
+            if not is_over_limit:
+                counter.level += self._get_counter_cost(counter_key)
+            counter.updated_at = now_int
+            counter.expires_at = now_int + self.window_size
+
+    def _increment_in_memory_counters(
+        self, increment_list: List["RedisPipelineIncrementOperation"]
+    ) -> None:
+        """
+        Apply the success/failure callback increments to the in-process counters, so the next check sees them without a cache round-trip.
+        """
+        now_int = int(datetime.now().timestamp())
+        for increment_op in increment_list:
+            counter_key = increment_op["key"]
+            counter = self.in_memory_counters.get(counter_key)
+            if counter is None:  # not rate limited on this instance
+                continue
+            counter.level += increment_op["increment_value"]
+            counter.expires_at = now_int + (increment_op["ttl"] or self.window_size)
+
     def create_rate_limit_keys(
         self,
         key: str,
@@ -323,57 +394,48 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
                 "descriptor_key": descriptor_key,
             }
 
-        ## CHECK IN-MEMORY CACHE
-        cache_values = await self.internal_usage_cache.async_batch_get_cache(
+        ## CHECK IN-MEMORY COUNTERS
+        cache_values = self.in_memory_sliding_window(
             keys=keys_to_fetch,
-            parent_otel_span=parent_otel_span,
-            local_only=True,
+            key_metadata=key_metadata,
+            now_int=now_int,
+            window_size=self.window_size,
         )
-
-        if cache_values is not None:
-            rate_limit_response = self.is_cache_list_over_limit(
-                keys_to_fetch, cache_values, key_metadata
-            )
-            if rate_limit_response["overall_code"] == "OVER_LIMIT":
-                return rate_limit_response
+        rate_limit_response = self.is_cache_list_over_limit(
+            keys_to_fetch, cache_values, key_metadata
+        )
+        if rate_limit_response["overall_code"] == "OVER_LIMIT":
+            return rate_limit_response
 
         ## IF under limit, check Redis
         if self.batch_rate_limiter_script is not None:
+            limits = [
+                self._get_counter_limit(
+                    keys_to_fetch[i + 1], key_metadata[keys_to_fetch[i]]
+                )
+                for i in range(0, len(keys_to_fetch), 2)
+            ]
             cache_values = await self.batch_rate_limiter_script(
                 keys=keys_to_fetch,
-                args=[now_int, self.window_size],  # Use integer timestamp
+                args=[now_int, self.window_size, *limits],  # Use integer timestamp
+            )
+            rate_limit_response = self.is_cache_list_over_limit(
+                keys_to_fetch, cache_values, key_metadata
             )
 
-            # update in-memory cache with new values
-            for i in range(0, len(cache_values), 2):
-                window_key = keys_to_fetch[i]
-                counter_key = keys_to_fetch[i + 1]
-                window_value = cache_values[i]
-                counter_value = cache_values[i + 1]
-                await self.internal_usage_cache.async_set_cache(
-                    key=counter_key,
-                    value=counter_value,
-                    ttl=self.window_size,
-                    litellm_parent_otel_span=parent_otel_span,
-                    local_only=True,
-                )
-                await self.internal_usage_cache.async_set_cache(
-                    key=window_key,
-                    value=window_value,
-                    ttl=self.window_size,
-                    litellm_parent_otel_span=parent_otel_span,
-                    local_only=True,
-                )
-        else:
-            cache_values = await self.in_memory_cache_sliding_window(
+            # update in-memory counters with the values from Redis
+            self._update_in_memory_counters(
                 keys=keys_to_fetch,
+                cache_values=cache_values,
                 now_int=now_int,
-                window_size=self.window_size,
+                is_over_limit=rate_limit_response["overall_code"] == "OVER_LIMIT",
             )
+        else:
+            for counter_key in keys_to_fetch[1::2]:
+                self.in_memory_counters[counter_key].level += self._get_counter_cost(
+                    counter_key
+                )
 
-        rate_limit_response = self.is_cache_list_over_limit(
-            keys_to_fetch, cache_values, key_metadata
-        )
         return rate_limit_response
 
     async def async_pre_call_hook(
@@ -712,6 +774,7 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
             # Execute all increments in a single pipeline
             if pipeline_operations:
+                self._increment_in_memory_counters(pipeline_operations)
                 await self.internal_usage_cache.dual_cache.async_increment_cache_pipeline(
                     increment_list=pipeline_operations,
                     litellm_parent_otel_span=litellm_parent_otel_span,
@@ -755,6 +818,7 @@ class _PROXY_MaxParallelRequestsHandler_v3(CustomLogger):
 
             # Execute all increments in a single pipeline
             if pipeline_operations:
+                self._increment_in_memory_counters(pipeline_operations)
                 await self.internal_usage_cache.dual_cache.async_increment_cache_pipeline(
                     increment_list=pipeline_operations,
                     litellm_parent_otel_span=litellm_parent_otel_span,
@@ -34,6 +34,7 @@ from litellm.proxy.auth.auth_checks import (
     get_key_object,
     get_team_object,
 )
+from litellm.proxy.auth.auth_result_cache import auth_result_cache
 from litellm.proxy.auth.auth_utils import abbreviate_api_key
 from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
 from litellm.proxy.common_utils.timezone_utils import get_budget_reset_time
@@ -1901,6 +1902,7 @@ async def delete_verification_tokens(
         # remove hash token from cache
         hashed_token = hash_token(cast(str, key))
         user_api_key_cache.delete_cache(hashed_token)
+        auth_result_cache.invalidate_key(key=key)
 
     return {"deleted_keys": deleted_tokens}, _keys_being_deleted
 
@@ -2771,6 +2773,7 @@ async def block_key(
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
     )
+    auth_result_cache.invalidate_key(key=hashed_token)
 
     return record
 
@@ -2882,6 +2885,7 @@ async def unblock_key(
         user_api_key_cache=user_api_key_cache,
         proxy_logging_obj=proxy_logging_obj,
     )
+    auth_result_cache.invalidate_key(key=hashed_token)
 
     return record
 
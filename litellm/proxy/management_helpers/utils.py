@@ -26,6 +26,7 @@ from litellm.proxy._types import (  # key request types; user request types; tea
     UserAPIKeyAuth,
     VirtualKeyEvent,
 )
+from litellm.proxy.auth.auth_result_cache import auth_result_cache
 from litellm.proxy.common_utils.http_parsing_utils import _read_request_body
 from litellm.proxy.utils import PrismaClient
 
@@ -164,11 +165,14 @@ def _delete_user_id_from_cache(kwargs):
         update_user_request = kwargs.get("data")
         if isinstance(update_user_request, UpdateUserRequest):
             user_api_key_cache.delete_cache(key=update_user_request.user_id)
+            if update_user_request.user_id is not None:
+                auth_result_cache.invalidate_user(user_id=update_user_request.user_id)
 
         # delete user request
         if isinstance(update_user_request, DeleteUserRequest):
             for user_id in update_user_request.user_ids:
                 user_api_key_cache.delete_cache(key=user_id)
+                auth_result_cache.invalidate_user(user_id=user_id)
     pass
 
 
@@ -179,11 +183,13 @@ def _delete_api_key_from_cache(kwargs):
         update_request = kwargs.get("data")
         if isinstance(update_request, UpdateKeyRequest):
             user_api_key_cache.delete_cache(key=update_request.key)
+            auth_result_cache.invalidate_key(key=update_request.key)
 
         # delete key request
         if isinstance(update_request, KeyRequest) and update_request.keys:
             for key in update_request.keys:
                 user_api_key_cache.delete_cache(key=key)
+                auth_result_cache.invalidate_key(key=key)
     pass
 
 
@@ -194,11 +200,13 @@ def _delete_team_id_from_cache(kwargs):
         update_request = kwargs.get("data")
         if isinstance(update_request, UpdateTeamRequest):
             user_api_key_cache.delete_cache(key=update_request.team_id)
+            auth_result_cache.invalidate_team(team_id=update_request.team_id)
 
         # delete team request
         if isinstance(update_request, DeleteTeamRequest):
             for team_id in update_request.team_ids:
                 user_api_key_cache.delete_cache(key=team_id)
+                auth_result_cache.invalidate_team(team_id=team_id)
     pass
 
 
@@ -131,6 +131,7 @@ from litellm.caching.caching import DualCache, RedisCache
 from litellm.caching.redis_cluster_cache import RedisClusterCache
 from litellm.constants import (
     DAYS_IN_A_MONTH,
+    DB_SPEND_UPDATE_JOB_NAME,
     DEFAULT_HEALTH_CHECK_INTERVAL,
     DEFAULT_MODEL_CREATED_AT_TIME,
     LITELLM_PROXY_ADMIN_NAME,
@@ -167,6 +168,7 @@ from litellm.proxy.auth.auth_checks import (
     get_team_object,
     log_db_metrics,
 )
+from litellm.proxy.auth.auth_result_cache import auth_result_cache
 from litellm.proxy.auth.auth_utils import check_response_size_is_safe
 from litellm.proxy.auth.handle_jwt import JWTHandler
 from litellm.proxy.auth.litellm_license import LicenseCheck
@@ -1113,6 +1115,9 @@ async def update_cache(  # noqa: PLR0915
         else:
             hashed_token = token
         verbose_proxy_logger.debug("_update_key_cache: hashed_token=%s", hashed_token)
+        auth_result_cache.increment_key_spend(
+            hashed_token=hashed_token, response_cost=response_cost
+        )
         existing_spend_obj: LiteLLM_VerificationTokenView = await user_api_key_cache.async_get_cache(key=hashed_token)  # type: ignore
         verbose_proxy_logger.debug(
             f"_update_key_cache: existing_spend_obj={existing_spend_obj}"
@@ -1197,6 +1202,10 @@ async def update_cache(  # noqa: PLR0915
                 # Fetch the existing cost for the given user
                 if _id is None:
                     continue
+                if response_cost is not None:
+                    auth_result_cache.increment_user_spend(
+                        user_id=_id, response_cost=response_cost
+                    )
                 existing_spend_obj = await user_api_key_cache.async_get_cache(key=_id)
                 if existing_spend_obj is None:
                     # do nothing if there is no cache value
@@ -3624,11 +3633,24 @@ class ProxyStartupEvent:
             )
 
         ### UPDATE SPEND ###
+        async def _update_spend_job():
+            try:
+                await update_spend(prisma_client, db_writer_client, proxy_logging_obj)
+            finally:
+                # run sooner while spend updates are piling up, later while the db is slow
+                scheduler.reschedule_job(
+                    job_id=DB_SPEND_UPDATE_JOB_NAME,
+                    trigger="interval",
+                    seconds=proxy_logging_obj.db_spend_update_writer.get_next_spend_update_interval(
+                        base_interval=batch_writing_interval
+                    ),
+                )
+
         scheduler.add_job(
-            update_spend,
+            _update_spend_job,
             "interval",
             seconds=batch_writing_interval,
-            args=[prisma_client, db_writer_client, proxy_logging_obj],
+            id=DB_SPEND_UPDATE_JOB_NAME,
         )
 
 
@@ -4,7 +4,6 @@ import hashlib
 import json
 import os
 import smtplib
-import threading
 import time
 import traceback
 from datetime import datetime, timedelta
@@ -22,7 +21,13 @@ from typing import (
     overload,
 )
 
-from litellm.constants import DEFAULT_MODEL_CREATED_AT_TIME, MAX_TEAM_LIST_LIMIT
+from litellm.constants import (
+    DEFAULT_MODEL_CREATED_AT_TIME,
+    MAX_TEAM_LIST_LIMIT,
+    SPEND_LOG_JOURNAL_DIR,
+    SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE,
+    SPEND_LOG_JOURNAL_MAX_ROWS_PER_FLUSH,
+)
 from litellm.proxy._types import (
     DB_CONNECTION_ERROR_TYPES,
     CommonProxyErrors,
@@ -61,6 +66,7 @@ from litellm.integrations.custom_logger import CustomLogger
 from litellm.integrations.SlackAlerting.slack_alerting import SlackAlerting
 from litellm.integrations.SlackAlerting.utils import _add_langfuse_trace_id_to_alert
 from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.logging_dispatcher import logging_dispatcher
 from litellm.litellm_core_utils.safe_json_dumps import safe_dumps
 from litellm.litellm_core_utils.safe_json_loads import safe_json_loads
 from litellm.llms.custom_httpx.httpx_handler import HTTPHandler
@@ -77,6 +83,7 @@ from litellm.proxy.db.create_views import (
     should_create_missing_views,
 )
 from litellm.proxy.db.db_spend_update_writer import DBSpendUpdateWriter
+from litellm.proxy.db.db_transaction_queue.spend_log_journal import SpendLogJournal
 from litellm.proxy.db.log_db_metrics import log_db_metrics
 from litellm.proxy.db.prisma_client import PrismaWrapper
 from litellm.proxy.hooks import PROXY_HOOKS, get_proxy_hook
@@ -426,6 +433,31 @@ class ProxyLogging:
                 callback_list=callback_list
             )
 
+    async def emit_in_memory_cache_stats(self) -> None:
+        """
+        Emit hit / miss / eviction stats of the proxy's in-memory caches as gauges, e.g. on `prometheus_system`
+        """
+        from litellm.proxy.proxy_server import llm_router, user_api_key_cache
+
+        in_memory_caches = {
+            "user_api_key_cache": user_api_key_cache.in_memory_cache,
+            "internal_usage_cache": self.internal_usage_cache.dual_cache.in_memory_cache,
+        }
+        if llm_router is not None:
+            in_memory_caches["llm_router_cache"] = llm_router.cache.in_memory_cache
+        for cache_name, in_memory_cache in in_memory_caches.items():
+            try:
+                await in_memory_cache.async_emit_cache_stats(
+                    service_logger_obj=self.service_logging_obj,
+                    cache_name=cache_name,
+                )
+            except Exception as e:
+                verbose_proxy_logger.debug(
+                    "Failed to emit in-memory cache stats for %s - %s",
+                    cache_name,
+                    str(e),
+                )
+
     async def update_request_status(
         self, litellm_call_id: str, status: Literal["success", "fail"]
     ):
@@ -1372,13 +1404,11 @@ class ProxyLogging:
                 traceback_exception=traceback.format_exc(),
             )
 
-            threading.Thread(
-                target=litellm_logging_obj.failure_handler,
-                args=(
-                    original_exception,
-                    traceback.format_exc(),
-                ),
-            ).start()
+            logging_dispatcher.submit(
+                litellm_logging_obj.failure_handler,
+                original_exception,
+                traceback.format_exc(),
+            )
 
     async def post_call_success_hook(
         self,
@@ -1580,6 +1610,7 @@ def jsonify_object(data: dict) -> dict:
 
 class PrismaClient:
     spend_log_transactions: List = []
+    spend_log_journal: Optional[SpendLogJournal] = None
 
     def __init__(
         self,
@@ -1625,6 +1656,8 @@ class PrismaClient:
                 ),
             )  # Client to connect to Prisma db
         verbose_proxy_logger.debug("Success - Created Prisma Client")
+        if SPEND_LOG_JOURNAL_DIR is not None:
+            self.spend_log_journal = SpendLogJournal(journal_dir=SPEND_LOG_JOURNAL_DIR)
 
     def get_request_status(
         self, payload: Union[dict, SpendLogsPayload]
@@ -3120,51 +3153,6 @@ def _hash_token_if_needed(token: str) -> str:
 
 
 class ProxyUpdateSpend:
-    @staticmethod
-    async def update_end_user_spend(
-        n_retry_times: int,
-        prisma_client: PrismaClient,
-        proxy_logging_obj: ProxyLogging,
-        end_user_list_transactions: Dict[str, float],
-    ):
-        for i in range(n_retry_times + 1):
-            start_time = time.time()
-            try:
-                async with prisma_client.db.tx(
-                    timeout=timedelta(seconds=60)
-                ) as transaction:
-                    async with transaction.batch_() as batcher:
-                        for (
-                            end_user_id,
-                            response_cost,
-                        ) in end_user_list_transactions.items():
-                            if litellm.max_end_user_budget is not None:
-                                pass
-                            batcher.litellm_endusertable.upsert(
-                                where={"user_id": end_user_id},
-                                data={
-                                    "create": {
-                                        "user_id": end_user_id,
-                                        "spend": response_cost,
-                                        "blocked": False,
-                                    },
-                                    "update": {"spend": {"increment": response_cost}},
-                                },
-                            )
-
-                break
-            except DB_CONNECTION_ERROR_TYPES as e:
-                if i >= n_retry_times:  # If we've reached the maximum number of retries
-                    _raise_failed_update_spend_exception(
-                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                    )
-                # Optionally, sleep for a bit before retrying
-                await asyncio.sleep(2**i)  # Exponential backoff
-            except Exception as e:
-                _raise_failed_update_spend_exception(
-                    e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
-                )
-
     @staticmethod
     async def update_spend_logs(
         n_retry_times: int,
@@ -3237,6 +3225,61 @@ class ProxyUpdateSpend:
                 e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
             )
 
+    @staticmethod
+    async def update_spend_logs_from_journal(
+        n_retry_times: int,
+        prisma_client: PrismaClient,
+        spend_log_journal: SpendLogJournal,
+        proxy_logging_obj: ProxyLogging,
+    ):
+        """
+        Write spend logs from the on-disk journal to the db, in multi-row inserts of `SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE` rows.
+
+        - The journal checkpoint only moves forward once a batch is committed - if the db is unreachable, the batch is retried on the next run.
+        - Batches the db rejects (non-connection errors) are moved to the journal's quarantine file, not dropped - the flush goes on with the next batch.
+        """
+        rows_flushed = 0
+        while rows_flushed < SPEND_LOG_JOURNAL_MAX_ROWS_PER_FLUSH:
+            batch, cursor = await spend_log_journal.async_read_batch(
+                max_rows=SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE
+            )
+            if len(batch) == 0:
+                break
+            start_time = time.time()
+            for i in range(n_retry_times + 1):
+                try:
+                    await prisma_client.db.litellm_spendlogs.create_many(
+                        data=batch, skip_duplicates=True  # type: ignore
+                    )
+                    await spend_log_journal.async_commit(
+                        cursor=cursor, rows=len(batch)
+                    )
+                    break
+                except DB_CONNECTION_ERROR_TYPES as e:
+                    if i >= n_retry_times:
+                        # leave the batch in the journal, for the next run
+                        await spend_log_journal.emit_stats()
+                        _raise_failed_update_spend_exception(
+                            e=e,
+                            start_time=start_time,
+                            proxy_logging_obj=proxy_logging_obj,
+                        )
+                    await asyncio.sleep(2**i)
+                except Exception as e:
+                    await spend_log_journal.async_quarantine(rows=batch, cursor=cursor)
+                    await spend_log_journal.emit_stats()
+                    _log_failed_update_spend_exception(
+                        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+                    )
+                    break
+            rows_flushed += len(batch)
+        verbose_proxy_logger.debug(
+            "%s spend logs flushed from journal. Journal stats: %s",
+            rows_flushed,
+            spend_log_journal.get_stats(),
+        )
+        await spend_log_journal.emit_stats()
+
     @staticmethod
     def disable_spend_updates() -> bool:
         """
@@ -3274,6 +3317,15 @@ async def update_spend(  # noqa: PLR0915
     )
 
     ### UPDATE SPEND LOGS ###
+    spend_log_journal = getattr(prisma_client, "spend_log_journal", None)
+    if spend_log_journal is not None:
+        await ProxyUpdateSpend.update_spend_logs_from_journal(
+            n_retry_times=n_retry_times,
+            prisma_client=prisma_client,
+            spend_log_journal=spend_log_journal,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+
     verbose_proxy_logger.debug(
         "Spend Logs transactions: {}".format(len(prisma_client.spend_log_transactions))
     )
@@ -3286,6 +3338,9 @@ async def update_spend(  # noqa: PLR0915
             db_writer_client=db_writer_client,
         )
 
+    ### EMIT IN-MEMORY CACHE STATS ###
+    await proxy_logging_obj.emit_in_memory_cache_stats()
+
 
 def _raise_failed_update_spend_exception(
     e: Exception, start_time: float, proxy_logging_obj: ProxyLogging
@@ -3296,6 +3351,18 @@ def _raise_failed_update_spend_exception(
     - Calls proxy_logging_obj.failure_handler to log the error
     - Ensures error messages says "Non-Blocking"
     """
+    _log_failed_update_spend_exception(
+        e=e, start_time=start_time, proxy_logging_obj=proxy_logging_obj
+    )
+    raise e
+
+
+def _log_failed_update_spend_exception(
+    e: Exception, start_time: float, proxy_logging_obj: ProxyLogging
+):
+    """
+    Log a failed update spend logs exception on proxy_logging_obj.failure_handler, without raising it
+    """
     import traceback
 
     error_msg = (
@@ -3312,7 +3379,6 @@ def _raise_failed_update_spend_exception(
             traceback_str=error_traceback,
         )
     )
-    raise e
 
 
 def _is_projected_spend_over_limit(
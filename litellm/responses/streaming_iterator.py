@@ -8,7 +8,7 @@ import httpx
 from litellm.constants import STREAM_SSE_DONE_STRING
 from litellm.litellm_core_utils.asyncify import run_async_function
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLoggingObj
-from litellm.litellm_core_utils.thread_pool_executor import executor
+from litellm.litellm_core_utils.logging_dispatcher import logging_dispatcher
 from litellm.llms.base_llm.responses.transformation import BaseResponsesAPIConfig
 from litellm.responses.utils import ResponsesAPIRequestUtils
 from litellm.types.llms.openai import (
@@ -170,7 +170,7 @@ class ResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
             )
         )
 
-        executor.submit(
+        logging_dispatcher.submit(
             self.logging_obj.success_handler,
             result=self.completed_response,
             cache_hit=None,
@@ -239,7 +239,7 @@ class SyncResponsesAPIStreamingIterator(BaseResponsesAPIStreamingIterator):
             cache_hit=None,
         )
 
-        executor.submit(
+        logging_dispatcher.submit(
             self.logging_obj.success_handler,
             result=self.completed_response,
             cache_hit=None,
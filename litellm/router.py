@@ -12,9 +12,9 @@ import copy
 import enum
 import hashlib
 import inspect
+import itertools
 import json
 import logging
-import threading
 import time
 import traceback
 import uuid
@@ -58,6 +58,7 @@ from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_k
 from litellm.litellm_core_utils.credential_accessor import CredentialAccessor
 from litellm.litellm_core_utils.dd_tracing import tracer
 from litellm.litellm_core_utils.litellm_logging import Logging as LiteLLMLogging
+from litellm.litellm_core_utils.logging_dispatcher import logging_dispatcher
 from litellm.router_strategy.budget_limiter import RouterBudgetLimiting
 from litellm.router_strategy.least_busy import LeastBusyLoggingHandler
 from litellm.router_strategy.lowest_cost import LowestCostLoggingHandler
@@ -81,6 +82,7 @@ from litellm.router_utils.clientside_credential_handler import (
     is_clientside_credential,
 )
 from litellm.router_utils.cooldown_cache import CooldownCache
+from litellm.router_utils.deployment_list import DeploymentList
 from litellm.router_utils.cooldown_handlers import (
     DEFAULT_COOLDOWN_TIME_SECONDS,
     _async_get_cooldown_deployments,
@@ -283,7 +285,7 @@ class Router:
             cache_kwargs (dict): Additional kwargs to pass to RedisCache. Defaults to {}.
             caching_groups (Optional[List[tuple]]): List of model groups for caching across model groups. Defaults to None.
             client_ttl (int): Time-to-live for cached clients in seconds. Defaults to 3600.
-            polling_interval: (Optional[float]): frequency of polling queue. Only for '.scheduler_acompletion()'. Default is 3ms.
+            polling_interval: (Optional[float]): max time a queued request waits before re-checking the queue, if not woken up by a slot freeing up. Only for '.scheduler_acompletion()'. Default is 1s.
             default_priority: (Optional[int]): the default priority for a request. Only for '.scheduler_acompletion()'. Default is None.
             num_retries (Optional[int]): Number of retries for failed requests. Defaults to 2.
             timeout (Optional[float]): Timeout for requests. Defaults to None.
@@ -411,6 +413,17 @@ class Router:
         )  # {"TEAM_ID": PatternMatchRouter}
         self.auto_routers: Dict[str, "AutoRouter"] = {}
 
+        ## DEPLOYMENT LOOKUP INDEXES ## - kept in sync with self.model_list, see `_add_model_to_list_and_index_map`
+        self.model_id_to_deployment_map: Dict[str, dict] = {}
+        self.model_name_to_deployments: Dict[str, List[dict]] = {}
+        self.litellm_model_to_deployments: Dict[str, List[dict]] = {}
+        self.team_id_to_deployments: Dict[str, List[dict]] = {}
+        # id(deployment) -> position in self.model_list order
+        self._deployment_positions: Dict[int, int] = {}
+        self._deployment_position_counter = itertools.count()
+        self._indexed_model_list: Optional[List] = None
+        self._indexed_model_list_version: int = -1
+
         if model_list is not None:
             model_list = copy.deepcopy(model_list)
             self.set_model_list(model_list)
@@ -971,7 +984,7 @@ class Router:
 
             ### DEPLOYMENT-SPECIFIC PRE-CALL CHECKS ### (e.g. update rpm pre-call. Raise error, if deployment over limit)
             ## only run if model group given, not model id
-            if model not in self.get_model_ids():
+            if not self.has_model_id(model):
                 self.routing_strategy_pre_call_checks(deployment=deployment)
 
             response = litellm.completion(
@@ -1117,10 +1130,8 @@ class Router:
                 async for item in model_response:
                     yield item
             except MidStreamFallbackError as e:
-                from litellm.main import stream_chunk_builder
-
-                complete_response_object = stream_chunk_builder(
-                    chunks=model_response.chunks
+                complete_response_object = (
+                    model_response.build_complete_streaming_response()
                 )
                 complete_response_object_usage = cast(
                     Optional[Usage],
@@ -1816,33 +1827,21 @@ class Router:
         item = FlowItem(
             priority=priority,  # 👈 SET PRIORITY FOR REQUEST
             request_id=_request_id,  # 👈 SET REQUEST ID
-            model_name="gpt-3.5-turbo",  # 👈 SAME as 'Router'
+            model_name=model,  # 👈 SAME as 'Router'
         )
         ### [fin] ###
 
         ## ADDS REQUEST TO QUEUE ##
         await self.scheduler.add_request(request=item)
 
-        ## POLL QUEUE
-        end_time = time.time() + self.timeout
-        curr_time = time.time()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
-            _healthy_deployments, _ = await self._async_get_healthy_deployments(
+        ## WAIT FOR TURN ## - returns 'True' if there's healthy deployments OR if request is at top of queue. Woken up when a slot frees up.
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=lambda: self._async_get_scheduler_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
-            )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.time()
+            ),
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -1885,26 +1884,14 @@ class Router:
         ## ADDS REQUEST TO QUEUE ##
         await self.scheduler.add_request(request=item)
 
-        ## POLL QUEUE
-        end_time = time.time() + self.timeout
-        curr_time = time.time()
-        poll_interval = self.scheduler.polling_interval  # poll every 3ms
-        make_request = False
-
-        while curr_time < end_time:
-            _healthy_deployments, _ = await self._async_get_healthy_deployments(
+        ## WAIT FOR TURN ## - returns 'True' if there's healthy deployments OR if request is at top of queue. Woken up when a slot frees up.
+        make_request = await self.scheduler.wait_for_turn(
+            request=item,
+            get_healthy_deployments=lambda: self._async_get_scheduler_healthy_deployments(
                 model=model, parent_otel_span=parent_otel_span
-            )
-            make_request = await self.scheduler.poll(  ## POLL QUEUE ## - returns 'True' if there's healthy deployments OR if request is at top of queue
-                id=item.request_id,
-                model_name=item.model_name,
-                health_deployments=_healthy_deployments,
-            )
-            if make_request:  ## IF TRUE -> MAKE REQUEST
-                break
-            else:  ## ELSE -> loop till default_timeout
-                await asyncio.sleep(poll_interval)
-                curr_time = time.time()
+            ),
+            timeout=self.timeout,
+        )
 
         if make_request:
             try:
@@ -4326,6 +4313,9 @@ class Router:
                 model_group = kwargs["litellm_params"]["metadata"].get("model_group", None)
                 model_info = kwargs["litellm_params"].get("model_info", {}) or {}
                 id = model_info.get("id", None)
+                if model_group is not None:
+                    # request finished - wake up queued priority requests for this model group
+                    self.scheduler.notify(model_name=model_group)
                 if model_group is None or id is None:
                     return
                 elif isinstance(id, int):
@@ -4546,6 +4536,9 @@ class Router:
         model_group = kwargs["litellm_params"]["metadata"].get("model_group", None)
         model_info = kwargs["litellm_params"].get("model_info", {}) or {}
         id = model_info.get("id", None)
+        if model_group is not None:
+            # request finished - wake up queued priority requests for this model group
+            self.scheduler.notify(model_name=model_group)
         if model_group is None or id is None:
             return
         elif isinstance(id, int):
@@ -4732,6 +4725,14 @@ class Router:
                 healthy_deployments.append(deployment)
         return healthy_deployments, _all_deployments
 
+    async def _async_get_scheduler_healthy_deployments(
+        self, model: str, parent_otel_span: Optional[Span]
+    ) -> List[Dict]:
+        healthy_deployments, _ = await self._async_get_healthy_deployments(
+            model=model, parent_otel_span=parent_otel_span
+        )
+        return healthy_deployments
+
     def routing_strategy_pre_call_checks(self, deployment: dict):
         """
         Mimics 'async_routing_strategy_pre_call_checks'
@@ -4780,10 +4781,11 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        logging_dispatcher.submit(
+                            logging_obj.failure_handler,
+                            e,
+                            traceback.format_exc(),
+                        )  # log response
                     _set_cooldown_deployments(
                         litellm_router_instance=self,
                         exception_status=e.status_code,
@@ -4803,10 +4805,11 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        logging_dispatcher.submit(
+                            logging_obj.failure_handler,
+                            e,
+                            traceback.format_exc(),
+                        )  # log response
                     raise e
 
     async def async_callback_filter_deployments(
@@ -4853,10 +4856,11 @@ class Router:
                             )
                         )
                         ## LOGGING
-                        threading.Thread(
-                            target=logging_obj.failure_handler,
-                            args=(e, traceback.format_exc()),
-                        ).start()  # log response
+                        logging_dispatcher.submit(
+                            logging_obj.failure_handler,
+                            e,
+                            traceback.format_exc(),
+                        )  # log response
                     raise e
         return returned_healthy_deployments
 
@@ -4952,7 +4956,7 @@ class Router:
 
             model = deployment.to_json(exclude_none=True)
 
-            self.model_list.append(model)
+            self._add_model_to_list_and_index_map(model=model)
             return deployment
         except Exception as e:
             if self.ignore_invalid_deployments:
@@ -5060,9 +5064,140 @@ class Router:
             return True
         return False
 
+    ## DEPLOYMENT LOOKUP INDEXES ##
+
+    def _reset_deployment_indexes(self) -> None:
+        """
+        Clear the lookup indexes.
+
+        If `router.model_list` was assigned a plain list (e.g. `router.model_list = [...]`), it's copied into a `DeploymentList` here - on the next lookup.
+        The router uses the copy from then on, so later changes to the assigned list object itself aren't seen - assign the list again instead.
+        """
+        self.model_id_to_deployment_map = {}
+        self.model_name_to_deployments = {}
+        self.litellm_model_to_deployments = {}
+        self.team_id_to_deployments = {}
+        self._deployment_positions = {}
+        self._deployment_position_counter = itertools.count()
+        if not isinstance(self.model_list, DeploymentList):
+            # e.g. `router.model_list = [...]` - copied, to track in-place changes from here on
+            self.model_list = DeploymentList(self.model_list)
+        self._indexed_model_list = self.model_list
+        self._indexed_model_list_version = self.model_list.version
+
+    def _index_deployment(self, model: dict) -> None:
+        """
+        Add a model_list entry to the id / model_name / litellm model / team_id indexes
+        """
+        model_info = model.get("model_info") or {}
+        model_id = model_info.get("id")
+        if model_id is not None:
+            self.model_id_to_deployment_map[model_id] = model
+        self.model_name_to_deployments.setdefault(model.get("model_name"), []).append(
+            model
+        )
+        litellm_model = (model.get("litellm_params") or {}).get("model")
+        self.litellm_model_to_deployments.setdefault(litellm_model, []).append(model)
+        team_id = model_info.get("team_id")
+        if team_id is not None:
+            self.team_id_to_deployments.setdefault(team_id, []).append(model)
+        self._deployment_positions[id(model)] = next(self._deployment_position_counter)
+
+    def _unindex_deployment(self, model: dict) -> None:
+        """
+        Remove a model_list entry from the id / model_name / litellm model / team_id indexes
+        """
+
+        def _remove_from_index(index: Dict[str, List[dict]], key: Any) -> None:
+            deployments = index.get(key)
+            if deployments is None:
+                return
+            for idx, m in enumerate(deployments):
+                if m is model:
+                    deployments.pop(idx)
+                    break
+            if len(deployments) == 0:
+                index.pop(key, None)
+
+        model_info = model.get("model_info") or {}
+        model_id = model_info.get("id")
+        if (
+            model_id is not None
+            and self.model_id_to_deployment_map.get(model_id) is model
+        ):
+            self.model_id_to_deployment_map.pop(model_id, None)
+        _remove_from_index(self.model_name_to_deployments, model.get("model_name"))
+        _remove_from_index(
+            self.litellm_model_to_deployments,
+            (model.get("litellm_params") or {}).get("model"),
+        )
+        team_id = model_info.get("team_id")
+        if team_id is not None:
+            _remove_from_index(self.team_id_to_deployments, team_id)
+        self._deployment_positions.pop(id(model), None)
+
+    def _rebuild_deployment_indexes(self) -> None:
+        self._reset_deployment_indexes()
+        for model in self.model_list:
+            self._index_deployment(model=model)
+
+    def invalidate_deployment_indexes(self) -> None:
+        """
+        Rebuild the deployment lookup indexes on the next lookup.
+
+        Call this after editing a deployment in `router.model_list` in place - e.g. its `model_name`, `litellm_params["model"]`, `model_info["id"]` or `model_info["team_id"]`.
+        Adding / replacing / removing deployments (via the router helpers, or on `router.model_list` itself) is picked up without it.
+        """
+        self._indexed_model_list = None
+
+    def _ensure_deployment_indexes(self) -> None:
+        """
+        Rebuild the indexes if self.model_list was replaced / mutated outside of the router's add / upsert / delete helpers
+
+        Edits to a deployment dict itself aren't detected - see `invalidate_deployment_indexes`.
+        """
+        if self._indexed_model_list is not self.model_list or (
+            self._indexed_model_list_version
+            != getattr(self.model_list, "version", None)
+        ):
+            self._rebuild_deployment_indexes()
+
+    def _add_model_to_list_and_index_map(self, model: dict) -> None:
+        """
+        Append a deployment to self.model_list and keep the lookup indexes in sync
+        """
+        self._ensure_deployment_indexes()
+        self.model_list.append(model)
+        self._index_deployment(model=model)
+        self._indexed_model_list_version = self.model_list.version
+
+    def _remove_model_from_list_and_index_map(self, model_id: str) -> Optional[dict]:
+        """
+        Remove the deployment with `model_id` from self.model_list and the lookup indexes
+        """
+        self._ensure_deployment_indexes()
+        model = self.model_id_to_deployment_map.get(model_id)
+        if model is None:
+            return None
+        for idx, m in enumerate(self.model_list):
+            if m is model:
+                self.model_list.pop(idx)
+                break
+        self._unindex_deployment(model=model)
+        self._indexed_model_list_version = self.model_list.version
+        return model
+
+    def has_model_id(self, model_id: str) -> bool:
+        """
+        O(1) check if a deployment with this model id exists on the router
+        """
+        self._ensure_deployment_indexes()
+        return model_id in self.model_id_to_deployment_map
+
     def set_model_list(self, model_list: list):
         original_model_list = copy.deepcopy(model_list)
-        self.model_list = []
+        self.model_list = DeploymentList()
+        self._reset_deployment_indexes()
         # we add api_base/api_key each model so load balancing between azure/gpt on api_base1 and api_base2 works
 
         for model in original_model_list:
@@ -5275,7 +5410,9 @@ class Router:
         """
         # check if deployment already exists
 
-        if deployment.model_info.id in self.get_model_ids():
+        if deployment.model_info.id is not None and self.has_model_id(
+            deployment.model_info.id
+        ):
             return None
 
         # add to model list
@@ -5284,7 +5421,7 @@ class Router:
         self._add_deployment(deployment=deployment)
 
         # add to model names
-        self.model_list.append(_deployment)
+        self._add_model_to_list_and_index_map(model=_deployment)
         self.model_names.append(deployment.model_name)
         return deployment
 
@@ -5312,13 +5449,9 @@ class Router:
 
                 # if there is a new litellm param -> then update the deployment
                 # remove the previous deployment
-                removal_idx: Optional[int] = None
-                for idx, model in enumerate(self.model_list):
-                    if model["model_info"]["id"] == deployment.model_info.id:
-                        removal_idx = idx
-
-                if removal_idx is not None:
-                    self.model_list.pop(removal_idx)
+                self._remove_model_from_list_and_index_map(
+                    model_id=_deployment_model_id
+                )
 
             # if the model_id is not in router
             self.add_deployment(deployment=deployment)
@@ -5341,17 +5474,8 @@ class Router:
         - The deleted deployment
         - OR None (if deleted deployment not found)
         """
-        deployment_idx = None
-        for idx, m in enumerate(self.model_list):
-            if m["model_info"]["id"] == id:
-                deployment_idx = idx
-
         try:
-            if deployment_idx is not None:
-                item = self.model_list.pop(deployment_idx)
-                return item
-            else:
-                return None
+            return self._remove_model_from_list_and_index_map(model_id=id)
         except Exception:
             return None
 
@@ -5361,16 +5485,16 @@ class Router:
 
         Raise Exception -> if model found in invalid format
         """
-        for model in self.model_list:
-            if "model_info" in model and "id" in model["model_info"]:
-                if model_id == model["model_info"]["id"]:
-                    if isinstance(model, dict):
-                        return Deployment(**model)
-                    elif isinstance(model, Deployment):
-                        return model
-                    else:
-                        raise Exception("Model invalid format - {}".format(type(model)))
-        return None
+        self._ensure_deployment_indexes()
+        model = self.model_id_to_deployment_map.get(model_id)
+        if model is None:
+            return None
+        if isinstance(model, dict):
+            return Deployment(**model)
+        elif isinstance(model, Deployment):
+            return model
+        else:
+            raise Exception("Model invalid format - {}".format(type(model)))
 
     def get_deployment_credentials(self, model_id: str) -> Optional[dict]:
         """
@@ -5391,14 +5515,14 @@ class Router:
 
         Raise Exception -> if model found in invalid format
         """
-        for model in self.model_list:
-            if model["model_name"] == model_group_name:
-                if isinstance(model, dict):
-                    return Deployment(**model)
-                elif isinstance(model, Deployment):
-                    return model
-                else:
-                    raise Exception("Model Name invalid - {}".format(type(model)))
+        self._ensure_deployment_indexes()
+        for model in self.model_name_to_deployments.get(model_group_name, []):
+            if isinstance(model, dict):
+                return Deployment(**model)
+            elif isinstance(model, Deployment):
+                return model
+            else:
+                raise Exception("Model Name invalid - {}".format(type(model)))
         return None
 
     @overload
@@ -5990,8 +6114,13 @@ class Router:
 
         Returns list of model id's.
         """
+        self._ensure_deployment_indexes()
+        if model_name is not None:
+            models: List = self.model_name_to_deployments.get(model_name, [])
+        else:
+            models = self.model_list
         ids = []
-        for model in self.model_list:
+        for model in models:
             if "model_info" in model and "id" in model["model_info"]:
                 id = model["model_info"]["id"]
                 if exclude_team_models and model["model_info"].get("team_id"):
@@ -6049,8 +6178,20 @@ class Router:
 
         if team_id specified, only return team-specific models
         """
+        self._ensure_deployment_indexes()
+        candidate_models: List[dict] = self.model_name_to_deployments.get(
+            model_name, []
+        )
+        if team_id is not None and team_id in self.team_id_to_deployments:
+            # team public model names can differ from the model_name - preserve model_list order
+            candidates = {id(m): m for m in candidate_models}
+            candidates.update((id(m), m) for m in self.team_id_to_deployments[team_id])
+            candidate_models = sorted(
+                candidates.values(), key=lambda m: self._deployment_positions[id(m)]
+            )
+
         returned_models: List[DeploymentTypedDict] = []
-        for model in self.model_list:
+        for model in candidate_models:
             if self.should_include_deployment(
                 model_name=model_name, model=model, team_id=team_id
             ):
@@ -6607,7 +6748,8 @@ class Router:
         """
         Get the deployment by litellm model.
         """
-        return [m for m in self.model_list if m["litellm_params"]["model"] == model]
+        self._ensure_deployment_indexes()
+        return list(self.litellm_model_to_deployments.get(model, []))
 
     def _common_checks_available_deployment(
         self,
@@ -6638,7 +6780,7 @@ class Router:
         # check if aliases set on litellm model alias map
         if specific_deployment is True:
             return model, self._get_deployment_by_litellm_model(model=model)
-        elif model in self.get_model_ids():
+        elif self.has_model_id(model):
             deployment = self.get_deployment(model_id=model)
             if deployment is not None:
                 deployment_model = deployment.litellm_params.model
@@ -6946,10 +7088,11 @@ class Router:
 
                 if logging_obj is not None:
                     ## LOGGING
-                    threading.Thread(
-                        target=logging_obj.failure_handler,
-                        args=(e, traceback_exception),
-                    ).start()  # log response
+                    logging_dispatcher.submit(
+                        logging_obj.failure_handler,
+                        e,
+                        traceback_exception,
+                    )  # log response
                     # Handle any exceptions that might occur during streaming
                     asyncio.create_task(
                         logging_obj.async_failure_handler(e, traceback_exception)  # type: ignore
@@ -7122,17 +7265,17 @@ class Router:
             List of healthy deployments
         """
         # filter out the deployments currently cooling down
-        deployments_to_remove = []
         verbose_router_logger.debug(f"cooldown deployments: {cooldown_deployments}")
-        # Find deployments in model_list whose model_id is cooling down
-        for deployment in healthy_deployments:
-            deployment_id = deployment["model_info"]["id"]
-            if deployment_id in cooldown_deployments:
-                deployments_to_remove.append(deployment)
-
-        # remove unhealthy deployments from healthy deployments
-        for deployment in deployments_to_remove:
-            healthy_deployments.remove(deployment)
+        if len(cooldown_deployments) == 0:
+            return healthy_deployments
+
+        cooldown_deployment_ids = set(cooldown_deployments)
+        # remove unhealthy deployments from healthy deployments (in place)
+        healthy_deployments[:] = [
+            deployment
+            for deployment in healthy_deployments
+            if deployment["model_info"]["id"] not in cooldown_deployment_ids
+        ]
         return healthy_deployments
 
     def _track_deployment_metrics(
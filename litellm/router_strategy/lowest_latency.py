@@ -1,32 +1,206 @@
 #### What this does ####
 #   picks based on response time (for streaming, this is time to first token)
+import asyncio
+import json
+import math
 import random
+import time
+import uuid
 from datetime import datetime, timedelta
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
 import litellm
 from litellm import ModelResponse, token_counter, verbose_logger
+from litellm._logging import verbose_router_logger
 from litellm.caching.caching import DualCache
+from litellm.constants import DEFAULT_REDIS_SYNC_INTERVAL
 from litellm.integrations.custom_logger import CustomLogger
 from litellm.litellm_core_utils.core_helpers import safe_divide_seconds
-from litellm.litellm_core_utils.core_helpers import _get_parent_otel_span_from_kwargs
+from litellm.types.router import DeploymentLatencyStatsSnapshot
 from litellm.types.utils import LiteLLMPydanticObjectBase
 
-if TYPE_CHECKING:
-    from opentelemetry.trace import Span as _Span
-
-    Span = Union[_Span, Any]
-else:
-    Span = Any
-
 
 class RoutingArgs(LiteLLMPydanticObjectBase):
     ttl: float = 1 * 60 * 60  # 1 hour
     lowest_latency_buffer: float = 0
     max_latency_list_size: int = 10
+    latency_percentile: Optional[float] = (
+        None  # e.g. 50 or 95 - route on the p50 / p95 latency of a deployment. Defaults to the mean latency.
+    )
+    sync_stats_with_redis: bool = (
+        True  # if redis is set, periodically share latency stats across instances
+    )
+    redis_sync_interval: float = DEFAULT_REDIS_SYNC_INTERVAL
+
+
+def _get_precise_minute() -> str:
+    return datetime.now().strftime("%Y-%m-%d-%H-%M")
+
+
+def _to_seconds(value: Union[float, timedelta]) -> float:
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return float(value)
+
+
+def _get_latency_value(samples: List[float], percentile: Optional[float]) -> float:
+    """
+    Mean of the samples, or their nearest-rank percentile if `percentile` is set. 0 if there are no samples.
+    """
+    if len(samples) == 0:
+        return 0.0
+    if percentile is None:
+        return sum(samples) / len(samples)
+    sorted_samples = sorted(samples)
+    rank = math.ceil(percentile / 100 * len(sorted_samples)) - 1
+    return sorted_samples[min(max(rank, 0), len(sorted_samples) - 1)]
+
+
+class LatencyRingBuffer:
+    """
+    Fixed-size buffer of the most recent samples - adding a sample overwrites the oldest one.
+    """
+
+    __slots__ = ("samples", "max_size", "next_idx")
+
+    def __init__(self, max_size: int):
+        self.samples: List[float] = []
+        self.max_size = max(max_size, 1)
+        self.next_idx = 0
+
+    def add(self, value: float) -> None:
+        if len(self.samples) < self.max_size:
+            self.samples.append(value)
+        else:
+            self.samples[self.next_idx] = value
+        self.next_idx = (self.next_idx + 1) % self.max_size
+
+    def __len__(self) -> int:
+        return len(self.samples)
+
+
+class DeploymentLatencyStats:
+    """
+    Latency / time to first token samples and current minute tpm / rpm of a deployment.
+
+    Updated in place on each request - no read-modify-write of the model group's stats.
+    `remote` holds the merged stats of the other instances, if stats are synced with redis.
+    """
+
+    __slots__ = (
+        "latency",
+        "time_to_first_token",
+        "precise_minute",
+        "tpm",
+        "rpm",
+        "remote",
+    )
+
+    def __init__(self, max_size: int):
+        self.latency = LatencyRingBuffer(max_size=max_size)
+        self.time_to_first_token = LatencyRingBuffer(max_size=max_size)
+        self.precise_minute: Optional[str] = None
+        self.tpm = 0
+        self.rpm = 0
+        self.remote: Optional[DeploymentLatencyStatsSnapshot] = None
+
+    def record_success(
+        self,
+        latency: float,
+        time_to_first_token: Optional[float],
+        total_tokens: int,
+        precise_minute: str,
+    ) -> None:
+        self.latency.add(latency)
+        if time_to_first_token is not None:
+            self.time_to_first_token.add(time_to_first_token)
+        if self.precise_minute != precise_minute:
+            self.precise_minute = precise_minute
+            self.tpm = 0
+            self.rpm = 0
+        self.tpm += total_tokens
+        self.rpm += 1
+
+    def record_timeout(self) -> None:
+        self.latency.add(1000.0)  # 1000s penalty for timing out
+
+    def get_usage(self, precise_minute: str) -> Tuple[int, int]:
+        """
+        Returns (tpm, rpm) of the current minute, across instances
+        """
+        tpm, rpm = 0, 0
+        if self.precise_minute == precise_minute:
+            tpm, rpm = self.tpm, self.rpm
+        if self.remote is not None and self.remote["precise_minute"] == precise_minute:
+            tpm += self.remote["tpm"]
+            rpm += self.remote["rpm"]
+        return tpm, rpm
+
+    def get_latency(self, stream: bool, percentile: Optional[float]) -> float:
+        """
+        Time to first token for streaming requests (if known), else latency - across instances
+        """
+        if stream:
+            samples = list(self.time_to_first_token.samples)
+            if self.remote is not None:
+                samples.extend(self.remote["time_to_first_token"])
+            if len(samples) > 0:
+                return _get_latency_value(samples=samples, percentile=percentile)
+
+        samples = list(self.latency.samples)
+        if self.remote is not None:
+            samples.extend(self.remote["latency"])
+        return _get_latency_value(samples=samples, percentile=percentile)
+
+    def to_snapshot(self) -> DeploymentLatencyStatsSnapshot:
+        """
+        Stats recorded by this instance
+        """
+        return DeploymentLatencyStatsSnapshot(
+            latency=list(self.latency.samples),
+            time_to_first_token=list(self.time_to_first_token.samples),
+            precise_minute=self.precise_minute,
+            tpm=self.tpm,
+            rpm=self.rpm,
+        )
+
+
+def merge_latency_stats_snapshots(
+    snapshots: List[DeploymentLatencyStatsSnapshot], precise_minute: str
+) -> DeploymentLatencyStatsSnapshot:
+    """
+    Merge the stats of a deployment from multiple instances. Only usage in `precise_minute` is counted.
+    """
+    merged_snapshot = DeploymentLatencyStatsSnapshot(
+        latency=[],
+        time_to_first_token=[],
+        precise_minute=precise_minute,
+        tpm=0,
+        rpm=0,
+    )
+    for snapshot in snapshots:
+        merged_snapshot["latency"].extend(snapshot.get("latency", []))
+        merged_snapshot["time_to_first_token"].extend(
+            snapshot.get("time_to_first_token", [])
+        )
+        if snapshot.get("precise_minute") == precise_minute:
+            merged_snapshot["tpm"] += snapshot.get("tpm", 0)
+            merged_snapshot["rpm"] += snapshot.get("rpm", 0)
+    return merged_snapshot
 
 
 class LowestLatencyLoggingHandler(CustomLogger):
+    """
+    Latency stats are kept per deployment, in the in-memory router cache:
+
+    {model_group}_map: {
+        id: DeploymentLatencyStats
+    }
+
+    The map is reset every `routing_args.ttl` seconds. If redis is set, each instance periodically writes a snapshot of
+    its stats to redis and merges in the snapshots of the other instances.
+    """
+
     test_flag: bool = False
     logged_success: int = 0
     logged_failure: int = 0
@@ -37,154 +211,103 @@ class LowestLatencyLoggingHandler(CustomLogger):
         self.router_cache = router_cache
         self.model_list = model_list
         self.routing_args = RoutingArgs(**routing_args)
+        self.instance_id = str(uuid.uuid4())
+        self.model_groups_to_sync: Set[str] = set()
+        self._redis_sync_task: Optional[asyncio.Task] = None
 
-    def log_success_event(  # noqa: PLR0915
-        self, kwargs, response_obj, start_time, end_time
-    ):
-        try:
-            """
-            Update latency usage on success
-            """
-            metadata_field = self._select_metadata_field(kwargs)
-            if kwargs["litellm_params"].get(metadata_field) is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"][metadata_field].get(
-                    "model_group", None
-                )
+    def _get_model_group_stats(
+        self, model_group: str
+    ) -> Dict[str, DeploymentLatencyStats]:
+        latency_key = f"{model_group}_map"
+        model_group_stats = self.router_cache.in_memory_cache.get_cache(key=latency_key)
+        if model_group_stats is None:
+            model_group_stats = {}
+            self.router_cache.in_memory_cache.set_cache(
+                key=latency_key, value=model_group_stats, ttl=self.routing_args.ttl
+            )  # reset map within window
+        return model_group_stats
+
+    def _get_deployment_stats(
+        self, model_group: str, id: str
+    ) -> DeploymentLatencyStats:
+        model_group_stats = self._get_model_group_stats(model_group=model_group)
+        deployment_stats = model_group_stats.get(id)
+        if deployment_stats is None:
+            deployment_stats = DeploymentLatencyStats(
+                max_size=self.routing_args.max_latency_list_size
+            )
+            model_group_stats[id] = deployment_stats
+        return deployment_stats
+
+    def _get_model_group_and_id(self, kwargs: dict) -> Tuple[Optional[str], Any]:
+        metadata_field = self._select_metadata_field(kwargs)
+        if kwargs["litellm_params"].get(metadata_field) is None:
+            return None, None
+        model_group = kwargs["litellm_params"][metadata_field].get("model_group", None)
+        id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
+        if isinstance(id, int):
+            id = str(id)
+        return model_group, id
+
+    def _record_success(self, kwargs, response_obj, start_time, end_time) -> None:
+        """
+        Update latency usage on success
+        """
+        model_group, id = self._get_model_group_and_id(kwargs)
+        if model_group is None or id is None:
+            return
 
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms = end_time - start_time
-                time_to_first_token_response_time = None
-
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
+        response_ms = end_time - start_time
+        time_to_first_token_response_time = None
+        if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
+            # only log ttft for streaming request
+            time_to_first_token_response_time = (
+                kwargs.get("completion_start_time", end_time) - start_time
+            )
 
-                final_value: Union[float, timedelta] = response_ms
-                time_to_first_token: Optional[float] = None
-                total_tokens = 0
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        
-                        # Handle both timedelta and float response times
-                        if isinstance(response_ms, timedelta):
-                            response_seconds = response_ms.total_seconds()
-                        else:
-                            response_seconds = response_ms
-                            
-                        final_value = safe_divide_seconds(response_seconds, completion_tokens)
-                        if final_value is not None:
-                            final_value = float(final_value)
-                        else:
-                            final_value = response_ms
-
-                        if time_to_first_token_response_time is not None:
-                            if isinstance(time_to_first_token_response_time, timedelta):
-                                ttft_seconds = time_to_first_token_response_time.total_seconds()
-                            else:
-                                ttft_seconds = time_to_first_token_response_time
-                            time_to_first_token = safe_divide_seconds(
-                                ttft_seconds, completion_tokens
-                            )
-
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    self.router_cache.get_cache(
-                        key=latency_key, parent_otel_span=parent_otel_span
-                    )
-                    or {}
-                )
+        final_value: float = _to_seconds(response_ms)
+        time_to_first_token: Optional[float] = None
+        total_tokens = 0
 
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
-
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
+        if isinstance(response_obj, ModelResponse):
+            _usage = getattr(response_obj, "usage", None)
+            if _usage is not None:
+                completion_tokens = _usage.completion_tokens
+                total_tokens = _usage.total_tokens
 
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
-                )
+                latency_per_token = safe_divide_seconds(final_value, completion_tokens)
+                if latency_per_token is not None:
+                    final_value = float(latency_per_token)
 
-                self.router_cache.set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
+                if time_to_first_token_response_time is not None:
+                    time_to_first_token = safe_divide_seconds(
+                        _to_seconds(time_to_first_token_response_time),
+                        completion_tokens,
+                    )
+
+        self._get_deployment_stats(model_group=model_group, id=id).record_success(
+            latency=final_value,
+            time_to_first_token=time_to_first_token,
+            total_tokens=total_tokens,
+            precise_minute=_get_precise_minute(),
+        )
+        self.model_groups_to_sync.add(model_group)
 
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+        ### TESTING ###
+        if self.test_flag:
+            self.logged_success += 1
+
+    def log_success_event(self, kwargs, response_obj, start_time, end_time):
+        try:
+            self._record_success(
+                kwargs=kwargs,
+                response_obj=response_obj,
+                start_time=start_time,
+                end_time=end_time,
+            )
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::log_success_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
@@ -192,218 +315,38 @@ class LowestLatencyLoggingHandler(CustomLogger):
 
     async def async_log_failure_event(self, kwargs, response_obj, start_time, end_time):
         """
-        Check if Timeout Error, if timeout set deployment latency -> 100
+        Check if Timeout Error, if timeout set deployment latency -> 1000
         """
         try:
-            metadata_field = self._select_metadata_field(kwargs)
             _exception = kwargs.get("exception", None)
             if isinstance(_exception, litellm.Timeout):
-                if kwargs["litellm_params"].get(metadata_field) is None:
-                    pass
-                else:
-                    model_group = kwargs["litellm_params"][metadata_field].get(
-                        "model_group", None
-                    )
-
-                    id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                    if model_group is None or id is None:
-                        return
-                    elif isinstance(id, int):
-                        id = str(id)
-
-                    # ------------
-                    # Setup values
-                    # ------------
-                    """
-                    {
-                        {model_group}_map: {
-                            id: {
-                                "latency": [..]
-                                f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                            }
-                        }
-                    }
-                    """
-                    latency_key = f"{model_group}_map"
-                    request_count_dict = (
-                        await self.router_cache.async_get_cache(key=latency_key) or {}
-                    )
-
-                    if id not in request_count_dict:
-                        request_count_dict[id] = {}
-
-                    ## Latency - give 1000s penalty for failing
-                    if (
-                        len(request_count_dict[id].get("latency", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault("latency", []).append(1000.0)
-                    else:
-                        request_count_dict[id]["latency"] = request_count_dict[id][
-                            "latency"
-                        ][: self.routing_args.max_latency_list_size - 1] + [1000.0]
-
-                    await self.router_cache.async_set_cache(
-                        key=latency_key,
-                        value=request_count_dict,
-                        ttl=self.routing_args.ttl,
-                    )  # reset map within window
+                model_group, id = self._get_model_group_and_id(kwargs)
+                if model_group is None or id is None:
+                    return
+                self._get_deployment_stats(
+                    model_group=model_group, id=id
+                ).record_timeout()
+                self.model_groups_to_sync.add(model_group)
             else:
                 # do nothing if it's not a timeout error
                 return
         except Exception as e:
             verbose_logger.exception(
-                "litellm.proxy.hooks.prompt_injection_detection.py::async_pre_call_hook(): Exception occured - {}".format(
+                "litellm.router_strategy.lowest_latency.py::async_log_failure_event(): Exception occured - {}".format(
                     str(e)
                 )
             )
             pass
 
-    async def async_log_success_event(  # noqa: PLR0915
-        self, kwargs, response_obj, start_time, end_time
-    ):
+    async def async_log_success_event(self, kwargs, response_obj, start_time, end_time):
         try:
-            """
-            Update latency usage on success
-            """
-            metadata_field = self._select_metadata_field(kwargs)
-            if kwargs["litellm_params"].get(metadata_field) is None:
-                pass
-            else:
-                model_group = kwargs["litellm_params"][metadata_field].get(
-                    "model_group", None
-                )
-
-                id = kwargs["litellm_params"].get("model_info", {}).get("id", None)
-                if model_group is None or id is None:
-                    return
-                elif isinstance(id, int):
-                    id = str(id)
-
-                # ------------
-                # Setup values
-                # ------------
-                """
-                {
-                    {model_group}_map: {
-                        id: {
-                            "latency": [..]
-                            "time_to_first_token": [..]
-                            f"{date:hour:minute}" : {"tpm": 34, "rpm": 3}
-                        }
-                    }
-                }
-                """
-                latency_key = f"{model_group}_map"
-
-                current_date = datetime.now().strftime("%Y-%m-%d")
-                current_hour = datetime.now().strftime("%H")
-                current_minute = datetime.now().strftime("%M")
-                precise_minute = f"{current_date}-{current_hour}-{current_minute}"
-
-                response_ms = end_time - start_time
-                time_to_first_token_response_time = None
-                if kwargs.get("stream", None) is not None and kwargs["stream"] is True:
-                    # only log ttft for streaming request
-                    time_to_first_token_response_time = (
-                        kwargs.get("completion_start_time", end_time) - start_time
-                    )
-
-                final_value: Union[float, timedelta] = response_ms
-                total_tokens = 0
-                time_to_first_token: Optional[float] = None
-
-                if isinstance(response_obj, ModelResponse):
-                    _usage = getattr(response_obj, "usage", None)
-                    if _usage is not None:
-                        completion_tokens = _usage.completion_tokens
-                        total_tokens = _usage.total_tokens
-                        
-                        # Handle both timedelta and float response times
-                        if isinstance(response_ms, timedelta):
-                            response_seconds = response_ms.total_seconds()
-                        else:
-                            response_seconds = response_ms
-                            
-                        final_value = safe_divide_seconds(response_seconds, completion_tokens)
-                        if final_value is not None:
-                            final_value = float(final_value)
-                        else:
-                            final_value = response_ms
-
-                        if time_to_first_token_response_time is not None:
-                            if isinstance(time_to_first_token_response_time, timedelta):
-                                ttft_seconds = time_to_first_token_response_time.total_seconds()
-                            else:
-                                ttft_seconds = time_to_first_token_response_time
-                            time_to_first_token = safe_divide_seconds(
-                                ttft_seconds, completion_tokens
-                            )
-                # ------------
-                # Update usage
-                # ------------
-                parent_otel_span = _get_parent_otel_span_from_kwargs(kwargs)
-                request_count_dict = (
-                    await self.router_cache.async_get_cache(
-                        key=latency_key,
-                        parent_otel_span=parent_otel_span,
-                        local_only=True,
-                    )
-                    or {}
-                )
-
-                if id not in request_count_dict:
-                    request_count_dict[id] = {}
-
-                ## Latency
-                if (
-                    len(request_count_dict[id].get("latency", []))
-                    < self.routing_args.max_latency_list_size
-                ):
-                    request_count_dict[id].setdefault("latency", []).append(final_value)
-                else:
-                    request_count_dict[id]["latency"] = request_count_dict[id][
-                        "latency"
-                    ][: self.routing_args.max_latency_list_size - 1] + [final_value]
-
-                ## Time to first token
-                if time_to_first_token is not None:
-                    if (
-                        len(request_count_dict[id].get("time_to_first_token", []))
-                        < self.routing_args.max_latency_list_size
-                    ):
-                        request_count_dict[id].setdefault(
-                            "time_to_first_token", []
-                        ).append(time_to_first_token)
-                    else:
-                        request_count_dict[id][
-                            "time_to_first_token"
-                        ] = request_count_dict[id]["time_to_first_token"][
-                            : self.routing_args.max_latency_list_size - 1
-                        ] + [
-                            time_to_first_token
-                        ]
-
-                if precise_minute not in request_count_dict[id]:
-                    request_count_dict[id][precise_minute] = {}
-
-                ## TPM
-                request_count_dict[id][precise_minute]["tpm"] = (
-                    request_count_dict[id][precise_minute].get("tpm", 0) + total_tokens
-                )
-
-                ## RPM
-                request_count_dict[id][precise_minute]["rpm"] = (
-                    request_count_dict[id][precise_minute].get("rpm", 0) + 1
-                )
-
-                await self.router_cache.async_set_cache(
-                    key=latency_key, value=request_count_dict, ttl=self.routing_args.ttl
-                )  # reset map within window
-
-                ### TESTING ###
-                if self.test_flag:
-                    self.logged_success += 1
+            self._record_success(
+                kwargs=kwargs,
+                response_obj=response_obj,
+                start_time=start_time,
+                end_time=end_time,
+            )
+            self._start_redis_sync_task()
         except Exception as e:
             verbose_logger.exception(
                 "litellm.router_strategy.lowest_latency.py::async_log_success_event(): Exception occured - {}".format(
@@ -412,6 +355,77 @@ class LowestLatencyLoggingHandler(CustomLogger):
             )
             pass
 
+    def _start_redis_sync_task(self) -> None:
+        if (
+            self._redis_sync_task is None
+            and self.routing_args.sync_stats_with_redis is True
+            and self.router_cache.redis_cache is not None
+        ):
+            self._redis_sync_task = asyncio.create_task(
+                self.periodic_sync_latency_stats_with_redis()
+            )
+
+    async def periodic_sync_latency_stats_with_redis(self):
+        while True:
+            try:
+                await self._sync_latency_stats_with_redis()
+            except Exception as e:
+                verbose_router_logger.error(
+                    f"Error syncing latency stats with Redis: {str(e)}"
+                )
+            await asyncio.sleep(self.routing_args.redis_sync_interval)
+
+    async def _sync_latency_stats_with_redis(self):
+        """
+        For each model group used on this instance:
+        1. Write the stats recorded by this instance to a redis hash - `{model_group}_latency_stats`, one field per instance
+        2. Merge the stats of the other instances into `DeploymentLatencyStats.remote`
+        """
+        redis_cache = self.router_cache.redis_cache
+        if redis_cache is None:
+            return
+
+        redis_client: Any = redis_cache.init_async_client()
+        now = time.time()
+        precise_minute = _get_precise_minute()
+        for model_group in list(self.model_groups_to_sync):
+            model_group_stats = self._get_model_group_stats(model_group=model_group)
+            redis_key = redis_cache.check_and_fix_namespace(
+                key=f"{model_group}_latency_stats"
+            )
+            local_snapshot = {
+                "updated_at": now,
+                "deployments": {
+                    id: deployment_stats.to_snapshot()
+                    for id, deployment_stats in model_group_stats.items()
+                },
+            }
+            await redis_client.hset(
+                redis_key, self.instance_id, json.dumps(local_snapshot)
+            )
+            await redis_client.expire(redis_key, int(self.routing_args.ttl))
+
+            remote_snapshots: Dict[str, List[DeploymentLatencyStatsSnapshot]] = {}
+            instance_snapshots = await redis_client.hgetall(redis_key)
+            for instance_id, instance_snapshot in instance_snapshots.items():
+                if isinstance(instance_id, bytes):
+                    instance_id = instance_id.decode("utf-8")
+                if instance_id == self.instance_id:
+                    continue
+                snapshot = json.loads(instance_snapshot)
+                if now - snapshot["updated_at"] > self.routing_args.ttl:
+                    await redis_client.hdel(redis_key, instance_id)
+                    continue
+                for id, deployment_snapshot in snapshot["deployments"].items():
+                    remote_snapshots.setdefault(id, []).append(deployment_snapshot)
+
+            for id, snapshots in remote_snapshots.items():
+                self._get_deployment_stats(model_group=model_group, id=id).remote = (
+                    merge_latency_stats_snapshots(
+                        snapshots=snapshots, precise_minute=precise_minute
+                    )
+                )
+
     def _get_available_deployments(  # noqa: PLR0915
         self,
         model_group: str,
@@ -419,7 +433,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
         messages: Optional[List[Dict[str, str]]] = None,
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
-        request_count_dict: Optional[Dict] = None,
+        request_count_dict: Optional[Dict[str, DeploymentLatencyStats]] = None,
     ):
         """Common logic for both sync and async get_available_deployments"""
 
@@ -429,48 +443,32 @@ class LowestLatencyLoggingHandler(CustomLogger):
         _latency_per_deployment = {}
         lowest_latency = float("inf")
 
-        current_date = datetime.now().strftime("%Y-%m-%d")
-        current_hour = datetime.now().strftime("%H")
-        current_minute = datetime.now().strftime("%M")
-        precise_minute = f"{current_date}-{current_hour}-{current_minute}"
+        precise_minute = _get_precise_minute()
 
         deployment = None
 
         if request_count_dict is None:  # base case
             return
 
-        all_deployments = request_count_dict
-        for d in healthy_deployments:
-            ## if healthy deployment not yet used
-            if d["model_info"]["id"] not in all_deployments:
-                all_deployments[d["model_info"]["id"]] = {
-                    "latency": [0],
-                    precise_minute: {"tpm": 0, "rpm": 0},
-                }
-
         try:
             input_tokens = token_counter(messages=messages, text=input)
         except Exception:
             input_tokens = 0
 
-        # randomly sample from all_deployments, incase all deployments have latency=0.0
-        _items = all_deployments.items()
+        is_stream = (
+            request_kwargs is not None
+            and request_kwargs.get("stream", None) is not None
+            and request_kwargs["stream"] is True
+        )
 
-        _all_deployments = random.sample(list(_items), len(_items))
-        all_deployments = dict(_all_deployments)
+        # randomly sample from healthy deployments, incase all deployments have latency=0.0
+        _healthy_deployments = random.sample(
+            healthy_deployments, len(healthy_deployments)
+        )
         ### GET AVAILABLE DEPLOYMENTS ### filter out any deployments > tpm/rpm limits
 
         potential_deployments = []
-        for item, item_map in all_deployments.items():
-            ## get the item from model list
-            _deployment = None
-            for m in healthy_deployments:
-                if item == m["model_info"]["id"]:
-                    _deployment = m
-
-            if _deployment is None:
-                continue  # skip to next one
-
+        for _deployment in _healthy_deployments:
             _deployment_tpm = (
                 _deployment.get("tpm", None)
                 or _deployment.get("litellm_params", {}).get("tpm", None)
@@ -484,27 +482,19 @@ class LowestLatencyLoggingHandler(CustomLogger):
                 or _deployment.get("model_info", {}).get("rpm", None)
                 or float("inf")
             )
-            item_latency = item_map.get("latency", [])
-            item_ttft_latency = item_map.get("time_to_first_token", [])
-            item_rpm = item_map.get(precise_minute, {}).get("rpm", 0)
-            item_tpm = item_map.get(precise_minute, {}).get("tpm", 0)
 
-            # get average latency or average ttft (depending on streaming/non-streaming)
-            total: float = 0.0
-            if (
-                request_kwargs is not None
-                and request_kwargs.get("stream", None) is not None
-                and request_kwargs["stream"] is True
-                and len(item_ttft_latency) > 0
-            ):
-                for _call_latency in item_ttft_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
+            ## if healthy deployment not yet used, latency is 0
+            deployment_stats = request_count_dict.get(_deployment["model_info"]["id"])
+            if deployment_stats is None:
+                item_latency, item_tpm, item_rpm = 0.0, 0, 0
             else:
-                for _call_latency in item_latency:
-                    if isinstance(_call_latency, float):
-                        total += _call_latency
-            item_latency = total / len(item_latency)
+                # get average / percentile latency or ttft (depending on streaming/non-streaming)
+                item_latency = deployment_stats.get_latency(
+                    stream=is_stream, percentile=self.routing_args.latency_percentile
+                )
+                item_tpm, item_rpm = deployment_stats.get_usage(
+                    precise_minute=precise_minute
+                )
 
             # -------------- #
             # Debugging Logic
@@ -562,26 +552,14 @@ class LowestLatencyLoggingHandler(CustomLogger):
         input: Optional[Union[str, List]] = None,
         request_kwargs: Optional[Dict] = None,
     ):
-        # get list of potential deployments
-        latency_key = f"{model_group}_map"
-
-        parent_otel_span: Optional[Span] = _get_parent_otel_span_from_kwargs(
-            request_kwargs
-        )
-        request_count_dict = (
-            await self.router_cache.async_get_cache(
-                key=latency_key, parent_otel_span=parent_otel_span
-            )
-            or {}
-        )
-
-        return self._get_available_deployments(
-            model_group,
-            healthy_deployments,
-            messages,
-            input,
-            request_kwargs,
-            request_count_dict,
+        self.model_groups_to_sync.add(model_group)
+        self._start_redis_sync_task()
+        return self.get_available_deployments(
+            model_group=model_group,
+            healthy_deployments=healthy_deployments,
+            messages=messages,
+            input=input,
+            request_kwargs=request_kwargs,
         )
 
     def get_available_deployments(
@@ -596,17 +574,7 @@ class LowestLatencyLoggingHandler(CustomLogger):
         Returns a deployment with the lowest latency
         """
         # get list of potential deployments
-        latency_key = f"{model_group}_map"
-
-        parent_otel_span: Optional[Span] = _get_parent_otel_span_from_kwargs(
-            request_kwargs
-        )
-        request_count_dict = (
-            self.router_cache.get_cache(
-                key=latency_key, parent_otel_span=parent_otel_span
-            )
-            or {}
-        )
+        request_count_dict = self._get_model_group_stats(model_group=model_group)
 
         return self._get_available_deployments(
             model_group,
@@ -2,12 +2,26 @@
 Wrapper around router cache. Meant to handle model cooldown logic
 """
 
+import asyncio
+import json
 import time
-from typing import TYPE_CHECKING, Any, List, Optional, Tuple, TypedDict, Union
+import uuid
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypedDict,
+    Union,
+)
 
 from litellm import verbose_logger
+from litellm._logging import verbose_router_logger
 from litellm.caching.caching import DualCache
-from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.constants import DEFAULT_COOLDOWN_PUBSUB_RETRY_INTERVAL_SECONDS
 
 if TYPE_CHECKING:
     from opentelemetry.trace import Span as _Span
@@ -24,11 +38,55 @@ class CooldownCacheValue(TypedDict):
     cooldown_time: float
 
 
+COOLDOWN_EVENTS_CHANNEL = "router:cooldown_events"
+
+
 class CooldownCache:
+    """
+    Cooldowns are kept in an in-process table (model_id -> cooldown expiry), so checking the cooldowns of a model group doesn't read the cache.
+
+    If the router cache has redis, cooldowns are also written to redis and published over redis pub/sub, so other instances add them to their table.
+    On first use, an instance loads the cooldowns that are already active from redis.
+    """
+
     def __init__(self, cache: DualCache, default_cooldown_time: float):
         self.cache = cache
         self.default_cooldown_time = default_cooldown_time
-        self.in_memory_cache = InMemoryCache()
+        self.pubsub_retry_interval = DEFAULT_COOLDOWN_PUBSUB_RETRY_INTERVAL_SECONDS
+
+        self.cooldown_table: Dict[str, Tuple[float, CooldownCacheValue]] = {}
+        self.instance_id = str(uuid.uuid4())
+        self._pubsub_task: Optional[asyncio.Task] = None
+        self._pubsub_stopped_at: Optional[float] = None
+        # model ids with cooldowns loaded from redis, kept up to date by the pub/sub listener
+        self._loaded_model_ids: Set[str] = set()
+
+    def _add_to_cooldown_table(
+        self, model_id: str, cooldown_data: CooldownCacheValue
+    ) -> None:
+        self.cooldown_table[model_id] = (
+            cooldown_data["timestamp"] + cooldown_data["cooldown_time"],
+            cooldown_data,
+        )
+
+    def _get_active_cooldowns_from_table(
+        self, model_ids: List[str]
+    ) -> List[Tuple[str, CooldownCacheValue]]:
+        if len(self.cooldown_table) == 0:
+            return []
+
+        current_time = time.time()
+        for model_id, (expires_at, _) in list(self.cooldown_table.items()):
+            if expires_at <= current_time:
+                self.cooldown_table.pop(model_id, None)
+
+        if len(self.cooldown_table) == 0:
+            return []
+        return [
+            (model_id, self.cooldown_table[model_id][1])
+            for model_id in model_ids
+            if model_id in self.cooldown_table
+        ]
 
     def _common_add_cooldown_logic(
         self, model_id: str, original_exception, exception_status, cooldown_time: float
@@ -78,12 +136,20 @@ class CooldownCache:
                 cooldown_time=_cooldown_time,
             )
 
+            self._add_to_cooldown_table(model_id=model_id, cooldown_data=cooldown_data)
+
             # Set the cache with a TTL equal to the cooldown time
             self.cache.set_cache(
                 value=cooldown_data,
                 key=cooldown_key,
                 ttl=_cooldown_time,
             )
+            if self.cache.redis_cache is not None:
+                self._schedule(
+                    self._redis_publish_cooldown(
+                        model_id=model_id, cooldown_data=cooldown_data
+                    )
+                )
         except Exception as e:
             verbose_logger.error(
                 "CooldownCache::add_deployment_to_cooldown - Exception occurred - {}".format(
@@ -99,77 +165,174 @@ class CooldownCache:
     async def async_get_active_cooldowns(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
     ) -> List[Tuple[str, CooldownCacheValue]]:
-        # Generate the keys for the deployments
-        keys = [
-            CooldownCache.get_cooldown_cache_key(model_id) for model_id in model_ids
-        ]
+        if self.cache.redis_cache is not None:
+            self._ensure_pubsub_listener()
+            await self._async_load_cooldowns_from_cache(
+                model_ids=model_ids, parent_otel_span=parent_otel_span
+            )
+        return self._get_active_cooldowns_from_table(model_ids=model_ids)
 
-        # Retrieve the values for the keys using mget
-        ## more likely to be none if no models ratelimited. So just check redis every 1s
-        ## each redis call adds ~100ms latency.
+    def get_active_cooldowns(
+        self, model_ids: List[str], parent_otel_span: Optional[Span]
+    ) -> List[Tuple[str, CooldownCacheValue]]:
+        if self.cache.redis_cache is not None:
+            self._load_cooldowns_from_cache(
+                model_ids=model_ids, parent_otel_span=parent_otel_span
+            )
+        return self._get_active_cooldowns_from_table(model_ids=model_ids)
 
-        ## check in memory cache first
-        results = await self.cache.async_batch_get_cache(
-            keys=keys, parent_otel_span=parent_otel_span
+    def get_min_cooldown(
+        self, model_ids: List[str], parent_otel_span: Optional[Span]
+    ) -> float:
+        """Return min cooldown time required for a group of model id's."""
+        active_cooldowns = self.get_active_cooldowns(
+            model_ids=model_ids, parent_otel_span=parent_otel_span
         )
-        active_cooldowns: List[Tuple[str, CooldownCacheValue]] = []
 
-        if results is None:
-            return active_cooldowns
+        min_cooldown_time: Optional[float] = None
+        for _, cooldown_cache_value in active_cooldowns:
+            if min_cooldown_time is None:
+                min_cooldown_time = cooldown_cache_value["cooldown_time"]
+            elif cooldown_cache_value["cooldown_time"] < min_cooldown_time:
+                min_cooldown_time = cooldown_cache_value["cooldown_time"]
 
-        # Process the results
-        for model_id, result in zip(model_ids, results):
-            if result and isinstance(result, dict):
-                cooldown_cache_value = CooldownCacheValue(**result)  # type: ignore
-                active_cooldowns.append((model_id, cooldown_cache_value))
+        return min_cooldown_time or self.default_cooldown_time
 
-        return active_cooldowns
+    ### REDIS - MULTI-INSTANCE ###
 
-    def get_active_cooldowns(
-        self, model_ids: List[str], parent_otel_span: Optional[Span]
-    ) -> List[Tuple[str, CooldownCacheValue]]:
-        # Generate the keys for the deployments
-        keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
-        # Retrieve the values for the keys using mget
-        results = (
-            self.cache.batch_get_cache(keys=keys, parent_otel_span=parent_otel_span)
-            or []
-        )
+    def _is_listening(self) -> bool:
+        return self._pubsub_task is not None and not self._pubsub_task.done()
+
+    def _get_model_ids_to_load(self, model_ids: List[str]) -> List[str]:
+        """
+        While the pub/sub listener runs, cooldowns of a model id are read from the cache once - later changes arrive over pub/sub.
+
+        Without a listener (e.g. sync-only usage), cooldowns are read from the cache on each call.
+        """
+        if not self._is_listening():
+            return model_ids
+        return [
+            model_id for model_id in model_ids if model_id not in self._loaded_model_ids
+        ]
 
-        active_cooldowns = []
-        # Process the results
+    def _add_cache_results_to_cooldown_table(
+        self, model_ids: List[str], results: Optional[List[Any]]
+    ) -> None:
+        self._loaded_model_ids.update(model_ids)
+        if results is None:
+            return
         for model_id, result in zip(model_ids, results):
             if result and isinstance(result, dict):
                 cooldown_cache_value = CooldownCacheValue(**result)  # type: ignore
-                active_cooldowns.append((model_id, cooldown_cache_value))
+                self._add_to_cooldown_table(
+                    model_id=model_id, cooldown_data=cooldown_cache_value
+                )
 
-        return active_cooldowns
+    async def _async_load_cooldowns_from_cache(
+        self, model_ids: List[str], parent_otel_span: Optional[Span]
+    ) -> None:
+        model_ids_to_load = self._get_model_ids_to_load(model_ids=model_ids)
+        if len(model_ids_to_load) == 0:
+            return
+        results = await self.cache.async_batch_get_cache(
+            keys=[
+                CooldownCache.get_cooldown_cache_key(model_id)
+                for model_id in model_ids_to_load
+            ],
+            parent_otel_span=parent_otel_span,
+        )
+        self._add_cache_results_to_cooldown_table(
+            model_ids=model_ids_to_load, results=results
+        )
 
-    def get_min_cooldown(
+    def _load_cooldowns_from_cache(
         self, model_ids: List[str], parent_otel_span: Optional[Span]
-    ) -> float:
-        """Return min cooldown time required for a group of model id's."""
+    ) -> None:
+        model_ids_to_load = self._get_model_ids_to_load(model_ids=model_ids)
+        if len(model_ids_to_load) == 0:
+            return
+        results = self.cache.batch_get_cache(
+            keys=[
+                CooldownCache.get_cooldown_cache_key(model_id)
+                for model_id in model_ids_to_load
+            ],
+            parent_otel_span=parent_otel_span,
+        )
+        self._add_cache_results_to_cooldown_table(
+            model_ids=model_ids_to_load, results=results
+        )
 
-        # Generate the keys for the deployments
-        keys = [f"deployment:{model_id}:cooldown" for model_id in model_ids]
+    def _schedule(self, coro: Any) -> None:
+        try:
+            asyncio.get_running_loop().create_task(coro)
+        except RuntimeError:
+            coro.close()  # no running loop - cooldown is still written to the cache
 
-        # Retrieve the values for the keys using mget
-        results = (
-            self.cache.batch_get_cache(keys=keys, parent_otel_span=parent_otel_span)
-            or []
-        )
+    async def _redis_publish_cooldown(
+        self, model_id: str, cooldown_data: CooldownCacheValue
+    ) -> None:
+        try:
+            redis_client: Any = self.cache.redis_cache.init_async_client()  # type: ignore
+            await redis_client.publish(
+                COOLDOWN_EVENTS_CHANNEL,
+                json.dumps(
+                    {
+                        "instance_id": self.instance_id,
+                        "model_id": model_id,
+                        "cooldown": cooldown_data,
+                    }
+                ),
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "CooldownCache: failed to publish cooldown event - {}".format(str(e))
+            )
 
-        min_cooldown_time: Optional[float] = None
-        # Process the results
-        for model_id, result in zip(model_ids, results):
-            if result and isinstance(result, dict):
-                cooldown_cache_value = CooldownCacheValue(**result)  # type: ignore
-                if min_cooldown_time is None:
-                    min_cooldown_time = cooldown_cache_value["cooldown_time"]
-                elif cooldown_cache_value["cooldown_time"] < min_cooldown_time:
-                    min_cooldown_time = cooldown_cache_value["cooldown_time"]
+    def _ensure_pubsub_listener(self) -> None:
+        if self._is_listening():
+            return
+        # listener stopped (e.g. redis is down) - don't restart it on every call. Until then, cooldowns are read from the cache on each call
+        if (
+            self._pubsub_stopped_at is not None
+            and time.time() - self._pubsub_stopped_at < self.pubsub_retry_interval
+        ):
+            return
+        # cooldowns set while not listening are re-loaded from the cache
+        self._loaded_model_ids = set()
+        self._pubsub_task = asyncio.create_task(self._redis_listen_for_cooldowns())
 
-        return min_cooldown_time or self.default_cooldown_time
+    def _handle_cooldown_event(self, data: Union[str, bytes]) -> None:
+        event = json.loads(data)
+        if event.get("instance_id") == self.instance_id:
+            return
+        self._add_to_cooldown_table(
+            model_id=event["model_id"],
+            cooldown_data=CooldownCacheValue(**event["cooldown"]),  # type: ignore
+        )
+
+    async def _redis_listen_for_cooldowns(self) -> None:
+        """
+        Add cooldowns set by other instances to the cooldown table
+        """
+        try:
+            redis_client: Any = self.cache.redis_cache.init_async_client()  # type: ignore
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(COOLDOWN_EVENTS_CHANNEL)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                try:
+                    self._handle_cooldown_event(data=message.get("data"))
+                except Exception as e:
+                    verbose_router_logger.debug(
+                        "CooldownCache: invalid cooldown event - {}".format(str(e))
+                    )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "CooldownCache: redis pub/sub listener stopped - {}".format(str(e))
+            )
+        finally:
+            self._pubsub_stopped_at = time.time()
 
 
 # Usage example:
@@ -302,6 +302,15 @@ def _set_cooldown_deployments(
             cooldown_time=time_to_cooldown,
         )
 
+        # Wake up queued priority requests for the model group, once the cooldown ends
+        litellm_router_instance._ensure_deployment_indexes()
+        _deployment = litellm_router_instance.model_id_to_deployment_map.get(deployment)
+        if _deployment is not None:
+            litellm_router_instance.scheduler.notify_after(
+                delay=time_to_cooldown or litellm_router_instance.cooldown_time,
+                model_name=_deployment.get("model_name"),
+            )
+
         # Trigger cooldown callback handler
         asyncio.create_task(
             router_cooldown_event_callback(
@@ -0,0 +1,47 @@
+"""
+List type for `Router.model_list` - counts its own mutations, so the router's lookup indexes can tell
+when the list was changed in place (e.g. `router.model_list[i] = new_deployment`) without re-scanning it.
+
+A plain list assigned to `router.model_list` is copied into a `DeploymentList` on the router's next lookup.
+Edits to the deployment dicts in the list aren't counted - call `Router.invalidate_deployment_indexes` after those.
+"""
+
+from typing import Any, Callable
+
+_MUTATING_LIST_METHODS = (
+    "__setitem__",
+    "__delitem__",
+    "__iadd__",
+    "__imul__",
+    "append",
+    "extend",
+    "insert",
+    "pop",
+    "remove",
+    "clear",
+    "sort",
+    "reverse",
+)
+
+
+class DeploymentList(list):
+    """
+    A list that bumps `version` on every mutation
+    """
+
+    version: int = 0
+
+
+def _count_mutation(method_name: str) -> Callable:
+    list_method = getattr(list, method_name)
+
+    def _mutating_method(self: DeploymentList, *args: Any, **kwargs: Any) -> Any:
+        self.version += 1
+        return list_method(self, *args, **kwargs)
+
+    _mutating_method.__name__ = method_name
+    return _mutating_method
+
+
+for _method_name in _MUTATING_LIST_METHODS:
+    setattr(DeploymentList, _method_name, _count_mutation(_method_name))
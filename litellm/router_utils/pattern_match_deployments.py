@@ -2,13 +2,18 @@
 Class to handle llm wildcard routing and regex pattern matching
 """
 
-import copy
 import re
-from re import Match
+from collections import OrderedDict
+from re import Match, Pattern
 from typing import Dict, List, Optional, Tuple
 
 from litellm import get_llm_provider
 from litellm._logging import verbose_router_logger
+from litellm.constants import MAX_PATTERN_MATCH_ROUTER_CACHE_SIZE
+
+# request, filtered model names -> deployments with the resolved litellm model name
+PatternMatchCacheKey = Tuple[str, Optional[Tuple[str, ...]]]
+PatternMatchCacheValue = Optional[List[Tuple[Dict, str]]]
 
 
 class PatternUtils:
@@ -56,10 +61,57 @@ class PatternMatchRouter:
     doc: https://docs.litellm.ai/docs/proxy/configs#provider-specific-wildcard-routing
 
     This class will store a mapping for regex pattern: List[Deployments]
+
+    Patterns are compiled once (sorted by specificity, into a single combined regex) when they change, and resolved
+    routes are kept in a bounded LRU cache - so routing an unknown model name doesn't re-sort and re-match every pattern.
     """
 
-    def __init__(self):
-        self.patterns: Dict[str, List] = {}
+    def __init__(self, max_cache_size: int = MAX_PATTERN_MATCH_ROUTER_CACHE_SIZE):
+        self._patterns: Dict[str, List] = {}
+        self.max_cache_size = max_cache_size
+        self.route_cache: (
+            "OrderedDict[PatternMatchCacheKey, PatternMatchCacheValue]"
+        ) = OrderedDict()
+        self._compiled_patterns: Optional[List[Tuple[str, Pattern, List[Dict]]]] = None
+        self._combined_regex: Optional[Pattern] = None
+
+    @property
+    def patterns(self) -> Dict[str, List]:
+        return self._patterns
+
+    @patterns.setter
+    def patterns(self, patterns: Dict[str, List]):
+        self._patterns = patterns
+        self._invalidate()
+
+    def _invalidate(self):
+        self._compiled_patterns = None
+        self._combined_regex = None
+        self.route_cache.clear()
+
+    def _compile_patterns(self) -> List[Tuple[str, Pattern, List[Dict]]]:
+        """
+        Compile the patterns, sorted by specificity, and a combined regex of all of them.
+
+        The combined regex tries the patterns in the same order, so the first matching pattern is the one returned by `re.match` in a loop.
+        """
+        if self._compiled_patterns is None:
+            sorted_patterns = PatternUtils.sorted_patterns(self._patterns)
+            self._compiled_patterns = [
+                (pattern, re.compile(pattern), llm_deployments)
+                for pattern, llm_deployments in sorted_patterns
+            ]
+            self._combined_regex = (
+                re.compile(
+                    "|".join(
+                        f"(?P<p{idx}>{pattern})"
+                        for idx, (pattern, _) in enumerate(sorted_patterns)
+                    )
+                )
+                if len(sorted_patterns) > 0
+                else None
+            )
+        return self._compiled_patterns
 
     def add_pattern(self, pattern: str, llm_deployment: Dict):
         """
@@ -71,9 +123,10 @@ class PatternMatchRouter:
         """
         # Convert the pattern to a regex
         regex = self._pattern_to_regex(pattern)
-        if regex not in self.patterns:
-            self.patterns[regex] = []
-        self.patterns[regex].append(llm_deployment)
+        if regex not in self._patterns:
+            self._patterns[regex] = []
+        self._patterns[regex].append(llm_deployment)
+        self._invalidate()
 
     def _pattern_to_regex(self, pattern: str) -> str:
         """
@@ -102,18 +155,70 @@ class PatternMatchRouter:
     def _return_pattern_matched_deployments(
         self, matched_pattern: Match, deployments: List[Dict]
     ) -> List[Dict]:
-        new_deployments = []
-        for deployment in deployments:
-            new_deployment = copy.deepcopy(deployment)
-            new_deployment["litellm_params"][
-                "model"
-            ] = PatternMatchRouter.set_deployment_model_name(
-                matched_pattern=matched_pattern,
-                litellm_deployment_litellm_model=deployment["litellm_params"]["model"],
+        return self._copy_deployments(
+            self._resolve_deployments(
+                matched_pattern=matched_pattern, deployments=deployments
+            )
+        )
+
+    @staticmethod
+    def _resolve_deployments(
+        matched_pattern: Match, deployments: List[Dict]
+    ) -> List[Tuple[Dict, str]]:
+        return [
+            (
+                deployment,
+                PatternMatchRouter.set_deployment_model_name(
+                    matched_pattern=matched_pattern,
+                    litellm_deployment_litellm_model=deployment["litellm_params"][
+                        "model"
+                    ],
+                ),
             )
-            new_deployments.append(new_deployment)
+            for deployment in deployments
+        ]
 
-        return new_deployments
+    @staticmethod
+    def _copy_deployments(resolved_deployments: List[Tuple[Dict, str]]) -> List[Dict]:
+        """
+        Shallow copy of each deployment, with its own litellm_params and the resolved model name
+        """
+        return [
+            {
+                **deployment,
+                "litellm_params": {**deployment["litellm_params"], "model": model},
+            }
+            for deployment, model in resolved_deployments
+        ]
+
+    def _match(
+        self, request: str, filtered_model_names: Optional[List[str]]
+    ) -> PatternMatchCacheValue:
+        compiled_patterns = self._compile_patterns()
+        if filtered_model_names is None:
+            if self._combined_regex is None:
+                return None
+            combined_match = self._combined_regex.match(request)
+            if combined_match is None or combined_match.lastgroup is None:
+                return None
+            candidates = [compiled_patterns[int(combined_match.lastgroup[1:])]]
+        else:
+            regex_filtered_model_names = {
+                self._pattern_to_regex(m) for m in filtered_model_names
+            }
+            candidates = [
+                compiled_pattern
+                for compiled_pattern in compiled_patterns
+                if compiled_pattern[0] in regex_filtered_model_names
+            ]
+
+        for _, compiled_regex, llm_deployments in candidates:
+            pattern_match = compiled_regex.match(request)
+            if pattern_match:
+                return self._resolve_deployments(
+                    matched_pattern=pattern_match, deployments=llm_deployments
+                )
+        return None
 
     def route(
         self, request: Optional[str], filtered_model_names: Optional[List[str]] = None
@@ -135,23 +240,27 @@ class PatternMatchRouter:
             if request is None:
                 return None
 
-            sorted_patterns = PatternUtils.sorted_patterns(self.patterns)
-            regex_filtered_model_names = (
-                [self._pattern_to_regex(m) for m in filtered_model_names]
-                if filtered_model_names is not None
-                else []
+            cache_key: PatternMatchCacheKey = (
+                request,
+                (
+                    tuple(filtered_model_names)
+                    if filtered_model_names is not None
+                    else None
+                ),
             )
-            for pattern, llm_deployments in sorted_patterns:
-                if (
-                    filtered_model_names is not None
-                    and pattern not in regex_filtered_model_names
-                ):
-                    continue
-                pattern_match = re.match(pattern, request)
-                if pattern_match:
-                    return self._return_pattern_matched_deployments(
-                        matched_pattern=pattern_match, deployments=llm_deployments
-                    )
+            if cache_key in self.route_cache:
+                self.route_cache.move_to_end(cache_key)
+                resolved_deployments = self.route_cache[cache_key]
+            else:
+                resolved_deployments = self._match(
+                    request=request, filtered_model_names=filtered_model_names
+                )
+                self.route_cache[cache_key] = resolved_deployments
+                if len(self.route_cache) > self.max_cache_size:
+                    self.route_cache.popitem(last=False)
+
+            if resolved_deployments is not None:
+                return self._copy_deployments(resolved_deployments)
         except Exception as e:
             verbose_router_logger.debug(f"Error in PatternMatchRouter.route: {str(e)}")
 
@@ -1,16 +1,34 @@
+import asyncio
 import enum
 import heapq
-from typing import Optional
+import itertools
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set, Tuple
 
 from pydantic import BaseModel
 
 from litellm import print_verbose
-from litellm.caching.caching import DualCache, RedisCache
-from litellm.constants import DEFAULT_IN_MEMORY_TTL, DEFAULT_POLLING_INTERVAL
+from litellm._logging import verbose_router_logger
+from litellm.caching.caching import RedisCache
+from litellm.constants import (  # noqa: F401 - DEFAULT_POLLING_INTERVAL kept for backwards compatibility
+    DEFAULT_IN_MEMORY_TTL,
+    DEFAULT_POLLING_INTERVAL,
+    DEFAULT_SCHEDULER_PUBLISH_INTERVAL,
+    DEFAULT_SCHEDULER_REDIS_QUEUE_TTL,
+    DEFAULT_SCHEDULER_WAKEUP_INTERVAL,
+)
+from litellm.types.integrations.prometheus import LATENCY_BUCKETS
+from litellm.types.scheduler import SchedulerQueueMetrics
+
+# redis sorted set score = priority * multiplier + enqueue time - must stay above any unix timestamp, so priority always outranks enqueue time
+SCHEDULER_PRIORITY_SCORE_MULTIPLIER = 1e10
+# max times the redis queue is re-read after dropping stale requests, per read
+_MAX_STALE_REQUEST_SWEEPS = 3
 
 
 class SchedulerCacheKeys(enum.Enum):
     queue = "scheduler:queue"
+    events_channel = "scheduler:events"
     default_in_memory_ttl = (
         DEFAULT_IN_MEMORY_TTL  # cache queue in-memory for 5s when redis cache available
     )
@@ -23,7 +41,18 @@ class FlowItem(BaseModel):
 
 
 class Scheduler:
-    cache: DualCache
+    """
+    Priority scheduler for requests to a model group.
+
+    Event-driven - waiters in `wait_for_turn` sleep on a per-model-group asyncio.Condition
+    and are woken by `notify` (slot freed up on success/failure, cooldown ended),
+    instead of re-polling the queue every few ms.
+
+    If a redis cache is passed, the queue is a redis sorted set (shared across instances), and
+    `notify` is published over redis pub/sub, so waiters on other instances are woken too.
+    Events are only published while the model group has queued requests, at most once per
+    `DEFAULT_SCHEDULER_PUBLISH_INTERVAL` - events in between are batched.
+    """
 
     def __init__(
         self,
@@ -31,33 +60,47 @@ class Scheduler:
         redis_cache: Optional[RedisCache] = None,
     ):
         """
-        polling_interval: float or null - frequency of polling queue. Default is 3ms.
+        polling_interval: float or null - max time a waiter sleeps before re-checking the queue, if no event wakes it up. Default is 1s.
         """
-        self.queue: list = []
-        default_in_memory_ttl: Optional[float] = None
-        if redis_cache is not None:
-            # if redis-cache available frequently poll that instead of using in-memory.
-            default_in_memory_ttl = SchedulerCacheKeys.default_in_memory_ttl.value
-        self.cache = DualCache(
-            redis_cache=redis_cache, default_in_memory_ttl=default_in_memory_ttl
-        )
+        self.redis_cache = redis_cache
         self.polling_interval = (
-            polling_interval or DEFAULT_POLLING_INTERVAL
-        )  # default to 3ms
+            polling_interval or DEFAULT_SCHEDULER_WAKEUP_INTERVAL
+        )  # fallback wakeup interval, default to 1s
+
+        # local priority queue per model group - heap of (priority, sequence, request_id)
+        self._queues: Dict[str, List[Tuple[int, int, str]]] = {}
+        self._removed_request_ids: Set[str] = set()
+        self._sequence = itertools.count()
+        self._enqueued_at: Dict[str, float] = {}
+
+        # per model group wakeup state
+        self._conditions: Dict[str, asyncio.Condition] = {}
+        self._generations: Dict[str, int] = {}
+        self._pubsub_task: Optional[asyncio.Task] = None
+        self.publish_interval = DEFAULT_SCHEDULER_PUBLISH_INTERVAL
+        # model groups with a publish scheduled, and when each was last published
+        self._pending_publishes: Set[Optional[str]] = set()
+        self._last_published_at: Dict[Optional[str], float] = {}
+
+        # metrics
+        self.wait_time_buckets: Tuple[float, ...] = LATENCY_BUCKETS
+        self._wait_time_histograms: Dict[str, List[int]] = {}
+        self._wait_time_sums: Dict[str, float] = {}
 
     async def add_request(self, request: FlowItem):
         # We use the priority directly, as lower values indicate higher priority
-        # get the queue
-        queue = await self.get_queue(model_name=request.model_name)
-        # update the queue
-        heapq.heappush(queue, (request.priority, request.request_id))
+        queue = self._queues.setdefault(request.model_name, [])
+        heapq.heappush(
+            queue, (request.priority, next(self._sequence), request.request_id)
+        )
+        self._enqueued_at[request.request_id] = time.time()
 
-        # save the queue
-        await self.save_queue(queue=queue, model_name=request.model_name)
+        if self.redis_cache is not None:
+            await self._redis_add_request(request=request)
 
     async def poll(self, id: str, model_name: str, health_deployments: list) -> bool:
         """
-        Return if request can be processed.
+        Return if request can be processed. If True, the request is removed from the queue.
 
         Returns:
         - True:
@@ -67,10 +110,11 @@ class Scheduler:
             * If no healthy deployments available
             * AND request not at the top of queue
         """
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        if self._get_local_top(model_name=model_name) is None:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is invalid. Queue={}".format(
+                    await self.get_queue(model_name=model_name)
+                )
             )
 
         # ------------
@@ -79,58 +123,404 @@ class Scheduler:
 
         print_verbose(f"len(health_deployments): {len(health_deployments)}")
         if len(health_deployments) == 0:
-            print_verbose(f"queue: {queue}, seeking id={id}")
+            print_verbose(f"seeking id={id}")
             # Check if the id is at the top of the heap
-            if queue[0][1] == id:
-                # Remove the item from the queue
-                heapq.heappop(queue)
-                print_verbose(f"Popped id: {id}")
-                return True
-            else:
+            if await self._get_top_request_id(model_name=model_name) != id:
                 return False
 
+        await self.remove_request(id=id, model_name=model_name)
+        print_verbose(f"Popped id: {id}")
         return True
 
     async def peek(self, id: str, model_name: str, health_deployments: list) -> bool:
         """Return if the id is at the top of the queue. Don't pop the value from heap."""
-        queue = await self.get_queue(model_name=model_name)
-        if not queue:
+        if self._get_local_top(model_name=model_name) is None:
             raise Exception(
-                "Incorrectly setup. Queue is invalid. Queue={}".format(queue)
+                "Incorrectly setup. Queue is invalid. Queue={}".format(
+                    await self.get_queue(model_name=model_name)
+                )
             )
 
-        # ------------
-        # Setup values
-        # ------------
-
         # Check if the id is at the top of the heap
-        if queue[0][1] == id:
+        if await self._get_top_request_id(model_name=model_name) == id:
             return True
 
         return False
 
-    def get_queue_status(self):
-        """Get the status of items in the queue"""
-        return self.queue
+    async def remove_request(self, id: str, model_name: str) -> None:
+        """
+        Remove a request from the queue (admitted or timed out), and record how long it waited.
+        """
+        self._removed_request_ids.add(id)
+        self._get_local_top(model_name=model_name)  # drop removed items off the top
+
+        enqueued_at = self._enqueued_at.pop(id, None)
+        if enqueued_at is not None:
+            self._observe_wait_time(
+                model_name=model_name, wait_time=time.time() - enqueued_at
+            )
+
+        if self.redis_cache is not None:
+            await self._redis_remove_request(id=id, model_name=model_name)
+
+        # queue head changed - next request in line (on any instance) may be able to go
+        self.notify(model_name=model_name)
+
+    async def wait_for_turn(
+        self,
+        request: FlowItem,
+        get_healthy_deployments: Callable[[], Awaitable[list]],
+        timeout: float,
+    ) -> bool:
+        """
+        Wait until the request can be processed. Request must be added via `add_request` first.
+
+        Re-checks the queue only when woken up by `notify`, or every `polling_interval` as a fallback.
+
+        Returns:
+        - True: if request can be processed (request is removed from the queue)
+        - False: if timeout reached (request is removed from the queue)
+        """
+        self._ensure_pubsub_listener()
+        end_time = time.time() + timeout
+        condition = self._get_condition(model_name=request.model_name)
+        while True:
+            generation = self._generations.get(request.model_name, 0)
+            healthy_deployments = await get_healthy_deployments()
+            if await self.poll(
+                id=request.request_id,
+                model_name=request.model_name,
+                health_deployments=healthy_deployments,
+            ):
+                return True
+
+            remaining_time = end_time - time.time()
+            if remaining_time <= 0:
+                await self.remove_request(
+                    id=request.request_id, model_name=request.model_name
+                )
+                return False
+
+            async with condition:
+                try:
+                    await asyncio.wait_for(
+                        condition.wait_for(
+                            lambda: self._generations.get(request.model_name, 0)
+                            != generation
+                        ),
+                        timeout=min(remaining_time, self.polling_interval),
+                    )
+                except asyncio.TimeoutError:
+                    pass
+
+    def notify(self, model_name: Optional[str] = None, publish: bool = True) -> None:
+        """
+        Wake up waiters for a model group (or all model groups if model_name is None).
+
+        Call when a slot frees up - e.g. a request succeeded / failed, or a deployment's cooldown ended.
+        """
+        model_names = [model_name] if model_name is not None else list(self._queues)
+        for _model_name in model_names:
+            self._generations[_model_name] = self._generations.get(_model_name, 0) + 1
+            condition = self._conditions.get(_model_name)
+            if condition is not None:
+                self._schedule(self._notify_condition(condition=condition))
+
+        if publish and self.redis_cache is not None:
+            self._schedule_publish(model_name=model_name)
+
+    def notify_after(self, delay: float, model_name: Optional[str] = None) -> None:
+        """
+        Wake up waiters for a model group after `delay` seconds - e.g. when a deployment's cooldown ends.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        loop.call_later(delay, self.notify, model_name, False)
+
+    def get_queue_status(self) -> Dict[str, List[Tuple[int, str]]]:
+        """Get the requests waiting in this instance's queues, as a sorted list of (priority, request_id) per model group"""
+        return {
+            model_name: [
+                (priority, request_id)
+                for priority, _, request_id in sorted(queue)
+                if request_id not in self._removed_request_ids
+            ]
+            for model_name, queue in self._queues.items()
+        }
+
+    def get_queue_depth(self, model_name: str) -> int:
+        """Number of requests waiting in this instance's queue for a model group"""
+        queue = self._queues.get(model_name, [])
+        return sum(1 for item in queue if item[2] not in self._removed_request_ids)
+
+    def get_queue_metrics(self) -> Dict[str, SchedulerQueueMetrics]:
+        """
+        Queue depth + wait time histogram (cumulative counts per `wait_time_buckets` upper bound) per model group
+        """
+        model_names = set(self._queues) | set(self._wait_time_histograms)
+        return {
+            model_name: SchedulerQueueMetrics(
+                queue_depth=self.get_queue_depth(model_name=model_name),
+                wait_time_buckets=list(self.wait_time_buckets),
+                wait_time_bucket_counts=list(
+                    itertools.accumulate(
+                        self._wait_time_histograms.get(
+                            model_name, [0] * (len(self.wait_time_buckets) + 1)
+                        )
+                    )
+                ),
+                wait_time_sum=self._wait_time_sums.get(model_name, 0.0),
+            )
+            for model_name in model_names
+        }
 
     async def get_queue(self, model_name: str) -> list:
         """
-        Return a queue for that specific model group
+        Return a queue for that specific model group, as a sorted list of (priority, request_id)
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            response = await self.cache.async_get_cache(key=_cache_key)
-            if response is None or not isinstance(response, list):
-                return []
-            elif isinstance(response, list):
-                return response
-        return self.queue
+        if self.redis_cache is not None:
+            redis_queue = await self._redis_get_queue(model_name=model_name)
+            if redis_queue is not None:
+                return redis_queue
+        self._get_local_top(model_name=model_name)
+        return [
+            (priority, request_id)
+            for priority, _, request_id in sorted(self._queues.get(model_name, []))
+            if request_id not in self._removed_request_ids
+        ]
 
     async def save_queue(self, queue: list, model_name: str) -> None:
         """
-        Save the updated queue of the model group
+        Replace the queue of the model group with a list of (priority, request_id)
         """
-        if self.cache is not None:
-            _cache_key = "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
-            await self.cache.async_set_cache(key=_cache_key, value=queue)
+        self._queues[model_name] = [
+            (priority, next(self._sequence), request_id)
+            for priority, request_id in queue
+        ]
+        heapq.heapify(self._queues[model_name])
         return None
+
+    ### HELPERS ###
+
+    def _get_local_top(self, model_name: str) -> Optional[str]:
+        """
+        Return the request_id at the top of the local queue, lazily dropping removed requests
+        """
+        queue = self._queues.get(model_name)
+        while queue:
+            request_id = queue[0][2]
+            if request_id not in self._removed_request_ids:
+                return request_id
+            heapq.heappop(queue)
+            self._removed_request_ids.discard(request_id)
+        return None
+
+    async def _get_top_request_id(self, model_name: str) -> Optional[str]:
+        if self.redis_cache is not None:
+            redis_queue = await self._redis_get_queue(model_name=model_name, count=1)
+            if redis_queue:
+                return redis_queue[0][1]
+        return self._get_local_top(model_name=model_name)
+
+    def _get_condition(self, model_name: str) -> asyncio.Condition:
+        condition = self._conditions.get(model_name)
+        if condition is None:
+            condition = asyncio.Condition()
+            self._conditions[model_name] = condition
+        return condition
+
+    async def _notify_condition(self, condition: asyncio.Condition) -> None:
+        async with condition:
+            condition.notify_all()
+
+    def _schedule(self, coro: Awaitable[Any]) -> None:
+        try:
+            asyncio.get_running_loop().create_task(coro)  # type: ignore
+        except RuntimeError:
+            coro.close()  # type: ignore  # no running loop - nothing is waiting
+
+    def _observe_wait_time(self, model_name: str, wait_time: float) -> None:
+        histogram = self._wait_time_histograms.setdefault(
+            model_name, [0] * (len(self.wait_time_buckets) + 1)
+        )
+        bucket_idx = len(self.wait_time_buckets)  # +Inf bucket
+        for idx, bucket in enumerate(self.wait_time_buckets):
+            if wait_time <= bucket:
+                bucket_idx = idx
+                break
+        histogram[bucket_idx] += 1
+        self._wait_time_sums[model_name] = (
+            self._wait_time_sums.get(model_name, 0.0) + wait_time
+        )
+
+    ### REDIS - MULTI-INSTANCE ###
+
+    def _get_redis_queue_key(self, model_name: str) -> str:
+        return "{}:{}".format(SchedulerCacheKeys.queue.value, model_name)
+
+    async def _redis_add_request(self, request: FlowItem) -> None:
+        """
+        Add request to the shared sorted set. Score orders by priority, then by enqueue time (FIFO).
+        """
+        try:
+            redis_client: Any = self.redis_cache.init_async_client()  # type: ignore
+            score = request.priority * SCHEDULER_PRIORITY_SCORE_MULTIPLIER + time.time()
+            queue_key = self._get_redis_queue_key(model_name=request.model_name)
+            await redis_client.zadd(queue_key, {request.request_id: score})
+            await redis_client.expire(queue_key, DEFAULT_SCHEDULER_REDIS_QUEUE_TTL)
+        except Exception as e:
+            verbose_router_logger.debug(
+                "Scheduler: failed to add request to redis queue - {}".format(str(e))
+            )
+
+    async def _redis_remove_request(self, id: str, model_name: str) -> None:
+        try:
+            redis_client: Any = self.redis_cache.init_async_client()  # type: ignore
+            await redis_client.zrem(
+                self._get_redis_queue_key(model_name=model_name), id
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "Scheduler: failed to remove request from redis queue - {}".format(
+                    str(e)
+                )
+            )
+
+    async def _redis_get_queue(
+        self, model_name: str, count: Optional[int] = None
+    ) -> Optional[list]:
+        """
+        Returns the shared queue as a sorted list of (priority, request_id). None if redis is unavailable.
+
+        Requests queued more than `DEFAULT_SCHEDULER_REDIS_QUEUE_TTL` ago (e.g. left behind by a dead instance) are dropped from the queue first, so they can't block the head of it.
+        """
+        queue_key = self._get_redis_queue_key(model_name=model_name)
+        try:
+            redis_client: Any = self.redis_cache.init_async_client()  # type: ignore
+            for _ in range(_MAX_STALE_REQUEST_SWEEPS):
+                response = await redis_client.zrange(
+                    queue_key,
+                    0,
+                    -1 if count is None else count - 1,
+                    withscores=True,
+                )
+                stale_priorities = self._get_stale_priorities(response=response)
+                if not stale_priorities:
+                    break
+                await self._redis_remove_stale_requests(
+                    redis_client=redis_client,
+                    queue_key=queue_key,
+                    priorities=stale_priorities,
+                )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "Scheduler: failed to read redis queue - {}".format(str(e))
+            )
+            return None
+        queue = []
+        min_enqueued_at = time.time() - DEFAULT_SCHEDULER_REDIS_QUEUE_TTL
+        for request_id, score in response:
+            if score % SCHEDULER_PRIORITY_SCORE_MULTIPLIER < min_enqueued_at:
+                continue
+            if isinstance(request_id, bytes):
+                request_id = request_id.decode("utf-8")
+            queue.append(
+                (int(score // SCHEDULER_PRIORITY_SCORE_MULTIPLIER), request_id)
+            )
+        return queue
+
+    def _get_stale_priorities(self, response: list) -> Set[int]:
+        """Priorities of the requests in `response` queued more than `DEFAULT_SCHEDULER_REDIS_QUEUE_TTL` ago"""
+        min_enqueued_at = time.time() - DEFAULT_SCHEDULER_REDIS_QUEUE_TTL
+        return {
+            int(score // SCHEDULER_PRIORITY_SCORE_MULTIPLIER)
+            for _, score in response
+            if score % SCHEDULER_PRIORITY_SCORE_MULTIPLIER < min_enqueued_at
+        }
+
+    async def _redis_remove_stale_requests(
+        self, redis_client: Any, queue_key: str, priorities: Set[int]
+    ) -> None:
+        # score = priority * multiplier + enqueue time - stale requests of a priority are one score range
+        min_enqueued_at = time.time() - DEFAULT_SCHEDULER_REDIS_QUEUE_TTL
+        for priority in priorities:
+            await redis_client.zremrangebyscore(
+                queue_key,
+                priority * SCHEDULER_PRIORITY_SCORE_MULTIPLIER,
+                priority * SCHEDULER_PRIORITY_SCORE_MULTIPLIER + min_enqueued_at,
+            )
+
+    def _schedule_publish(self, model_name: Optional[str]) -> None:
+        """
+        Publish an event for the model group, at most once per `publish_interval` - a publish already scheduled covers this event too.
+        """
+        if model_name in self._pending_publishes:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return  # no running loop - nothing is waiting
+        self._pending_publishes.add(model_name)
+        delay = self._last_published_at.get(model_name, 0.0) + self.publish_interval
+        loop.call_later(max(delay - time.time(), 0.0), self._start_publish, model_name)
+
+    def _start_publish(self, model_name: Optional[str]) -> None:
+        self._schedule(self._redis_publish_event(model_name=model_name))
+
+    async def _redis_has_waiters(
+        self, redis_client: Any, model_name: Optional[str]
+    ) -> bool:
+        if model_name is None or self.get_queue_depth(model_name=model_name) > 0:
+            return True
+        return (
+            await redis_client.zcard(self._get_redis_queue_key(model_name=model_name))
+            > 0
+        )
+
+    async def _redis_publish_event(self, model_name: Optional[str]) -> None:
+        """Publish an event for the model group, if any instance has requests queued for it"""
+        # events from here on need another publish
+        self._pending_publishes.discard(model_name)
+        self._last_published_at[model_name] = time.time()
+        try:
+            redis_client: Any = self.redis_cache.init_async_client()  # type: ignore
+            if not await self._redis_has_waiters(
+                redis_client=redis_client, model_name=model_name
+            ):
+                return
+            await redis_client.publish(
+                SchedulerCacheKeys.events_channel.value, model_name or ""
+            )
+        except Exception as e:
+            verbose_router_logger.debug(
+                "Scheduler: failed to publish redis event - {}".format(str(e))
+            )
+
+    def _ensure_pubsub_listener(self) -> None:
+        if self.redis_cache is None:
+            return
+        if self._pubsub_task is not None and not self._pubsub_task.done():
+            return
+        self._pubsub_task = asyncio.create_task(self._redis_listen_for_events())
+
+    async def _redis_listen_for_events(self) -> None:
+        """
+        Wake up local waiters when another instance frees up a slot for a model group
+        """
+        try:
+            redis_client: Any = self.redis_cache.init_async_client()  # type: ignore
+            pubsub = redis_client.pubsub()
+            await pubsub.subscribe(SchedulerCacheKeys.events_channel.value)
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+                model_name = message.get("data")
+                if isinstance(model_name, bytes):
+                    model_name = model_name.decode("utf-8")
+                self.notify(model_name=model_name or None, publish=False)
+        except Exception as e:
+            verbose_router_logger.debug(
+                "Scheduler: redis pub/sub listener stopped - {}".format(str(e))
+            )
@@ -13,6 +13,7 @@ class LiteLLMCacheType(str, Enum):
     QDRANT_SEMANTIC = "qdrant-semantic"
     AZURE_BLOB = "azure-blob"
     GCS = "gcs"
+    LOCAL_SEMANTIC = "local-semantic"
 
 
 CachingSupportedCallTypes = Literal[
@@ -29,6 +30,29 @@ CachingSupportedCallTypes = Literal[
 ]
 
 
+class InMemoryCacheStats(TypedDict):
+    """
+    Counters tracked by InMemoryCache
+    """
+
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    size: int
+    max_size: int
+
+
+class RequestCoalescingStats(TypedDict):
+    """
+    Counters tracked by RequestCoalescer
+    """
+
+    in_flight_requests: int
+    upstream_requests: int
+    coalesced_requests: int
+
+
 class RedisPipelineIncrementOperation(TypedDict):
     """
     TypeDict for 1 Redis Pipeline Increment Operation
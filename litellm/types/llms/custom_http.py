@@ -1,6 +1,6 @@
 import ssl
 from enum import Enum
-from typing import Union
+from typing import TypedDict, Union
 
 
 class httpxSpecialProvider(str, Enum):
@@ -23,3 +23,15 @@ class httpxSpecialProvider(str, Enum):
 
 
 VerifyTypes = Union[str, bool, ssl.SSLContext]
+
+
+class HTTPClientPoolStats(TypedDict):
+    pooled_clients: int
+    open_clients: int  # incl. clients evicted from the pool, still held by a caller
+    open_connections: int
+    connections_opened: int  # new tcp/tls connections, across all clients
+    client_hits: int
+    client_misses: int
+    reuse_ratio: float
+    evictions: int
+    clients_closed: int
@@ -792,3 +792,15 @@ class PreRoutingHookResponse(BaseModel):
 
     model: str
     messages: Optional[List[Dict[str, str]]]
+
+
+class DeploymentLatencyStatsSnapshot(TypedDict):
+    """
+    Latency stats of a deployment, as shared across instances via redis (lowest latency routing)
+    """
+
+    latency: List[float]
+    time_to_first_token: List[float]
+    precise_minute: Optional[str]
+    tpm: int
+    rpm: int
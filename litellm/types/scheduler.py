@@ -1,7 +1,17 @@
 from enum import Enum
+from typing import List, TypedDict
 
 
 class DefaultPriorities(Enum):
     High = 0
     Medium = 128
     Low = 255
+
+
+class SchedulerQueueMetrics(TypedDict):
+    queue_depth: int
+    wait_time_buckets: List[float]  # upper bounds (seconds), last bucket is +Inf
+    wait_time_bucket_counts: List[
+        int
+    ]  # cumulative counts, len = len(wait_time_buckets) + 1
+    wait_time_sum: float
@@ -26,6 +26,8 @@ class ServiceTypes(str, enum.Enum):
     AUTH = "auth"
     PROXY_PRE_CALL = "proxy_pre_call"
     POD_LOCK_MANAGER = "pod_lock_manager"
+    IN_MEMORY_CACHE = "in_memory_cache"
+    REQUEST_COALESCING = "request_coalescing"
 
     """
     Operational metrics for DB Transaction Queues
@@ -38,6 +40,10 @@ class ServiceTypes(str, enum.Enum):
     # spend update queue - current spend of key, user, team
     IN_MEMORY_SPEND_UPDATE_QUEUE = "in_memory_spend_update_queue"
     REDIS_SPEND_UPDATE_QUEUE = "redis_spend_update_queue"
+    # spend update commits - latency + rows committed per table
+    SPEND_UPDATE_COMMIT = "spend_update_commit"
+    # spend log journal - spend logs waiting to be written to the db
+    SPEND_LOG_JOURNAL = "spend_log_journal"
 
 
 class ServiceConfig(TypedDict):
@@ -79,6 +85,10 @@ DEFAULT_SERVICE_CONFIGS = {
     ServiceTypes.PROXY_PRE_CALL.value: {
         "metrics": [ServiceMetrics.COUNTER, ServiceMetrics.HISTOGRAM]
     },
+    ServiceTypes.IN_MEMORY_CACHE.value: {"metrics": [ServiceMetrics.GAUGE]},
+    ServiceTypes.REQUEST_COALESCING.value: {
+        "metrics": [ServiceMetrics.COUNTER, ServiceMetrics.HISTOGRAM]
+    },
     # Operational metrics for DB Transaction Queues
     ServiceTypes.POD_LOCK_MANAGER.value: {"metrics": [ServiceMetrics.GAUGE]},
     ServiceTypes.IN_MEMORY_DAILY_SPEND_UPDATE_QUEUE.value: {
@@ -91,6 +101,14 @@ DEFAULT_SERVICE_CONFIGS = {
         "metrics": [ServiceMetrics.GAUGE]
     },
     ServiceTypes.REDIS_SPEND_UPDATE_QUEUE.value: {"metrics": [ServiceMetrics.GAUGE]},
+    ServiceTypes.SPEND_UPDATE_COMMIT.value: {
+        "metrics": [
+            ServiceMetrics.COUNTER,
+            ServiceMetrics.HISTOGRAM,
+            ServiceMetrics.GAUGE,
+        ]
+    },
+    ServiceTypes.SPEND_LOG_JOURNAL.value: {"metrics": [ServiceMetrics.GAUGE]},
 }
 
 
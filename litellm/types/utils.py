@@ -2549,6 +2549,18 @@ class CallbacksByType(TypedDict):
     success_and_failure: List[str]
 
 
+class LoggingDispatcherStats(TypedDict):
+    """
+    Per-callback counters tracked by LoggingDispatcher
+    """
+
+    queued: int
+    processed: int
+    dropped: int
+    errors: int
+    lag_seconds: float  # time the last processed event spent queued
+
+
 CostResponseTypes = Union[
     ModelResponse,
     TextCompletionResponse,
@@ -0,0 +1,91 @@
+"""
+Microbenchmark - cost of hashing the cache key params of a long chat request
+
+Cache.get_cache_key feeds each param into a streaming SHA-256 hash as canonical JSON (CacheKeyHasher),
+instead of hashing one large `str()` of every param. With orjson installed this should be faster than
+the `str()` key it replaced.
+
+Run with: pytest tests/load_tests/test_cache_key_benchmark.py -s
+"""
+
+import hashlib
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.caching import cache_key_hasher
+from litellm.caching.cache_key_hasher import CacheKeyHasher
+
+
+def _build_request_params() -> dict:
+    messages = [
+        {
+            "role": "user" if i % 2 == 0 else "assistant",
+            "content": f"This is message number {i} with some moderately long text content. "
+            * 4,
+        }
+        for i in range(100)
+    ]
+    tools = [
+        {
+            "type": "function",
+            "function": {
+                "name": f"tool_{i}",
+                "description": "does a thing " * 5,
+                "parameters": {
+                    "type": "object",
+                    "properties": {
+                        "a": {"type": "string"},
+                        "b": {"type": "integer", "minimum": 0},
+                    },
+                    "required": ["a"],
+                },
+            },
+        }
+        for i in range(10)
+    ]
+    return {"messages": messages, "model": "gpt-4o", "temperature": 0.7, "tools": tools}
+
+
+def _str_cache_key(params: dict) -> str:
+    """the previous key - `str()` of every param, hashed in one go"""
+    cache_key = ""
+    for param, param_value in params.items():
+        cache_key += f"{str(param)}: {str(param_value)}"
+    return hashlib.sha256(cache_key.encode()).hexdigest()
+
+
+def _hasher_cache_key(params: dict) -> str:
+    hasher = CacheKeyHasher()
+    for param, param_value in sorted(params.items(), key=lambda p: p[0]):
+        hasher.update(param, param_value)
+    return hasher.hexdigest()
+
+
+def _time_cache_key(get_cache_key, params: dict, num_iterations: int = 1000) -> float:
+    """Returns best avg. time (in microseconds) of `get_cache_key(params)` over 5 runs"""
+    for _ in range(50):
+        get_cache_key(params)
+    best = float("inf")
+    for _ in range(5):
+        start_time = time.perf_counter()
+        for _ in range(num_iterations):
+            get_cache_key(params)
+        best = min(best, (time.perf_counter() - start_time) / num_iterations * 1e6)
+    return best
+
+
+@pytest.mark.skipif(cache_key_hasher.orjson is None, reason="needs orjson")
+def test_cache_key_hashing_cost_vs_str_key():
+    params = _build_request_params()
+
+    str_key_us = _time_cache_key(_str_cache_key, params)
+    hasher_key_us = _time_cache_key(_hasher_cache_key, params)
+    print(f"str() key: {str_key_us:.1f} us / key")
+    print(f"CacheKeyHasher: {hasher_key_us:.1f} us / key")
+
+    assert hasher_key_us < str_key_us
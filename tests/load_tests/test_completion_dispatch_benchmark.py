@@ -0,0 +1,131 @@
+"""
+Microbenchmark - per-call SDK overhead of `litellm.completion` across providers
+
+Requests go to an in-process mock transport, so the time measured is litellm's own work per call - resolving the provider
+(`get_llm_provider`), picking its config / handler (`provider_registry`), transforming the request and response, and logging.
+
+Run with: pytest tests/load_tests/test_completion_dispatch_benchmark.py -s
+"""
+
+import json
+import os
+import sys
+import time
+
+import httpx
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
+from litellm.types.utils import LlmProviders
+from litellm.utils import ProviderConfigManager
+
+OPENAI_RESPONSE = {
+    "id": "chatcmpl-123",
+    "object": "chat.completion",
+    "created": 1700000000,
+    "model": "gpt-4o",
+    "choices": [
+        {
+            "index": 0,
+            "message": {"role": "assistant", "content": "Hello!"},
+            "finish_reason": "stop",
+        }
+    ],
+    "usage": {"prompt_tokens": 10, "completion_tokens": 2, "total_tokens": 12},
+    "service_tier": "default",
+}
+
+ANTHROPIC_RESPONSE = {
+    "id": "msg_123",
+    "type": "message",
+    "role": "assistant",
+    "model": "claude-3-5-sonnet-20240620",
+    "content": [{"type": "text", "text": "Hello!"}],
+    "stop_reason": "end_turn",
+    "stop_sequence": None,
+    "usage": {"input_tokens": 10, "output_tokens": 2},
+}
+
+
+def _mock_transport(response_body: dict) -> httpx.MockTransport:
+    content = json.dumps(response_body).encode()
+    return httpx.MockTransport(
+        lambda request: httpx.Response(
+            200, content=content, headers={"content-type": "application/json"}
+        )
+    )
+
+
+def _get_client(model: str):
+    if model.startswith("anthropic/"):
+        transport = _mock_transport(ANTHROPIC_RESPONSE)
+    else:
+        transport = _mock_transport(OPENAI_RESPONSE)
+    if model.startswith("openai/"):
+        from openai import OpenAI
+
+        return OpenAI(api_key="fake-key", http_client=httpx.Client(transport=transport))
+    return HTTPHandler(client=httpx.Client(transport=transport))
+
+
+def _time_completion(model: str, num_iterations: int = 200) -> float:
+    """Returns avg. time (in microseconds) of a `litellm.completion` call"""
+    client = _get_client(model)
+    messages = [{"role": "user", "content": "Hey, how's it going?"}]
+
+    def _call():
+        response = litellm.completion(
+            model=model, messages=messages, api_key="fake-key", client=client
+        )
+        assert response.choices[0].message.content == "Hello!"
+
+    for _ in range(10):  # warm up - lazy imports, config construction
+        _call()
+    start_time = time.perf_counter()
+    for _ in range(num_iterations):
+        _call()
+    return (time.perf_counter() - start_time) / num_iterations * 1e6
+
+
+def test_completion_per_call_overhead_across_providers():
+    results = {}
+    for model in [
+        "openai/gpt-4o",
+        "xai/grok-2",
+        "deepseek/deepseek-chat",
+        "groq/llama3-8b-8192",
+        "anthropic/claude-3-5-sonnet-20240620",
+    ]:
+        results[model] = _time_completion(model=model)
+        print(f"{model}: {results[model]:.0f} us / call")
+
+    # end-to-end timings include background logging - too noisy to compare providers on, see the dispatch benchmark below
+    assert all(result > 0 for result in results.values())
+
+
+def _time_dispatch(model: str, num_iterations: int = 2000) -> float:
+    """Returns min. avg. time (in microseconds) over 5 runs of resolving a model's provider + chat config"""
+    timings = []
+    for _ in range(5):
+        start_time = time.perf_counter()
+        for _ in range(num_iterations):
+            _, custom_llm_provider, _, _ = litellm.get_llm_provider(model=model)
+            ProviderConfigManager.get_provider_chat_config(
+                model=model, provider=LlmProviders(custom_llm_provider)
+            )
+        timings.append((time.perf_counter() - start_time) / num_iterations * 1e6)
+    return min(timings)
+
+
+def test_provider_dispatch_cost_vs_provider_position():
+    # first (after openai) / last providers of the old `if provider == ...` chain in get_provider_chat_config
+    results = {
+        model: _time_dispatch(model=model)
+        for model in ["deepseek/deepseek-chat", "hyperbolic/deepseek-v3", "gpt-4o"]
+    }
+    for model, result in results.items():
+        print(f"{model}: {result:.2f} us / dispatch")
+
+    assert results["hyperbolic/deepseek-v3"] < results["deepseek/deepseek-chat"] * 2
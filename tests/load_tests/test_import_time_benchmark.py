@@ -0,0 +1,72 @@
+"""
+Benchmark - cold `import litellm` latency and peak RSS
+
+Provider configs are imported on first access (see `litellm/_lazy_imports.py`), so `import litellm` shouldn't import
+every provider's transformation module.
+
+Run with: pytest tests/load_tests/test_import_time_benchmark.py -s
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+_IMPORT_SCRIPT = """
+import json, resource, sys, time
+
+start_time = time.perf_counter()
+import litellm
+
+import_time = time.perf_counter() - start_time
+
+from litellm._lazy_imports import LAZY_PROVIDER_CONFIGS
+
+provider_config_modules = {module for module, _ in LAZY_PROVIDER_CONFIGS.values()}
+print(
+    json.dumps(
+        {
+            "import_time": import_time,
+            "max_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "num_modules": len(sys.modules),
+            "provider_config_modules": len(provider_config_modules),
+            "provider_config_modules_imported": len(
+                provider_config_modules & set(sys.modules)
+            ),
+        }
+    )
+)
+"""
+
+
+def _cold_import() -> dict:
+    """Import litellm in a fresh interpreter, so nothing is already in sys.modules"""
+    result = subprocess.run(
+        [sys.executable, "-c", _IMPORT_SCRIPT],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "LITELLM_LOCAL_MODEL_COST_MAP": "True"},
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def test_cold_import_latency_and_rss():
+    runs = [_cold_import() for _ in range(5)]
+    import_times = [run["import_time"] for run in runs]
+    print(
+        f"import litellm: median={statistics.median(import_times) * 1000:.0f}ms "
+        f"min={min(import_times) * 1000:.0f}ms "
+        f"max_rss={max(run['max_rss_mb'] for run in runs):.0f}MB "
+        f"modules={runs[0]['num_modules']} "
+        f"provider config modules imported={runs[0]['provider_config_modules_imported']}/{runs[0]['provider_config_modules']}"
+    )
+
+    # provider configs only used by `litellm.main` handlers are imported - the rest load on first access
+    assert (
+        runs[0]["provider_config_modules_imported"]
+        < runs[0]["provider_config_modules"] / 2
+    )
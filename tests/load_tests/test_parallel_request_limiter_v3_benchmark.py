@@ -0,0 +1,59 @@
+"""
+Microbenchmark - overhead of the v3 rate limiter pre-call hook vs. number of rate limited keys
+
+Rate limit state is kept in-process (one counter per key, updated synchronously), so the per-request
+overhead should stay ~flat as the number of keys grows.
+
+Run with: pytest tests/load_tests/test_parallel_request_limiter_v3_benchmark.py -s
+"""
+
+import asyncio
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from litellm.caching.caching import DualCache
+from litellm.proxy._types import UserAPIKeyAuth
+from litellm.proxy.hooks.parallel_request_limiter_v3 import (
+    _PROXY_MaxParallelRequestsHandler_v3,
+)
+from litellm.proxy.utils import InternalUsageCache
+
+
+async def _time_pre_call_hook(num_keys: int, num_iterations: int = 20000) -> float:
+    """Returns avg. time (in microseconds) of async_pre_call_hook, round-robin over `num_keys` api keys"""
+    handler = _PROXY_MaxParallelRequestsHandler_v3(
+        internal_usage_cache=InternalUsageCache(DualCache())
+    )
+    local_cache = DualCache()
+    user_api_key_dicts = [
+        UserAPIKeyAuth(
+            api_key=f"sk-key-{i}",
+            user_id=f"user-{i}",
+            rpm_limit=1_000_000,
+            tpm_limit=1_000_000,
+            user_rpm_limit=1_000_000,
+        )
+        for i in range(num_keys)
+    ]
+
+    start_time = time.perf_counter()
+    for i in range(num_iterations):
+        await handler.async_pre_call_hook(
+            user_api_key_dict=user_api_key_dicts[i % num_keys],
+            cache=local_cache,
+            data={},
+            call_type="",
+        )
+    return (time.perf_counter() - start_time) / num_iterations * 1e6
+
+
+def test_rate_limiter_pre_call_hook_overhead_vs_key_count():
+    results = {}
+    for num_keys in [100, 10_000]:
+        results[num_keys] = asyncio.run(_time_pre_call_hook(num_keys=num_keys))
+        print(f"keys={num_keys}: {results[num_keys]:.2f} us / pre-call hook")
+
+    assert results[10_000] < results[100] * 3
@@ -0,0 +1,50 @@
+"""
+Microbenchmark - cost of deployment selection vs. number of deployments on the router
+
+Deployment lookups (get_deployment, get_model_ids, _get_all_deployments) use indexes maintained by the router,
+so selection cost should stay ~flat as the model list grows.
+
+Run with: pytest tests/load_tests/test_router_deployment_lookup_benchmark.py -s
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+import litellm
+
+
+def _build_router(num_deployments: int) -> litellm.Router:
+    model_list = [
+        {
+            "model_name": f"model-group-{i // 5}",
+            "litellm_params": {"model": f"openai/gpt-4o-{i}", "api_key": "fake-key"},
+            "model_info": {"id": f"deployment-{i}"},
+        }
+        for i in range(num_deployments)
+    ]
+    return litellm.Router(model_list=model_list)
+
+
+def _time_selection(router: litellm.Router, num_iterations: int = 2000) -> float:
+    """Returns avg. time (in microseconds) of the per-request lookups in _common_checks_available_deployment"""
+    start_time = time.perf_counter()
+    for i in range(num_iterations):
+        router._common_checks_available_deployment(model=f"model-group-{i % 20}")
+        router.get_deployment(model_id=f"deployment-{i % 100}")
+    return (time.perf_counter() - start_time) / num_iterations * 1e6
+
+
+def test_router_deployment_selection_cost_vs_deployment_count():
+    results = {}
+    for num_deployments in [100, 1000, 2000]:
+        router = _build_router(num_deployments=num_deployments)
+        results[num_deployments] = _time_selection(router=router)
+        print(
+            f"deployments={num_deployments}: {results[num_deployments]:.2f} us / selection"
+        )
+
+    # 5 deployments per model group - total deployments grow 20x, selection cost should stay ~flat
+    assert results[2000] < results[100] * 5
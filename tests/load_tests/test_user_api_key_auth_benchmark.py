@@ -0,0 +1,107 @@
+"""
+Benchmark - virtual key auth latency (p50 / p99) with 100k active keys
+
+Compares `user_api_key_auth` with the auth result cache (`litellm/proxy/auth/auth_result_cache.py`) disabled and enabled.
+Both runs start warm - every key (and its user) is already in `user_api_key_cache`, so neither run hits the db.
+
+Run with: pytest tests/load_tests/test_user_api_key_auth_benchmark.py -s
+"""
+
+import asyncio
+import os
+import random
+import statistics
+import sys
+import time
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(0, os.path.abspath("../.."))
+
+from fastapi import Request
+from starlette.datastructures import URL
+
+import litellm.proxy.proxy_server as proxy_server
+from litellm.caching.dual_cache import DualCache
+from litellm.caching.in_memory_cache import InMemoryCache
+from litellm.proxy._types import LiteLLM_UserTable, UserAPIKeyAuth, hash_token
+from litellm.proxy.auth.auth_result_cache import auth_result_cache
+from litellm.proxy.auth.user_api_key_auth import user_api_key_auth
+
+NUM_KEYS = 100_000
+NUM_USERS = 1_000
+NUM_REQUESTS = 5_000
+
+
+def _key(i: int) -> str:
+    return f"sk-benchmark-{i}"
+
+
+def _build_user_api_key_cache() -> DualCache:
+    cache = DualCache(
+        in_memory_cache=InMemoryCache(max_size_in_memory=NUM_KEYS + NUM_USERS)
+    )
+    for i in range(NUM_USERS):
+        cache.set_cache(
+            key=f"user-{i}",
+            value=LiteLLM_UserTable(user_id=f"user-{i}", spend=0.0).model_dump(),
+        )
+    for i in range(NUM_KEYS):
+        cache.set_cache(
+            key=hash_token(_key(i)),
+            value=UserAPIKeyAuth(
+                token=hash_token(_key(i)),
+                user_id=f"user-{i % NUM_USERS}",
+                models=["gpt-4o"],
+                spend=1.0,
+                max_budget=100.0,
+            ),
+        )
+    return cache
+
+
+def _build_request() -> Request:
+    request = Request(scope={"type": "http", "method": "POST", "headers": []})
+    request._url = URL(url="/chat/completions")
+    return request
+
+
+async def _auth_latencies(key_indexes: list) -> list:
+    latencies = []
+    for i in key_indexes:
+        start_time = time.perf_counter()
+        await user_api_key_auth(request=_build_request(), api_key=f"Bearer {_key(i)}")
+        latencies.append(time.perf_counter() - start_time)
+    return latencies
+
+
+def _percentile(latencies: list, percentile: float) -> float:
+    return sorted(latencies)[int(len(latencies) * percentile)] * 1e6
+
+
+def test_user_api_key_auth_latency_with_100k_keys(monkeypatch):
+    monkeypatch.setattr(proxy_server, "user_api_key_cache", _build_user_api_key_cache())
+    monkeypatch.setattr(proxy_server, "master_key", "sk-master-key")
+    monkeypatch.setattr(proxy_server, "prisma_client", MagicMock())
+    key_indexes = [random.randrange(NUM_KEYS) for _ in range(NUM_REQUESTS)]
+
+    monkeypatch.setattr(auth_result_cache, "ttl", 3600)
+    results = {}
+    with patch(
+        "litellm.proxy.auth.user_api_key_auth._read_request_body",
+        return_value={"model": "gpt-4o"},
+    ):
+        for max_size in [0, NUM_KEYS]:
+            monkeypatch.setattr(auth_result_cache, "max_size", max_size)
+            auth_result_cache.clear()
+            if max_size > 0:
+                # every key authenticates once before the measured run
+                asyncio.run(_auth_latencies(range(NUM_KEYS)))
+            latencies = asyncio.run(_auth_latencies(key_indexes))
+            results[max_size] = latencies
+            print(
+                f"auth result cache max_size={max_size}: "
+                f"p50={statistics.median(latencies) * 1e6:.0f} us, "
+                f"p99={_percentile(latencies, 0.99):.0f} us"
+            )
+
+    assert _percentile(results[NUM_KEYS], 0.99) < _percentile(results[0], 0.99)
@@ -148,7 +148,7 @@ def test_latency_updated():
     latency_key = f"{model_group}_map"
     assert (
         end_time - start_time
-        == test_cache.get_cache(key=latency_key)[deployment_id]["latency"][0]
+        == test_cache.get_cache(key=latency_key)[deployment_id].latency.samples[0]
     )
 
 
@@ -131,13 +131,6 @@ def test_get_cache_key_text_completion():
     assert cache_key_2 == cache_key_3
 
 
-def test_get_hashed_cache_key():
-    cache = Cache()
-    cache_key = "model:gpt-3.5-turbo,messages:Hello world"
-    hashed_key = Cache._get_hashed_cache_key(cache_key)
-    assert len(hashed_key) == 64  # SHA-256 produces a 64-character hex string
-
-
 def test_add_namespace_to_cache_key():
     cache = Cache(namespace="test_namespace")
     hashed_key = "abcdef1234567890"
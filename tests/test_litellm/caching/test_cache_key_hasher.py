@@ -0,0 +1,90 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.caching import cache_key_hasher
+from litellm.caching.cache_key_hasher import (
+    CacheKeyHasher,
+    _encode_value,
+    get_message_prefix_hashes,
+)
+from litellm.caching.caching import Cache
+
+
+def _hash(*params) -> str:
+    hasher = CacheKeyHasher()
+    for param, value in params:
+        hasher.update(param, value)
+    return hasher.hexdigest()
+
+
+def test_cache_key_hasher_separates_params():
+    assert _hash(("a", "bc")) != _hash(("ab", "c"))
+    assert _hash(("a", "b"), ("c", "d")) != _hash(("a", "b: c"), ("", "d"))
+    assert _hash(("temperature", 1)) != _hash(("temperature", "1"))
+    assert len(_hash(("model", "gpt-4o"))) == 64
+
+
+def test_cache_key_hasher_ignores_dict_key_order():
+    assert _hash(("messages", [{"role": "user", "content": "hi"}])) == _hash(
+        ("messages", [{"content": "hi", "role": "user"}])
+    )
+
+
+def test_get_cache_key_ignores_kwarg_order():
+    cache = Cache()
+    messages = [{"role": "user", "content": "hi"}]
+    key_1 = cache.get_cache_key(model="gpt-4o", messages=messages, temperature=0.2)
+    key_2 = cache.get_cache_key(temperature=0.2, messages=messages, model="gpt-4o")
+    key_3 = cache.get_cache_key(model="gpt-4o", messages=messages, temperature=0.3)
+    assert key_1 == key_2
+    assert key_1 != key_3
+
+
+def test_encode_value_is_canonical_json():
+    assert _encode_value({"b": [1, 2.5, None], "a": "é"}) == (
+        '{"a":"é","b":[1,2.5,null]}'.encode("utf-8")
+    )
+    assert _encode_value(2**70) == b"1180591620717411303424"
+    # not JSON serializable -> str()
+    assert _encode_value({1, 2}) == b'"{1, 2}"'
+    assert _encode_value({1: "a", "b": 2}) == str({1: "a", "b": 2}).encode()
+
+
+@pytest.mark.skipif(cache_key_hasher.orjson is None, reason="needs orjson")
+@pytest.mark.parametrize(
+    "value",
+    [
+        [{"role": "user", "content": "héllo \u2028 \U0001F600 \x01"}],
+        {"temperature": 0.7, "top_p": 1.0, "n": 2, "stop": None, "stream": False},
+        [1e-05, 1e16, 1e-4, 123456.789, -0.0, float("nan"), float("inf")],
+        {"b": (1, 2), "a": {"é": [True, 2**63, 2**70]}},
+        ["lone \ud800 surrogate"],
+    ],
+)
+def test_encode_value_same_with_and_without_orjson(value, monkeypatch):
+    """workers with and without orjson installed must compute the same keys"""
+    with_orjson = _encode_value(value)
+    monkeypatch.setattr(cache_key_hasher, "orjson", None)
+    assert _encode_value(value) == with_orjson
+
+
+def test_get_message_prefix_hashes():
+    messages = [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": "hi"},
+        {"role": "assistant", "content": "hello"},
+    ]
+    prefix_hashes = get_message_prefix_hashes(messages)
+
+    assert len(prefix_hashes) == 3 and len(set(prefix_hashes)) == 3
+    assert get_message_prefix_hashes(messages[:2]) == prefix_hashes[:2]
+    assert (
+        get_message_prefix_hashes(messages[:2] + [{"role": "user", "content": "?"}])[:2]
+        == prefix_hashes[:2]
+    )
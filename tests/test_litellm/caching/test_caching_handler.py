@@ -52,3 +52,30 @@ async def test_process_async_embedding_cached_response():
 
     print(f"response: {response}")
     assert len(response.data) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_log_cache_hit_on_callbacks_uses_logging_dispatcher():
+    llm_caching_handler = LLMCachingHandler(
+        original_function=MagicMock(),
+        request_kwargs={},
+        start_time=datetime.now(),
+    )
+    mock_logging_obj = MagicMock()
+    mock_logging_obj.async_success_handler = AsyncMock()
+    start_time, end_time = datetime.now(), datetime.now()
+
+    with patch(
+        "litellm.caching.caching_handler.logging_dispatcher.submit"
+    ) as mock_submit:
+        llm_caching_handler._async_log_cache_hit_on_callbacks(
+            logging_obj=mock_logging_obj,
+            cached_result="cached",
+            start_time=start_time,
+            end_time=end_time,
+            cache_hit=True,
+        )
+
+    mock_submit.assert_called_once_with(
+        mock_logging_obj.success_handler, "cached", start_time, end_time, True
+    )
@@ -88,3 +88,123 @@ def test_in_memory_cache_ttl_allow_override():
     new_ttl_time = in_memory_cache.ttl_dict["new-fake-key"]
     assert new_ttl_time is not None
     assert new_ttl_time != initial_ttl_time
+
+
+def test_in_memory_cache_hard_size_bound_lru_eviction():
+    """
+    Check that
+    - cache never grows past max_size_in_memory, even when nothing is expired
+    - the least recently used key is evicted first
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=3, default_ttl=600)
+
+    for i in range(3):
+        in_memory_cache.set_cache(key=f"key-{i}", value=i)
+
+    # touch key-0 -> key-1 becomes least recently used
+    assert in_memory_cache.get_cache(key="key-0") == 0
+
+    in_memory_cache.set_cache(key="key-3", value=3)
+
+    assert len(in_memory_cache.cache_dict) == 3
+    assert in_memory_cache.get_cache(key="key-1") is None
+    assert in_memory_cache.get_cache(key="key-0") == 0
+    assert in_memory_cache.get_cache(key="key-3") == 3
+    assert in_memory_cache.get_cache_stats()["evictions"] == 1
+
+
+def test_in_memory_cache_evicts_expired_keys_before_lru():
+    """
+    When the cache is full, expired keys are removed before any live key is evicted
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=2, default_ttl=600)
+    in_memory_cache.set_cache(key="live-key", value="live")
+    in_memory_cache.set_cache(key="expired-key", value="expired", ttl=1)
+    in_memory_cache.ttl_dict["expired-key"] = time.time() - 1
+    in_memory_cache.expiration_heap = [
+        (in_memory_cache.ttl_dict["expired-key"], "expired-key")
+    ]
+
+    in_memory_cache.set_cache(key="new-key", value="new")
+
+    assert in_memory_cache.get_cache(key="live-key") == "live"
+    assert in_memory_cache.get_cache(key="new-key") == "new"
+    assert "expired-key" not in in_memory_cache.cache_dict
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["evictions"] == 0
+    assert stats["expirations"] == 1
+
+
+def test_in_memory_cache_namespace_budget():
+    """
+    Keys matching a namespace prefix are bounded by the namespace budget, without evicting other keys
+    """
+    in_memory_cache = InMemoryCache(
+        max_size_in_memory=100, namespace_max_size_in_memory={"rpm:": 2}
+    )
+    in_memory_cache.set_cache(key="other-key", value=1)
+    for i in range(5):
+        in_memory_cache.set_cache(key=f"rpm:{i}", value=i)
+
+    assert in_memory_cache.get_cache(key="other-key") == 1
+    assert len(in_memory_cache.namespace_keys["rpm:"]) == 2
+    assert [k for k in in_memory_cache.cache_dict if k.startswith("rpm:")] == [
+        "rpm:3",
+        "rpm:4",
+    ]
+
+    in_memory_cache.delete_cache(key="rpm:3")
+    assert list(in_memory_cache.namespace_keys["rpm:"]) == ["rpm:4"]
+
+
+def test_in_memory_cache_hit_miss_counters():
+    in_memory_cache = InMemoryCache()
+    in_memory_cache.set_cache(key="my-key", value="my-value")
+
+    in_memory_cache.get_cache(key="my-key")
+    in_memory_cache.get_cache(key="my-key")
+    in_memory_cache.get_cache(key="missing-key")
+
+    stats = in_memory_cache.get_cache_stats()
+    assert stats["hits"] == 2
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_in_memory_cache_expiration_heap_is_compacted():
+    """
+    Stale heap entries left behind by deleted keys should not grow the heap without bound
+    """
+    in_memory_cache = InMemoryCache(max_size_in_memory=10)
+    for i in range(1000):
+        in_memory_cache.set_cache(key=f"key-{i}", value=i)
+        in_memory_cache.delete_cache(key=f"key-{i}")
+
+    assert len(in_memory_cache.expiration_heap) <= 2 * 64 + 1
+
+
+@pytest.mark.asyncio
+async def test_in_memory_cache_emit_cache_stats():
+    from litellm.types.services import ServiceTypes
+
+    in_memory_cache = InMemoryCache()
+    in_memory_cache.set_cache(key="my-key", value="my-value")
+    in_memory_cache.get_cache(key="my-key")
+
+    service_logger_obj = MagicMock()
+    service_logger_obj.async_service_success_hook = AsyncMock()
+
+    await in_memory_cache.async_emit_cache_stats(
+        service_logger_obj=service_logger_obj, cache_name="test_cache"
+    )
+
+    calls = service_logger_obj.async_service_success_hook.call_args_list
+    emitted = {
+        call.kwargs["event_metadata"]["gauge_labels"]: call.kwargs["event_metadata"][
+            "gauge_value"
+        ]
+        for call in calls
+    }
+    assert calls[0].kwargs["service"] == ServiceTypes.IN_MEMORY_CACHE
+    assert emitted["test_cache_hits"] == 1
+    assert emitted["test_cache_size"] == 1
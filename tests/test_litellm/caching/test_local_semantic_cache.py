@@ -0,0 +1,179 @@
+import asyncio
+import os
+import sys
+import zlib
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+pytest.importorskip("numpy")
+
+import litellm
+from litellm.caching.local_semantic_cache import LocalSemanticCache, _VectorIndex
+
+
+def _embed(text: str):
+    """bag-of-words embedding - prompts sharing most words are similar"""
+    vector = [0.0] * 64
+    for word in text.lower().split():
+        vector[zlib.crc32(word.encode()) % 64] += 1.0
+    return vector
+
+
+@pytest.fixture
+def embedding_calls(monkeypatch):
+    calls = []
+
+    def _response(input):
+        inputs = [input] if isinstance(input, str) else input
+        calls.append(inputs)
+        return {
+            "data": [
+                {"index": i, "embedding": _embed(text)} for i, text in enumerate(inputs)
+            ]
+        }
+
+    def mock_embedding(model, input, **kwargs):
+        return _response(input)
+
+    async def mock_aembedding(model, input, **kwargs):
+        return _response(input)
+
+    monkeypatch.setattr(litellm, "embedding", mock_embedding)
+    monkeypatch.setattr(litellm, "aembedding", mock_aembedding)
+    return calls
+
+
+def _messages(text: str):
+    return [{"role": "user", "content": text}]
+
+
+def test_local_semantic_cache_requires_threshold():
+    with pytest.raises(ValueError):
+        LocalSemanticCache()
+
+
+def test_local_semantic_cache_hits(embedding_calls):
+    cache = LocalSemanticCache(similarity_threshold=0.8)
+    prompt = "what is the capital of france"
+    cache.set_cache("key-1", "paris", messages=_messages(prompt))
+
+    # exact key - no embedding call
+    num_calls = len(embedding_calls)
+    assert cache.get_cache("key-1", messages=_messages(prompt)) == "paris"
+    assert len(embedding_calls) == num_calls
+
+    assert (
+        cache.get_cache("key-2", messages=_messages("what is the capital of france ?"))
+        == "paris"
+    )
+    assert cache.get_cache("key-3", messages=_messages("how do airplanes fly")) is None
+
+
+def test_local_semantic_cache_scopes_hits_to_model(embedding_calls):
+    cache = LocalSemanticCache(similarity_threshold=0.8)
+    cache.set_cache(
+        "key-1", "paris", messages=_messages("capital of france"), model="a"
+    )
+
+    assert (
+        cache.get_cache("key-2", messages=_messages("capital of france"), model="a")
+        == "paris"
+    )
+    assert (
+        cache.get_cache("key-3", messages=_messages("capital of france"), model="b")
+        is None
+    )
+
+
+def test_local_semantic_cache_evicts_least_recently_used(embedding_calls):
+    cache = LocalSemanticCache(similarity_threshold=0.99, max_size=2)
+    cache.set_cache("key-1", "one", messages=_messages("alpha"))
+    cache.set_cache("key-2", "two", messages=_messages("beta"))
+    assert cache.get_cache("key-1", messages=_messages("alpha")) == "one"
+    cache.set_cache("key-3", "three", messages=_messages("gamma"))
+
+    assert cache.get_cache("key-2", messages=_messages("beta")) is None
+    assert cache.get_cache("key-1", messages=_messages("alpha")) == "one"
+    assert cache.get_cache("key-3", messages=_messages("gamma")) == "three"
+
+
+def test_local_semantic_cache_persists(embedding_calls, tmp_path):
+    cache = LocalSemanticCache(similarity_threshold=0.8, persist_path=str(tmp_path))
+    cache.set_cache(
+        "key-1", {"response": "paris"}, messages=_messages("capital of france")
+    )
+    cache.persist()
+    cache._persist_lock_file.close()  # process exited
+
+    reloaded = LocalSemanticCache(similarity_threshold=0.8, persist_path=str(tmp_path))
+    assert reloaded._persist_dir == cache._persist_dir
+    assert reloaded.get_cache("key-2", messages=_messages("the capital of france")) == {
+        "response": "paris"
+    }
+
+
+def test_local_semantic_cache_workers_sharing_persist_path(embedding_calls, tmp_path):
+    worker_1 = LocalSemanticCache(similarity_threshold=0.8, persist_path=str(tmp_path))
+    worker_2 = LocalSemanticCache(similarity_threshold=0.8, persist_path=str(tmp_path))
+    assert worker_1._persist_dir != worker_2._persist_dir
+
+    worker_1.set_cache("key-1", "paris", messages=_messages("capital of france"))
+    worker_2.set_cache("key-2", "lift", messages=_messages("how do airplanes fly"))
+    worker_1.persist()
+    worker_2.persist()
+
+    assert sorted(os.listdir(tmp_path)) == ["worker-0", "worker-1"]
+    for worker_dir in os.listdir(tmp_path):
+        assert "entries.json" in os.listdir(tmp_path / worker_dir)
+
+
+@pytest.mark.asyncio
+async def test_local_semantic_cache_batches_async_embeddings(embedding_calls):
+    cache = LocalSemanticCache(similarity_threshold=0.8)
+    cache.set_cache("key-1", "paris", messages=_messages("capital of france"))
+    embedding_calls.clear()
+
+    metadata = {}
+    results = await asyncio.gather(
+        cache.async_get_cache(
+            "key-2", messages=_messages("the capital of france"), metadata=metadata
+        ),
+        cache.async_get_cache("key-3", messages=_messages("how do airplanes fly")),
+        cache.async_get_cache("key-4", messages=_messages("why is the sky blue")),
+    )
+
+    assert results == ["paris", None, None]
+    assert len(embedding_calls) == 1 and len(embedding_calls[0]) == 3
+    assert metadata["semantic-similarity"] >= 0.8
+
+    # storing the response reuses the lookup's embedding
+    await cache.async_set_cache(
+        "key-3", "lift", messages=_messages("how do airplanes fly")
+    )
+    assert len(embedding_calls) == 1
+
+
+def test_vector_index_ivf_search():
+    import numpy as np
+
+    rng = np.random.default_rng(1)
+    vectors = rng.normal(size=(500, 16)).astype(np.float32)
+    vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    index = _VectorIndex(capacity=500, dim=16, ivf_min_size=200, nprobe=4)
+    # slots added while the index trains are assigned once training is done
+    for slot, vector in enumerate(vectors):
+        index.add(slot, vector)
+    training_thread = index._training_thread
+    if training_thread is not None:
+        training_thread.join()  # trained in the background
+    assert index.centroids is not None
+
+    for slot in (0, 250, 499):
+        assert index.search(vectors[slot], k=1)[0][0] == slot
+    index.remove(250)
+    assert all(s != 250 for s, _ in index.search(vectors[250], k=5))
@@ -0,0 +1,276 @@
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.caching import caching_handler
+from litellm.caching.caching import Cache
+from litellm.caching.request_coalescing import RequestCoalescer, StreamTee
+
+
+@pytest.fixture
+def request_coalescer(monkeypatch):
+    request_coalescer = RequestCoalescer()
+    monkeypatch.setattr(caching_handler, "request_coalescer", request_coalescer)
+    monkeypatch.setattr(litellm, "cache", Cache(enable_request_coalescing=True))
+    return request_coalescer
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_requests_share_one_upstream_call(
+    request_coalescer,
+):
+    responses = await asyncio.gather(
+        *[
+            litellm.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "coalesce me"}],
+                mock_response="hello",
+                mock_delay=0.2,
+            )
+            for _ in range(5)
+        ]
+    )
+
+    assert [response.choices[0].message.content for response in responses] == [
+        "hello"
+    ] * 5
+    assert request_coalescer.get_stats() == {
+        "in_flight_requests": 0,
+        "upstream_requests": 1,
+        "coalesced_requests": 4,
+    }
+    assert (
+        sum(
+            response._hidden_params.get("coalesced_request", False) is True
+            for response in responses
+        )
+        == 4
+    )
+    # waiters get their own copy of the response
+    assert len({id(response) for response in responses}) == 5
+
+
+@pytest.mark.asyncio
+async def test_streaming_requests_are_tee_d_to_all_waiters(request_coalescer):
+    async def _stream_completion():
+        response = await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "coalesce my stream"}],
+            mock_response="a b c d",
+            mock_delay=0.2,
+            stream=True,
+        )
+        return [
+            (chunk.choices[0].delta.content, chunk.choices[0].finish_reason)
+            async for chunk in response
+        ]
+
+    streams = await asyncio.gather(*[_stream_completion() for _ in range(3)])
+
+    assert streams[0][-1][1] == "stop"
+    assert "".join(content or "" for content, _ in streams[0]) == "a b c d"
+    assert streams[1] == streams[0]
+    assert streams[2] == streams[0]
+    assert request_coalescer.get_stats()["upstream_requests"] == 1
+    assert request_coalescer.get_stats()["in_flight_requests"] == 0
+
+
+def test_sync_completion_requests_coalesced(request_coalescer):
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _completion(_):
+        return litellm.completion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "coalesce me sync"}],
+            mock_response="hello",
+            mock_delay=0.2,
+        )
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        responses = list(executor.map(_completion, range(3)))
+
+    assert [response.choices[0].message.content for response in responses] == [
+        "hello"
+    ] * 3
+    assert request_coalescer.get_stats()["upstream_requests"] == 1
+    assert request_coalescer.get_stats()["coalesced_requests"] == 2
+
+
+def test_sync_waiter_bounded_by_request_timeout(request_coalescer):
+    """
+    Waiters wait for the leader's response at most for their own request timeout
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def _completion(_):
+        try:
+            return litellm.completion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "coalesce me slowly"}],
+                mock_response="hello",
+                mock_delay=1,  # mock responses don't apply the timeout
+                timeout=0.2,
+            )
+        except litellm.Timeout as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        results = list(executor.map(_completion, range(3)))
+
+    assert sum(isinstance(result, litellm.Timeout) for result in results) == 2
+    assert request_coalescer.get_stats()["upstream_requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_async_waiter_bounded_by_request_timeout(request_coalescer):
+    results = await asyncio.gather(
+        *[
+            litellm.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "coalesce me slowly"}],
+                mock_response="hello",
+                mock_delay=1,
+                timeout=0.2,
+            )
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, litellm.Timeout) for result in results) == 2
+    assert request_coalescer.get_stats()["upstream_requests"] == 1
+
+
+@pytest.mark.asyncio
+async def test_leader_exception_raised_for_waiters(request_coalescer):
+    results = await asyncio.gather(
+        *[
+            litellm.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "coalesce my error"}],
+                mock_response=Exception("upstream error"),
+                mock_delay=0.2,
+            )
+            for _ in range(3)
+        ],
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, Exception) for result in results)
+    assert request_coalescer.get_stats()["upstream_requests"] == 1
+    assert request_coalescer.get_stats()["in_flight_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_request_coalescing_is_opt_in(monkeypatch):
+    request_coalescer = RequestCoalescer()
+    monkeypatch.setattr(caching_handler, "request_coalescer", request_coalescer)
+    monkeypatch.setattr(litellm, "cache", Cache())
+
+    await asyncio.gather(
+        *[
+            litellm.acompletion(
+                model="gpt-4o",
+                messages=[{"role": "user", "content": "don't coalesce me"}],
+                mock_response="hello",
+                mock_delay=0.1,
+            )
+            for _ in range(2)
+        ]
+    )
+    assert request_coalescer.get_stats()["upstream_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_tee_reader_stopping_early_does_not_stall_others():
+    async def _stream():
+        for i in range(3):
+            yield i
+
+    stream_tee = StreamTee(stream=_stream())  # type: ignore
+
+    early_reader = stream_tee.aiter_chunks()
+    assert await early_reader.__anext__() == 0
+
+    assert [chunk async for chunk in stream_tee.aiter_chunks()] == [0, 1, 2]
+    assert stream_tee.is_done is True
+
+
+@pytest.mark.asyncio
+async def test_stream_tee_closed_by_all_readers_releases_key():
+    request_coalescer = RequestCoalescer()
+    upstream_closed = False
+
+    async def _stream():
+        nonlocal upstream_closed
+        try:
+            for i in range(3):
+                yield i
+        finally:
+            upstream_closed = True
+
+    in_flight_request, is_leader = request_coalescer.join(
+        key="key", loop=asyncio.get_running_loop()
+    )
+    assert is_leader is True
+    stream_tee = StreamTee(
+        stream=_stream(),  # type: ignore
+        on_done=lambda: request_coalescer.leave("key", in_flight_request),
+    )
+    in_flight_request.response.set_result(stream_tee)
+
+    readers = [stream_tee.aiter_chunks(), stream_tee.aiter_chunks()]
+    assert await readers[0].__anext__() == 0
+    await readers[0].aclose()
+    assert request_coalescer.get_stats()["in_flight_requests"] == 1
+
+    assert await readers[1].__anext__() == 0
+    await readers[1].aclose()
+    assert request_coalescer.get_stats()["in_flight_requests"] == 0
+    assert upstream_closed is True
+    assert stream_tee.chunks == []
+
+
+@pytest.mark.asyncio
+async def test_idle_stream_is_not_joined(monkeypatch):
+    from litellm.caching import request_coalescing
+
+    request_coalescer = RequestCoalescer()
+    loop = asyncio.get_running_loop()
+
+    async def _stream():
+        yield 0
+
+    in_flight_request, _ = request_coalescer.join(key="key", loop=loop)
+    stream_tee = StreamTee(stream=_stream())  # type: ignore
+    in_flight_request.response.set_result(stream_tee)
+    assert request_coalescer.join(key="key", loop=loop) == (in_flight_request, False)
+
+    monkeypatch.setattr(request_coalescing, "REQUEST_COALESCING_STREAM_IDLE_TIMEOUT", 0)
+    new_in_flight_request, is_leader = request_coalescer.join(key="key", loop=loop)
+    assert is_leader is True
+    assert new_in_flight_request is not in_flight_request
+
+
+@pytest.mark.asyncio
+async def test_leader_stream_wrapper_shares_hidden_params(request_coalescer):
+    from litellm.caching.request_coalescing import CoalescedStreamWrapper
+
+    response = await litellm.acompletion(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "coalesce my stream"}],
+        mock_response="a b",
+        stream=True,
+    )
+    assert isinstance(response, CoalescedStreamWrapper)
+    assert response._hidden_params is response.stream_tee.stream._hidden_params
+    assert response.model == response.stream_tee.stream.model
+
+    await response.aclose()
+    assert request_coalescer.get_stats()["in_flight_requests"] == 0
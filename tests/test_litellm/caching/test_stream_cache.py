@@ -0,0 +1,186 @@
+import asyncio
+import datetime
+import gc
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.caching import caching_handler
+from litellm.caching.caching import Cache
+from litellm.caching.stream_cache import (
+    InProgressStreamCache,
+    StreamCacheEntry,
+    StreamCacheWriterError,
+    decode_stream_chunks,
+    encode_stream_chunks,
+    is_cached_stream,
+)
+from litellm.types.utils import ModelResponseStream
+
+
+def _chunk_dict(content: str) -> dict:
+    return {
+        "id": "chatcmpl-123",
+        "created": 1,
+        "model": "gpt-4o",
+        "object": "chat.completion.chunk",
+        "choices": [{"index": 0, "delta": {"content": content}}],
+    }
+
+
+def test_encode_decode_stream_chunks():
+    chunks = [(0.0, _chunk_dict("hello")), (0.25, _chunk_dict(" world"))]
+    assert decode_stream_chunks(encode_stream_chunks(chunks)) == chunks
+
+
+@pytest.mark.asyncio
+async def test_streaming_response_cached_and_replayed_chunk_by_chunk(monkeypatch):
+    monkeypatch.setattr(litellm, "cache", Cache())
+
+    async def _stream_completion():
+        response = await litellm.acompletion(
+            model="gpt-4o",
+            messages=[{"role": "user", "content": "cache my stream"}],
+            mock_response="a b c d e f",
+            stream=True,
+        )
+        chunks = [
+            (chunk.choices[0].delta.content, chunk.choices[0].finish_reason)
+            async for chunk in response
+        ]
+        return response, chunks
+
+    response, chunks = await _stream_completion()
+    await asyncio.sleep(0.1)  # cache write is a background task
+
+    cache_key = litellm.cache.get_cache_key(
+        model="gpt-4o",
+        messages=[{"role": "user", "content": "cache my stream"}],
+        stream=True,
+    )
+    assert is_cached_stream(litellm.cache.get_cache(cache_key=cache_key))
+
+    cached_response, cached_chunks = await _stream_completion()
+    assert cached_response._hidden_params["cache_hit"] is True
+    assert len(chunks) > 2
+    assert cached_chunks == chunks
+
+
+@pytest.mark.asyncio
+async def test_identical_stream_replays_while_being_written(monkeypatch):
+    monkeypatch.setattr(litellm, "cache", Cache())
+    messages = [{"role": "user", "content": "follow my stream"}]
+
+    writer = await litellm.acompletion(
+        model="gpt-4o", messages=messages, mock_response="a b c d e f", stream=True
+    )
+    first_chunk = await writer.__anext__()
+    assert len(caching_handler.in_progress_stream_cache.entries) == 1
+
+    reader = await litellm.acompletion(
+        model="gpt-4o", messages=messages, mock_response="not used", stream=True
+    )
+    assert reader._hidden_params["cache_hit"] is True
+
+    async def _read():
+        return [chunk.choices[0].delta.content async for chunk in reader]
+
+    read_task = asyncio.create_task(_read())
+    writer_chunks = [first_chunk.choices[0].delta.content]
+    async for chunk in writer:
+        writer_chunks.append(chunk.choices[0].delta.content)
+        await asyncio.sleep(0.01)
+
+    assert await asyncio.wait_for(read_task, timeout=5) == writer_chunks
+    assert len(caching_handler.in_progress_stream_cache.entries) == 0
+
+
+@pytest.mark.asyncio
+async def test_stream_replay_pacing():
+    entry = StreamCacheEntry(start_time=0)
+    entry.chunks = [(0.0, _chunk_dict("hello")), (0.2, _chunk_dict(" world"))]
+    entry.is_done = True
+
+    start_time = time.time()
+    assert [chunk.choices[0].delta.content async for chunk in entry.aiter_chunks()] == [
+        "hello",
+        " world",
+    ]
+    assert time.time() - start_time < 0.1
+
+    start_time = time.time()
+    assert len([chunk async for chunk in entry.aiter_chunks(pace=True)]) == 2
+    assert time.time() - start_time >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_reader_falls_back_when_writer_fails():
+    in_progress_stream_cache = InProgressStreamCache()
+    entry = in_progress_stream_cache.start(key="key", start_time=time.time())
+
+    async def _fallback():
+        async def _stream():
+            yield "upstream chunk"
+
+        return _stream()
+
+    read_task = asyncio.create_task(
+        asyncio.wait_for(
+            _collect(entry.aiter_chunks(fallback=_fallback)),
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0.01)
+    in_progress_stream_cache.fail(key="key", entry=entry)
+
+    assert await read_task == ["upstream chunk"]
+    assert in_progress_stream_cache.get("key") is None
+
+
+@pytest.mark.asyncio
+async def test_reader_raises_when_writer_fails_mid_stream():
+    entry = StreamCacheEntry()
+    entry.add_chunk(_chunk_dict("hello"))
+    reader = entry.aiter_chunks(fallback=None)
+    assert (await reader.__anext__()).choices[0].delta.content == "hello"
+
+    entry.fail()
+    with pytest.raises(StreamCacheWriterError):
+        await reader.__anext__()
+
+
+def test_dropped_writer_fails_in_progress_entry(monkeypatch):
+    monkeypatch.setattr(litellm, "cache", Cache())
+    monkeypatch.setattr(
+        caching_handler, "in_progress_stream_cache", InProgressStreamCache()
+    )
+    llm_caching_handler = caching_handler.LLMCachingHandler(
+        original_function=litellm.completion,
+        request_kwargs={
+            "model": "gpt-4o",
+            "messages": [{"role": "user", "content": "drop my stream"}],
+            "stream": True,
+        },
+        start_time=datetime.datetime.now(),
+    )
+    llm_caching_handler._add_streaming_chunk_to_cache(
+        ModelResponseStream(**_chunk_dict("hello"))
+    )
+    entry = llm_caching_handler.stream_cache_entry
+    assert entry is not None
+
+    del llm_caching_handler
+    gc.collect()
+
+    assert entry.is_failed is True
+    assert caching_handler.in_progress_stream_cache.entries == {}
+
+
+async def _collect(chunks) -> list:
+    return [chunk async for chunk in chunks]
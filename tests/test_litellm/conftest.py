@@ -36,6 +36,7 @@ def setup_and_teardown():
         print(f"Error reloading litellm.proxy.proxy_server: {e}")
 
     litellm.in_memory_llm_clients_cache.flush_cache()
+    litellm.http_client_pool.flush()
 
     import asyncio
 
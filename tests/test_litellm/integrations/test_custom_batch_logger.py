@@ -0,0 +1,146 @@
+import asyncio
+import gzip
+import json
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.integrations.custom_batch_logger import CustomBatchLogger
+
+
+class RecordingBatchLogger(CustomBatchLogger):
+    def __init__(self, fail_first_n: int = 0, **kwargs):
+        self.sent_batches = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.fail_first_n = fail_first_n
+        super().__init__(flush_lock=asyncio.Lock(), **kwargs)
+
+    async def async_send_batch(self, batch=None):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            if self.fail_first_n > 0:
+                self.fail_first_n -= 1
+                raise Exception("sink unavailable")
+            self.sent_batches.append(list(batch))
+        finally:
+            self.in_flight -= 1
+
+
+def test_log_queue_drops_oldest_events_when_full():
+    logger = RecordingBatchLogger(max_queue_size=3)
+    for i in range(5):
+        logger.log_queue.append(i)
+    logger.log_queue.extend([5])
+
+    assert logger.log_queue == [3, 4, 5]
+    assert logger.log_queue.num_dropped == 3
+
+    # subclasses re-assign the queue - it stays bounded
+    logger.log_queue = list(range(10))
+    assert logger.log_queue == [7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_sends_concurrent_batches():
+    logger = RecordingBatchLogger(batch_size=2, max_concurrent_flushes=2)
+    logger.log_queue.extend(range(7))
+    assert logger.should_flush()
+
+    await logger.flush_queue()
+
+    assert logger.sent_batches == [[0, 1], [2, 3], [4, 5], [6]]
+    assert logger.max_in_flight == 2
+    assert logger.log_queue == []
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_splits_batches_by_bytes():
+    logger = RecordingBatchLogger(batch_size=100, max_batch_bytes=20)
+    logger.log_queue.extend(["a" * 8, "b" * 8, "c" * 8])  # 10 bytes each, encoded
+    assert logger.log_queue.num_bytes == 30
+    assert logger.should_flush()
+
+    await logger.flush_queue()
+
+    assert logger.sent_batches == [["a" * 8, "b" * 8], ["c" * 8]]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_failed_batches(monkeypatch):
+    monkeypatch.setattr(
+        "litellm.integrations.custom_batch_logger.DEFAULT_BATCH_LOGGER_RETRY_BACKOFF_SECONDS",
+        0,
+    )
+    logger = RecordingBatchLogger(fail_first_n=2, max_flush_retries=2)
+    logger.log_queue.extend([1, 2])
+
+    await logger.flush_queue()
+    assert logger.sent_batches == [[1, 2]]
+
+    logger.fail_first_n = 3
+    logger.log_queue.append(3)
+    await logger.flush_queue()  # gives up after 3 attempts, doesn't raise
+    assert logger.sent_batches == [[1, 2]]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_retries_batches_reported_as_not_sent(monkeypatch):
+    """
+    Sinks that catch their own errors return False - only the events left in the batch are retried
+    """
+    monkeypatch.setattr(
+        "litellm.integrations.custom_batch_logger.DEFAULT_BATCH_LOGGER_RETRY_BACKOFF_SECONDS",
+        0,
+    )
+    attempts = []
+
+    class PartiallyFailingBatchLogger(CustomBatchLogger):
+        async def async_send_batch(self, batch=None):
+            attempts.append(list(batch))
+            if len(attempts) == 1:
+                del batch[0]  # first event sent, the rest failed
+                return False
+
+    logger = PartiallyFailingBatchLogger(flush_lock=asyncio.Lock())
+    logger.log_queue.extend([1, 2, 3])
+    await logger.flush_queue()
+
+    assert attempts == [[1, 2, 3], [2, 3]]
+
+
+@pytest.mark.asyncio
+async def test_flush_queue_sends_queue_to_sinks_without_batch_arg():
+    sent = []
+
+    class QueueBatchLogger(CustomBatchLogger):
+        async def async_send_batch(self):
+            sent.append(list(self.log_queue))
+
+    logger = QueueBatchLogger(flush_lock=asyncio.Lock(), batch_size=2)
+    logger.log_queue.extend([1, 2, 3])
+    await logger.flush_queue()
+
+    assert sent == [[1, 2, 3]]
+    assert logger.log_queue == []
+
+
+@pytest.mark.asyncio
+async def test_async_encode_batch():
+    logger = RecordingBatchLogger()
+    batch = [{"a": 1}, {"b": 2}]
+
+    assert json.loads(await logger.async_encode_batch(batch)) == batch
+    assert (
+        json.loads(
+            gzip.decompress(await logger.async_encode_batch(batch, compress=True))
+        )
+        == batch
+    )
@@ -0,0 +1,76 @@
+import os
+import sys
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.get_llm_provider_logic import (
+    _provider_route_cache,
+    get_llm_provider,
+)
+
+
+def test_get_llm_provider_caches_route():
+    _provider_route_cache.flush_cache()
+
+    assert get_llm_provider(model="gpt-4o") == ("gpt-4o", "openai", None, None)
+    assert get_llm_provider(model="llama3", custom_llm_provider="ollama") == (
+        "llama3",
+        "ollama",
+        None,
+        None,
+    )
+    assert _provider_route_cache.get(("gpt-4o", None, None)) == (
+        "resolved",
+        "gpt-4o",
+        "openai",
+    )
+    assert _provider_route_cache.get(("llama3", "ollama", None)) is not None
+
+    # cache hits return the same as a miss
+    assert get_llm_provider(model="gpt-4o") == ("gpt-4o", "openai", None, None)
+    assert get_llm_provider(model="llama3", custom_llm_provider="ollama") == (
+        "llama3",
+        "ollama",
+        None,
+        None,
+    )
+
+
+def test_get_llm_provider_cache_hit_reads_api_key_from_env(monkeypatch):
+    _provider_route_cache.flush_cache()
+
+    monkeypatch.setenv("GROQ_API_KEY", "groq-key-1")
+    assert get_llm_provider(model="groq/llama3")[2] == "groq-key-1"
+
+    monkeypatch.setenv("GROQ_API_KEY", "groq-key-2")
+    assert get_llm_provider(model="groq/llama3")[2] == "groq-key-2"
+    assert get_llm_provider(model="groq/llama3", api_key="my-key")[2] == "my-key"
+
+
+def test_get_llm_provider_does_not_cache_dynamic_params():
+    _provider_route_cache.flush_cache()
+
+    get_llm_provider(model="gpt-4o", api_key="os.environ/OPENAI_API_KEY")
+    get_llm_provider(model="gpt-4o", api_base="https://api.groq.com/openai/v1")
+
+    assert len(_provider_route_cache._cache) == 0
+
+
+def test_register_model_flushes_get_llm_provider_cache():
+    get_llm_provider(model="gpt-4o")
+    assert len(_provider_route_cache._cache) > 0
+
+    litellm.register_model(
+        {
+            "my-custom-route-model": {
+                "litellm_provider": "openai",
+                "mode": "chat",
+            }
+        }
+    )
+
+    assert len(_provider_route_cache._cache) == 0
+    assert get_llm_provider(model="my-custom-route-model")[1] == "openai"
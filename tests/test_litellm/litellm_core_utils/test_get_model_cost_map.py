@@ -0,0 +1,99 @@
+import os
+import sys
+from unittest.mock import MagicMock, patch
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.get_model_cost_map import (
+    get_bundled_model_cost_map,
+    refresh_model_cost_map,
+    start_background_model_cost_map_refresh,
+)
+
+
+def test_refresh_model_cost_map_keeps_registered_models():
+    """
+    Remote entries are returned as updates to the bundled map, except for entries changed since import (e.g. `register_model`)
+    """
+    bundled = get_bundled_model_cost_map()
+    model_cost = get_bundled_model_cost_map()
+    unchanged_model, registered_model = list(bundled)[:2]
+    model_cost[registered_model] = {
+        **model_cost[registered_model],
+        "input_cost_per_token": 1.0,
+    }
+
+    remote = {
+        unchanged_model: {**bundled[unchanged_model], "input_cost_per_token": 2.0},
+        registered_model: {**bundled[registered_model], "input_cost_per_token": 3.0},
+        "brand-new-model": {"litellm_provider": "openai", "mode": "chat"},
+    }
+    response = MagicMock()
+    response.json.return_value = remote
+
+    with patch(
+        "litellm.litellm_core_utils.get_model_cost_map.httpx.get",
+        return_value=response,
+    ):
+        model_cost_updates = refresh_model_cost_map(
+            url="https://example.com/model_cost.json", model_cost=model_cost
+        )
+
+    assert model_cost_updates == {
+        unchanged_model: remote[unchanged_model],
+        "brand-new-model": remote["brand-new-model"],
+    }
+    # the input map isn't modified
+    assert model_cost[unchanged_model] == bundled[unchanged_model]
+    assert "brand-new-model" not in model_cost
+
+
+def test_apply_model_cost_map_refresh_swaps_model_cost(monkeypatch):
+    import litellm
+
+    old_model_cost = {"gpt-4": {"litellm_provider": "openai", "mode": "chat"}}
+    old_models = ["gpt-4"]
+    monkeypatch.setattr(litellm, "model_cost", old_model_cost)
+    monkeypatch.setattr(litellm, "open_ai_chat_completion_models", old_models)
+
+    litellm._apply_model_cost_map_refresh(
+        {"brand-new-model": {"litellm_provider": "openai", "mode": "chat"}}
+    )
+
+    assert litellm.model_cost is not old_model_cost
+    assert set(litellm.model_cost) == {"gpt-4", "brand-new-model"}
+    assert litellm.open_ai_chat_completion_models == ["gpt-4", "brand-new-model"]
+    # readers holding the old objects never see them change
+    assert old_model_cost == {"gpt-4": {"litellm_provider": "openai", "mode": "chat"}}
+    assert old_models == ["gpt-4"]
+
+
+def test_background_refresh_skipped_for_local_model_cost_map(monkeypatch):
+    monkeypatch.setenv("LITELLM_LOCAL_MODEL_COST_MAP", "True")
+    with patch("litellm.litellm_core_utils.get_model_cost_map.httpx.get") as mock_get:
+        thread = start_background_model_cost_map_refresh(
+            url="https://example.com/model_cost.json",
+            model_cost={},
+            on_refresh=MagicMock(),
+        )
+    assert thread is None
+    mock_get.assert_not_called()
+
+
+def test_background_refresh_failure_keeps_bundled_map(monkeypatch):
+    monkeypatch.delenv("LITELLM_LOCAL_MODEL_COST_MAP", raising=False)
+    on_refresh = MagicMock()
+    with patch(
+        "litellm.litellm_core_utils.get_model_cost_map.httpx.get",
+        side_effect=Exception("network unreachable"),
+    ):
+        thread = start_background_model_cost_map_refresh(
+            url="https://example.com/model_cost.json",
+            model_cost={"gpt-4": {"litellm_provider": "openai"}},
+            on_refresh=on_refresh,
+        )
+        assert thread is not None
+        thread.join(timeout=5)
+    on_refresh.assert_not_called()
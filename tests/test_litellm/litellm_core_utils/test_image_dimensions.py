@@ -0,0 +1,159 @@
+import asyncio
+import base64
+import os
+import struct
+import sys
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.constants import DEFAULT_IMAGE_HEIGHT, DEFAULT_IMAGE_WIDTH
+from litellm.litellm_core_utils.image_dimensions import (
+    ImageDimensionsProber,
+    parse_image_dimensions,
+)
+
+
+def _png(width: int, height: int) -> bytes:
+    return (
+        b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR"
+        + struct.pack(">LL", width, height)
+        + b"\x08\x02\x00\x00\x00"
+        + b"\x00" * 1000
+    )
+
+
+def _jpeg(width: int, height: int, exif_size: int = 20000) -> bytes:
+    app1 = b"\xff\xe1" + struct.pack(">H", exif_size + 2) + b"\x00" * exif_size
+    sof0 = b"\xff\xc0" + struct.pack(">HBHHB", 17, 8, height, width, 3) + b"\x00" * 9
+    return b"\xff\xd8" + app1 + sof0 + b"\x00" * 100000
+
+
+def _gif(width: int, height: int) -> bytes:
+    return b"GIF89a" + struct.pack("<HH", width, height) + b"\x00" * 100
+
+
+def _webp(width: int, height: int) -> bytes:
+    return (
+        b"RIFF\x00\x00\x00\x00WEBPVP8X"
+        + b"\x00" * 8
+        + struct.pack("<I", width - 1)[:3]
+        + struct.pack("<I", height - 1)[:3]
+        + b"\x00" * 100
+    )
+
+
+@pytest.mark.parametrize(
+    "image_data", [_png(640, 480), _jpeg(640, 480), _gif(640, 480), _webp(640, 480)]
+)
+def test_parse_image_dimensions(image_data):
+    assert parse_image_dimensions(image_data) == (640, 480)
+    assert parse_image_dimensions(image_data[:9]) is None
+
+
+@pytest.fixture
+def image_server(monkeypatch):
+    """serves a JPEG, ignoring `Range` - records the requests"""
+    requests = []
+
+    async def handler(request: httpx.Request):
+        requests.append(request)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, content=_jpeg(1024, 768))
+
+    client = SimpleNamespace(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(
+        "litellm.llms.custom_httpx.http_handler.get_async_httpx_client",
+        lambda **kwargs: client,
+    )
+    return requests
+
+
+@pytest.mark.asyncio
+async def test_async_get_image_dimensions_probes_url_once(image_server):
+    prober = ImageDimensionsProber(max_probe_bytes=65536)
+    url = "https://example.com/image.jpg"
+
+    results = await asyncio.gather(
+        *(prober.async_get_image_dimensions(url) for _ in range(5))
+    )
+    assert results == [(1024, 768)] * 5
+    assert await prober.async_get_image_dimensions(url) == (1024, 768)
+
+    assert len(image_server) == 1
+    assert image_server[0].headers["Range"] == "bytes=0-65535"
+
+
+@pytest.mark.asyncio
+async def test_get_image_dimensions_does_not_block_event_loop(image_server):
+    prober = ImageDimensionsProber()
+    url = "https://example.com/image.jpg"
+
+    # cache miss - default dimensions, the url is probed in the background
+    assert prober.get_image_dimensions(url) == (
+        DEFAULT_IMAGE_WIDTH,
+        DEFAULT_IMAGE_HEIGHT,
+    )
+    await asyncio.gather(*prober._background_probes)
+
+    assert prober.get_image_dimensions(url) == (1024, 768)
+    assert len(image_server) == 1
+
+
+def test_get_image_dimensions_base64():
+    prober = ImageDimensionsProber(max_size=1)
+    png_url = "data:image/png;base64," + base64.b64encode(_png(20, 10)).decode()
+    jpeg_url = "data:image/jpeg;base64," + base64.b64encode(_jpeg(300, 200)).decode()
+
+    assert prober.get_image_dimensions(png_url) == (20, 10)
+    assert len(prober._cache) == 0  # header in the first chunk - not worth caching
+
+    assert prober.get_image_dimensions(jpeg_url) == (300, 200)
+    assert list(prober._cache.values()) == [(300, 200)]
+    assert prober.get_image_dimensions(jpeg_url) == (300, 200)
+
+
+@pytest.mark.asyncio
+async def test_async_get_image_dimensions_caches_failed_probes(monkeypatch):
+    requests = []
+
+    async def handler(request: httpx.Request):
+        requests.append(request)
+        return httpx.Response(404)
+
+    client = SimpleNamespace(
+        client=httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    )
+    monkeypatch.setattr(
+        "litellm.llms.custom_httpx.http_handler.get_async_httpx_client",
+        lambda **kwargs: client,
+    )
+    prober = ImageDimensionsProber(failed_probe_ttl=60)
+    url = "https://example.com/missing.jpg"
+
+    for _ in range(3):
+        assert await prober.async_get_image_dimensions(url) == (
+            DEFAULT_IMAGE_WIDTH,
+            DEFAULT_IMAGE_HEIGHT,
+        )
+    assert len(requests) == 1
+
+    # probed again once the ttl is up
+    prober._failed[url] = 0
+    await prober.async_get_image_dimensions(url)
+    assert len(requests) == 2
+
+
+def test_get_image_dimensions_base64_without_payload():
+    prober = ImageDimensionsProber()
+    assert prober.get_image_dimensions("data:image/png;base64") == (
+        DEFAULT_IMAGE_WIDTH,
+        DEFAULT_IMAGE_HEIGHT,
+    )
@@ -0,0 +1,136 @@
+import os
+import sys
+import threading
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.logging_dispatcher import LoggingDispatcher
+
+
+def test_logging_dispatcher_runs_sync_and_async_callbacks():
+    dispatcher = LoggingDispatcher()
+    calls = []
+
+    def sync_callback(value, key=None):
+        calls.append(("sync", value, key, threading.current_thread().name))
+
+    async def async_callback(value):
+        calls.append(("async", value))
+
+    for i in range(3):
+        dispatcher.submit(sync_callback, i, key="k")
+    dispatcher.submit(async_callback, 3)
+
+    assert dispatcher.flush(timeout=5)
+    sync_calls = [call for call in calls if call[0] == "sync"]
+    assert [call[1:3] for call in sync_calls] == [(i, "k") for i in range(3)]
+    # run in order, on a dispatcher worker
+    assert all(call[3].startswith("litellm-logging-dispatcher") for call in sync_calls)
+    assert ("async", 3) in calls
+
+    stats = dispatcher.get_stats()
+    assert stats[sync_callback.__qualname__]["processed"] == 3
+    assert stats[sync_callback.__qualname__]["queued"] == 0
+    assert stats[async_callback.__qualname__]["processed"] == 1
+
+
+@pytest.mark.parametrize(
+    "drop_policy, expected_calls",
+    [("drop_oldest", [1, 2]), ("drop_newest", [0, 1])],
+)
+def test_logging_dispatcher_drops_events_when_queue_is_full(
+    drop_policy, expected_calls
+):
+    dispatcher = LoggingDispatcher(
+        max_queue_size=2, drop_policy=drop_policy, num_workers=1
+    )
+    release = threading.Event()
+    calls = []
+
+    def blocking_callback():
+        release.wait(timeout=5)
+
+    def callback(value):
+        calls.append(value)
+
+    dispatcher.submit(blocking_callback)
+    time.sleep(0.1)  # the only worker is now busy with blocking_callback
+    for i in range(3):
+        dispatcher.submit(callback, i)
+    release.set()
+
+    assert dispatcher.flush(timeout=5)
+    assert calls == expected_calls
+    assert dispatcher.get_stats()[callback.__qualname__]["dropped"] == 1
+
+
+def test_logging_dispatcher_drops_lagging_events():
+    dispatcher = LoggingDispatcher(max_lag_seconds=0.05, num_workers=1)
+    calls = []
+
+    def blocking_callback():
+        time.sleep(0.2)
+
+    def callback(value):
+        calls.append(value)
+
+    dispatcher.submit(blocking_callback)
+    time.sleep(0.05)
+    dispatcher.submit(callback, 1)
+
+    assert dispatcher.flush(timeout=5)
+    assert calls == []
+    stats = dispatcher.get_stats()[callback.__qualname__]
+    assert stats["dropped"] == 1
+    assert stats["lag_seconds"] > 0.05
+
+
+def test_logging_dispatcher_counts_errors():
+    dispatcher = LoggingDispatcher()
+    calls = []
+
+    def callback(value):
+        if value == 0:
+            raise ValueError("bad event")
+        calls.append(value)
+
+    dispatcher.submit(callback, 0)
+    dispatcher.submit(callback, 1)
+
+    assert dispatcher.flush(timeout=5)
+    assert calls == [1]
+    stats = dispatcher.get_stats()[callback.__qualname__]
+    assert stats["errors"] == 1 and stats["processed"] == 1
+
+
+def test_logging_dispatcher_slow_callback_does_not_block_other_instances():
+    dispatcher = LoggingDispatcher(num_workers=2)
+    release = threading.Event()
+    calls = []
+
+    class Callback:
+        def __init__(self, name):
+            self.name = name
+
+        def log_event(self, value):
+            if self.name == "slow":
+                release.wait(timeout=5)
+            calls.append((self.name, value))
+
+    slow, fast = Callback("slow"), Callback("fast")
+    dispatcher.submit(slow.log_event, 0)
+    for i in range(3):
+        dispatcher.submit(fast.log_event, i)
+
+    assert dispatcher.flush(timeout=0.5) is False  # the slow callback is still running
+    assert calls == [("fast", 0), ("fast", 1), ("fast", 2)]
+
+    release.set()
+    assert dispatcher.flush(timeout=5)
+    assert calls[-1] == ("slow", 0)
+    assert dispatcher.get_stats()[Callback.log_event.__qualname__]["processed"] == 4
@@ -0,0 +1,74 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.litellm_core_utils.provider_registry import (
+    ProviderRegistry,
+    provider_registry,
+)
+from litellm.types.utils import LlmProviders
+from litellm.utils import ProviderConfigManager
+
+
+@pytest.mark.parametrize(
+    "model, provider, expected_config",
+    [
+        ("gpt-4o", LlmProviders.OPENAI, "OpenAIGPTConfig"),
+        ("o3-mini", LlmProviders.OPENAI, "OpenAIOSeriesConfig"),
+        ("grok-2", LlmProviders.XAI, "XAIChatConfig"),
+        ("llama3", LlmProviders.GROQ, "GroqChatConfig"),
+        ("claude-3-5-sonnet-20240620", LlmProviders.ANTHROPIC, "AnthropicConfig"),
+        ("jina-embeddings-v3", LlmProviders.JINA_AI, None),
+    ],
+)
+def test_get_provider_chat_config(model, provider, expected_config):
+    config = ProviderConfigManager.get_provider_chat_config(
+        model=model, provider=provider
+    )
+    if expected_config is None:
+        assert config is None
+    else:
+        assert type(config) is getattr(litellm, expected_config)
+
+
+def test_register_chat_config_overrides_default():
+    registry = ProviderRegistry()
+    config = litellm.OpenAIGPTConfig()
+    registry.register_chat_config(LlmProviders.GROQ, lambda model: config)
+
+    assert (
+        registry.get_chat_config(model="llama3", provider=LlmProviders.GROQ) is config
+    )
+    assert (
+        provider_registry.get_chat_config(model="llama3", provider=LlmProviders.GROQ)
+        is not config
+    )
+
+
+@pytest.mark.parametrize("model", ["xai/grok-2", "deepseek/deepseek-chat"])
+def test_completion_dispatches_to_registered_handler(model, monkeypatch):
+    calls = []
+
+    def mock_completion(**kwargs):
+        calls.append(kwargs)
+        return kwargs["model_response"]
+
+    monkeypatch.setattr(
+        litellm.main.base_llm_http_handler, "completion", mock_completion
+    )
+    litellm.completion(
+        model=model,
+        messages=[{"role": "user", "content": "hi"}],
+        api_key="fake-key",
+    )
+
+    assert len(calls) == 1
+    assert calls[0]["custom_llm_provider"] == model.split("/")[0]
+    assert provider_registry.get_completion_handler(model.split("/")[0]) is not None
+    assert provider_registry.get_completion_handler("azure") is None
@@ -0,0 +1,153 @@
+import os
+import sys
+import time
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.litellm_core_utils.litellm_logging import Logging
+from litellm.litellm_core_utils.streaming_chunk import StreamingChunk
+from litellm.litellm_core_utils.streaming_handler import CustomStreamWrapper
+from litellm.llms.openai.chat.gpt_transformation import (
+    OpenAIChatCompletionStreamingHandler,
+)
+from litellm.types.utils import ModelResponseStream
+
+
+def _openai_chunk(delta: dict, finish_reason=None, **kwargs) -> dict:
+    return {
+        "id": "chatcmpl-123",
+        "object": "chat.completion.chunk",
+        "created": 1700000000,
+        "model": "deepseek-chat",
+        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+        **kwargs,
+    }
+
+
+openai_chunks = [
+    _openai_chunk({"role": "assistant", "content": ""}, system_fingerprint="fp_1"),
+    _openai_chunk({"reasoning_content": "Let me think"}),
+    _openai_chunk({"content": "Hello"}),
+    _openai_chunk({"content": " world"}),
+    _openai_chunk({}, finish_reason="stop"),
+]
+
+
+@pytest.mark.parametrize(
+    "chunk",
+    [
+        _openai_chunk({"content": ""}),
+        _openai_chunk({"content": "Hello"}, finish_reason="stop"),
+        _openai_chunk(
+            {
+                "tool_calls": [
+                    {"index": 0, "function": {"name": "get_weather", "arguments": ""}}
+                ]
+            }
+        ),
+        _openai_chunk({"content": "Hello"}, usage={"total_tokens": 10}),
+        {**_openai_chunk({"content": "Hello"}), "created": None},
+    ],
+)
+def test_streaming_chunk_from_openai_chunk_returns_none(chunk):
+    assert StreamingChunk.from_openai_chunk(chunk) is None
+
+
+def test_streaming_chunk_converts_on_attribute_access():
+    chunk = StreamingChunk.from_openai_chunk(_openai_chunk({"content": "Hello"}))
+    assert chunk is not None
+    assert chunk.content == "Hello"
+    assert chunk._model_response_stream is None
+
+    assert chunk.choices[0].delta.content == "Hello"
+    assert chunk["id"] == "chatcmpl-123"
+    assert isinstance(chunk.to_model_response_stream(), ModelResponseStream)
+    assert chunk.to_model_response_stream() is chunk.to_model_response_stream()
+
+
+def _stream(chunks: list, merge_reasoning_content_in_choices: bool) -> list:
+    logging_obj = Logging(
+        model="deepseek-chat",
+        messages=[{"role": "user", "content": "Hey"}],
+        stream=True,
+        call_type="completion",
+        start_time=time.time(),
+        litellm_call_id="12345",
+        function_id="1245",
+    )
+    logging_obj.update_environment_variables(
+        model="deepseek-chat",
+        user=None,
+        optional_params={},
+        litellm_params={
+            "litellm_call_id": "12345",
+            "merge_reasoning_content_in_choices": merge_reasoning_content_in_choices,
+        },
+    )
+    return list(
+        CustomStreamWrapper(
+            completion_stream=iter(chunks),
+            model="deepseek-chat",
+            logging_obj=logging_obj,
+            custom_llm_provider="deepseek",
+        )
+    )
+
+
+@pytest.mark.parametrize("merge_reasoning_content_in_choices", [False, True])
+def test_streaming_chunk_matches_model_response_stream(
+    merge_reasoning_content_in_choices,
+):
+    """
+    `CustomStreamWrapper` returns the same chunks for `StreamingChunk`s as for the `ModelResponseStream`s they stand for
+    """
+    streaming_handler = OpenAIChatCompletionStreamingHandler(
+        streaming_response=None, sync_stream=True
+    )
+    chunks = [streaming_handler.chunk_parser(chunk) for chunk in openai_chunks]
+    assert [isinstance(chunk, StreamingChunk) for chunk in chunks] == [
+        False,
+        True,
+        True,
+        True,
+        False,
+    ]
+
+    streaming_chunks = _stream(
+        chunks, merge_reasoning_content_in_choices=merge_reasoning_content_in_choices
+    )
+    model_response_streams = _stream(
+        [
+            (
+                chunk.to_model_response_stream()
+                if isinstance(chunk, StreamingChunk)
+                else chunk
+            )
+            for chunk in chunks
+        ],
+        merge_reasoning_content_in_choices=merge_reasoning_content_in_choices,
+    )
+
+    assert len(streaming_chunks) == len(model_response_streams) == 4
+    for streaming_chunk, model_response_stream in zip(
+        streaming_chunks, model_response_streams
+    ):
+        assert type(streaming_chunk) is ModelResponseStream
+        streaming_chunk.created = model_response_stream.created
+        assert streaming_chunk.model_dump() == model_response_stream.model_dump()
+        assert streaming_chunk.model_dump_json(
+            exclude_none=True, exclude_unset=True
+        ) == model_response_stream.model_dump_json(
+            exclude_none=True, exclude_unset=True
+        )
+        assert {
+            k: v for k, v in streaming_chunk._hidden_params.items() if k != "created_at"
+        } == {
+            k: v
+            for k, v in model_response_stream._hidden_params.items()
+            if k != "created_at"
+        }
@@ -8,7 +8,10 @@ sys.path.insert(
     0, os.path.abspath("../../..")
 )  # Adds the parent directory to the system path
 
-from litellm.litellm_core_utils.streaming_chunk_builder_utils import ChunkProcessor
+from litellm.litellm_core_utils.streaming_chunk_builder_utils import (
+    ChunkProcessor,
+    StreamingChunkAccumulator,
+)
 from litellm.types.utils import (
     ChatCompletionDeltaToolCall,
     ChatCompletionMessageToolCall,
@@ -325,3 +328,80 @@ def test_stream_chunk_builder_litellm_usage_chunks():
     assert usage.prompt_tokens == 50
     assert usage.completion_tokens == 27
     assert usage.total_tokens == 77
+
+
+def _stream_chunk(content=None, tool_calls=None, finish_reason=None, usage=None):
+    chunk = ModelResponseStream(
+        id="chatcmpl-accumulator",
+        created=1745513206,
+        model="gpt-4o",
+        object="chat.completion.chunk",
+        choices=[
+            StreamingChoices(
+                index=0,
+                delta=Delta(role="assistant", content=content, tool_calls=tool_calls),
+                finish_reason=finish_reason,
+            )
+        ],
+    )
+    if usage is not None:
+        chunk.usage = usage
+    return chunk
+
+
+def test_streaming_chunk_accumulator_matches_stream_chunk_builder():
+    from litellm import stream_chunk_builder
+
+    chunks = [_stream_chunk(content="Let me check")] + [
+        _stream_chunk(
+            tool_calls=[
+                ChatCompletionDeltaToolCall(
+                    id="call_1" if i == 0 else None,
+                    index=0,
+                    function=Function(
+                        name="get_weather" if i == 0 else None, arguments=arguments
+                    ),
+                    type="function",
+                )
+            ]
+        )
+        for i, arguments in enumerate(['{"city": ', '"Paris"}'])
+    ]
+    chunks.append(
+        _stream_chunk(
+            finish_reason="tool_calls",
+            usage=Usage(prompt_tokens=12, completion_tokens=9, total_tokens=21),
+        )
+    )
+
+    accumulator = StreamingChunkAccumulator()
+    for chunk in chunks:
+        accumulator.add_chunk(chunk)
+    response = accumulator.build()
+
+    expected = stream_chunk_builder(chunks=chunks)
+    assert response.model_dump(exclude={"created"}) == expected.model_dump(
+        exclude={"created"}
+    )
+    assert response.choices[0].message.content == "Let me check"
+    assert response.choices[0].message.tool_calls[0].function.arguments == (
+        '{"city": "Paris"}'
+    )
+    assert response.choices[0].finish_reason == "tool_calls"
+    assert response.usage.prompt_tokens == 12
+    assert accumulator.get_total_usage().total_tokens == 21
+
+    # folded into one chunk, that builds the same response
+    (folded_chunk,) = accumulator.get_chunks()
+    assert stream_chunk_builder(chunks=[folded_chunk]).model_dump(
+        exclude={"created"}
+    ) == expected.model_dump(exclude={"created"})
+
+
+def test_streaming_chunk_accumulator_raises_chunk_errors_on_build():
+    accumulator = StreamingChunkAccumulator()
+    assert accumulator.build() is None
+
+    accumulator.add_chunk({"choices": [{"delta": None}]})  # doesn't raise mid-stream
+    with pytest.raises(Exception):
+        accumulator.build()
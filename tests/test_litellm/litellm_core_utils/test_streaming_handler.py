@@ -813,3 +813,29 @@ def test_optional_combine_thinking_block_with_none_content(
     assert final_response.choices[0].delta.content == "</think>The answer is 42"
     assert initialized_custom_stream_wrapper.sent_last_thinking_block is True
     assert not hasattr(final_response.choices[0].delta, "reasoning_content")
+
+
+def test_chunks_builds_the_same_complete_response(
+    initialized_custom_stream_wrapper: CustomStreamWrapper,
+):
+    assert initialized_custom_stream_wrapper.chunks == []
+
+    usage_chunk = ModelResponseStream(
+        id="chatcmpl-87291500-d8c5-428e-b187-36fe5a4c97ab",
+        created=1742056047,
+        choices=[],
+        usage=Usage(prompt_tokens=10, completion_tokens=4, total_tokens=14),
+    )
+    for chunk in bedrock_chunks + [usage_chunk]:
+        initialized_custom_stream_wrapper._accumulate_chunk(chunk)
+
+    # the chunks aren't kept - they're folded into a single chunk
+    chunks = initialized_custom_stream_wrapper.chunks
+    assert len(chunks) == 1
+    expected = initialized_custom_stream_wrapper.build_complete_streaming_response()
+    response = litellm.stream_chunk_builder(chunks=chunks)
+    assert response.model_dump(exclude={"created"}) == expected.model_dump(
+        exclude={"created"}
+    )
+    assert response.choices[0].message.content == "I'm Claude, an AI"
+    assert response.usage.total_tokens == 14
@@ -4,6 +4,7 @@ import os
 import sys
 import time
 import traceback
+import uuid
 from unittest.mock import MagicMock
 
 import pytest
@@ -16,7 +17,9 @@ from unittest.mock import AsyncMock, MagicMock, patch
 import litellm
 from litellm import create_pretrained_tokenizer, decode, encode, get_modified_max_tokens
 from litellm import token_counter as token_counter_old
+from litellm.litellm_core_utils.token_counter import batch_token_counter
 from litellm.litellm_core_utils.token_counter import token_counter as token_counter_new
+from litellm.litellm_core_utils.tokenizer_backends import BaseTokenizerBackend
 from tests.large_text import text
 from tests.test_litellm.litellm_core_utils.messages_with_counts import (
     MESSAGES_TEXT,
@@ -630,3 +633,58 @@ def test_bad_input_token_counter(model, messages):
         messages=messages,
         default_token_count=1000,
     )
+
+
+class _RecordingTokenizerBackend(BaseTokenizerBackend):
+    """one token per word - records every batch it tokenizes"""
+
+    def __init__(self):
+        self.tokenizer_id = f"recording:{uuid.uuid4()}"
+        self.batches = []
+
+    def count_tokens(self, text: str) -> int:
+        self.batches.append([text])
+        return len(text.split())
+
+    def count_tokens_batch(self, texts):
+        self.batches.append(list(texts))
+        return [len(text.split()) for text in texts]
+
+
+def test_token_counter_only_tokenizes_new_messages():
+    tokenizer = _RecordingTokenizerBackend()
+    messages = [
+        {"role": "system", "content": "be brief"},
+        {"role": "user", "content": [{"type": "text", "text": "hello there"}]},
+    ]
+    first = token_counter_new(messages=messages, custom_tokenizer=tokenizer)
+    assert tokenizer.batches == [["system", "be brief", "user", "hello there"]]
+
+    messages = messages + [{"role": "assistant", "content": "hi, how can I help"}]
+    second = token_counter_new(messages=messages, custom_tokenizer=tokenizer)
+    assert tokenizer.batches[1:] == [["assistant", "hi, how can I help"]]
+    assert second == first + 3 + 1 + 5  # per-message tokens + role + content
+
+
+def test_token_counter_caches_tool_definitions():
+    tokenizer = _RecordingTokenizerBackend()
+    tools = [
+        {
+            "type": "function",
+            "function": {"name": "get_weather", "parameters": {"type": "object"}},
+        }
+    ]
+    messages = [{"role": "user", "content": "weather?"}]
+    counts = [
+        token_counter_new(messages=messages, tools=tools, custom_tokenizer=tokenizer)
+        for _ in range(2)
+    ]
+    assert counts[0] == counts[1]
+    assert len(tokenizer.batches) == 2  # the message batch + the tool definitions
+
+
+def test_batch_token_counter():
+    texts = ["hello world", "", "The quick brown fox jumps over the lazy dog"]
+    assert batch_token_counter(texts, model="gpt-4o") == [
+        token_counter_new(model="gpt-4o", text=text) for text in texts
+    ]
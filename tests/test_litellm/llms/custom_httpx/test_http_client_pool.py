@@ -0,0 +1,185 @@
+import asyncio
+import gc
+import os
+import sys
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.llms.custom_httpx.http_client_pool import HTTPClientPool
+from litellm.llms.custom_httpx.http_handler import (
+    AsyncHTTPHandler,
+    HTTPHandler,
+    _get_httpx_client,
+    _should_use_http2,
+    get_async_httpx_client,
+)
+
+
+def test_http_client_pool_normalizes_config():
+    """
+    Equivalent configs should share a client, different api base hosts should not
+    """
+    client_1 = _get_httpx_client(params={"timeout": 600})
+    client_2 = _get_httpx_client(params={"timeout": 600.0})
+    client_3 = _get_httpx_client(params={"timeout": httpx.Timeout(600)})
+    assert client_1 is client_2 is client_3
+
+    client_4 = _get_httpx_client(
+        params={"timeout": 600}, api_base="https://api.openai.com/v1/chat/completions"
+    )
+    client_5 = _get_httpx_client(
+        params={"timeout": 600}, api_base="https://API.openai.com/v1/embeddings"
+    )
+    client_6 = _get_httpx_client(
+        params={"timeout": 600}, api_base="https://api.anthropic.com"
+    )
+    assert client_4 is client_5
+    assert client_4 is not client_1
+    assert client_4 is not client_6
+
+
+def test_http_client_pool_key_compares_objects_by_identity():
+    """
+    Params like ssl contexts are compared by identity - the key holds them, so their id can't be reused by a new object
+    """
+    import ssl
+
+    ssl_context = ssl.create_default_context()
+    key_1 = HTTPClientPool.get_pool_key(
+        client_type="sync", params={"ssl_verify": ssl_context}
+    )
+    assert key_1 == HTTPClientPool.get_pool_key(
+        client_type="sync", params={"ssl_verify": ssl_context}
+    )
+
+    del ssl_context
+    gc.collect()
+    for _ in range(10):
+        assert key_1 != HTTPClientPool.get_pool_key(
+            client_type="sync", params={"ssl_verify": ssl.create_default_context()}
+        )
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_async_client_per_provider():
+    client_1 = get_async_httpx_client(llm_provider=litellm.LlmProviders.OPENAI)
+    client_2 = get_async_httpx_client(llm_provider="openai")
+    client_3 = get_async_httpx_client(llm_provider=litellm.LlmProviders.ANTHROPIC)
+
+    assert isinstance(client_1, AsyncHTTPHandler)
+    assert client_1 is client_2
+    assert client_1 is not client_3
+
+
+def test_http_client_pool_bounded_lru():
+    pool = HTTPClientPool(max_size=2)
+
+    def get_client(name: str) -> HTTPHandler:
+        return pool.get_client(
+            key=HTTPClientPool.get_pool_key(client_type="sync", llm_provider=name),
+            create_client=HTTPHandler,
+        )
+
+    client_a = get_client("a")
+    get_client("b")
+    assert get_client("a") is client_a  # "a" is now the most recently used
+    get_client("c")
+
+    assert len(pool.clients) == 2
+    assert pool.evictions == 1
+    assert get_client("a") is client_a
+    assert pool.get_stats()["pooled_clients"] == 2
+
+
+def test_http_client_pool_closes_evicted_client_when_released():
+    """
+    Evicted clients should stay open while a caller holds them, and be closed once released
+    """
+    pool = HTTPClientPool(max_size=1)
+    key_a = HTTPClientPool.get_pool_key(client_type="sync", llm_provider="a")
+    key_b = HTTPClientPool.get_pool_key(client_type="sync", llm_provider="b")
+
+    client_a = pool.get_client(key=key_a, create_client=HTTPHandler)
+    underlying_client = client_a.client
+    pool.get_client(key=key_b, create_client=HTTPHandler)  # evicts "a"
+
+    assert key_a not in pool.clients
+    assert underlying_client.is_closed is False
+    assert pool.get_stats()["open_clients"] == 2
+
+    del client_a
+    gc.collect()
+
+    assert underlying_client.is_closed is True
+    stats = pool.get_stats()
+    assert stats["clients_closed"] == 1
+    assert stats["open_clients"] == 1
+
+
+@pytest.mark.asyncio
+async def test_http_client_pool_closes_released_async_client_on_its_loop():
+    pool = HTTPClientPool(max_size=1)
+    key_a = HTTPClientPool.get_pool_key(client_type="async", llm_provider="a")
+    key_b = HTTPClientPool.get_pool_key(client_type="async", llm_provider="b")
+
+    client_a = pool.get_client(key=key_a, create_client=AsyncHTTPHandler)
+    underlying_client = client_a.client
+    pool.get_client(key=key_b, create_client=AsyncHTTPHandler)  # evicts "a"
+    del client_a
+    gc.collect()
+
+    assert pool.get_stats()["clients_closed"] == 0  # close is scheduled on the loop
+    for _ in range(3):
+        await asyncio.sleep(0)
+    assert underlying_client.is_closed is True
+    assert pool.get_stats()["clients_closed"] == 1
+
+
+def test_http_client_pool_does_not_count_async_client_without_loop():
+    pool = HTTPClientPool(max_size=1)
+    loop = asyncio.new_event_loop()
+
+    async def _get_client(name: str) -> AsyncHTTPHandler:
+        return pool.get_client(
+            key=HTTPClientPool.get_pool_key(client_type="async", llm_provider=name),
+            create_client=AsyncHTTPHandler,
+        )
+
+    client_a = loop.run_until_complete(_get_client("a"))
+    loop.run_until_complete(_get_client("b"))  # evicts "a"
+    loop.close()
+    del client_a
+    gc.collect()
+
+    assert pool.get_stats()["clients_closed"] == 0
+
+
+def test_http_client_pool_idle_ttl():
+    pool = HTTPClientPool(ttl=60)
+    key = HTTPClientPool.get_pool_key(client_type="sync", llm_provider="a")
+
+    client_1 = pool.get_client(key=key, create_client=HTTPHandler)
+    assert pool.get_client(key=key, create_client=HTTPHandler) is client_1
+
+    pool.clients[key].last_used_at -= 61
+    client_2 = pool.get_client(key=key, create_client=HTTPHandler)
+    assert client_2 is not client_1
+
+    stats = pool.get_stats()
+    assert stats["client_hits"] == 1
+    assert stats["client_misses"] == 2
+    assert stats["reuse_ratio"] == pytest.approx(1 / 3)
+
+
+def test_should_use_http2(monkeypatch):
+    monkeypatch.setattr(litellm, "enable_http2", False)
+    assert _should_use_http2() is False
+
+    monkeypatch.setattr(litellm, "enable_http2", True)
+    monkeypatch.setitem(sys.modules, "h2", None)  # h2 not installed
+    assert _should_use_http2() is False
@@ -0,0 +1,128 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm.proxy._types import LiteLLM_UserTable, UserAPIKeyAuth, hash_token
+from litellm.proxy.auth.auth_result_cache import AuthResultCache
+
+
+def _valid_token(key: str = "sk-1234", **kwargs) -> UserAPIKeyAuth:
+    return UserAPIKeyAuth(token=hash_token(key), **kwargs)
+
+
+def test_auth_result_cache_lru_and_ttl(monkeypatch):
+    cache = AuthResultCache(max_size=2, ttl=60)
+    for key in ["sk-1", "sk-2"]:
+        cache.set(hash_token(key), valid_token=_valid_token(key), user_obj=None)
+    assert cache.get(hash_token("sk-1")) is not None  # sk-2 is now least recently used
+
+    cache.set(hash_token("sk-3"), valid_token=_valid_token("sk-3"), user_obj=None)
+    assert cache.get(hash_token("sk-2")) is None
+    assert cache.get(hash_token("sk-1")) is not None
+
+    monkeypatch.setattr(
+        "litellm.proxy.auth.auth_result_cache.time.time", lambda: 10**12
+    )
+    assert cache.get(hash_token("sk-1")) is None
+
+
+def test_auth_result_cache_disabled():
+    cache = AuthResultCache(max_size=0)
+    cache.set(hash_token("sk-1"), valid_token=_valid_token("sk-1"), user_obj=None)
+    assert cache.get(hash_token("sk-1")) is None
+
+
+def test_auth_result_cache_invalidation():
+    cache = AuthResultCache(max_size=10)
+    cache.set(
+        hash_token("sk-1"),
+        valid_token=_valid_token("sk-1", team_id="team-1", user_id="user-1"),
+        user_obj=None,
+    )
+    cache.set(
+        hash_token("sk-2"),
+        valid_token=_valid_token("sk-2", team_id="team-1", user_id="user-2"),
+        user_obj=None,
+    )
+    cache.set(
+        hash_token("sk-3"),
+        valid_token=_valid_token("sk-3", user_id="user-2"),
+        user_obj=None,
+    )
+
+    cache.invalidate_key("sk-1")  # raw key
+    assert cache.get(hash_token("sk-1")) is None
+
+    cache.invalidate_team("team-1")
+    assert cache.get(hash_token("sk-2")) is None
+    assert cache.get(hash_token("sk-3")) is not None
+
+    cache.invalidate_user("user-2")
+    assert cache.get(hash_token("sk-3")) is None
+    assert cache._tokens_by_team_id == {} and cache._tokens_by_user_id == {}
+
+
+def test_auth_result_cache_increment_spend():
+    cache = AuthResultCache(max_size=10)
+    user_obj = LiteLLM_UserTable(user_id="user-1", spend=1.0)
+    for key in ["sk-1", "sk-2"]:
+        cache.set(
+            hash_token(key),
+            valid_token=_valid_token(key, user_id="user-1", spend=2.0, team_spend=3.0),
+            user_obj=user_obj,
+        )
+    valid_token = cache.get(hash_token("sk-1")).valid_token
+
+    cache.increment_key_spend(hash_token("sk-1"), response_cost=0.5)
+    cache.increment_user_spend("user-1", response_cost=0.5)
+
+    result = cache.get(hash_token("sk-1"))
+    assert result.valid_token.spend == 2.5
+    assert result.valid_token.team_spend == 3.5
+    assert result.valid_token.team_member_spend is None
+    assert result.user_obj.spend == 1.5
+    assert cache.get(hash_token("sk-2")).user_obj.spend == 1.5
+    # cached objects are replaced, not mutated
+    assert valid_token.spend == 2.0 and user_obj.spend == 1.0
+
+
+@pytest.mark.parametrize(
+    "models, model, expected",
+    [
+        (["gpt-4o"], "gpt-4o", True),
+        (["gpt-4o"], "gpt-4o-mini", False),  # falls back to can_key_call_model
+        (["openai/*"], "openai/gpt-4o", False),
+        ([], "gpt-4o", True),
+        (["*"], "gpt-4o", True),
+        (["gpt-4o"], ["gpt-4o"], False),
+    ],
+)
+def test_auth_result_can_call_model(models, model, expected):
+    cache = AuthResultCache(max_size=10)
+    cache.set(
+        hash_token("sk-1"),
+        valid_token=_valid_token("sk-1", models=models),
+        user_obj=None,
+    )
+    assert (
+        cache.get(hash_token("sk-1")).can_call_model(model, llm_router=None) is expected
+    )
+
+
+def test_auth_result_can_call_model_alias(monkeypatch):
+    monkeypatch.setattr(litellm, "model_alias_map", {"gpt-4o": "gpt-4"})
+    cache = AuthResultCache(max_size=10)
+    cache.set(
+        hash_token("sk-1"),
+        valid_token=_valid_token("sk-1", models=["gpt-4o"]),
+        user_obj=None,
+    )
+    assert (
+        cache.get(hash_token("sk-1")).can_call_model("gpt-4o", llm_router=None) is False
+    )
@@ -350,7 +350,11 @@ async def test_aggregate_queue_updates_accuracy(daily_spend_update_queue):
     await daily_spend_update_queue.aggregate_queue_updates()
     updates = await daily_spend_update_queue.flush_all_updates_from_in_memory_queue()
     print("AGGREGATED UPDATES", json.dumps(updates, indent=4))
-    daily_spend_update_transactions = updates[0]
+    # the queue holds one item per transaction key
+    assert len(updates) == 2
+    daily_spend_update_transactions = (
+        DailySpendUpdateQueue.get_aggregated_daily_spend_update_transactions(updates)
+    )
 
     # Should have 2 keys after aggregation (test_key1/test_key2 combined, and test_key3)
     assert len(daily_spend_update_transactions) == 2
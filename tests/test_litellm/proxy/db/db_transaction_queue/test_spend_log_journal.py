@@ -0,0 +1,185 @@
+import os
+import sys
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.proxy.db.db_transaction_queue.spend_log_journal import SpendLogJournal
+from litellm.proxy.utils import ProxyUpdateSpend
+
+
+def _spend_log(request_id: str) -> dict:
+    return {
+        "request_id": request_id,
+        "spend": 0.1,
+        "startTime": datetime(2025, 1, 1, tzinfo=timezone.utc),
+        "metadata": {"user_api_key": "hashed"},
+    }
+
+
+def test_read_and_commit_spend_logs(tmp_path):
+    journal = SpendLogJournal(journal_dir=str(tmp_path), segment_size_bytes=200)
+    for i in range(5):
+        assert journal.append(_spend_log(f"request-{i}")) is True
+    assert journal.get_stats()["segments"] > 1
+
+    rows, cursor = journal.read_batch(max_rows=3)
+    assert [row["request_id"] for row in rows] == [
+        "request-0",
+        "request-1",
+        "request-2",
+    ]
+    # rows are ready for `create_many`
+    assert rows[0]["startTime"] == datetime(2025, 1, 1, tzinfo=timezone.utc)
+    assert rows[0]["metadata"] == '{"user_api_key": "hashed"}'
+
+    # not committed - the same rows are read again
+    assert journal.read_batch(max_rows=3)[0] == rows
+
+    journal.commit(cursor=cursor, rows=len(rows))
+    rows, cursor = journal.read_batch(max_rows=10)
+    assert [row["request_id"] for row in rows] == ["request-3", "request-4"]
+    journal.commit(cursor=cursor, rows=len(rows))
+
+    assert journal.read_batch(max_rows=10)[0] == []
+    assert journal.get_stats()["pending_rows"] == 0
+    assert journal.get_stats()["segments"] == 1
+
+
+def test_journal_recovers_uncommitted_spend_logs_after_restart(tmp_path):
+    journal = SpendLogJournal(journal_dir=str(tmp_path))
+    for i in range(3):
+        journal.append(_spend_log(f"request-{i}"))
+    rows, cursor = journal.read_batch(max_rows=1)
+    journal.commit(cursor=cursor, rows=len(rows))
+    # crash mid-write
+    journal._write_file.write(b'{"request_id": "partial')
+    journal._write_file.flush()
+    journal.close()
+
+    journal = SpendLogJournal(journal_dir=str(tmp_path))
+    assert journal.get_stats()["pending_rows"] == 2
+    assert [row["request_id"] for row in journal.read_batch(max_rows=10)[0]] == [
+        "request-1",
+        "request-2",
+    ]
+
+
+def test_full_journal_drops_spend_logs(tmp_path):
+    journal = SpendLogJournal(journal_dir=str(tmp_path), max_size_bytes=250)
+    results = [journal.append(_spend_log(f"request-{i}")) for i in range(5)]
+
+    assert results[0] is True
+    assert results[-1] is False
+    stats = journal.get_stats()
+    assert stats["dropped_rows"] == results.count(False)
+    assert stats["size_bytes"] <= 250
+
+
+def test_each_process_claims_its_own_journal_dir(tmp_path):
+    journal_1 = SpendLogJournal(journal_dir=str(tmp_path))
+    journal_2 = SpendLogJournal(journal_dir=str(tmp_path))
+    assert journal_1.journal_dir != journal_2.journal_dir
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_from_journal(tmp_path, monkeypatch):
+    monkeypatch.setattr("litellm.proxy.utils.SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE", 2)
+    journal = SpendLogJournal(journal_dir=str(tmp_path))
+    for i in range(5):
+        journal.append(_spend_log(f"request-{i}"))
+    prisma_client = MagicMock()
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock()
+
+    await ProxyUpdateSpend.update_spend_logs_from_journal(
+        n_retry_times=0,
+        prisma_client=prisma_client,
+        spend_log_journal=journal,
+        proxy_logging_obj=MagicMock(),
+    )
+
+    assert prisma_client.db.litellm_spendlogs.create_many.call_count == 3
+    assert journal.get_stats()["pending_rows"] == 0
+
+
+@pytest.mark.asyncio
+async def test_update_spend_logs_from_journal_keeps_rows_on_db_errors(tmp_path):
+    journal = SpendLogJournal(journal_dir=str(tmp_path))
+    journal.append(_spend_log("request-0"))
+    prisma_client = MagicMock()
+    proxy_logging_obj = MagicMock()
+    proxy_logging_obj.failure_handler = AsyncMock()
+
+    # connection error - the rows stay in the journal
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock(
+        side_effect=httpx.ConnectError("Failed to connect")
+    )
+    with pytest.raises(httpx.ConnectError):
+        await ProxyUpdateSpend.update_spend_logs_from_journal(
+            n_retry_times=0,
+            prisma_client=prisma_client,
+            spend_log_journal=journal,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+    assert journal.get_stats()["pending_rows"] == 1
+
+    # rejected by the db - the rows are quarantined, the next batch is still written
+    journal.append(_spend_log("request-1"))
+    prisma_client.db.litellm_spendlogs.create_many = AsyncMock(
+        side_effect=[Exception("invalid row"), None]
+    )
+    with patch("litellm.proxy.utils.SPEND_LOG_JOURNAL_FLUSH_BATCH_SIZE", 1):
+        await ProxyUpdateSpend.update_spend_logs_from_journal(
+            n_retry_times=0,
+            prisma_client=prisma_client,
+            spend_log_journal=journal,
+            proxy_logging_obj=proxy_logging_obj,
+        )
+    assert prisma_client.db.litellm_spendlogs.create_many.call_count == 2
+    assert journal.get_stats()["pending_rows"] == 0
+    assert journal.get_stats()["quarantined_rows"] == 1
+    with open(os.path.join(journal.journal_dir, "quarantine.log")) as f:
+        assert "request-0" in f.read()
+
+
+@pytest.mark.asyncio
+async def test_async_append_and_read_batch(tmp_path):
+    journal = SpendLogJournal(journal_dir=str(tmp_path))
+    assert await journal.async_append(_spend_log("request-0")) is True
+
+    rows, cursor = await journal.async_read_batch(max_rows=10)
+    assert [row["request_id"] for row in rows] == ["request-0"]
+    await journal.async_commit(cursor=cursor, rows=len(rows))
+    assert journal.get_stats()["pending_rows"] == 0
+
+
+def test_orphaned_journal_dir_is_adopted_on_startup(tmp_path):
+    journals = [SpendLogJournal(journal_dir=str(tmp_path)) for _ in range(3)]
+    for i in range(3):
+        journals[1].append(_spend_log(f"request-{i}"))
+    rows, cursor = journals[1].read_batch(max_rows=1)
+    journals[1].commit(cursor=cursor, rows=len(rows))
+    journals[2].append(_spend_log("request-live"))
+    # after a restart, only 2 workers come back - worker-1's dir is no longer locked
+    journals[0].close()
+    journals[1].close()
+
+    journal = SpendLogJournal(journal_dir=str(tmp_path))
+
+    assert journal.journal_dir == journals[0].journal_dir
+    assert [row["request_id"] for row in journal.read_batch(max_rows=10)[0]] == [
+        "request-1",
+        "request-2",
+    ]
+    assert journal.get_stats()["pending_rows"] == 2
+    assert os.listdir(journals[1].journal_dir) == ["lock"]
+    # a live worker's journal is left alone
+    assert [row["request_id"] for row in journals[2].read_batch(max_rows=10)[0]] == [
+        "request-live"
+    ]
@@ -263,3 +263,63 @@ async def test_queue_size_reduction_with_large_volume(monkeypatch, spend_queue):
     )
     assert aggregated["user_list_transactions"]["user1"] == 200 * 0.5
     assert aggregated["key_list_transactions"]["key1"] == 300 * 1.0
+
+
+@pytest.mark.asyncio
+async def test_updates_aggregated_on_insert(spend_queue):
+    """Updates for the same entity are merged on insert, without mutating the caller's update"""
+    update: SpendUpdateQueueItem = {
+        "entity_type": Litellm_EntityType.KEY,
+        "entity_id": "key-1",
+        "response_cost": 1.0,
+    }
+    for _ in range(3):
+        await spend_queue.add_update(update)
+    await spend_queue.add_update(
+        {"entity_type": Litellm_EntityType.KEY, "entity_id": "key-2"}
+    )
+
+    assert spend_queue.update_queue.qsize() == 2
+    assert update["response_cost"] == 1.0
+    assert spend_queue.update_queue.oldest_item_age() >= 0
+
+    updates = await spend_queue.flush_all_updates_from_in_memory_queue()
+    assert [u["entity_id"] for u in updates] == ["key-1", "key-2"]
+    assert updates[0]["response_cost"] == 3.0
+    assert spend_queue.update_queue.empty()
+
+
+@pytest.mark.asyncio
+async def test_queue_full_calls_overflow_handler(monkeypatch, spend_queue):
+    """Once the queue holds MAX_SIZE_IN_MEMORY_QUEUE entities, a new entity triggers the overflow handler"""
+    monkeypatch.setattr(spend_queue, "MAX_SIZE_IN_MEMORY_QUEUE", 2)
+    overflowed = []
+
+    async def overflow_handler(queue):
+        overflowed.extend(await queue.flush_all_updates_from_in_memory_queue())
+        return True
+
+    spend_queue.overflow_handler = overflow_handler
+    for entity_id in ["user-1", "user-2", "user-1"]:
+        await spend_queue.add_update(
+            {
+                "entity_type": Litellm_EntityType.USER,
+                "entity_id": entity_id,
+                "response_cost": 1.0,
+            }
+        )
+    # queued entity - no overflow
+    assert overflowed == []
+
+    await spend_queue.add_update(
+        {
+            "entity_type": Litellm_EntityType.USER,
+            "entity_id": "user-3",
+            "response_cost": 1.0,
+        }
+    )
+    assert {u["entity_id"]: u["response_cost"] for u in overflowed} == {
+        "user-1": 2.0,
+        "user-2": 1.0,
+    }
+    assert spend_queue.update_queue.qsize() == 1
@@ -135,3 +135,37 @@ async def test_update_daily_spend_with_null_entity_id():
     assert create_data["api_requests"] == 1
     assert create_data["successful_requests"] == 1
     assert create_data["failed_requests"] == 0
+
+
+@pytest.mark.asyncio
+async def test_in_memory_queue_overflow_moves_updates_to_redis(monkeypatch):
+    """
+    A full in-memory queue is moved to the redis buffer when `use_redis_transaction_buffer` is enabled
+    """
+    from litellm.proxy._types import Litellm_EntityType
+    from litellm.proxy.db.db_transaction_queue.redis_update_buffer import (
+        RedisUpdateBuffer,
+    )
+
+    writer = DBSpendUpdateWriter(redis_cache=MagicMock())
+    writer.redis_update_buffer.store_in_memory_spend_updates_in_redis = AsyncMock()
+    monkeypatch.setattr(writer.spend_update_queue, "MAX_SIZE_IN_MEMORY_QUEUE", 1)
+
+    update = {"entity_type": Litellm_EntityType.KEY, "response_cost": 1.0}
+    with patch.object(
+        RedisUpdateBuffer, "_should_commit_spend_updates_to_redis", return_value=False
+    ):
+        await writer.spend_update_queue.add_update({**update, "entity_id": "key-1"})
+        await writer.spend_update_queue.add_update({**update, "entity_id": "key-2"})
+    writer.redis_update_buffer.store_in_memory_spend_updates_in_redis.assert_not_called()
+
+    with patch.object(
+        RedisUpdateBuffer, "_should_commit_spend_updates_to_redis", return_value=True
+    ):
+        await writer.spend_update_queue.add_update({**update, "entity_id": "key-3"})
+    writer.redis_update_buffer.store_in_memory_spend_updates_in_redis.assert_awaited_once_with(
+        spend_update_queue=writer.spend_update_queue,
+        daily_spend_update_queue=writer.daily_spend_update_queue,
+        daily_team_spend_update_queue=writer.daily_team_spend_update_queue,
+        daily_tag_spend_update_queue=writer.daily_tag_spend_update_queue,
+    )
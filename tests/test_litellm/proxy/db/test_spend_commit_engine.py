@@ -0,0 +1,148 @@
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+
+from litellm.constants import MAX_SIZE_IN_MEMORY_QUEUE
+from litellm.proxy._types import DBSpendUpdateTransactions
+from litellm.proxy.db.spend_commit_engine import (
+    SPEND_UPDATE_TABLES,
+    SpendCommitEngine,
+    get_spend_update_query,
+)
+
+
+def _spend_update_transactions(**kwargs) -> DBSpendUpdateTransactions:
+    transactions = DBSpendUpdateTransactions(
+        user_list_transactions=None,
+        end_user_list_transactions=None,
+        key_list_transactions=None,
+        team_list_transactions=None,
+        team_member_list_transactions=None,
+        org_list_transactions=None,
+    )
+    transactions.update(kwargs)  # type: ignore
+    return transactions
+
+
+def _mock_prisma_client(execute_raw: AsyncMock) -> MagicMock:
+    prisma_client = MagicMock()
+    transaction = MagicMock()
+    transaction.execute_raw = execute_raw
+    prisma_client.db.tx.return_value.__aenter__.return_value = transaction
+    return prisma_client
+
+
+def test_get_spend_update_query():
+    query = get_spend_update_query(
+        SPEND_UPDATE_TABLES["team_member_list_transactions"], 2
+    )
+    assert query == (
+        'UPDATE "LiteLLM_TeamMembership" AS t '
+        'SET "spend" = t."spend" + v."spend" '
+        'FROM (VALUES ($1::text, $2::text, $3::double precision), ($4::text, $5::text, $6::double precision)) AS v("team_id", "user_id", "spend") '
+        'WHERE t."team_id" = v."team_id" AND t."user_id" = v."user_id"'
+    )
+
+    query = get_spend_update_query(SPEND_UPDATE_TABLES["key_list_transactions"], 1)
+    assert '"updated_at" = now()' in query
+
+    query = get_spend_update_query(SPEND_UPDATE_TABLES["end_user_list_transactions"], 1)
+    assert query.startswith('INSERT INTO "LiteLLM_EndUserTable"')
+    assert "ON CONFLICT" in query
+
+
+@pytest.mark.asyncio
+async def test_commit_spend_updates_one_statement_per_table():
+    execute_raw = AsyncMock()
+    prisma_client = _mock_prisma_client(execute_raw=execute_raw)
+
+    await SpendCommitEngine().commit_spend_updates(
+        prisma_client=prisma_client,
+        n_retry_times=0,
+        proxy_logging_obj=MagicMock(),
+        db_spend_update_transactions=_spend_update_transactions(
+            key_list_transactions={"key-b": 2.0, "key-a": 1.0, "key-c": 3.0},
+            team_member_list_transactions={"team_id::team-1::user_id::user-1": 0.5},
+        ),
+    )
+
+    # one transaction per table
+    assert prisma_client.db.tx.call_count == 2
+    assert execute_raw.call_count == 2
+    key_call, team_member_call = execute_raw.call_args_list
+    assert '"LiteLLM_VerificationToken"' in key_call.args[0]
+    # sorted by id, so concurrent writers lock rows in the same order
+    assert key_call.args[1:] == ("key-a", 1.0, "key-b", 2.0, "key-c", 3.0)
+    assert team_member_call.args[1:] == ("team-1", "user-1", 0.5)
+
+
+@pytest.mark.asyncio
+async def test_commit_spend_updates_splits_large_tables(monkeypatch):
+    monkeypatch.setattr(
+        "litellm.proxy.db.spend_commit_engine.SPEND_UPDATE_MAX_ROWS_PER_STATEMENT", 2
+    )
+    execute_raw = AsyncMock()
+    prisma_client = _mock_prisma_client(execute_raw=execute_raw)
+    engine = SpendCommitEngine()
+
+    await engine.commit_spend_updates(
+        prisma_client=prisma_client,
+        n_retry_times=0,
+        proxy_logging_obj=MagicMock(),
+        db_spend_update_transactions=_spend_update_transactions(
+            user_list_transactions={f"user-{i}": 1.0 for i in range(5)}
+        ),
+    )
+
+    assert prisma_client.db.tx.call_count == 1
+    assert [len(call.args) - 1 for call in execute_raw.call_args_list] == [4, 4, 2]
+    assert engine.table_stats["LiteLLM_UserTable"]["rows"] == 5
+
+
+@pytest.mark.asyncio
+async def test_commit_spend_updates_skips_rejected_table():
+    execute_raw = AsyncMock(side_effect=[Exception("invalid row"), None])
+    prisma_client = _mock_prisma_client(execute_raw=execute_raw)
+    proxy_logging_obj = MagicMock()
+    proxy_logging_obj.failure_handler = AsyncMock()
+    engine = SpendCommitEngine()
+
+    await engine.commit_spend_updates(
+        prisma_client=prisma_client,
+        n_retry_times=0,
+        proxy_logging_obj=proxy_logging_obj,
+        db_spend_update_transactions=_spend_update_transactions(
+            user_list_transactions={"user-1": 1.0},
+            key_list_transactions={"key-1": 1.0},
+        ),
+    )
+
+    # the key table is still committed after the user table is rejected
+    assert execute_raw.call_count == 2
+    assert '"LiteLLM_VerificationToken"' in execute_raw.call_args_list[1].args[0]
+    assert list(engine.table_stats) == ["LiteLLM_VerificationToken"]
+
+
+def test_get_next_flush_interval():
+    engine = SpendCommitEngine()
+    assert engine.get_next_flush_interval(base_interval=10, queue_depth=0) == 10
+
+    # queue filling up -> flush sooner
+    assert (
+        engine.get_next_flush_interval(
+            base_interval=10, queue_depth=MAX_SIZE_IN_MEMORY_QUEUE
+        )
+        == 5
+    )
+
+    # slow db -> back off
+    engine.db_latency_ewma = 8
+    assert engine.get_next_flush_interval(base_interval=10, queue_depth=0) == 16
+    engine.db_latency_ewma = 100
+    assert engine.get_next_flush_interval(base_interval=10, queue_depth=0) == 40
@@ -108,9 +108,9 @@ async def test_sliding_window_rate_limit_v3(monkeypatch):
 
 
 @pytest.mark.asyncio
-async def test_rate_limiter_script_return_values_v3(monkeypatch):
+async def test_in_memory_rate_limiter_counter_values_v3(monkeypatch):
     """
-    Test that the rate limiter script returns both counter and window values correctly
+    Test that the in-memory rate limiter tracks a counter per key, and drains it after the window
     """
     monkeypatch.setenv("LITELLM_RATE_LIMIT_WINDOW_SIZE", "2")
     _api_key = "sk-12345"
@@ -121,71 +121,20 @@ async def test_rate_limiter_script_return_values_v3(monkeypatch):
         internal_usage_cache=InternalUsageCache(local_cache)
     )
 
-    # Mock the batch_rate_limiter_script to simulate window expiry and use correct key construction
-    window_starts: Dict[str, int] = {}
-
-    async def mock_batch_rate_limiter(*args, **kwargs):
-        keys = kwargs.get("keys") if kwargs else args[0]
-        args_list = kwargs.get("args") if kwargs else args[1]
-        now = args_list[0]
-        window_size = args_list[1]
-        results = []
-        for i in range(0, len(keys), 3):
-            window_key = keys[i]
-            counter_key = keys[i + 1]
-            # Simulate window expiry
-            prev_window = window_starts.get(window_key)
-            prev_counter = await local_cache.async_get_cache(key=counter_key) or 0
-            if prev_window is None or (now - prev_window) >= window_size:
-                # Window expired, reset
-                window_starts[window_key] = now
-                new_counter = 1
-                await local_cache.async_set_cache(
-                    key=window_key, value=now, ttl=window_size
-                )
-                await local_cache.async_set_cache(
-                    key=counter_key, value=new_counter, ttl=window_size
-                )
-            else:
-                new_counter = prev_counter + 1
-                await local_cache.async_set_cache(
-                    key=counter_key, value=new_counter, ttl=window_size
-                )
-            results.append(now)
-            results.append(new_counter)
-        return results
-
-    parallel_request_handler.batch_rate_limiter_script = mock_batch_rate_limiter
+    counter_key = f"{{api_key:{_api_key}}}:requests"
 
     # Make first request
     await parallel_request_handler.async_pre_call_hook(
         user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
     )
-
-    # Verify both counter and window values are stored in cache
-    window_key = f"{{api_key:{_api_key}}}:window"
-    counter_key = f"{{api_key:{_api_key}}}:requests"
-
-    window_value = await local_cache.async_get_cache(key=window_key)
-    counter_value = await local_cache.async_get_cache(key=counter_key)
-
-    assert window_value is not None, "Window value should be stored in cache"
-    assert counter_value is not None, "Counter value should be stored in cache"
-    assert counter_value == 1, "Counter should be 1 after first request"
+    counter = parallel_request_handler.in_memory_counters[counter_key]
+    assert counter.level == 1, "Counter should be 1 after first request"
 
     # Make second request
     await parallel_request_handler.async_pre_call_hook(
         user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
     )
-
-    # Verify counter increased but window stayed same
-    new_window_value = await local_cache.async_get_cache(key=window_key)
-    new_counter_value = await local_cache.async_get_cache(key=counter_key)
-
-    assert (
-        new_window_value == window_value
-    ), "Window value should not change within window"
-    assert new_counter_value == 2, "Counter should be 2 after second request"
+    assert 1 < counter.level <= 2, "Counter should be ~2 after second request"
 
     # Wait for window to expire
     await asyncio.sleep(3)
@@ -194,13 +143,152 @@ async def test_rate_limiter_script_return_values_v3(monkeypatch):
     await parallel_request_handler.async_pre_call_hook(
         user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
     )
+    assert counter.level == 1, "Counter should reset to 1 after window expiry"
 
-    # Verify new window and reset counter
-    final_window_value = await local_cache.async_get_cache(key=window_key)
-    final_counter_value = await local_cache.async_get_cache(key=counter_key)
 
-    assert final_window_value != window_value, "Window value should change after expiry"
-    assert final_counter_value == 1, "Counter should reset to 1 after window expiry"
+def test_in_memory_rate_limiter_no_burst_at_window_edge_v3():
+    """
+    A client that used its full limit at the end of one window should not get a second full burst right after - the counter drains at limit / window_size.
+    """
+    handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(DualCache())
+    )
+    handler.window_size = 60
+    window_key = "{api_key:test}:window"
+    keys = [window_key, "{api_key:test}:requests"]
+    key_metadata = {
+        window_key: {
+            "requests_limit": 6,
+            "tokens_limit": None,
+            "max_parallel_requests_limit": None,
+            "window_size": 60,
+            "descriptor_key": "api_key",
+        }
+    }
+
+    def make_request(now_int: int) -> bool:
+        values = handler.in_memory_sliding_window(
+            keys=keys, key_metadata=key_metadata, now_int=now_int, window_size=60
+        )
+        response = handler.is_cache_list_over_limit(keys, values, key_metadata)
+        if response["overall_code"] == "OVER_LIMIT":
+            return False
+        handler.in_memory_counters[keys[1]].level += 1
+        return True
+
+    # full burst at the end of a window
+    assert all(make_request(now_int=1059) for _ in range(6))
+    assert make_request(now_int=1059) is False
+
+    # 1s later - a fixed window would allow 6 more, here ~0.1 requests have drained
+    assert make_request(now_int=1060) is False
+
+    # 10s later - 1 request (6 per 60s) has drained
+    assert make_request(now_int=1069) is True
+    assert make_request(now_int=1069) is False
+
+
+@pytest.mark.asyncio
+async def test_rate_limiter_over_limit_request_not_counted_v3():
+    """
+    Rejected requests should not consume the limit, and the success / failure callbacks should update the in-memory counters
+    """
+    _api_key = hash_token("sk-12345")
+    user_api_key_dict = UserAPIKeyAuth(api_key=_api_key, max_parallel_requests=1)
+    local_cache = DualCache()
+    parallel_request_handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(local_cache)
+    )
+    counter_key = f"{{api_key:{_api_key}}}:max_parallel_requests"
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+    for _ in range(3):
+        with pytest.raises(HTTPException):
+            await parallel_request_handler.async_pre_call_hook(
+                user_api_key_dict=user_api_key_dict,
+                cache=local_cache,
+                data={},
+                call_type="",
+            )
+    assert parallel_request_handler.in_memory_counters[counter_key].level == 1
+
+    await parallel_request_handler.async_log_failure_event(
+        kwargs={"litellm_params": {"metadata": {"user_api_key": _api_key}}},
+        response_obj=None,
+        start_time=None,
+        end_time=None,
+    )
+    assert parallel_request_handler.in_memory_counters[counter_key].level == 0
+
+    await parallel_request_handler.async_pre_call_hook(
+        user_api_key_dict=user_api_key_dict, cache=local_cache, data={}, call_type=""
+    )
+
+
+def test_in_memory_rate_limiter_counters_bounded_v3():
+    handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(DualCache())
+    )
+    handler.max_in_memory_counters = 2
+
+    for i in range(3):
+        handler._get_in_memory_counter(counter_key=f"key-{i}", now_int=1000)
+
+    assert list(handler.in_memory_counters.keys()) == ["key-1", "key-2"]
+
+
+def test_batch_rate_limiter_script_matches_in_memory_v3():
+    """
+    The redis script and the in-memory rate limiter should implement the same algorithm
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    from litellm.proxy.hooks.parallel_request_limiter_v3 import (
+        BATCH_RATE_LIMITER_SCRIPT,
+    )
+
+    redis_script = fakeredis.FakeStrictRedis().register_script(
+        BATCH_RATE_LIMITER_SCRIPT
+    )
+    handler = _PROXY_MaxParallelRequestsHandler(
+        internal_usage_cache=InternalUsageCache(DualCache())
+    )
+    window_key = "{api_key:test}:window"
+    keys = [
+        window_key,
+        "{api_key:test}:requests",
+        window_key,
+        "{api_key:test}:max_parallel_requests",
+    ]
+    key_metadata = {
+        window_key: {
+            "requests_limit": 3,
+            "tokens_limit": None,
+            "max_parallel_requests_limit": 5,
+            "window_size": 60,
+            "descriptor_key": "api_key",
+        }
+    }
+
+    # redis key ttls run on wall-clock time, so stay within one window of the first request
+    for now_int in [100, 100, 100, 100, 101, 110, 130, 131, 150]:
+        redis_values = redis_script(keys=keys, args=[now_int, 60, 3, 5])
+        redis_response = handler.is_cache_list_over_limit(
+            keys, redis_values, key_metadata
+        )
+
+        values = handler.in_memory_sliding_window(
+            keys=keys, key_metadata=key_metadata, now_int=now_int, window_size=60
+        )
+        response = handler.is_cache_list_over_limit(keys, values, key_metadata)
+        if response["overall_code"] == "OK":
+            for counter_key in keys[1::2]:
+                handler.in_memory_counters[counter_key].level += 1
+
+        assert [int(v) for v in redis_values[1::2]] == values[1::2]
+        assert redis_response == response
 
 
 @pytest.mark.parametrize(
@@ -89,3 +89,25 @@ def test_get_model_group_info_order():
 
     model_groups = [m.model_group for m in model_list]
     assert model_groups == ["openai/tts-1", "openai/gpt-3.5-turbo"]
+
+
+@pytest.mark.asyncio
+async def test_emit_in_memory_cache_stats(monkeypatch):
+    from unittest.mock import AsyncMock
+
+    import litellm.proxy.proxy_server as proxy_server
+
+    monkeypatch.setattr(proxy_server, "llm_router", None)
+    proxy_logging_obj = ProxyLogging(user_api_key_cache=DualCache())
+    proxy_logging_obj.service_logging_obj = MagicMock()
+    proxy_logging_obj.service_logging_obj.async_service_success_hook = AsyncMock()
+    proxy_server.user_api_key_cache.get_cache(key="missing-key")
+
+    await proxy_logging_obj.emit_in_memory_cache_stats()
+
+    gauge_labels = {
+        call.kwargs["event_metadata"]["gauge_labels"]
+        for call in proxy_logging_obj.service_logging_obj.async_service_success_hook.call_args_list
+    }
+    assert "user_api_key_cache_misses" in gauge_labels
+    assert "internal_usage_cache_size" in gauge_labels
@@ -0,0 +1,222 @@
+import asyncio
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+import litellm
+from litellm.caching.caching import DualCache
+from litellm.router_strategy.lowest_latency import (
+    DeploymentLatencyStats,
+    LatencyRingBuffer,
+    LowestLatencyLoggingHandler,
+)
+
+model_list = [
+    {
+        "model_name": "gpt-4o",
+        "litellm_params": {"model": "gpt-4o", "api_base": "https://fast.example.com"},
+        "model_info": {"id": "fast"},
+    },
+    {
+        "model_name": "gpt-4o",
+        "litellm_params": {"model": "gpt-4o", "api_base": "https://slow.example.com"},
+        "model_info": {"id": "slow"},
+    },
+]
+
+
+def _get_kwargs(deployment_id: str) -> dict:
+    return {
+        "litellm_params": {
+            "metadata": {"model_group": "gpt-4o"},
+            "model_info": {"id": deployment_id},
+        }
+    }
+
+
+def _get_response(total_tokens: int = 10) -> litellm.ModelResponse:
+    return litellm.ModelResponse(
+        usage=litellm.Usage(
+            prompt_tokens=total_tokens - 1,
+            completion_tokens=1,
+            total_tokens=total_tokens,
+        )
+    )
+
+
+def test_latency_ring_buffer_overwrites_oldest_sample():
+    ring_buffer = LatencyRingBuffer(max_size=3)
+    for value in [1.0, 2.0, 3.0, 4.0, 5.0]:
+        ring_buffer.add(value)
+
+    assert len(ring_buffer) == 3
+    assert sorted(ring_buffer.samples) == [3.0, 4.0, 5.0]
+
+
+def test_deployment_latency_stats_rolls_over_minute():
+    stats = DeploymentLatencyStats(max_size=10)
+    stats.record_success(
+        latency=1.0, time_to_first_token=None, total_tokens=10, precise_minute="m1"
+    )
+    stats.record_success(
+        latency=1.0, time_to_first_token=None, total_tokens=10, precise_minute="m1"
+    )
+    assert stats.get_usage(precise_minute="m1") == (20, 2)
+
+    stats.record_success(
+        latency=1.0, time_to_first_token=None, total_tokens=5, precise_minute="m2"
+    )
+    assert stats.get_usage(precise_minute="m2") == (5, 1)
+    assert stats.get_usage(precise_minute="m3") == (0, 0)
+
+
+@pytest.mark.asyncio
+async def test_lowest_latency_concurrent_success_events():
+    """
+    Concurrent success events should all be recorded, and the latency window stays bounded
+    """
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(),
+        model_list=model_list,
+        routing_args={"max_latency_list_size": 5},
+    )
+
+    await asyncio.gather(
+        *[
+            handler.async_log_success_event(
+                kwargs=_get_kwargs("fast"),
+                response_obj=_get_response(total_tokens=10),
+                start_time=0.0,
+                end_time=1.0,
+            )
+            for _ in range(50)
+        ]
+    )
+
+    stats = handler._get_model_group_stats(model_group="gpt-4o")["fast"]
+    assert len(stats.latency) == 5
+    assert stats.rpm == 50
+    assert stats.tpm == 500
+
+
+@pytest.mark.parametrize(
+    "latency_percentile, expected_deployment_id",
+    [(None, "slow"), (50, "fast"), (95, "slow")],
+)
+def test_lowest_latency_routing_percentile(latency_percentile, expected_deployment_id):
+    """
+    "fast" is mostly fast with one very slow outlier, "slow" is consistently slow-ish
+
+    - mean: fast=(9 * 0.1 + 10) / 10 = 1.09 > slow=1 -> slow
+    - p50: fast=0.1 < slow=1 -> fast
+    - p95: fast=10 > slow=1 -> slow
+    """
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(),
+        model_list=model_list,
+        routing_args={"latency_percentile": latency_percentile},
+    )
+    for latency in [0.1] * 9 + [10.0]:
+        handler.log_success_event(
+            kwargs=_get_kwargs("fast"),
+            response_obj={},
+            start_time=0.0,
+            end_time=latency,
+        )
+    for _ in range(10):
+        handler.log_success_event(
+            kwargs=_get_kwargs("slow"),
+            response_obj={},
+            start_time=0.0,
+            end_time=1.0,
+        )
+
+    deployment = handler.get_available_deployments(
+        model_group="gpt-4o", healthy_deployments=model_list
+    )
+    assert deployment["model_info"]["id"] == expected_deployment_id
+
+
+@pytest.mark.asyncio
+async def test_lowest_latency_timeout_penalty():
+    handler = LowestLatencyLoggingHandler(
+        router_cache=DualCache(), model_list=model_list
+    )
+    handler.log_success_event(
+        kwargs=_get_kwargs("slow"), response_obj={}, start_time=0.0, end_time=5.0
+    )
+    await handler.async_log_failure_event(
+        kwargs={
+            **_get_kwargs("fast"),
+            "exception": litellm.Timeout(
+                message="timeout", model="gpt-4o", llm_provider="openai"
+            ),
+        },
+        response_obj=None,
+        start_time=0.0,
+        end_time=1.0,
+    )
+
+    deployment = await handler.async_get_available_deployments(
+        model_group="gpt-4o", healthy_deployments=model_list
+    )
+    assert deployment["model_info"]["id"] == "slow"
+
+
+@pytest.mark.asyncio
+async def test_lowest_latency_stats_merged_across_instances_via_redis():
+    fakeredis = pytest.importorskip("fakeredis")
+
+    redis_client = fakeredis.FakeAsyncRedis()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    redis_cache.check_and_fix_namespace.side_effect = lambda key: key
+
+    handlers = []
+    for _ in range(2):
+        router_cache = DualCache()
+        router_cache.redis_cache = redis_cache
+        handlers.append(
+            LowestLatencyLoggingHandler(
+                router_cache=router_cache,
+                model_list=model_list,
+                routing_args={"sync_stats_with_redis": False},
+            )
+        )
+    handler_1, handler_2 = handlers
+
+    # instance 1 only saw slow responses from "fast"
+    for _ in range(3):
+        handler_1.log_success_event(
+            kwargs=_get_kwargs("fast"),
+            response_obj=_get_response(total_tokens=10),
+            start_time=0.0,
+            end_time=5.0,
+        )
+    # instance 2 only saw "slow"
+    handler_2.log_success_event(
+        kwargs=_get_kwargs("slow"),
+        response_obj=_get_response(total_tokens=10),
+        start_time=0.0,
+        end_time=1.0,
+    )
+
+    await handler_1._sync_latency_stats_with_redis()
+    await handler_2._sync_latency_stats_with_redis()
+
+    remote_stats = handler_2._get_model_group_stats(model_group="gpt-4o")["fast"]
+    assert remote_stats.remote is not None
+    assert remote_stats.remote["latency"] == [5.0, 5.0, 5.0]
+    assert remote_stats.remote["rpm"] == 3
+    assert remote_stats.remote["tpm"] == 30
+
+    # instance 2 routes away from "fast", based on instance 1's stats
+    deployment = handler_2.get_available_deployments(
+        model_group="gpt-4o", healthy_deployments=model_list
+    )
+    assert deployment["model_info"]["id"] == "slow"
@@ -0,0 +1,144 @@
+import asyncio
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+from litellm.caching.caching import DualCache
+from litellm.router_utils.cooldown_cache import CooldownCache
+
+
+@pytest.mark.asyncio
+async def test_cooldown_table_no_cache_reads():
+    """
+    Without redis, cooldowns are served from the in-process table - the cache is never read
+    """
+    cache = DualCache()
+    cache.async_batch_get_cache = AsyncMock()  # type: ignore
+    cooldown_cache = CooldownCache(cache=cache, default_cooldown_time=60)
+
+    cooldown_cache.add_deployment_to_cooldown(
+        model_id="a",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=None,
+    )
+
+    active_cooldowns = await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["a", "b"], parent_otel_span=None
+    )
+    assert [model_id for model_id, _ in active_cooldowns] == ["a"]
+    assert active_cooldowns[0][1]["status_code"] == "429"
+    assert cooldown_cache.get_min_cooldown(model_ids=["a"], parent_otel_span=None) == 60
+    cache.async_batch_get_cache.assert_not_called()
+
+
+def test_cooldown_table_expiry():
+    cooldown_cache = CooldownCache(cache=DualCache(), default_cooldown_time=60)
+    cooldown_cache.add_deployment_to_cooldown(
+        model_id="a",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=5,
+    )
+    assert len(cooldown_cache.get_active_cooldowns(["a"], parent_otel_span=None)) == 1
+
+    expires_at, cooldown_data = cooldown_cache.cooldown_table["a"]
+    cooldown_cache.cooldown_table["a"] = (expires_at - 10, cooldown_data)
+
+    assert cooldown_cache.get_active_cooldowns(["a"], parent_otel_span=None) == []
+    assert "a" not in cooldown_cache.cooldown_table
+
+
+@pytest.mark.asyncio
+async def test_cooldown_shared_across_instances_via_pubsub():
+    """
+    A cooldown set on one instance reaches the other instance over redis pub/sub, without the other instance re-reading the cache
+    """
+    fakeredis = pytest.importorskip("fakeredis")
+
+    redis_client = fakeredis.FakeAsyncRedis()
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    redis_cache.async_batch_get_cache = AsyncMock(return_value={})
+
+    cooldown_caches = [
+        CooldownCache(
+            cache=DualCache(redis_cache=redis_cache), default_cooldown_time=60
+        )
+        for _ in range(2)
+    ]
+    instance_1, instance_2 = cooldown_caches
+
+    # start listening + load existing cooldowns from redis
+    assert (
+        await instance_2.async_get_active_cooldowns(
+            model_ids=["a", "b"], parent_otel_span=None
+        )
+        == []
+    )
+    assert redis_cache.async_batch_get_cache.call_count == 1
+    await asyncio.sleep(0.1)  # let the listener subscribe
+
+    instance_1.add_deployment_to_cooldown(
+        model_id="a",
+        original_exception=Exception("rate limited"),
+        exception_status=429,
+        cooldown_time=30,
+    )
+
+    active_cooldowns = []
+    for _ in range(50):
+        await asyncio.sleep(0.02)
+        active_cooldowns = await instance_2.async_get_active_cooldowns(
+            model_ids=["a", "b"], parent_otel_span=None
+        )
+        if active_cooldowns:
+            break
+
+    assert [model_id for model_id, _ in active_cooldowns] == ["a"]
+    assert active_cooldowns[0][1]["cooldown_time"] == 30
+    assert redis_cache.async_batch_get_cache.call_count == 1
+
+    pubsub_tasks = [
+        cooldown_cache._pubsub_task
+        for cooldown_cache in cooldown_caches
+        if cooldown_cache._pubsub_task is not None
+    ]
+    for pubsub_task in pubsub_tasks:
+        pubsub_task.cancel()
+    await asyncio.gather(*pubsub_tasks, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_pubsub_listener_restart_backoff():
+    """
+    With redis down, the pub/sub listener isn't restarted on every call - cooldowns are read from the cache instead
+    """
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.side_effect = ConnectionError("redis is down")
+    redis_cache.async_batch_get_cache = AsyncMock(return_value={})
+    cooldown_cache = CooldownCache(
+        cache=DualCache(redis_cache=redis_cache), default_cooldown_time=60
+    )
+
+    for _ in range(5):
+        await cooldown_cache.async_get_active_cooldowns(
+            model_ids=["a"], parent_otel_span=None
+        )
+        await asyncio.sleep(0)
+
+    assert redis_cache.init_async_client.call_count == 1
+    assert redis_cache.async_batch_get_cache.call_count == 5
+
+    # retried once the interval passed
+    cooldown_cache.pubsub_retry_interval = 0
+    await cooldown_cache.async_get_active_cooldowns(
+        model_ids=["a"], parent_otel_span=None
+    )
+    await asyncio.sleep(0)
+    assert redis_cache.init_async_client.call_count == 2
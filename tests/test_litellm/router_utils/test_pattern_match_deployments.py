@@ -0,0 +1,89 @@
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../../..")
+)  # Adds the parent directory to the system path
+from litellm.router_utils.pattern_match_deployments import PatternMatchRouter
+
+
+def _deployment(model_name: str, model: str) -> dict:
+    return {
+        "model_name": model_name,
+        "litellm_params": {"model": model, "api_key": "sk-1234"},
+        "model_info": {"id": model_name},
+    }
+
+
+@pytest.fixture
+def pattern_router() -> PatternMatchRouter:
+    router = PatternMatchRouter()
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+    router.add_pattern(
+        "openai/fo::*::static::*",
+        _deployment("openai/fo::*::static::*", "openai/fo::*::static::*"),
+    )
+    router.add_pattern("llmengine/*", _deployment("llmengine/*", "openai/*"))
+    return router
+
+
+def test_route_most_specific_pattern_wins(pattern_router):
+    deployments = pattern_router.route("openai/fo::hi::static::hello")
+    assert deployments is not None
+    assert len(deployments) == 1
+    assert deployments[0]["model_name"] == "openai/fo::*::static::*"
+    assert deployments[0]["litellm_params"]["model"] == "openai/fo::hi::static::hello"
+
+    deployments = pattern_router.route("llmengine/gpt-4o")
+    assert deployments[0]["litellm_params"]["model"] == "openai/gpt-4o"
+
+    assert pattern_router.route("anthropic/claude-3") is None
+
+
+def test_route_filtered_model_names(pattern_router):
+    assert (
+        pattern_router.route("openai/gpt-4o", filtered_model_names=["llmengine/*"])
+        is None
+    )
+    deployments = pattern_router.route(
+        "openai/gpt-4o", filtered_model_names=["openai/*"]
+    )
+    assert deployments[0]["litellm_params"]["model"] == "openai/gpt-4o"
+
+
+def test_route_returns_independent_copies(pattern_router):
+    """
+    Returned deployments are shallow copies - changing the litellm params of one must not leak into the stored deployment or later routes
+    """
+    deployments = pattern_router.route("openai/gpt-4o")
+    deployments[0]["litellm_params"]["model"] = "changed"
+    deployments[0]["litellm_params"]["api_key"] = "changed"
+
+    stored_deployment = pattern_router.patterns[
+        pattern_router._pattern_to_regex("openai/*")
+    ][0]
+    assert stored_deployment["litellm_params"]["model"] == "openai/*"
+    assert stored_deployment["litellm_params"]["api_key"] == "sk-1234"
+
+    deployments = pattern_router.route("openai/gpt-4o")
+    assert deployments[0]["litellm_params"]["model"] == "openai/gpt-4o"
+    assert deployments[0]["litellm_params"]["api_key"] == "sk-1234"
+
+
+def test_route_cache_is_bounded_and_invalidated():
+    router = PatternMatchRouter(max_cache_size=2)
+    router.add_pattern("openai/*", _deployment("openai/*", "openai/*"))
+
+    for model in ["openai/a", "openai/b", "openai/c", "unknown"]:
+        router.route(model)
+    assert list(router.route_cache.keys()) == [("openai/c", None), ("unknown", None)]
+    assert router.route_cache[("unknown", None)] is None
+
+    # new patterns apply to previously resolved routes
+    router.add_pattern("unknown", _deployment("unknown", "anthropic/claude-3"))
+    assert len(router.route_cache) == 0
+    assert router.route("unknown")[0]["litellm_params"]["model"] == (
+        "anthropic/claude-3"
+    )
@@ -0,0 +1,62 @@
+import ast
+import importlib
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+import litellm
+from litellm._lazy_imports import LAZY_PROVIDER_CONFIG_INSTANCES, LAZY_PROVIDER_CONFIGS
+
+
+@pytest.mark.parametrize("name", sorted(LAZY_PROVIDER_CONFIGS))
+def test_lazy_provider_config_resolves(name):
+    module_name, attribute_name = LAZY_PROVIDER_CONFIGS[name]
+    expected = getattr(importlib.import_module(module_name), attribute_name)
+    assert getattr(litellm, name) is expected
+    assert name in dir(litellm)
+
+
+def test_lazy_provider_config_instances():
+    for name, config_name in LAZY_PROVIDER_CONFIG_INSTANCES.items():
+        instance = getattr(litellm, name)
+        assert isinstance(instance, getattr(litellm, config_name))
+        # created once
+        assert getattr(litellm, name) is instance
+
+
+def test_from_import_and_unknown_attribute():
+    from litellm import AnthropicConfig
+
+    assert AnthropicConfig is litellm.AnthropicConfig
+    with pytest.raises(AttributeError):
+        litellm.NotARealProviderConfig
+
+
+def test_lazy_imports_match_type_checking_imports():
+    """`litellm/_lazy_imports.py` and the `if TYPE_CHECKING:` provider config imports in `litellm/__init__.py` list the same names"""
+    with open(litellm.__file__) as f:
+        tree = ast.parse(f.read())
+
+    type_checking_names = set()
+    for node in tree.body:
+        if (
+            isinstance(node, ast.If)
+            and isinstance(node.test, ast.Name)
+            and node.test.id == "TYPE_CHECKING"
+        ):
+            for statement in node.body:
+                if isinstance(statement, ast.ImportFrom):
+                    type_checking_names.update(
+                        alias.asname or alias.name for alias in statement.names
+                    )
+                elif isinstance(statement, ast.AnnAssign):
+                    type_checking_names.add(statement.target.id)  # type: ignore
+
+    assert type_checking_names == set(LAZY_PROVIDER_CONFIGS) | set(
+        LAZY_PROVIDER_CONFIG_INSTANCES
+    )
@@ -1159,7 +1159,9 @@ async def test_acompletion_streaming_iterator():
             self.items = items
             self.index = 0
             self.error_after_index = error_after_index
-            self.chunks = []
+
+        def build_complete_streaming_response(self):
+            return None
 
         def __aiter__(self):
             return self
@@ -1267,7 +1269,9 @@ async def test_acompletion_streaming_iterator_edge_cases():
             self.model = "gpt-4"
             self.custom_llm_provider = "openai"
             self.logging_obj = MagicMock()
-            self.chunks = []
+
+        def build_complete_streaming_response(self):
+            return None
 
         def __aiter__(self):
             return self
@@ -1690,3 +1694,165 @@ def test_get_deployment_model_info_base_model_merge_priority():
             assert result["key"] == "gpt-4"
 
     print("✓ Base model merge priority test passed!")
+
+
+def test_router_deployment_indexes_add_upsert_delete():
+    """
+    Test that id / model_name / litellm model / team_id lookup indexes stay in sync with model_list
+    """
+    from litellm.types.router import Deployment, LiteLLM_Params, ModelInfo
+
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o"},
+                "model_info": {"id": "deployment-1"},
+            },
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "azure/gpt-4o"},
+                "model_info": {"id": "deployment-2"},
+            },
+        ]
+    )
+
+    assert router.has_model_id("deployment-1")
+    assert router.get_model_ids(model_name="gpt-4o") == [
+        "deployment-1",
+        "deployment-2",
+    ]
+    assert router.get_deployment(model_id="deployment-2").litellm_params.model == (
+        "azure/gpt-4o"
+    )
+    assert len(router._get_deployment_by_litellm_model(model="openai/gpt-4o")) == 1
+
+    ## ADD TEAM DEPLOYMENT
+    router.add_deployment(
+        Deployment(
+            model_name="team-gpt-4o",
+            litellm_params=LiteLLM_Params(model="openai/gpt-4o"),
+            model_info=ModelInfo(
+                id="deployment-3",
+                team_id="team-1",
+                team_public_model_name="gpt-4o",
+            ),
+        )
+    )
+    assert [m["model_info"]["id"] for m in router.team_id_to_deployments["team-1"]] == [
+        "deployment-3"
+    ]
+    assert len(router._get_all_deployments(model_name="gpt-4o", team_id="team-1")) == 3
+    assert len(router._get_all_deployments(model_name="gpt-4o")) == 2
+    assert len(router._get_deployment_by_litellm_model(model="openai/gpt-4o")) == 2
+
+    ## UPSERT - changes litellm model
+    router.upsert_deployment(
+        Deployment(
+            model_name="gpt-4o",
+            litellm_params=LiteLLM_Params(model="openai/gpt-4o-mini"),
+            model_info=ModelInfo(id="deployment-1"),
+        )
+    )
+    assert len(router.model_list) == 3
+    assert router.get_deployment(model_id="deployment-1").litellm_params.model == (
+        "openai/gpt-4o-mini"
+    )
+    assert len(router._get_deployment_by_litellm_model(model="openai/gpt-4o")) == 1
+
+    ## DELETE
+    deleted = router.delete_deployment(id="deployment-3")
+    assert deleted["model_info"]["id"] == "deployment-3"
+    assert "team-1" not in router.team_id_to_deployments
+    assert router.has_model_id("deployment-3") is False
+    assert router.delete_deployment(id="deployment-3") is None
+    assert [m["model_info"]["id"] for m in router.model_list] == [
+        m["model_info"]["id"] for m in router.model_id_to_deployment_map.values()
+    ]
+
+
+def test_router_deployment_indexes_rebuilt_on_model_list_mutation():
+    """
+    If model_list is replaced outside of the router helpers, lookups should still be correct
+    """
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o"},
+                "model_info": {"id": "deployment-1"},
+            },
+        ]
+    )
+    router.model_list = [
+        {
+            "model_name": "claude",
+            "litellm_params": {"model": "anthropic/claude-3-5-sonnet"},
+            "model_info": {"id": "deployment-2"},
+        }
+    ]
+
+    assert router.get_deployment(model_id="deployment-1") is None
+    assert router.get_deployment(model_id="deployment-2") is not None
+    assert router.get_model_ids(model_name="claude") == ["deployment-2"]
+
+
+def test_router_model_list_assignment_is_copied():
+    router = litellm.Router(model_list=[])
+    model_list = [
+        {
+            "model_name": "gpt-4o",
+            "litellm_params": {"model": "openai/gpt-4o"},
+            "model_info": {"id": "deployment-1"},
+        }
+    ]
+    router.model_list = model_list
+    assert router.get_model_ids(model_name="gpt-4o") == ["deployment-1"]
+    assert router.model_list is not model_list
+
+    # the router uses its own copy - edits to the assigned list aren't seen
+    model_list.clear()
+    assert router.get_model_ids(model_name="gpt-4o") == ["deployment-1"]
+
+
+def test_router_invalidate_deployment_indexes_after_in_place_edit():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o"},
+                "model_info": {"id": "deployment-1", "team_id": "team-1"},
+            },
+        ]
+    )
+    assert router.get_model_ids(model_name="gpt-4o") == ["deployment-1"]
+
+    router.model_list[0]["model_name"] = "gpt-4o-renamed"
+    router.model_list[0]["model_info"]["team_id"] = "team-2"
+    router.invalidate_deployment_indexes()
+
+    assert router.get_model_ids(model_name="gpt-4o") == []
+    assert router.get_model_ids(model_name="gpt-4o-renamed") == ["deployment-1"]
+    assert "team-1" not in router.team_id_to_deployments
+    assert len(router.team_id_to_deployments["team-2"]) == 1
+
+
+def test_router_deployment_indexes_rebuilt_on_in_place_replacement():
+    router = litellm.Router(
+        model_list=[
+            {
+                "model_name": "gpt-4o",
+                "litellm_params": {"model": "openai/gpt-4o"},
+                "model_info": {"id": "deployment-1"},
+            },
+        ]
+    )
+    router.model_list[0] = {
+        "model_name": "claude",
+        "litellm_params": {"model": "anthropic/claude-3-5-sonnet"},
+        "model_info": {"id": "deployment-2"},
+    }
+
+    assert router.get_deployment(model_id="deployment-1") is None
+    assert router.get_deployment(model_id="deployment-2") is not None
+    assert router.get_model_ids(model_name="claude") == ["deployment-2"]
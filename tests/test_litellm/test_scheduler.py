@@ -0,0 +1,216 @@
+import asyncio
+import os
+import sys
+import time
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.abspath("../..")
+)  # Adds the parent directory to the system path
+
+from litellm.scheduler import FlowItem, Scheduler
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_for_turn_woken_by_notify():
+    """
+    Queued request should be admitted as soon as the request ahead of it leaves the queue - without waiting for the fallback polling interval
+    """
+    scheduler = Scheduler(polling_interval=10)
+
+    item1 = FlowItem(priority=0, request_id="1", model_name="gpt-4o")
+    item2 = FlowItem(priority=1, request_id="2", model_name="gpt-4o")
+    await scheduler.add_request(item1)
+    await scheduler.add_request(item2)
+
+    get_healthy_deployments = AsyncMock(return_value=[])  # all deployments busy
+
+    waiter = asyncio.create_task(
+        scheduler.wait_for_turn(
+            request=item2,
+            get_healthy_deployments=get_healthy_deployments,
+            timeout=5,
+        )
+    )
+    await asyncio.sleep(0.05)
+    assert waiter.done() is False
+    assert scheduler.get_queue_depth(model_name="gpt-4o") == 2
+
+    start_time = time.time()
+    assert (
+        await scheduler.poll(id="1", model_name="gpt-4o", health_deployments=[]) is True
+    )
+    assert await asyncio.wait_for(waiter, timeout=1) is True
+    assert time.time() - start_time < 1
+    assert scheduler.get_queue_depth(model_name="gpt-4o") == 0
+
+
+@pytest.mark.asyncio
+async def test_scheduler_wait_for_turn_timeout_removes_request():
+    scheduler = Scheduler(polling_interval=0.01)
+
+    item1 = FlowItem(priority=0, request_id="1", model_name="gpt-4o")
+    item2 = FlowItem(priority=1, request_id="2", model_name="gpt-4o")
+    await scheduler.add_request(item1)
+    await scheduler.add_request(item2)
+
+    result = await scheduler.wait_for_turn(
+        request=item2,
+        get_healthy_deployments=AsyncMock(return_value=[]),
+        timeout=0.05,
+    )
+
+    assert result is False
+    assert await scheduler.get_queue(model_name="gpt-4o") == [(0, "1")]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_poll_with_healthy_deployments_removes_request():
+    """
+    Admitted requests should leave the queue, so they don't block lower priority requests later on
+    """
+    scheduler = Scheduler()
+
+    item1 = FlowItem(priority=0, request_id="1", model_name="gpt-4o")
+    item2 = FlowItem(priority=0, request_id="2", model_name="gpt-4o")
+    await scheduler.add_request(item1)
+    await scheduler.add_request(item2)
+
+    assert await scheduler.poll(
+        id="1", model_name="gpt-4o", health_deployments=[{"key": "value"}]
+    )
+    assert await scheduler.peek(id="2", model_name="gpt-4o", health_deployments=[])
+
+
+@pytest.mark.asyncio
+async def test_scheduler_same_priority_is_fifo():
+    scheduler = Scheduler()
+    for request_id in ["b", "a", "c"]:
+        await scheduler.add_request(
+            FlowItem(priority=5, request_id=request_id, model_name="gpt-4o")
+        )
+
+    assert await scheduler.get_queue(model_name="gpt-4o") == [
+        (5, "b"),
+        (5, "a"),
+        (5, "c"),
+    ]
+
+
+@pytest.mark.asyncio
+async def test_scheduler_queue_metrics():
+    scheduler = Scheduler()
+    await scheduler.add_request(FlowItem(priority=0, request_id="1", model_name="m"))
+    await scheduler.add_request(FlowItem(priority=0, request_id="2", model_name="m"))
+    await scheduler.poll(id="1", model_name="m", health_deployments=[])
+
+    metrics = scheduler.get_queue_metrics()["m"]
+    assert metrics["queue_depth"] == 1
+    assert scheduler.get_queue_status() == {"m": [(0, "2")]}
+    assert metrics["wait_time_bucket_counts"][-1] == 1
+    assert len(metrics["wait_time_bucket_counts"]) == (
+        len(metrics["wait_time_buckets"]) + 1
+    )
+
+
+def _mock_redis_cache(queue: list):
+    """redis cache whose sorted set holds `queue` - (request_id, score) pairs"""
+    redis_client = MagicMock()
+    redis_client.zadd = AsyncMock()
+    redis_client.expire = AsyncMock()
+    redis_client.zrem = AsyncMock()
+    redis_client.zremrangebyscore = AsyncMock()
+    redis_client.publish = AsyncMock()
+    redis_client.zrange = AsyncMock(return_value=queue)
+    redis_client.zcard = AsyncMock(return_value=len(queue))
+    redis_cache = MagicMock()
+    redis_cache.init_async_client.return_value = redis_client
+    return redis_cache, redis_client
+
+
+@pytest.mark.asyncio
+async def test_scheduler_redis_queue_and_publish():
+    """
+    With redis, the queue is a shared sorted set, and notify publishes an event for other instances
+    """
+    redis_cache, redis_client = _mock_redis_cache(
+        queue=[(b"other-instance-request", time.time())]
+    )
+
+    scheduler = Scheduler(redis_cache=redis_cache)
+    scheduler.publish_interval = 0
+    item = FlowItem(priority=0, request_id="1", model_name="gpt-4o")
+    await scheduler.add_request(item)
+
+    redis_client.zadd.assert_called_once()
+    assert redis_client.zadd.call_args.args[0] == "scheduler:queue:gpt-4o"
+    redis_client.expire.assert_called_once()
+
+    # request from another instance is at the top of the shared queue
+    assert (
+        await scheduler.poll(id="1", model_name="gpt-4o", health_deployments=[])
+        is False
+    )
+
+    redis_client.zrange.return_value = [(b"1", time.time())]
+    assert (
+        await scheduler.poll(id="1", model_name="gpt-4o", health_deployments=[]) is True
+    )
+    redis_client.zrem.assert_called_once_with("scheduler:queue:gpt-4o", "1")
+
+    # the request left the queue - other instances' waiters are woken up
+    await asyncio.sleep(0.01)
+    redis_client.publish.assert_called_once_with("scheduler:events", "gpt-4o")
+
+
+@pytest.mark.asyncio
+async def test_scheduler_publishes_only_with_waiters_and_batches_events():
+    redis_cache, redis_client = _mock_redis_cache(queue=[])
+    scheduler = Scheduler(redis_cache=redis_cache)
+    scheduler.publish_interval = 0.05
+
+    # no request queued on any instance - nothing to wake up
+    scheduler.notify(model_name="gpt-4o")
+    await asyncio.sleep(0.01)
+    redis_client.publish.assert_not_called()
+
+    # requests queued (on another instance) - events within the interval are batched into one publish
+    redis_client.zcard.return_value = 1
+    for _ in range(10):
+        scheduler.notify(model_name="gpt-4o")
+    await asyncio.sleep(0.1)
+    redis_client.publish.assert_called_once_with("scheduler:events", "gpt-4o")
+
+
+@pytest.mark.asyncio
+async def test_scheduler_drops_stale_redis_requests():
+    """
+    Requests left behind by a dead instance are dropped from the shared queue, instead of blocking its head
+    """
+    from litellm.constants import DEFAULT_SCHEDULER_REDIS_QUEUE_TTL
+    from litellm.scheduler import SCHEDULER_PRIORITY_SCORE_MULTIPLIER
+
+    now = time.time()
+    stale_score = (
+        SCHEDULER_PRIORITY_SCORE_MULTIPLIER
+        + now
+        - 2 * DEFAULT_SCHEDULER_REDIS_QUEUE_TTL
+    )
+    redis_cache, redis_client = _mock_redis_cache(
+        queue=[(b"dead-instance-request", stale_score)]
+    )
+    live_queue = [(b"1", SCHEDULER_PRIORITY_SCORE_MULTIPLIER + now)]
+    redis_client.zremrangebyscore.side_effect = (
+        lambda *args: redis_client.zrange.configure_mock(return_value=live_queue)
+    )
+
+    scheduler = Scheduler(redis_cache=redis_cache)
+    assert await scheduler.get_queue(model_name="gpt-4o") == [(1, "1")]
+
+    redis_client.zremrangebyscore.assert_called_once()
+    key, min_score, max_score = redis_client.zremrangebyscore.call_args.args
+    assert key == "scheduler:queue:gpt-4o"
+    assert min_score == SCHEDULER_PRIORITY_SCORE_MULTIPLIER
+    assert stale_score <= max_score < live_queue[0][1]